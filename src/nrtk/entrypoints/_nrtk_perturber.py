@@ -2,7 +2,6 @@
 
 __all__ = ["nrtk_perturber"]
 
-import itertools
 import logging
 from collections.abc import Iterable
 
@@ -34,15 +33,7 @@ def nrtk_perturber(*, maite_dataset: Dataset, perturber_factory: PerturbImageFac
     Returns:
         A list of tuples containing perturber configurations and augmented datasets
     """
-    perturber_factory_config = perturber_factory.get_config()
-    if "theta_keys" in perturber_factory_config:  # pyBSM doesn't follow interface rules
-        perturb_factory_keys = perturber_factory_config["theta_keys"]
-        thetas = perturber_factory.thetas
-    else:
-        perturb_factory_keys = [perturber_factory.theta_key]
-        thetas = [perturber_factory.thetas]
-
-    perturber_combinations = [dict(zip(perturb_factory_keys, v, strict=False)) for v in itertools.product(*thetas)]
+    perturber_combinations = [perturber_factory.theta_values(i) for i in range(len(perturber_factory))]
     logger.info(f"Perturber sweep values: {perturber_combinations}")
 
     # Iterate through the different perturber factory parameter combinations and
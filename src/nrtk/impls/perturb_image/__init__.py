@@ -10,6 +10,7 @@ if TYPE_CHECKING:
         AlbumentationsPerturber as AlbumentationsPerturber,
     )
     from nrtk.impls.perturb_image._compose_perturber import ComposePerturber as ComposePerturber
+    from nrtk.impls.perturb_image._tiled_perturber import TiledPerturber as TiledPerturber
 
 __getattr__: Callable[[str], Any]
 __dir__: Callable[[], list[str]]
@@ -19,7 +20,12 @@ __getattr__, __dir__, __all__ = guard(
     namespace=globals(),
     submodules=["geometric", "photometric", "environment", "optical", "generative"],
     groups=[
-        Group(symbols={"ComposePerturber": "nrtk.impls.perturb_image._compose_perturber"}),
+        Group(
+            symbols={
+                "ComposePerturber": "nrtk.impls.perturb_image._compose_perturber",
+                "TiledPerturber": "nrtk.impls.perturb_image._tiled_perturber",
+            },
+        ),
         Group(
             symbols={
                 "AlbumentationsPerturber": "nrtk.impls.perturb_image._albumentations.albumentations_perturber",
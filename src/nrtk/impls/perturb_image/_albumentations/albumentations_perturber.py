@@ -20,6 +20,7 @@ from __future__ import annotations
 __all__ = ["AlbumentationsPerturber"]
 
 from collections.abc import Hashable, Iterable
+from copy import deepcopy
 from typing import Any
 
 import albumentations
@@ -161,8 +162,14 @@ class AlbumentationsPerturber(RandomPerturbImage):
                 bboxes.append(AlbumentationsPerturber._aabb_to_bbox(box=box[0], image=perturbed_image))
                 labels.append(box[1])
 
-        # Run transform
-        output = self._transform(
+        # Run transform, on a copy seeded from the random state of the call if it was given one, since the transform
+        # keeps its own random state
+        transform = self._transform
+        call_rng = self._call_rng
+        if call_rng is not None:
+            transform = deepcopy(transform)
+            transform.set_random_seed(int(call_rng.integers(1 << 31)))
+        output = transform(
             image=perturbed_image,
             bboxes=np.array(bboxes),
         )
@@ -23,9 +23,20 @@ class NumpyRandomPerturbImage(RandomPerturbImage):
 
     Initializes self._rng as a numpy Generator seeded with self._seed.
     When seed is None, creates an unseeded Generator for non-deterministic behavior.
+    During a call given its own ``rng`` or ``seed``, self._rng is the random state of that call instead.
     """
 
-    _rng: np.random.Generator
+    _own_rng: np.random.Generator
+
+    @property
+    def _rng(self) -> np.random.Generator:
+        """Random state to draw from: that of the call in progress if it was given one, else the perturber's."""
+        call_rng = self._call_rng
+        return self._own_rng if call_rng is None else call_rng
+
+    @_rng.setter
+    def _rng(self, rng: np.random.Generator) -> None:
+        self._own_rng = rng
 
     @override
     def _set_seed(self) -> None:
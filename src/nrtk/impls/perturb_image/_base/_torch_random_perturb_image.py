@@ -28,12 +28,27 @@ class TorchRandomPerturbImage(RandomPerturbImage):
     Creates a torch Generator on the appropriate device, seeded with self._seed.
     The generator is stored as self._generator for use in pipeline calls.
 
+    During a call given its own ``rng`` or ``seed``, self._generator is a Generator seeded from the random state
+    of that call instead.
+
     Note:
         Subclasses must set self._device before calling super().__init__().
     """
 
     _device: str
-    _generator: Any
+    _own_generator: Any
+
+    @property
+    def _generator(self) -> Any:  # noqa: ANN401 - torch is an optional dependency
+        """Generator to draw from: one seeded by the random state of the call in progress, else the perturber's."""
+        call_rng = self._call_rng
+        if call_rng is None:
+            return self._own_generator
+        return torch.Generator(device=self._get_device()).manual_seed(int(call_rng.integers(1 << 63)))
+
+    @_generator.setter
+    def _generator(self, generator: Any) -> None:  # noqa: ANN401 - torch is an optional dependency
+        self._own_generator = generator
 
     @override
     def _set_seed(self) -> None:
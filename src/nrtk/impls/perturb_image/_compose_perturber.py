@@ -22,7 +22,7 @@ from __future__ import annotations
 __all__ = ["ComposePerturber"]
 
 import copy
-from collections.abc import Hashable, Iterable
+from collections.abc import Hashable, Iterable, Sequence
 from typing import Any
 
 import numpy as np
@@ -34,6 +34,69 @@ from smqtk_image_io.bbox import AxisAlignedBoundingBox
 from typing_extensions import Self, override
 
 from nrtk.interfaces import PerturbImage
+from nrtk.interfaces._random_perturb_image import RandomPerturbImage
+from nrtk.interfaces._warp_map import WarpMap
+
+
+def _apply_lut(*, image: np.ndarray[Any, Any], lut: np.ndarray[Any, Any] | None) -> np.ndarray[Any, Any]:
+    """Map each channel of a uint8 image through the matching row of a (C, 256) lookup table, if any."""
+    if lut is None:
+        return image
+    if image.ndim == 2 or (lut == lut[0]).all():
+        return np.take(lut[0], image)
+    perturbed_image = np.empty_like(image)
+    for c in range(image.shape[2]):
+        perturbed_image[..., c] = np.take(lut[c], image[..., c])
+    return perturbed_image
+
+
+def _fft_len(n: int) -> int:
+    """Smallest length of at least ``n`` whose only prime factors are 2, 3 and 5, which the FFT handles fastest."""
+    best = 2 * n
+    power_of_5 = 1
+    while power_of_5 < best:
+        power_of_35 = power_of_5
+        while power_of_35 < best:
+            # Smallest power of 2 multiple of power_of_35 that is at least n
+            length = power_of_35 << max(0, (n - 1) // power_of_35).bit_length()
+            best = min(best, length)
+            power_of_35 *= 3
+        power_of_5 *= 5
+    return best
+
+
+def _apply_kernels(*, image: np.ndarray[Any, Any], kernels: list[np.ndarray[Any, Any]]) -> np.ndarray[Any, Any]:
+    """Correlate a uint8 image with a sequence of kernels in a single pass, by multiplying their transfer functions.
+
+    Args:
+        image:
+            Input uint8 image of shape (H, W) or (H, W, C).
+        kernels:
+            Kernels in the format returned by ``PerturbImage._blur_kernel()``, in the order they apply.
+
+    Returns:
+        The blurred uint8 image, with reflected image borders.
+    """
+    # Even-sized kernels are centered on their lower middle element, which an appended zero makes the middle one
+    kernels = [np.pad(kernel, ((0, 1 - kernel.shape[0] % 2), (0, 1 - kernel.shape[1] % 2))) for kernel in kernels]
+    pad_y = sum(kernel.shape[0] // 2 for kernel in kernels)
+    pad_x = sum(kernel.shape[1] // 2 for kernel in kernels)
+    # Channel first, so that each 2D transform runs over contiguous memory
+    channels = image[np.newaxis] if image.ndim == 2 else np.moveaxis(image, -1, 0)
+    padded = np.pad(channels.astype(np.float64), ((0, 0), (pad_y, pad_y), (pad_x, pad_x)), mode="reflect")
+
+    # Correlating with a kernel is convolving with the flipped kernel. The kernels are small, so their transfer
+    # functions are multiplied at the size of the combined kernel before transforming it at the image size.
+    kshape = (2 * pad_y + 1, 2 * pad_x + 1)
+    kernel = np.fft.irfft2(np.prod([np.fft.rfft2(k[::-1, ::-1], s=kshape) for k in kernels], axis=0), s=kshape)
+    # The circular convolution of the padded image only wraps around into the padding, which is cropped
+    fshape = tuple(_fft_len(n) for n in padded.shape[1:])
+    transfer = np.fft.rfft2(kernel, s=fshape)
+    blurred = np.fft.irfft2(np.fft.rfft2(padded, s=fshape) * transfer, s=fshape)
+    blurred = blurred[:, 2 * pad_y : 2 * pad_y + image.shape[0], 2 * pad_x : 2 * pad_x + image.shape[1]]
+
+    blurred = np.clip(np.rint(blurred), 0, 255).astype(np.uint8)
+    return blurred[0] if image.ndim == 2 else np.moveaxis(blurred, 0, -1).copy()
 
 
 class ComposePerturber(PerturbImage):
@@ -42,13 +105,15 @@ class ComposePerturber(PerturbImage):
     Attributes:
         perturbers (list[PerturbImage]):
             List of perturbers to apply.
+        fuse_blur (bool):
+            Whether consecutive linear shift-invariant blurs are fused into a single convolution.
 
     Note:
         This class has not been tested with perturber factories and is not expected
         to work with perturber factories.
     """
 
-    def __init__(self, perturbers: list[PerturbImage] | None = None) -> None:
+    def __init__(self, perturbers: list[PerturbImage] | None = None, *, fuse_blur: bool = False) -> None:
         """Initializes the ComposePerturber.
 
         This has not been tested with perturber factories and is not expected to work with perturber factories.
@@ -56,11 +121,17 @@ class ComposePerturber(PerturbImage):
         Args:
             perturbers:
                 List of perturbers to apply.
+            fuse_blur:
+                Whether to fuse consecutive linear shift-invariant blurs, such as the Gaussian and average blurs and
+                the pyBSM OTF perturbers that do not resample the image, into a single convolution in the frequency
+                domain. Fused blurs are not rounded between stages and share one border treatment, so results
+                differ slightly from applying each blur in turn, mostly near the image borders.
         """
         super().__init__()
         if perturbers is None:
             perturbers = []
         self.perturbers = perturbers
+        self.fuse_blur = fuse_blur
 
     @override
     def perturb(
@@ -72,6 +143,13 @@ class ComposePerturber(PerturbImage):
     ) -> tuple[np.ndarray[Any, Any], Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]:
         """Apply the sequence of perturbers to the input image.
 
+        Consecutive perturbers that map each uint8 pixel value independently, such as brightness, contrast and
+        uniform haze, are fused into a single lookup table that is applied in one pass over the image, without
+        materializing the intermediate images. Consecutive geometric warps of uint8 images, such as random translation
+        and radial distortion, are composed into a single pixel gather and a matching sequence of box transforms. With
+        ``fuse_blur``, consecutive blurs are likewise applied as a single
+        convolution whose transfer function is the product of theirs.
+
         Args:
             image:
                 The input image to perturb.
@@ -84,28 +162,236 @@ class ComposePerturber(PerturbImage):
         Returns:
             The perturbed image and the source bounding boxes.
         """
+        perturbed_image, perturbed_boxes = self._apply_perturbers(image=image, boxes=boxes, **kwargs)
+
+        if len(self.perturbers) == 0:
+            perturbed_image = copy.deepcopy(image)
+        if perturbed_boxes is boxes:
+            # Only pointwise perturbers were applied, none of which copied the boxes
+            perturbed_boxes = copy.deepcopy(boxes)
+
+        return perturbed_image, perturbed_boxes
+
+    @override
+    def _random_stages(self) -> list[RandomPerturbImage]:
+        """Returns the random stages of each perturber, in the order they are applied."""
+        return [stage for perturber in self.perturbers for stage in perturber._random_stages()]  # noqa: SLF001
+
+    def _apply_perturbers(
+        self,
+        *,
+        image: np.ndarray[Any, Any],
+        boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None,
+        **kwargs: Any,
+    ) -> tuple[np.ndarray[Any, Any], Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]:
+        """Apply the sequence of perturbers, fusing consecutive pointwise perturbers, blurs and warps.
+
+        At most one kind of fused stage is pending at any time. It is applied before any perturber of another kind.
+        """
         perturbed_image = image
         perturbed_boxes = boxes
+        # Fused lookup table of the pointwise perturbers not yet applied to perturbed_image
+        lut = None
+        # Blurs not yet applied to perturbed_image, with their kernels
+        blurs: list[tuple[PerturbImage, np.ndarray[Any, Any]]] = []
+        # Composed warp of the geometric perturbers not yet applied to perturbed_image
+        warp = None
 
-        # Applies series of perturbations to a the given input image
         for perturber in self.perturbers:
+            stage_warp = self._fuse_warp(perturber=perturber, image=perturbed_image, **kwargs)
+            if stage_warp is not None:
+                perturbed_image, perturbed_boxes = self._apply_pending(
+                    image=perturbed_image,
+                    boxes=perturbed_boxes,
+                    lut=lut,
+                    blurs=blurs,
+                    **kwargs,
+                )
+                lut, blurs = None, []
+                warp = stage_warp if warp is None else warp.then(stage_warp)
+                continue
+            perturbed_image, perturbed_boxes = self._apply_pending(
+                image=perturbed_image,
+                boxes=perturbed_boxes,
+                warp=warp,
+                **kwargs,
+            )
+            warp = None
+
+            kernel = self._fuse_kernel(perturber=perturber, image=perturbed_image, **kwargs)
+            if kernel is not None:
+                perturbed_image, lut = _apply_lut(image=perturbed_image, lut=lut), None
+                blurs.append((perturber, kernel))
+                continue
+            perturbed_image, perturbed_boxes = self._apply_blurs(
+                image=perturbed_image,
+                boxes=perturbed_boxes,
+                blurs=blurs,
+                **kwargs,
+            )
+            blurs = []
+
+            fused_lut = self._fuse_lut(perturber=perturber, image=perturbed_image, lut=lut, **kwargs)
+            if fused_lut is not None:
+                lut = fused_lut
+                continue
+            perturbed_image, lut = _apply_lut(image=perturbed_image, lut=lut), None
             perturbed_image, perturbed_boxes = perturber(
                 image=perturbed_image,
                 boxes=perturbed_boxes,
                 **kwargs,
             )
 
+        return self._apply_pending(
+            image=perturbed_image,
+            boxes=perturbed_boxes,
+            lut=lut,
+            blurs=blurs,
+            warp=warp,
+            **kwargs,
+        )
+
+    @classmethod
+    def _apply_pending(
+        cls,
+        *,
+        image: np.ndarray[Any, Any],
+        boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None,
+        lut: np.ndarray[Any, Any] | None = None,
+        blurs: list[tuple[PerturbImage, np.ndarray[Any, Any]]] | None = None,
+        warp: WarpMap | None = None,
+        **kwargs: Any,
+    ) -> tuple[np.ndarray[Any, Any], Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]:
+        """Apply the given pending lookup table, blurs and warp, of which at most one is pending."""
+        image, boxes = cls._apply_blurs(
+            image=_apply_lut(image=image, lut=lut),
+            boxes=boxes,
+            blurs=blurs or [],
+            **kwargs,
+        )
+        if warp is None:
+            return image, boxes
+        # A single warp is applied as well, since it has already drawn its random parameters
+        return warp.apply(image), warp.warp_boxes(copy.deepcopy(boxes))
+
+    @staticmethod
+    def _apply_blurs(
+        *,
+        image: np.ndarray[Any, Any],
+        boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None,
+        blurs: list[tuple[PerturbImage, np.ndarray[Any, Any]]],
+        **kwargs: Any,
+    ) -> tuple[np.ndarray[Any, Any], Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]:
+        """Apply pending blurs, as a single convolution when there are several of them."""
+        if len(blurs) == 1:
+            # Nothing to fuse, so the blur is applied exactly as it would be on its own
+            perturber, _ = blurs[0]
+            return perturber(image=image, boxes=boxes, **kwargs)
+        if blurs:
+            image = _apply_kernels(image=image, kernels=[kernel for _, kernel in blurs])
+        return image, boxes
+
+    def _fuse_kernel(
+        self,
+        *,
+        perturber: PerturbImage,
+        image: np.ndarray[Any, Any],
+        **kwargs: Any,
+    ) -> np.ndarray[Any, Any] | None:
+        """Kernel of a blur that can be fused with its neighbours, or None if ``perturber`` cannot be fused."""
+        if not self.fuse_blur or image.dtype != np.uint8 or image.ndim not in (2, 3):
+            return None
+        return perturber._blur_kernel(image=image, **kwargs)  # noqa: SLF001
+
+    @staticmethod
+    def _fuse_warp(
+        *,
+        perturber: PerturbImage,
+        image: np.ndarray[Any, Any],
+        **kwargs: Any,
+    ) -> WarpMap | None:
+        """Warp of a geometric perturber that can be composed with its neighbours, or None if it cannot be."""
+        if image.dtype != np.uint8 or image.ndim not in (2, 3):
+            return None
+        return perturber._warp_map(image=image, **kwargs)  # noqa: SLF001
+
+    @staticmethod
+    def _fuse_lut(
+        *,
+        perturber: PerturbImage,
+        image: np.ndarray[Any, Any],
+        lut: np.ndarray[Any, Any] | None,
+        **kwargs: Any,
+    ) -> np.ndarray[Any, Any] | None:
+        """Compose the lookup table of a pointwise perturber with the lookup table of the preceding ones.
+
+        Args:
+            perturber:
+                The next perturber to apply.
+            image:
+                The uint8 image the lookup tables apply to.
+            lut:
+                Lookup table of shape (C, 256) of the preceding pointwise perturbers, or None if there are none.
+            kwargs:
+                Additional perturbation keyword arguments.
+
+        Returns:
+            Lookup table of shape (C, 256) applying the preceding pointwise perturbers followed by ``perturber``,
+                or None if ``perturber`` cannot be expressed as a lookup table for this image.
+        """
+        if image.dtype != np.uint8 or image.ndim not in (2, 3):
+            return None
+        if lut is None:
+            lut = np.tile(np.arange(256, dtype=np.uint8), (1 if image.ndim == 2 else image.shape[2], 1))
+        stage_lut = perturber._pointwise_lut(image=image, lut=lut, **kwargs)  # noqa: SLF001
+        if stage_lut is None:
+            return None
+        return np.take_along_axis(stage_lut, lut.astype(np.intp), axis=1)
+
+    @override
+    def perturb_batch(
+        self,
+        *,
+        images: np.ndarray[Any, Any] | Sequence[np.ndarray[Any, Any]],
+        boxes_list: Sequence[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None] | None = None,
+        **kwargs: Any,
+    ) -> tuple[
+        np.ndarray[Any, Any] | list[np.ndarray[Any, Any]],
+        list[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None],
+    ]:
+        """Apply the sequence of perturbers to a batch of images, one batched stage at a time.
+
+        Args:
+            images:
+                The batch of input images to perturb.
+            boxes_list:
+                The bounding boxes for each input image.
+            kwargs:
+                Additional perturbation keyword arguments.
+
+        Returns:
+            The perturbed images and the bounding boxes for each image.
+        """
         if len(self.perturbers) == 0:
-            perturbed_image = copy.deepcopy(image)
-            perturbed_boxes = copy.deepcopy(boxes)
+            return super().perturb_batch(images=images, boxes_list=boxes_list, **kwargs)
 
-        return perturbed_image, perturbed_boxes
+        perturbed_images = images
+        perturbed_boxes_list = boxes_list
+        for perturber in self.perturbers:
+            perturbed_images, perturbed_boxes_list = perturber.perturb_batch(
+                images=perturbed_images,
+                boxes_list=perturbed_boxes_list,
+                **kwargs,
+            )
+
+        return perturbed_images, perturbed_boxes_list
 
     @override
     def get_config(self) -> dict[str, Any]:
         """Returns the configuration dictionary of the ComposePerturber instance."""
         cfg = super().get_config()
         cfg["perturbers"] = [to_config_dict(perturber) for perturber in self.perturbers]
+        cfg["fuse_blur"] = self.fuse_blur
         return cfg
 
     @classmethod
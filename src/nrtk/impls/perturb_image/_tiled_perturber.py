@@ -0,0 +1,333 @@
+"""Defines TiledPerturber to apply a perturber to a large image one overlapping tile at a time.
+
+Classes:
+    TiledPerturber: A perturbation class that splits an image into tiles with a halo of context, perturbs the tiles
+    on a thread pool and stitches the results back together.
+
+Dependencies:
+    - numpy: For numerical operations and array manipulation.
+    - smqtk_image_io.AxisAlignedBoundingBox: For handling bounding boxes.
+    - nrtk.interfaces.PerturbImage: Base class for perturbation algorithms.
+
+Example usage:
+    >>> from nrtk.impls.perturb_image.photometric.blur import GaussianBlurPerturber
+    >>> image = np.ones((4096, 4096, 3), dtype=np.uint8)
+    >>> perturber = TiledPerturber(perturber=GaussianBlurPerturber(ksize=5), tile_size=1024)
+    >>> perturbed_image, _ = perturber(image=image)
+"""
+
+from __future__ import annotations
+
+__all__ = ["TiledPerturber"]
+
+from collections.abc import Hashable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+from smqtk_core.configuration import (
+    from_config_dict,
+    to_config_dict,
+)
+from smqtk_image_io.bbox import AxisAlignedBoundingBox
+from typing_extensions import Self, override
+
+from nrtk.interfaces import PerturbImage
+from nrtk.interfaces._random_perturb_image import RandomPerturbImage
+
+
+class TiledPerturber(PerturbImage):
+    """Applies a perturber to an image one tile at a time, on a thread pool.
+
+    Each tile is perturbed together with a halo of surrounding pixels, which is cropped from the result, so that
+    pixels near tile edges see the same neighbourhood as they would in the whole image. For perturbers whose output
+    pixels only depend on the input pixels within ``halo`` of them, such as blurs, the stitched image matches
+    perturbing the whole image up to floating point rounding, while only ``max_workers`` tiles and their intermediate
+    arrays are held in memory at a time. The wrapped perturber must preserve the image size and be safe to call from
+    several threads. Use ``perturb_into()`` to stream memory-mapped images that do not fit in memory.
+
+    Each tile of a perturber with random stages, such as a random perturber or a ``ComposePerturber`` of any, draws
+    from its own generator, spawned in tile order from the random state of the call, so that tiles neither repeat the
+    same noise nor depend on the scheduling of the thread pool. The random state of the call is the ``rng`` or
+    ``seed`` given to it, or else one seeded with the seeds of the random stages, advanced by every call unless they
+    are all static, or unseeded if any has no seed. Images that fit in one tile are perturbed by the wrapped
+    perturber directly.
+
+    Attributes:
+        perturber (PerturbImage):
+            Perturber applied to each tile.
+        tile_size (int):
+            Height and width of the tiles, excluding their halo.
+        halo (int | None):
+            Width of the context added around each tile, or None to size it from the blur kernel of ``perturber``.
+        max_workers (int | None):
+            Maximum number of tiles perturbed concurrently, or None for the ``ThreadPoolExecutor`` default.
+    """
+
+    # Tiles are perturbed from the input and stitched into a separately allocated output
+    _copy_input = False
+
+    def __init__(
+        self,
+        *,
+        perturber: PerturbImage,
+        tile_size: int = 2048,
+        halo: int | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        """Initializes the TiledPerturber.
+
+        Args:
+            perturber:
+                Perturber applied to each tile. It must return images of the same height and width as its input.
+            tile_size:
+                Height and width of the tiles, excluding their halo.
+            halo:
+                Width of the context added around each tile. When None, it is half the size of the kernel given by
+                the perturber's ``_blur_kernel()``, as for the Gaussian and average blurs and the pyBSM OTF
+                perturbers that do not resample the image.
+            max_workers:
+                Maximum number of tiles perturbed concurrently. Defaults to the ``ThreadPoolExecutor`` default.
+
+        Raises:
+            ValueError: If tile_size is not positive or halo is negative.
+        """
+        super().__init__()
+        if tile_size < 1:
+            raise ValueError(f"tile_size must be positive, got {tile_size}")
+        if halo is not None and halo < 0:
+            raise ValueError(f"halo must not be negative, got {halo}")
+        self.perturber = perturber
+        self.tile_size = tile_size
+        self.halo = halo
+        self.max_workers = max_workers
+        self._set_seed()
+
+    def _set_seed(self) -> None:
+        """Seed the random state that the tiles of calls given no ``rng`` or ``seed`` are spawned from."""
+        seeds = [stage.seed for stage in self._random_stages()]
+        if None in seeds:
+            self._rng = np.random.default_rng()
+        else:
+            # A single random stage seeds the tiles as a generator seeded with its own seed would
+            self._rng = np.random.default_rng(seeds[0] if len(seeds) == 1 else seeds)
+
+    @override
+    def perturb(
+        self,
+        *,
+        image: np.ndarray[Any, Any],
+        boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None = None,
+        **kwargs: Any,
+    ) -> tuple[np.ndarray[Any, Any], Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]:
+        """Apply the wrapped perturber to each tile of the input image and stitch the results.
+
+        Args:
+            image:
+                Input image as a numpy array of shape (H, W) or (H, W, C).
+            boxes:
+                List of bounding boxes in AxisAlignedBoundingBox format and their corresponding classes.
+            kwargs:
+                Additional perturbation keyword arguments, given to the wrapped perturber for every tile. The
+                ``rng`` or ``seed`` of random perturbers is the random state the generators of the tiles are
+                spawned from.
+
+        Returns:
+            The stitched perturbed image and the source bounding boxes.
+
+        Raises:
+            ValueError: If the halo cannot be sized from the wrapped perturber, or if it changes the size of a tile.
+        """
+        h, w = image.shape[0], image.shape[1]
+        if h <= self.tile_size and w <= self.tile_size:
+            return self.perturber(image=image, boxes=boxes, **kwargs)
+
+        tile_rngs = self._tile_rngs(image=image, kwargs=kwargs)
+        image, perturbed_boxes = super().perturb(image=image, boxes=boxes, **kwargs)
+        halo = self._tile_halo(image=image, **kwargs)
+
+        # The first tile determines the dtype and channels of the output, which the others are written into
+        first = self._perturb_tile(image=image, y=0, x=0, halo=halo, rng=tile_rngs[0], **kwargs)
+        perturbed_image = np.empty((h, w, *first.shape[2:]), dtype=first.dtype)
+        self._stitch(image=image, out=perturbed_image, halo=halo, tile_rngs=tile_rngs, first=first, **kwargs)
+
+        return perturbed_image, perturbed_boxes
+
+    def perturb_into(
+        self,
+        *,
+        image: np.ndarray[Any, Any],
+        out: np.ndarray[Any, Any],
+        boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None = None,
+        **kwargs: Any,
+    ) -> tuple[np.ndarray[Any, Any], Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]:
+        """Apply the wrapped perturber to each tile of the input image, writing the results into ``out``.
+
+        This streams images that do not fit in memory: ``image`` and ``out`` may both be ``np.memmap`` arrays, for
+        example opened with ``np.lib.format.open_memmap()``. Tiles are processed in row-major order, so both arrays
+        are read and written one band of rows at a time, and only the tiles being perturbed are held in memory.
+
+        Args:
+            image:
+                Input image of shape (H, W) or (H, W, C).
+            out:
+                Preallocated output of the same height and width as ``image``, with the channels of the perturbed
+                image. Perturbed tiles are cast to its dtype.
+            boxes:
+                List of bounding boxes in AxisAlignedBoundingBox format and their corresponding classes.
+            kwargs:
+                Additional perturbation keyword arguments, given to the wrapped perturber for every tile. The
+                ``rng`` or ``seed`` of random perturbers is the random state the generators of the tiles are
+                spawned from.
+
+        Returns:
+            ``out``, holding the stitched perturbed image, and the source bounding boxes.
+
+        Raises:
+            ValueError: If ``out`` does not match the size of ``image``, if the halo cannot be sized from the wrapped
+                perturber, or if it changes the size of a tile.
+        """
+        if out.shape[:2] != image.shape[:2]:
+            raise ValueError(f"Output of shape {out.shape} does not match the size of the image {image.shape[:2]}")
+
+        tile_rngs = self._tile_rngs(image=image, kwargs=kwargs)
+        image, perturbed_boxes = super().perturb(image=image, boxes=boxes, **kwargs)
+        halo = self._tile_halo(image=image, **kwargs)
+        self._stitch(image=image, out=out, halo=halo, tile_rngs=tile_rngs, **kwargs)
+        if isinstance(out, np.memmap):
+            out.flush()
+
+        return out, perturbed_boxes
+
+    @override
+    def _random_stages(self) -> list[RandomPerturbImage]:
+        """Returns the random stages of the wrapped perturber."""
+        return self.perturber._random_stages()  # noqa: SLF001
+
+    def _tiles(self, image: np.ndarray[Any, Any]) -> list[tuple[int, int]]:
+        """Top-left corner of each tile of ``image``, in row-major order."""
+        return [
+            (y, x) for y in range(0, image.shape[0], self.tile_size) for x in range(0, image.shape[1], self.tile_size)
+        ]
+
+    def _tile_rngs(self, *, image: np.ndarray[Any, Any], kwargs: dict[str, Any]) -> list[np.random.Generator | None]:
+        """Random state of each tile of ``image``, taking the ``rng`` or ``seed`` of the call out of ``kwargs``.
+
+        Tiles of perturbers without random stages are given no random state, and the ``rng`` or ``seed`` of the
+        call, if any, is left in ``kwargs`` for them.
+
+        Raises:
+            ValueError: If both rng and seed are given.
+        """
+        count = len(self._tiles(image))
+        stages = self._random_stages()
+        if not stages:
+            return [None] * count
+        rng, seed = kwargs.pop("rng", None), kwargs.pop("seed", None)
+        if rng is not None and seed is not None:
+            raise ValueError("Only one of rng and seed may be given")
+        if rng is not None or seed is not None:
+            return list((rng or np.random.default_rng(seed)).spawn(count))
+
+        tile_rngs: list[np.random.Generator | None] = list(self._rng.spawn(count))
+        if all(stage.is_static for stage in stages):
+            self._set_seed()
+        return tile_rngs
+
+    def _stitch(
+        self,
+        *,
+        image: np.ndarray[Any, Any],
+        out: np.ndarray[Any, Any],
+        halo: int,
+        tile_rngs: list[np.random.Generator | None],
+        first: np.ndarray[Any, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Perturb every tile of ``image`` with its random state on the thread pool and write it into ``out``.
+
+        The perturbed first tile is written as given, if already computed.
+        """
+        tiles = list(zip(self._tiles(image), tile_rngs, strict=True))
+        if first is not None:
+            out[: first.shape[0], : first.shape[1]] = first
+            tiles = tiles[1:]
+
+        def _write_tile(tile: tuple[tuple[int, int], np.random.Generator | None]) -> None:
+            (y, x), rng = tile
+            perturbed_tile = self._perturb_tile(image=image, y=y, x=x, halo=halo, rng=rng, **kwargs)
+            out[y : y + perturbed_tile.shape[0], x : x + perturbed_tile.shape[1]] = perturbed_tile
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            # Consuming the results re-raises the first exception of any tile
+            list(pool.map(_write_tile, tiles))
+
+    def _tile_halo(self, *, image: np.ndarray[Any, Any], **kwargs: Any) -> int:
+        """Width of the context around each tile, sized from the wrapped perturber's kernel if not configured."""
+        if self.halo is not None or (image.shape[0] <= self.tile_size and image.shape[1] <= self.tile_size):
+            # A single tile needs no context
+            return self.halo or 0
+        kernel = self.perturber._blur_kernel(image=image, **kwargs)  # noqa: SLF001
+        if kernel is None:
+            raise ValueError(
+                f"{type(self.perturber).__name__} provides no blur kernel for this image, so halo must be given",
+            )
+        return max(kernel.shape) // 2
+
+    def _perturb_tile(
+        self,
+        *,
+        image: np.ndarray[Any, Any],
+        y: int,
+        x: int,
+        halo: int,
+        rng: np.random.Generator | None,
+        **kwargs: Any,
+    ) -> np.ndarray[Any, Any]:
+        """Perturb the tile at (y, x) along with its halo, drawing from ``rng`` if given, and crop the halo."""
+        h, w = image.shape[0], image.shape[1]
+        y0, y1 = max(y - halo, 0), min(y + self.tile_size + halo, h)
+        x0, x1 = max(x - halo, 0), min(x + self.tile_size + halo, w)
+        if rng is not None:
+            kwargs["rng"] = rng
+        out, _ = self.perturber(image=image[y0:y1, x0:x1], **kwargs)
+        if out.shape[:2] != (y1 - y0, x1 - x0):
+            raise ValueError(
+                f"{type(self.perturber).__name__} changed the size of a tile from {(y1 - y0, x1 - x0)} to "
+                f"{out.shape[:2]}, which cannot be stitched",
+            )
+        return out[y - y0 : min(y + self.tile_size, h) - y0, x - x0 : min(x + self.tile_size, w) - x0]
+
+    @override
+    def get_config(self) -> dict[str, Any]:
+        """Returns the configuration dictionary of the TiledPerturber instance."""
+        cfg = super().get_config()
+        cfg["perturber"] = to_config_dict(self.perturber)
+        cfg["tile_size"] = self.tile_size
+        cfg["halo"] = self.halo
+        cfg["max_workers"] = self.max_workers
+        return cfg
+
+    @classmethod
+    @override
+    def from_config(
+        cls,
+        config_dict: dict[str, Any],
+        merge_default: bool = True,
+    ) -> Self:
+        """Create a TiledPerturber instance from a configuration dictionary.
+
+        Args:
+            config_dict:
+                Configuration dictionary with the wrapped perturber details.
+            merge_default:
+                Whether to merge with the default configuration.
+
+        Returns:
+            An instance of TiledPerturber.
+        """
+        config_dict = dict(config_dict)
+
+        config_dict["perturber"] = from_config_dict(config=config_dict["perturber"], type_iter=PerturbImage.get_impls())
+
+        return super().from_config(config_dict, merge_default=merge_default)
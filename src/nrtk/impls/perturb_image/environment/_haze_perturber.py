@@ -19,7 +19,8 @@ from __future__ import annotations
 
 __all__ = ["HazePerturber"]
 
-from collections.abc import Hashable, Iterable
+from collections.abc import Hashable, Iterable, Sequence
+from copy import deepcopy
 from typing import Any
 
 import numpy as np
@@ -27,6 +28,7 @@ from smqtk_image_io.bbox import AxisAlignedBoundingBox
 from typing_extensions import override
 
 from nrtk.interfaces import PerturbImage
+from nrtk.utils._precision import float_dtype
 
 
 class HazePerturber(PerturbImage):
@@ -34,16 +36,24 @@ class HazePerturber(PerturbImage):
 
     Attributes:
         factor (float): Strength of haze applied to an image.
+        precision (str | None): Floating-point precision of the weathering, or None to follow the default precision.
     """
 
-    def __init__(self, factor: float = 1.0) -> None:
+    # Weathering is computed out of place
+    _copy_input = False
+
+    def __init__(self, factor: float = 1.0, *, precision: str | None = None) -> None:
         """HazePerturber applies haze to an input image.
 
         Attributes:
             factor: Strength of haze applied to an image.
+            precision: Floating-point precision, "float32" or "float64", of the weathering. If None, the default
+                precision set with ``nrtk.utils.set_default_precision()`` is used.
         """
         super().__init__()
         self.factor = factor
+        float_dtype(precision)
+        self.precision = precision
 
     @override
     def perturb(
@@ -75,28 +85,107 @@ class HazePerturber(PerturbImage):
             Image with haze applied and source bounding boxes.
         """
         perturbed_image, perturbed_boxes = super().perturb(image=image, boxes=boxes, **kwargs)
+        dtype = float_dtype(self.precision)
 
-        # Use either the provided depth map or a map containing all values = 1
-        if depth_map is None:
-            depth_map = np.ones_like(perturbed_image)
-        else:
-            if len(perturbed_image.shape) != len(depth_map.shape):
-                raise ValueError(
-                    f"image dims ({len(perturbed_image.shape)}) does not match depth_map dims ({len(depth_map.shape)})",
-                )
+        attenuation = self._attenuation(image=perturbed_image, depth_map=depth_map)
 
         # Use either the provided sky_color map or a map containing avg. pixel values
         if sky_color is None:
-            final_sky_color = np.mean(perturbed_image, axis=(0, 1))
+            final_sky_color = np.mean(perturbed_image, axis=(0, 1)).astype(dtype)
         else:
             final_sky_color = self._check_sky_color(image=perturbed_image, sky_color=sky_color)
 
-        # Beer's Law of Attenuation based on the haze factor and depth map
-        attenuation = np.exp(-self.factor * depth_map)
-        perturbed_image = perturbed_image * attenuation + final_sky_color * (1 - attenuation)
+        final_sky_color = np.asarray(final_sky_color, dtype=dtype)
+        perturbed_image = perturbed_image.astype(dtype) * attenuation + final_sky_color * (1 - attenuation)
 
         return perturbed_image.astype(np.uint8), perturbed_boxes
 
+    @override
+    def perturb_batch(
+        self,
+        *,
+        images: np.ndarray[Any, Any] | Sequence[np.ndarray[Any, Any]],
+        boxes_list: Sequence[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None] | None = None,
+        depth_map: np.ndarray[Any, Any] | None = None,
+        sky_color: list[float] | None = None,
+        **kwargs: Any,
+    ) -> tuple[
+        np.ndarray[Any, Any] | list[np.ndarray[Any, Any]],
+        list[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None],
+    ]:
+        """Apply haze to a stacked batch of images, sharing ``depth_map`` and ``sky_color`` across the batch.
+
+        Without a ``sky_color``, each image is weathered towards its own average pixel value, as in ``perturb()``.
+        Batches given as a sequence of arrays are perturbed one image at a time.
+        """
+        if not isinstance(images, np.ndarray) or len(images) == 0:
+            return super().perturb_batch(
+                images=images,
+                boxes_list=boxes_list,
+                depth_map=depth_map,
+                sky_color=sky_color,
+                **kwargs,
+            )
+
+        boxes_list = self._batch_boxes_list(images=images, boxes_list=boxes_list)
+        dtype = float_dtype(self.precision)
+        attenuation = self._attenuation(image=images[0], depth_map=depth_map)
+
+        if sky_color is None:
+            # Averaged one image at a time so the result matches perturb() exactly
+            final_sky_color = np.expand_dims(
+                np.stack([np.mean(image, axis=(0, 1)).astype(dtype) for image in images]),
+                axis=(1, 2),
+            )
+        else:
+            final_sky_color = self._check_sky_color(image=images[0], sky_color=sky_color)
+
+        final_sky_color = np.asarray(final_sky_color, dtype=dtype)
+        perturbed_images = images.astype(dtype) * attenuation + final_sky_color * (1 - attenuation)
+
+        return perturbed_images.astype(np.uint8), [deepcopy(boxes) for boxes in boxes_list]
+
+    @override
+    def _pointwise_lut(
+        self,
+        *,
+        image: np.ndarray[Any, Any],
+        lut: np.ndarray[Any, Any],
+        depth_map: np.ndarray[Any, Any] | None = None,
+        sky_color: list[float] | None = None,
+        **kwargs: Any,
+    ) -> np.ndarray[Any, Any] | None:
+        # Only a uniform depth attenuates every pixel alike
+        if depth_map is not None or image.dtype != np.uint8:
+            return None
+
+        dtype = float_dtype(self.precision)
+        attenuation = self._attenuation(image=image[:1, :1], depth_map=None).reshape(-1, 1)
+
+        if sky_color is None:
+            # Average pixel value of the mapped image, computed from the histogram of each channel
+            channels = image.reshape(-1, len(lut))
+            histograms = [np.bincount(channels[:, c], minlength=256) for c in range(len(lut))]
+            final_sky_color = np.array([histogram @ lut[c] for c, histogram in enumerate(histograms)]) / len(channels)
+        else:
+            final_sky_color = np.asarray(self._check_sky_color(image=image, sky_color=sky_color))
+        final_sky_color = final_sky_color.astype(dtype).reshape(-1, 1)
+
+        return (np.arange(256, dtype=dtype) * attenuation + final_sky_color * (1 - attenuation)).astype(np.uint8)
+
+    def _attenuation(self, *, image: np.ndarray, depth_map: np.ndarray | None) -> np.ndarray:
+        # Use either the provided depth map or a map containing all values = 1
+        dtype = float_dtype(self.precision)
+        if depth_map is None:
+            depth_map = np.ones(image.shape, dtype=dtype)
+        elif len(image.shape) != len(depth_map.shape):
+            raise ValueError(
+                f"image dims ({len(image.shape)}) does not match depth_map dims ({len(depth_map.shape)})",
+            )
+
+        # Beer's Law of Attenuation based on the haze factor and depth map
+        return np.exp(-self.factor * depth_map.astype(dtype, copy=False)).astype(dtype, copy=False)
+
     def _check_sky_color(self, *, image: np.ndarray, sky_color: list[float]) -> list[float]:
         if (len(image.shape) == 3 and len(sky_color) != 3) or (len(image.shape) == 2 and len(sky_color) != 1):
             raise ValueError(
@@ -109,4 +198,5 @@ class HazePerturber(PerturbImage):
         """Returns the current configuration of the HazePerturber instance."""
         cfg = super().get_config()
         cfg["factor"] = self.factor
+        cfg["precision"] = self.precision
         return cfg
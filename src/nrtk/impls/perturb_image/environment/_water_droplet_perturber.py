@@ -43,10 +43,10 @@ from __future__ import annotations
 
 __all__ = ["WaterDropletPerturber"]
 
-import copy
 import math
 import warnings
 from collections.abc import Hashable, Iterable, Sequence
+from copy import copy
 from typing import Any, Protocol
 
 import numba
@@ -58,6 +58,7 @@ from smqtk_image_io.bbox import AxisAlignedBoundingBox
 from typing_extensions import override
 
 from nrtk.impls.perturb_image._base._numpy_random_perturb_image import NumpyRandomPerturbImage
+from nrtk.utils._precision import float_dtype
 
 
 def points_in_polygon_impl(*, points: np.ndarray, polygon: np.ndarray) -> np.ndarray:
@@ -369,8 +370,13 @@ class WaterDropletPerturber(NumpyRandomPerturbImage):
             Random seed for reproducibility. None for non-deterministic behavior.
         is_static (bool):
             If True, resets RNG after each call for consistent results.
+        precision (str | None):
+            Floating-point precision of the blur, or None to follow the default precision.
     """
 
+    # render() and blur() allocate their own buffers
+    _copy_input = False
+
     def __init__(
         self,
         *,
@@ -384,6 +390,7 @@ class WaterDropletPerturber(NumpyRandomPerturbImage):
         f_y: int = 400,
         seed: int | None = None,
         is_static: bool = False,
+        precision: str | None = None,
     ) -> None:
         """Initializes the WaterDropletPerturber.
 
@@ -413,6 +420,9 @@ class WaterDropletPerturber(NumpyRandomPerturbImage):
             is_static:
                 If True and seed is provided, resets RNG after each perturb call for consistent
                 results across multiple calls (useful for video frame processing).
+            precision:
+                Floating-point precision, "float32" or "float64", of the blur. If None, the default precision set
+                with ``nrtk.utils.set_default_precision()`` is used.
 
             If any of the parameters are absent, the following values will be set
             as defaults:
@@ -427,6 +437,7 @@ class WaterDropletPerturber(NumpyRandomPerturbImage):
             f_y = 400
             seed = None
             is_static = False
+            precision = None
         """
         if size_range[0] < 0.1 or size_range[1] < 0.1:
             warnings.warn(
@@ -444,6 +455,8 @@ class WaterDropletPerturber(NumpyRandomPerturbImage):
         self.n_water = n_water
         self.f_x = f_x
         self.f_y = f_y
+        float_dtype(precision)
+        self.precision = precision
         # super().__init__ is called last so that all attributes exist when
         # _set_seed() is invoked during RandomPerturbImage.__init__.
         super().__init__(seed=seed, is_static=is_static)
@@ -860,7 +873,7 @@ class WaterDropletPerturber(NumpyRandomPerturbImage):
         # Also initializes the function that perturbs the spheres
         q = self._in_sphere_raindrop(gls)
 
-        rain_image = copy.deepcopy(image)
+        rain_image = np.copy(image)
         for idx in np.unique(q):
             if idx != -1:
                 idx_int = int(idx)
@@ -926,18 +939,18 @@ class WaterDropletPerturber(NumpyRandomPerturbImage):
         Returns:
             Output of blur operation applied on the `rain_image`.
         """
-        blur_image = copy.deepcopy(rain_image)
         _, w = image.shape[:2]
-        blur_back = copy.deepcopy(rain_image)
         blur_values = [w / 40, w / 60]
         blur_values_adj = [int(np.floor(val / 2) * 2 + 1) for val in blur_values]
 
-        blur_image = self._apply_gaussian(image=blur_image, sigma=w / 150, ksize=blur_values_adj[0])
+        # _apply_gaussian always returns a new array, so rain_image can be read directly
+        blur_image = self._apply_gaussian(image=rain_image, sigma=w / 150, ksize=blur_values_adj[0])
 
         # Blur the background of the image using the desired blur strength
-        blur_back = self._apply_gaussian(image=blur_back, sigma=1.5, ksize=7)
+        blur_back = self._apply_gaussian(image=rain_image, sigma=1.5, ksize=7)
 
-        blur_back = self.blur_strength * blur_back + (1 - self.blur_strength) * rain_image
+        dtype = float_dtype(self.precision)
+        blur_back = self.blur_strength * blur_back.astype(dtype) + (1 - self.blur_strength) * rain_image.astype(dtype)
         # Blur mask to help make the boundaries of the droplets appear "fuzzier"
         mask = self._apply_gaussian(image=mask, sigma=w / 125, ksize=blur_values_adj[1])
 
@@ -947,20 +960,21 @@ class WaterDropletPerturber(NumpyRandomPerturbImage):
 
     def _apply_gaussian(self, *, image: np.ndarray[Any, Any], sigma: float, ksize: int) -> np.ndarray[Any, Any]:
         truncate = (ksize - 1) / 2 / sigma
+        dtype = float_dtype(self.precision)
         if image.ndim == 2:
             # Grayscale
             blurred = gaussian_filter(
-                image.astype(np.float64),
+                image.astype(dtype),
                 sigma=sigma,
                 truncate=truncate,
                 mode="grid-wrap",
             )
         else:
             # Color image – apply Gaussian to each channel independently
-            blurred = np.empty_like(image, dtype=np.float64)
+            blurred = np.empty_like(image, dtype=dtype)
             for c in range(image.shape[2]):
                 blurred[..., c] = gaussian_filter(
-                    image[..., c].astype(np.float64),
+                    image[..., c].astype(dtype),
                     sigma=sigma,
                     truncate=truncate,
                     mode="grid-wrap",
@@ -991,7 +1005,16 @@ class WaterDropletPerturber(NumpyRandomPerturbImage):
         """
         perturbed_image, perturbed_boxes = super().perturb(image=image, boxes=boxes, **kwargs)
 
-        rain_image, mask = self.render(image=perturbed_image)
+        call_rng = self._call_rng
+        if call_rng is None:
+            rain_image, mask = self.render(image=perturbed_image)
+        else:
+            # render() keeps the droplets on the perturber, so a call given its own random state draws the glass and
+            # background planes and the droplets on a copy that concurrent calls do not share
+            droplets = copy(self)
+            with droplets._call_rng_scope(rng=call_rng, seed=None):  # noqa: SLF001 - copy of self
+                droplets._initialize_derived_parameters()  # noqa: SLF001 - copy of self
+                rain_image, mask = droplets.render(image=perturbed_image)
         perturbed_image = self.blur(
             image=perturbed_image,
             rain_image=rain_image,
@@ -1020,6 +1043,7 @@ class WaterDropletPerturber(NumpyRandomPerturbImage):
         cfg["n_water"] = self.n_water
         cfg["f_x"] = self.f_x
         cfg["f_y"] = self.f_y
+        cfg["precision"] = self.precision
 
         return cfg
 
@@ -74,6 +74,9 @@ class DiffusionPerturber(TorchRandomPerturbImage):
         Images will be resized to a minimum dimension of 256 pixels and dimensions
         divisible by 8 for optimal diffusion model performance.
         Device selection is automatic: CUDA is used if available, otherwise CPU.
+        A per-call ``rng`` or ``seed`` makes a call reproducible, but the diffusion
+        pipeline keeps scheduler state while it runs, so calls to one instance must
+        not run concurrently.
     """
 
     def __init__(
@@ -29,6 +29,7 @@ from smqtk_image_io.bbox import AxisAlignedBoundingBox
 from typing_extensions import override
 
 from nrtk.impls.perturb_image._base._numpy_random_perturb_image import NumpyRandomPerturbImage
+from nrtk.interfaces import BoxArray
 
 
 class RandomCropPerturber(NumpyRandomPerturbImage):
@@ -40,6 +41,9 @@ class RandomCropPerturber(NumpyRandomPerturbImage):
         is_static (bool): If True, resets RNG after each call for consistent results.
     """
 
+    # Every branch of perturb() returns its own copy of the (cropped) image
+    _copy_input = False
+
     def __init__(
         self,
         *,
@@ -76,6 +80,15 @@ class RandomCropPerturber(NumpyRandomPerturbImage):
         crop_h: int,
     ) -> Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]]:
         """Compute the intersect-shifted bbox coordinates."""
+        if isinstance(boxes, BoxArray):
+            return RandomCropPerturber._compute_box_array(
+                boxes=boxes,
+                crop_x=crop_x,
+                crop_y=crop_y,
+                crop_w=crop_w,
+                crop_h=crop_h,
+            )
+
         adjusted_bboxes = []
         for bbox, metadata in boxes:
             crop_box = AxisAlignedBoundingBox(
@@ -98,6 +111,27 @@ class RandomCropPerturber(NumpyRandomPerturbImage):
                 adjusted_bboxes.append((adjusted_box, deepcopy(metadata)))
         return adjusted_bboxes
 
+    @staticmethod
+    def _compute_box_array(
+        *,
+        boxes: BoxArray,
+        crop_x: int,
+        crop_y: int,
+        crop_w: int,
+        crop_h: int,
+    ) -> BoxArray:
+        """Compute the intersect-shifted bbox coordinates for all boxes of a BoxArray at once.
+
+        Boxes that do not overlap the crop region are dropped, as in ``_compute_bboxes``.
+        """
+        crop_min = np.array([crop_y, crop_x])
+        crop_max = crop_min + (crop_h, crop_w)
+        intersected_min = np.maximum(boxes.coords[:, 0:2], crop_min)
+        intersected_max = np.minimum(boxes.coords[:, 2:4], crop_max)
+        keep = np.min(intersected_max - intersected_min, axis=1) > 0
+        coords = np.hstack((intersected_min - crop_min, intersected_max - crop_min))
+        return boxes.with_coords(coords[keep], keep=keep)
+
     def perturb(
         self,
         *,
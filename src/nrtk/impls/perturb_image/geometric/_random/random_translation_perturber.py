@@ -22,6 +22,7 @@ __all__ = ["RandomTranslationPerturber"]
 
 from collections.abc import Hashable, Iterable, Sequence
 from copy import deepcopy
+from functools import partial
 from typing import Any
 
 import numpy as np
@@ -29,6 +30,8 @@ from smqtk_image_io.bbox import AxisAlignedBoundingBox
 from typing_extensions import override
 
 from nrtk.impls.perturb_image._base._numpy_random_perturb_image import NumpyRandomPerturbImage
+from nrtk.interfaces import BoxArray
+from nrtk.interfaces._warp_map import WarpMap
 
 
 class RandomTranslationPerturber(NumpyRandomPerturbImage):
@@ -43,6 +46,9 @@ class RandomTranslationPerturber(NumpyRandomPerturbImage):
             Background color fill for RGB image.
     """
 
+    # The region left in view is copied into a separately allocated output
+    _copy_input = False
+
     def __init__(
         self,
         *,
@@ -72,7 +78,7 @@ class RandomTranslationPerturber(NumpyRandomPerturbImage):
         self.color_fill: np.ndarray[np.int64, Any] = np.array(color_fill)
 
     @override
-    def perturb(  # noqa: C901 - translation logic with directional boundary checks
+    def perturb(
         self,
         *,
         image: np.ndarray[Any, Any],
@@ -96,15 +102,103 @@ class RandomTranslationPerturber(NumpyRandomPerturbImage):
         Returns:
             Translated image with the modified bounding boxes.
         """
-        perturbed_image, perturbed_boxes = super().perturb(image=image, boxes=boxes, **kwargs)
+        perturbed_image, _ = super().perturb(image=image, boxes=boxes, **kwargs)
+
+        translate_x, translate_y = self._sample_translation(
+            shape=perturbed_image.shape,
+            max_translation_limit=max_translation_limit,
+        )
+
+        # Apply background color fill based on the number of image dimensions
+        final_image = np.empty_like(perturbed_image)
+        final_image[...] = self._fill_value(ndim=perturbed_image.ndim, dtype=perturbed_image.dtype)
+        self._translate_into(image=perturbed_image, out=final_image, translate_x=translate_x, translate_y=translate_y)
+
+        perturbed_boxes = self._translate_boxes(boxes=boxes, translate_x=translate_x, translate_y=translate_y)
+        return final_image, perturbed_boxes
+
+    @override
+    def perturb_batch(
+        self,
+        *,
+        images: np.ndarray[Any, Any] | Sequence[np.ndarray[Any, Any]],
+        boxes_list: Sequence[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None] | None = None,
+        max_translation_limit: tuple[int, int] | None = None,
+        **kwargs: Any,
+    ) -> tuple[
+        np.ndarray[Any, Any] | list[np.ndarray[Any, Any]],
+        list[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None],
+    ]:
+        """Randomly translates each image of a stacked batch into a single preallocated output array.
+
+        Translations are drawn in the same order as successive ``perturb()`` calls would draw them. Batches given
+        as a sequence of arrays, and static perturbers, are perturbed one image at a time.
+        """
+        if not isinstance(images, np.ndarray) or self._resets_seed:
+            return super().perturb_batch(
+                images=images,
+                boxes_list=boxes_list,
+                max_translation_limit=max_translation_limit,
+                **kwargs,
+            )
+
+        boxes_list = self._batch_boxes_list(images=images, boxes_list=boxes_list)
+        final_images = np.empty_like(images)
+        final_images[...] = self._fill_value(ndim=images.ndim - 1, dtype=images.dtype)
+
+        perturbed_boxes = []
+        for image, boxes, final_image in zip(images, boxes_list, final_images, strict=True):
+            translate_x, translate_y = self._sample_translation(
+                shape=image.shape,
+                max_translation_limit=max_translation_limit,
+            )
+            self._translate_into(image=image, out=final_image, translate_x=translate_x, translate_y=translate_y)
+            perturbed_boxes.append(self._translate_boxes(boxes=boxes, translate_x=translate_x, translate_y=translate_y))
+
+        return final_images, perturbed_boxes
 
+    @override
+    def _warp_map(
+        self,
+        *,
+        image: np.ndarray[Any, Any],
+        max_translation_limit: tuple[int, int] | None = None,
+        **kwargs: Any,
+    ) -> WarpMap | None:
+        # perturb() resets the random state before drawing the translation
+        if self._resets_seed:
+            self._set_seed()
+        translate_x, translate_y = self._sample_translation(
+            shape=image.shape,
+            max_translation_limit=max_translation_limit,
+        )
+
+        h, w = image.shape[0], image.shape[1]
+        return WarpMap(
+            index=WarpMap.source_index(
+                x=np.arange(w) - translate_x,
+                y=(np.arange(h) - translate_y)[:, np.newaxis],
+                shape=(h, w),
+            ),
+            shape=(h, w),
+            fills=[self._fill_value(ndim=image.ndim, dtype=image.dtype)],
+            box_transforms=[partial(self._translate_boxes, translate_x=translate_x, translate_y=translate_y)],
+        )
+
+    def _sample_translation(
+        self,
+        *,
+        shape: tuple[int, ...],
+        max_translation_limit: tuple[int, int] | None,
+    ) -> tuple[int, int]:
+        """Randomly select the (x, y) translation magnitude for an image of the given shape."""
         if max_translation_limit is None:
-            translate_h, translate_w = (perturbed_image.shape[0], perturbed_image.shape[1])
+            translate_h, translate_w = (shape[0], shape[1])
         else:
             translate_h, translate_w = max_translation_limit
 
-        if abs(translate_h) > perturbed_image.shape[0] or abs(translate_w) > perturbed_image.shape[1]:
-            raise ValueError(f"Max translation limit should be less than or equal to {perturbed_image.shape[:2]}")
+        if abs(translate_h) > shape[0] or abs(translate_w) > shape[1]:
+            raise ValueError(f"Max translation limit should be less than or equal to {shape[:2]}")
 
         # Randomly select the translation magnitude for each direction
         translate_x, translate_y = (0, 0)
@@ -112,31 +206,43 @@ class RandomTranslationPerturber(NumpyRandomPerturbImage):
             translate_x = self._rng.integers(low=-translate_w, high=translate_w)
         if translate_h > 0:
             translate_y = self._rng.integers(low=-translate_h, high=translate_h)
+        return translate_x, translate_y
 
-        # Apply background color fill based on the number of image dimensions
-        if perturbed_image.ndim == 3:
-            final_image = np.full_like(
-                perturbed_image,
-                self.color_fill.astype(perturbed_image.dtype),
-                dtype=perturbed_image.dtype,
-            )
-        else:
-            final_image = np.zeros_like(perturbed_image, dtype=perturbed_image.dtype)
-
-        # Perform the translation
-        translated_image = np.roll(perturbed_image.copy(), (translate_y, translate_x), axis=[0, 1])
-
-        # Apply the valid translated image region to the final background image
-        if translate_x >= 0 and translate_y >= 0:
-            final_image[translate_y:, translate_x:, ...] = translated_image[translate_y:, translate_x:, ...]
-        elif translate_x < 0 and translate_y >= 0:
-            final_image[translate_y:, :translate_x, ...] = translated_image[translate_y:, :translate_x, ...]
-        elif translate_x >= 0 and translate_y < 0:
-            final_image[:translate_y, translate_x:, ...] = translated_image[:translate_y, translate_x:, ...]
-        else:
-            final_image[:translate_y, :translate_x, ...] = translated_image[:translate_y, :translate_x, ...]
+    def _fill_value(self, *, ndim: int, dtype: np.dtype[Any]) -> np.ndarray[Any, Any]:
+        """Background color fill based on the number of image dimensions."""
+        if ndim == 3:
+            return self.color_fill.astype(dtype)
+        return np.zeros((), dtype=dtype)
+
+    @staticmethod
+    def _translate_into(
+        *,
+        image: np.ndarray[Any, Any],
+        out: np.ndarray[Any, Any],
+        translate_x: int,
+        translate_y: int,
+    ) -> None:
+        """Copy the region of ``image`` that remains in view after the translation into ``out``."""
+        h, w = image.shape[0], image.shape[1]
+        out[max(translate_y, 0) : h + min(translate_y, 0), max(translate_x, 0) : w + min(translate_x, 0), ...] = image[
+            max(-translate_y, 0) : h - max(translate_y, 0),
+            max(-translate_x, 0) : w - max(translate_x, 0),
+            ...,
+        ]
+
+    @staticmethod
+    def _translate_boxes(  # noqa: C901 - boundary checks for each bounding box coordinate
+        *,
+        boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None,
+        translate_x: int,
+        translate_y: int,
+    ) -> list[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | BoxArray:
+        """Adjust bounding boxes to follow the translation."""
+        if isinstance(boxes, BoxArray):
+            # Same boundary conditions as below, applied to every coordinate at once
+            shifted = boxes.coords + (translate_x, translate_y, translate_x, translate_y)
+            return boxes.with_coords(np.where(shifted < 0, 0, np.minimum(shifted, boxes.coords[:, [2, 3, 2, 3]])))
 
-        # Adjust bounding boxes
         perturbed_boxes = []
         if boxes is not None:
             for bbox, metadata in boxes:
@@ -178,8 +284,7 @@ class RandomTranslationPerturber(NumpyRandomPerturbImage):
                 adjusted_box = AxisAlignedBoundingBox(min_vertex=shifted_min, max_vertex=shifted_max)
                 perturbed_boxes.append((adjusted_box, deepcopy(metadata)))
 
-        perturbed_image = final_image
-        return perturbed_image, perturbed_boxes
+        return perturbed_boxes
 
     @override
     def get_config(self) -> dict[str, Any]:
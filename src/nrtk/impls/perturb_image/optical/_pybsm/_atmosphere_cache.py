@@ -0,0 +1,115 @@
+"""On-disk cache of the interpolated MODTRAN atmospheres of pyBSM scenarios.
+
+Scenarios constructed with ``interp=True`` interpolate the atmosphere database of pyBSM for their altitude and ground
+range, which every process repeats for every scenario. When a cache directory is set, interpolated atmospheres are
+stored there as ``.npy`` files keyed by haze, altitude and ground range, and read back memory-mapped and read-only,
+so processes sharing the directory share both the work and the pages. ``precompute_atmospheres`` fills the cache for
+a grid of altitudes and ground ranges ahead of a sweep.
+
+The cache directory is set with ``set_atmosphere_cache_dir``, or for processes that do not set it, such as spawned
+workers, with the ``NRTK_ATMOSPHERE_CACHE_DIR`` environment variable.
+
+Example:
+    set_atmosphere_cache_dir("/tmp/nrtk-atmospheres")
+    precompute_atmospheres(ihaze=1, altitudes=[1000.0, 1500.0], ground_ranges=np.linspace(0.0, 5000.0, 11))
+"""
+
+from __future__ import annotations
+
+__all__ = ["cached_atmosphere", "get_atmosphere_cache_dir", "precompute_atmospheres", "set_atmosphere_cache_dir"]
+
+import itertools
+import os
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pybsm
+from pybsm import utils
+
+from nrtk.impls.perturb_image.optical._pybsm._cache_files import CacheDir, write_atomically
+
+_CACHE_DIR = CacheDir(variable="NRTK_ATMOSPHERE_CACHE_DIR")
+
+
+def get_atmosphere_cache_dir() -> Path | None:
+    """Returns the directory interpolated atmospheres are cached in, or None if they are not cached."""
+    return _CACHE_DIR.get()
+
+
+def set_atmosphere_cache_dir(cache_dir: str | os.PathLike[str] | None) -> None:
+    """Set the directory interpolated atmospheres are cached in.
+
+    Args:
+        cache_dir:
+            Directory to cache in, created on first use, or None to follow the ``NRTK_ATMOSPHERE_CACHE_DIR``
+            environment variable, and not cache if it is unset.
+    """
+    _CACHE_DIR.set(cache_dir)
+
+
+def _path(*, cache_dir: Path, ihaze: int, altitude: float, ground_range: float) -> Path:
+    """File of the atmosphere for the given haze, altitude and ground range, under a directory per pyBSM version."""
+    name = f"ihaze{int(ihaze)}_altitude{float(altitude)!r}_range{float(ground_range)!r}.npy"
+    return cache_dir / f"pybsm-{pybsm.__version__}" / name
+
+
+def _store(*, path: Path, ihaze: int, altitude: float, ground_range: float) -> None:
+    """Interpolate the atmosphere and write it to ``path`` atomically, so readers never see a partial file."""
+    atm = utils.load_database_atmosphere(altitude=altitude, ground_range=ground_range, ihaze=ihaze)
+    write_atomically(path=path, write=lambda file: np.save(file, atm))
+
+
+def cached_atmosphere(*, ihaze: int, altitude: float, ground_range: float) -> np.ndarray[Any, Any] | None:
+    """Interpolated atmosphere from the cache, interpolated and stored first if missing.
+
+    Args:
+        ihaze:
+            MODTRAN code for visibility.
+        altitude:
+            Sensor height above ground level in meters.
+        ground_range:
+            Distance on the ground between the target and sensor in meters.
+
+    Returns:
+        The atmosphere, as returned by ``pybsm.utils.load_database_atmosphere``, memory-mapped read-only, or None if
+        no cache directory is set.
+    """
+    cache_dir = get_atmosphere_cache_dir()
+    if cache_dir is None:
+        return None
+    path = _path(cache_dir=cache_dir, ihaze=ihaze, altitude=altitude, ground_range=ground_range)
+    if not path.exists():
+        _store(path=path, ihaze=ihaze, altitude=altitude, ground_range=ground_range)
+    return np.load(path, mmap_mode="r")
+
+
+def precompute_atmospheres(*, ihaze: int, altitudes: Iterable[float], ground_ranges: Iterable[float]) -> int:
+    """Cache the interpolated atmospheres of every altitude and ground range of a grid.
+
+    Args:
+        ihaze:
+            MODTRAN code for visibility.
+        altitudes:
+            Sensor heights above ground level in meters.
+        ground_ranges:
+            Distances on the ground between the target and sensor in meters.
+
+    Returns:
+        Number of atmospheres interpolated, leaving out those already cached.
+
+    Raises:
+        ValueError:
+            If no cache directory is set.
+    """
+    cache_dir = get_atmosphere_cache_dir()
+    if cache_dir is None:
+        raise ValueError(f"No atmosphere cache directory is set, see set_atmosphere_cache_dir or {_CACHE_DIR.variable}")
+    count = 0
+    for altitude, ground_range in itertools.product(list(altitudes), list(ground_ranges)):
+        path = _path(cache_dir=cache_dir, ihaze=ihaze, altitude=altitude, ground_range=ground_range)
+        if not path.exists():
+            _store(path=path, ihaze=ihaze, altitude=altitude, ground_range=ground_range)
+            count += 1
+    return count
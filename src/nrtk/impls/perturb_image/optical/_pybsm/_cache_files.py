@@ -0,0 +1,75 @@
+"""Directories and atomic writes of the files that pyBSM perturbers share between processes.
+
+Classes:
+    CacheDir: Directory set by the process, or for processes that do not set one, named by an environment variable.
+
+Functions:
+    write_atomically: Write a file through a temporary file in the same directory, so readers never see it partial.
+
+Note:
+    This is a private implementation detail of the atmosphere cache and the OTF bundles.
+"""
+
+from __future__ import annotations
+
+__all__ = ["CacheDir", "write_atomically"]
+
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import IO
+
+
+class CacheDir:
+    """Directory set by the process, or else named by an environment variable.
+
+    The variable gives the directory to processes that do not set one, such as spawned workers.
+
+    Attributes:
+        variable (str):
+            Environment variable naming the directory of processes that do not set one.
+        path (Path | None):
+            Directory set by the process, or None to follow the environment variable.
+    """
+
+    def __init__(self, *, variable: str) -> None:
+        """Initialize a directory that is not set, and so follows ``variable``.
+
+        Args:
+            variable:
+                Environment variable naming the directory of processes that do not set one.
+        """
+        self.variable = variable
+        self.path: Path | None = None
+
+    def get(self) -> Path | None:
+        """Returns the directory set by the process, else the one named by the variable, else None."""
+        if self.path is not None:
+            return self.path
+        variable = os.environ.get(self.variable)
+        return Path(variable) if variable else None
+
+    def set(self, path: str | os.PathLike[str] | None) -> None:
+        """Set the directory, or None to follow the environment variable."""
+        self.path = None if path is None else Path(path)
+
+
+def write_atomically(*, path: Path, write: Callable[[IO[bytes]], None]) -> None:
+    """Write ``path`` with ``write``, through a temporary file replacing it once complete.
+
+    Args:
+        path:
+            File to write, replaced if it exists. Its directory is created if missing.
+        write:
+            Function writing the contents of the file to the open binary file it is given.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as file:
+        try:
+            write(file)
+        except BaseException:
+            file.close()
+            os.unlink(file.name)
+            raise
+    os.replace(file.name, path)
@@ -0,0 +1,658 @@
+"""System OTF simulator keeping its most expensive derived state for reuse by simulators of similar systems.
+
+Classes:
+    ComponentOTFSimulator: ``SystemOTFSimulator`` that keeps the wavelength-weighted component OTFs, system OTF and
+    native PSF it computes, and takes those of a previous simulator, with its atmosphere and frequency grid, that a
+    change of sensor or scenario parameters leaves valid. PSFs and transfer functions are shared by all simulators of
+    the same system, and batches of images of one size and GSD are blurred with stacked FFTs.
+
+Dependencies:
+    - pyBSM for the OTF and image simulation functions.
+    - scipy for the FFTs and PSF resampling, as used by pyBSM.
+"""
+
+from __future__ import annotations
+
+__all__: list[str] = []
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from typing import Any, Literal, NamedTuple, cast
+
+import numpy as np
+from PIL import Image
+from pybsm.otf import functional as otf
+from pybsm.simulation import SystemOTFSimulator
+from pybsm.simulation.image_simulator import _apply_noise2d, _apply_noise3d
+from pybsm.simulation.scenario import Scenario
+from scipy import fft
+from scipy.ndimage import zoom
+from typing_extensions import override
+
+from nrtk.impls.perturb_image.optical._pybsm._atmosphere_cache import cached_atmosphere
+from nrtk.impls.perturb_image.optical._pybsm._polychromatic_otf import (
+    polychromatic_aperture_otf,
+    polychromatic_turbulence_otf,
+    polychromatic_wavefront_otf,
+)
+from nrtk.utils._incremental import changed_values, stale_state, state_inputs
+
+# Derived state of the simulator, with the sensor and scenario attributes, values computed by the simulator and other
+# derived state that each piece is computed from
+_DERIVED_STATE: dict[str, frozenset[str]] = {
+    "atmosphere": frozenset({"ihaze", "altitude", "ground_range", "interp"}),
+    "frequency_grid": frozenset({"cutoff_frequency"}),
+    "ap_OTF": frozenset({"frequency_grid", "mtf_wavelengths", "mtf_weights", "D", "eta"}),
+    "turb_OTF": frozenset(
+        {
+            "frequency_grid",
+            "mtf_wavelengths",
+            "mtf_weights",
+            "altitude",
+            "slant_range",
+            "D",
+            "ha_wind_speed",
+            "cn2_at_1m",
+            "int_time",
+            "n_tdi",
+            "aircraft_speed",
+        },
+    ),
+    "wav_OTF": frozenset({"frequency_grid", "mtf_wavelengths", "mtf_weights", "pv", "pv_wavelength", "L_x", "L_y"}),
+    "system_OTF": frozenset(
+        {
+            "ap_OTF",
+            "turb_OTF",
+            "wav_OTF",
+            "frequency_grid",
+            "w_x",
+            "w_y",
+            "f",
+            "p_x",
+            "s_x",
+            "s_y",
+            "da_x",
+            "da_y",
+            "int_time",
+            "n_tdi",
+            "filter_kernel",
+        },
+    ),
+    "native_PSF": frozenset({"system_OTF"}),
+    "psf": frozenset({"native_PSF", "frequency_grid", "slant_range"}),
+    "resampling": frozenset({"p_x", "p_y", "f", "slant_range"}),
+}
+
+# Bounds of the caches shared by all simulators, in native PSFs (the size of the frequency grid, 18 MB each), PSFs
+# (tens of kB each) and transfer functions (FFTs of a PSF padded to the size of an image, a few MB each)
+_NATIVE_PSF_CACHE_SIZE = 2
+_PSF_CACHE_SIZE = 64
+_TRANSFER_CACHE_SIZE = 8
+
+# Number of pixels converted to uint8 at a time, which keeps the intermediate values of a block in cache
+_CONVERSION_BLOCK_SIZE = 1 << 16
+
+
+class _LRUCache:
+    """Thread-safe, bounded mapping evicting its least recently used values."""
+
+    def __init__(self, *, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._values: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, *, key: Hashable, compute: Callable[[], Any]) -> Any:  # noqa: ANN401 - values of any type
+        """Value for ``key``, computed, outside the lock, if not cached."""
+        with self._lock:
+            if key in self._values:
+                self._values.move_to_end(key)
+                return self._values[key]
+        value = compute()
+        with self._lock:
+            self._values[key] = value
+            if len(self._values) > self._maxsize:
+                self._values.popitem(last=False)
+        return value
+
+
+_NATIVE_PSF_CACHE = _LRUCache(maxsize=_NATIVE_PSF_CACHE_SIZE)
+_PSF_CACHE = _LRUCache(maxsize=_PSF_CACHE_SIZE)
+_TRANSFER_CACHE = _LRUCache(maxsize=_TRANSFER_CACHE_SIZE)
+
+
+class _RadiometricCalibration(NamedTuple):
+    """Constants of the radiometric conversion of photoelectrons to pixels in [0, 255], as by pyBSM."""
+
+    # Bounds of the forward photoelectron grid, to which photoelectrons are clipped
+    pe_min: float
+    pe_max: float
+    # Inverse of the forward map, reflectance = (photoelectrons - offset) / scale
+    scale: float
+    offset: float
+    # Reflectance range mapped to [0, 255]
+    r1: float
+    r_span: float
+
+
+class _TransferPlan(NamedTuple):
+    """Convolution of images of one size with a PSF, and the size to resample them to, as by ``simulate_image``."""
+
+    # Real FFT of the PSF, made odd-sized, at the padded size of the image
+    transfer: np.ndarray[Any, Any]
+    fft_shape: list[int]
+    # Half sizes of the PSF, by which images are reflect-padded
+    ky: int
+    kx: int
+    # Width and height of resampled images, or None to keep their size
+    resampled_wh: tuple[int, int] | None
+
+
+def _fingerprint(values: Mapping[str, Any]) -> str:
+    """Digest of values, comparing arrays by value, that is the same in every process."""
+    digest = hashlib.sha256()
+    for name, array in sorted((name, np.asarray(value)) for name, value in values.items()):
+        digest.update(repr((name, array.dtype.str, array.shape)).encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def _native_psf(system_otf: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    """PSF at the sampling of the OTF, as computed by ``pybsm.otf.functional.otf_to_psf``."""
+    return np.real(fft.fftshift(fft.ifft2(fft.fftshift(system_otf))))
+
+
+def _resample_psf(*, native_psf: np.ndarray[Any, Any], dx_in: float, dx_out: float) -> np.ndarray[Any, Any]:
+    """Resample and crop a native PSF to a blur kernel, as ``pybsm.otf.functional.otf_to_psf``.
+
+    Args:
+        native_psf:
+            PSF at the sampling of the OTF.
+        dx_in:
+            Sample spacing of the native PSF (radians).
+        dx_out:
+            Sample spacing of the blur kernel (radians).
+
+    Returns:
+        Blur kernel covering at least 95% of the PSF, normalized to sum to 1.
+    """
+    new_x = max([1, int(native_psf.shape[1] * dx_in / dx_out)])
+    new_y = max([1, int(native_psf.shape[0] * dx_in / dx_out)])
+    zoom_factors = (new_x / native_psf.shape[1], new_y / native_psf.shape[0])
+    psf = zoom(native_psf, zoom_factors, order=1, grid_mode=True, mode="grid-constant").astype(np.float64)
+    psf = psf / psf.sum()
+
+    psf_out = np.asarray([])
+    for k_size in np.arange(10, np.min(native_psf.shape), 5):
+        psf_out = psf[
+            tuple(slice(int(np.floor(d / 2 - k_size / 2)), int(np.ceil(d / 2 + k_size / 2))) for d in psf.shape)
+        ]
+        if psf_out.sum() > 0.95:
+            break
+    return psf_out / psf_out.sum()
+
+
+def _scenario_inputs(scenario: Scenario) -> dict[str, Any]:
+    """Scenario attributes that derived state is computed from."""
+    return {
+        "ihaze": scenario.ihaze,
+        "altitude": scenario.altitude,
+        "ground_range": scenario.ground_range,
+        "interp": scenario._interp,  # noqa: SLF001 - Scenario has no public interp property
+        "aircraft_speed": scenario.aircraft_speed,
+        "ha_wind_speed": scenario.ha_wind_speed,
+        "cn2_at_1m": scenario.cn2_at_1m,
+    }
+
+
+def _known_atmosphere(*, scenario: Scenario, previous: ComponentOTFSimulator | None) -> np.ndarray[Any, Any] | None:
+    """Atmosphere of ``scenario`` loaded by ``previous`` or cached on disk, or None if it has to be loaded."""
+    if scenario._atm is not None:  # noqa: SLF001 - loaded atmosphere
+        return None
+    if previous is not None and previous.scenario._atm is not None:  # noqa: SLF001 - loaded atmosphere
+        changed = changed_values(old=_scenario_inputs(previous.scenario), new=_scenario_inputs(scenario))
+        if "atmosphere" not in stale_state(dependencies=_DERIVED_STATE, changed=changed):
+            return previous.scenario._atm  # noqa: SLF001 - loaded atmosphere
+    if not scenario._interp:  # noqa: SLF001 - Scenario has no public interp property
+        return None
+    return cached_atmosphere(ihaze=scenario.ihaze, altitude=scenario.altitude, ground_range=scenario.ground_range)
+
+
+class ComponentOTFSimulator(SystemOTFSimulator):
+    """``SystemOTFSimulator`` keeping the wavelength-weighted component OTFs for reuse.
+
+    The aperture, turbulence and wavefront OTFs are weighted over the wavelengths of the sensor and dominate the cost
+    of the system OTF. They are kept once computed, with the system OTF and the PSF at its sampling, so the PSF for a
+    further GSD only pays for resampling. They are taken by a simulator constructed with this one as ``previous``
+    unless its parameters invalidate them.
+
+    PSFs, and the transfer functions and resampled sizes of images of a given size, are kept in bounded caches shared
+    by all simulators and keyed by a fingerprint of the values they are computed from. Further images of the same
+    size and GSD, perturbed by any simulator of the same system, only pay for the FFTs of the image. Interpolated
+    atmospheres are read from the on-disk atmosphere cache when a cache directory is set.
+    """
+
+    def __init__(self, *, previous: ComponentOTFSimulator | None = None, **kwargs: Any) -> None:
+        """Initialize the simulator, reusing the derived state of ``previous`` that its parameters leave valid.
+
+        Args:
+            previous:
+                Simulator of another sensor or scenario to reuse derived state from, or None.
+            kwargs:
+                Arguments of ``SystemOTFSimulator``.
+        """
+        scenario: Scenario = kwargs["scenario"]
+        atm = _known_atmosphere(scenario=scenario, previous=previous)
+        if atm is not None:
+            scenario = copy.copy(scenario)
+            scenario._atm = atm  # noqa: SLF001 - Scenario has no public atmosphere setter
+        super().__init__(**(kwargs | {"scenario": scenario}))
+
+        self._otfs: dict[str, np.ndarray[Any, Any]] = {}
+        if previous is not None:
+            self._reuse(previous)
+
+        inputs = self._inputs()
+        self._fingerprint = _fingerprint(
+            {name: inputs[name] for name in state_inputs(dependencies=_DERIVED_STATE, names={"psf", "resampling"})},
+        )
+        self._calibration = self._radiometric_calibration()
+
+    def _radiometric_calibration(self) -> _RadiometricCalibration | None:
+        """Constants of the radiometric conversion, or None if pyBSM falls back to another conversion or raises."""
+        if not self._use_reflectance or not self._forward_is_monotonic or self._affine_pe_coefs[0] == 0.0:
+            return None
+        r1, r2 = float(self._reflectance_range[0]), float(self._reflectance_range[1])
+        return _RadiometricCalibration(
+            pe_min=self._fwd_y_min,
+            pe_max=self._fwd_y_max,
+            scale=self._affine_pe_coefs[0],
+            offset=self._affine_pe_coefs[1],
+            r1=r1,
+            r_span=r2 - r1,
+        )
+
+    def _inputs(self) -> dict[str, Any]:
+        """Values that the derived state of the simulator is computed from."""
+        return {
+            **vars(self.sensor),
+            **_scenario_inputs(self.scenario),
+            "mtf_wavelengths": self.mtf_wavelengths,
+            "mtf_weights": self.mtf_weights,
+            "cutoff_frequency": self._cutoff_frequency,
+            "slant_range": self.slant_range,
+        }
+
+    def _reuse(self, previous: ComponentOTFSimulator) -> None:
+        """Take the frequency grid and the component OTFs, system OTF and native PSF of ``previous`` that are valid."""
+        changed = changed_values(old=previous._inputs(), new=self._inputs())
+        stale = stale_state(dependencies=_DERIVED_STATE, changed=changed)
+        if "frequency_grid" not in stale:
+            self._uu, self._vv = previous._uu, previous._vv
+        self._otfs = {name: value for name, value in previous._otfs.items() if name not in stale}
+
+    def _cached_otf(self, *, name: str, compute: Callable[[], np.ndarray[Any, Any]]) -> np.ndarray[Any, Any]:
+        """Kept OTF or native PSF ``name``, computed on first use."""
+        value = self._otfs.get(name)
+        if value is None:
+            value = self._otfs[name] = compute()
+        return value
+
+    def _turbulence_otf(self) -> np.ndarray[Any, Any]:
+        """Turbulence OTF, or no attenuation if turbulence is turned off with a ground level Cn2 of 0."""
+        if self.scenario.cn2_at_1m <= 0.0:
+            return np.ones(self.uu.shape)
+        return polychromatic_turbulence_otf(
+            u=self.uu[0],
+            v=self.vv[:, 0],
+            wavelengths=self.mtf_wavelengths,
+            weights=self.mtf_weights,
+            altitude=self.scenario.altitude,
+            slant_range=self.slant_range,
+            D=self.sensor.D,
+            ha_wind_speed=self.scenario.ha_wind_speed,
+            cn2_at_1m=self.scenario.cn2_at_1m,
+            int_time=self.sensor.int_time * self.sensor.n_tdi,
+            aircraft_speed=self.scenario.aircraft_speed,
+            workers=-1,
+        )
+
+    @override
+    def _compute_otf(self) -> np.ndarray:
+        """System OTF, computed on first use."""
+        return self._cached_otf(name="system_OTF", compute=self._system_otf)
+
+    def _system_otf(self) -> np.ndarray[Any, Any]:
+        """System OTF, computed as by ``pybsm.otf.common_OTFs`` from the kept component OTFs.
+
+        The wavelength-weighted OTFs are evaluated for all wavelengths at once, matching pyBSM up to rounding.
+        """
+        sensor, uu, vv = self.sensor, self.uu, self.vv
+        # The frequency grid is a meshgrid, so its first row and column give the frequencies of every column and row
+        u, v = uu[0], vv[:, 0]
+        ap_otf = self._cached_otf(
+            name="ap_OTF",
+            compute=lambda: polychromatic_aperture_otf(
+                u=u,
+                v=v,
+                wavelengths=self.mtf_wavelengths,
+                weights=self.mtf_weights,
+                D=sensor.D,
+                eta=sensor.eta,
+                workers=-1,
+            ),
+        )
+        turb_otf = self._cached_otf(name="turb_OTF", compute=self._turbulence_otf)
+        wav_otf = self._cached_otf(
+            name="wav_OTF",
+            compute=lambda: polychromatic_wavefront_otf(
+                u=u,
+                v=v,
+                wavelengths=self.mtf_wavelengths,
+                weights=self.mtf_weights,
+                pv=sensor.pv,
+                pv_wavelength=sensor.pv_wavelength,
+                L_x=sensor.L_x,
+                L_y=sensor.L_y,
+                workers=-1,
+            ),
+        )
+
+        det_otf = otf.detector_OTF(u=uu, v=vv, w_x=sensor.w_x, w_y=sensor.w_y, f=sensor.f)
+        jit_otf = otf.jitter_OTF(u=uu, v=vv, s_x=sensor.s_x, s_y=sensor.s_y)
+        drft_otf = otf.drift_OTF(
+            u=uu,
+            v=vv,
+            a_x=sensor.da_x * sensor.int_time * sensor.n_tdi,
+            a_y=sensor.da_y * sensor.int_time * sensor.n_tdi,
+        )
+        if sensor.filter_kernel.shape[0] > 1:
+            filter_otf = otf.filter_OTF(u=uu, v=vv, kernel=sensor.filter_kernel, ifov=sensor.p_x / sensor.f)
+        else:
+            filter_otf = np.ones(uu.shape)
+
+        # Multiplied in the same order as common_OTFs, for identical results
+        system_otf = ap_otf.copy()
+        for x_otf in (turb_otf, det_otf, jit_otf, drft_otf, wav_otf, filter_otf):
+            np.multiply(system_otf, x_otf, out=system_otf)
+        return system_otf
+
+    def _native_psf(self) -> np.ndarray[Any, Any]:
+        """PSF at the sampling of the OTF, kept once computed by this or another simulator of the same system."""
+        return self._cached_otf(
+            name="native_PSF",
+            compute=lambda: _NATIVE_PSF_CACHE.get(
+                key=self._fingerprint,
+                compute=lambda: _native_psf(self._compute_otf()),
+            ),
+        )
+
+    @override
+    def _get_psf(self, gsd: float) -> np.ndarray:
+        """PSF for ``gsd``, resampled from the native PSF."""
+        return _resample_psf(
+            native_psf=self._native_psf(),
+            dx_in=1 / (self.uu.shape[0] * self._df),
+            dx_out=2 * np.arctan(gsd / 2 / self.slant_range),
+        )
+
+    @override
+    def _get_default_psf(self) -> np.ndarray:
+        """PSF at the sampling of the OTF, cropped from the native PSF."""
+        dx_in = 1 / (self.uu.shape[0] * self._df)
+        return _resample_psf(native_psf=self._native_psf(), dx_in=dx_in, dx_out=dx_in)
+
+    @override
+    def _get_psf_cached(self, gsd: float | None = None, use_default: bool = False) -> np.ndarray:
+        """PSF for ``gsd``, or the default PSF, from the cache shared by simulators of the same system."""
+        gsd_key = None if use_default or gsd is None else round(gsd, 6)
+        return _PSF_CACHE.get(
+            key=(self._fingerprint, gsd_key),
+            compute=lambda: self._get_default_psf() if gsd is None or use_default else self._get_psf(gsd),
+        )
+
+    def _transfer_plan(self, *, shape: tuple[int, int], gsd: float | None) -> _TransferPlan:
+        """Transfer function and resampled size of images of ``shape``, as computed by ``simulate_image``."""
+        psf = self._get_psf_cached(gsd=gsd, use_default=gsd is None)
+        # Odd-sized kernels match the alignment of correlate
+        psf = np.pad(psf, (((psf.shape[0] + 1) % 2, 0), ((psf.shape[1] + 1) % 2, 0)), constant_values=0.0)
+        ky, kx = psf.shape[0] // 2, psf.shape[1] // 2
+        # Size of the full convolution of the padded image with the PSF
+        fft_shape = [
+            fft.next_fast_len(size + 2 * half + psf_size - 1, real=True)
+            for size, half, psf_size in zip(shape, (ky, kx), psf.shape, strict=True)
+        ]
+
+        resampled_wh = None
+        if gsd and self.do_resample:
+            resampled_wh = otf.resampled_dimensions(
+                img_hw=shape,
+                dx_in=gsd / self.slant_range,
+                dx_out=self._calculate_dx_out(gsd=gsd),
+            )
+        return _TransferPlan(
+            transfer=cast(np.ndarray, fft.rfft2(psf, fft_shape, axes=(0, 1))),
+            fft_shape=fft_shape,
+            ky=ky,
+            kx=kx,
+            resampled_wh=resampled_wh,
+        )
+
+    def _to_photoelectrons(self, image: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+        """Map pixels to reflectance and then photoelectrons, as ``apply_convolution``, if using reflectance."""
+        if not self._use_reflectance:
+            return image
+        p1, p2 = image.min(), image.max()
+        r1, r2 = self._reflectance_range
+        reflectance_img = image.astype(np.float64)
+        if p2 == p1:
+            # The scale of a uniform image is undefined, so it is mapped to the middle of the reflectance range
+            reflectance_img.fill((float(r1) + float(r2)) / 2.0)
+        else:
+            scale = (r2 - r1) / (p2 - p1)
+            np.subtract(reflectance_img, p1, out=reflectance_img)
+            np.multiply(reflectance_img, scale, out=reflectance_img)
+            np.add(reflectance_img, r1, out=reflectance_img)
+        np.clip(reflectance_img, 0, 1, out=reflectance_img)
+        return self._reflect_to_photoelectrons(reflectance_img)
+
+    def _cached_transfer_plan(self, *, shape: tuple[int, int], gsd: float | None) -> _TransferPlan:
+        """Transfer plan of images of ``shape``, from the cache shared by simulators of the same system."""
+        return cast(
+            _TransferPlan,
+            _TRANSFER_CACHE.get(
+                key=(self._fingerprint, None if gsd is None else round(gsd, 6), shape, self.do_resample),
+                compute=lambda: self._transfer_plan(shape=shape, gsd=gsd),
+            ),
+        )
+
+    def _blur(
+        self,
+        *,
+        true_imgs: np.ndarray[Any, Any],
+        plan: _TransferPlan,
+        workers: int | None,
+    ) -> list[np.ndarray[Any, Any]]:
+        """Convolve a stack of images of shape (N, H, W[, C]) with the PSF of ``plan``, and resample them."""
+        height, width = true_imgs.shape[1:3]
+        padding = ((0, 0), (plan.ky, plan.ky), (plan.kx, plan.kx)) + (((0, 0),) if true_imgs.ndim == 4 else ())
+        img_f = cast(
+            np.ndarray,
+            fft.rfft2(np.pad(true_imgs, padding, mode="reflect"), plan.fft_shape, axes=(1, 2), workers=workers),
+        )
+        np.multiply(img_f, plan.transfer[..., None] if true_imgs.ndim == 4 else plan.transfer, out=img_f)
+        blur_imgs = cast(np.ndarray, fft.irfft2(img_f, plan.fft_shape, axes=(1, 2), workers=workers))
+
+        blurred = []
+        for blur_img in blur_imgs:
+            cropped = np.ascontiguousarray(
+                blur_img[2 * plan.ky : 2 * plan.ky + height, 2 * plan.kx : 2 * plan.kx + width],
+            )
+            if plan.resampled_wh is not None:
+                cropped = self._apply_resampling_float(
+                    image=cropped,
+                    new_wh=plan.resampled_wh,
+                    mode=Image.Resampling.BILINEAR,
+                )
+            blurred.append(cropped)
+        return blurred
+
+    def blur_batch(
+        self,
+        images: np.ndarray[Any, Any] | Sequence[np.ndarray[Any, Any]],
+        *,
+        gsd: float | None,
+        workers: int | None = None,
+    ) -> list[np.ndarray[Any, Any]]:
+        """Blurred images of a batch of images of one size and GSD, as by ``simulate_image`` without noise.
+
+        Args:
+            images:
+                Images of the same shape, stacked along a leading axis or as a sequence of arrays.
+            gsd:
+                Ground sample distance of the images. If None, the default PSF is used and images are not resampled.
+            workers:
+                Number of threads of the FFTs, as by ``scipy.fft``. Defaults to one.
+
+        Returns:
+            Blurred, and resampled, image of each input image, in photoelectrons if using reflectance.
+        """
+        plan = self._cached_transfer_plan(shape=images[0].shape[:2], gsd=gsd)
+        true_imgs = np.stack([self._to_photoelectrons(image) for image in images])
+        return self._blur(true_imgs=true_imgs, plan=plan, workers=workers)
+
+    def photoelectrons_to_uint8(
+        self,
+        photoelectrons_img: np.ndarray[Any, Any],
+        *,
+        mode: Literal["radiometric", "minmax"] = "radiometric",
+    ) -> np.ndarray[Any, Any]:
+        """Convert photoelectrons to uint8 pixels, as ``photoelectrons_to_pixels`` followed by a cast to uint8.
+
+        Radiometric conversions of float64 images use the calibration computed with the simulator, and convert
+        blocks of pixels through every step, from clipping to the cast, directly into the output. The clip fraction
+        is recorded, and warned about, as by ``photoelectrons_to_pixels``, which converts other images.
+
+        Args:
+            photoelectrons_img:
+                Photoelectron array.
+            mode:
+                ``"radiometric"`` or ``"minmax"``, as by ``photoelectrons_to_pixels``.
+
+        Returns:
+            Pixel array of the same shape as ``photoelectrons_img``, of dtype uint8.
+        """
+        calibration = self._calibration
+        if (
+            mode != "radiometric"
+            or calibration is None
+            or photoelectrons_img.dtype != np.float64
+            or photoelectrons_img.size == 0
+        ):
+            return self.photoelectrons_to_pixels(photoelectrons_img, mode=mode).astype(np.uint8)
+
+        flat = photoelectrons_img.reshape(-1)
+        pixels = np.empty(flat.shape, dtype=np.uint8)
+        block = np.empty(min(flat.size, _CONVERSION_BLOCK_SIZE))
+        n_low = n_high = 0
+        for start in range(0, flat.size, block.size):
+            pe = flat[start : start + block.size]
+            values = block[: pe.size]
+            if not np.isfinite(pe).all():
+                # Raises as pyBSM does
+                return self.photoelectrons_to_pixels(photoelectrons_img, mode=mode).astype(np.uint8)
+            n_low += int(np.count_nonzero(pe < calibration.pe_min))
+            n_high += int(np.count_nonzero(pe > calibration.pe_max))
+            # The operations of photoelectrons_to_pixels, in the same order, for identical results
+            np.clip(pe, calibration.pe_min, calibration.pe_max, out=values)
+            np.subtract(values, calibration.offset, out=values)
+            np.divide(values, calibration.scale, out=values)
+            np.clip(values, 0.0, 1.0, out=values)
+            np.subtract(values, calibration.r1, out=values)
+            np.divide(values, calibration.r_span, out=values)
+            np.multiply(values, 255.0, out=values)
+            np.clip(values, 0.0, 255.0, out=values)
+            np.copyto(pixels[start : start + pe.size], values, casting="unsafe")
+
+        clip_fraction = (n_low / flat.size, n_high / flat.size)
+        if max(clip_fraction) > 0.01:
+            self._record_clip_fraction(photoelectrons_img)
+        else:
+            self._last_clip_fraction = clip_fraction
+        return pixels.reshape(photoelectrons_img.shape)
+
+    @override
+    def apply_noise(
+        self,
+        image: np.ndarray[Any, Any],
+        *,
+        rng: np.random.Generator | None = None,
+    ) -> np.ndarray[Any, Any]:
+        """Apply noise as ``SystemOTFSimulator``, drawing from ``rng`` if given.
+
+        Args:
+            image:
+                Blurred image of shape (H, W) or (H, W, C).
+            rng:
+                Random state to draw the noise from, or None for that of the simulator.
+
+        Returns:
+            The noisy image, or ``image`` if the simulator adds no noise.
+
+        Raises:
+            RuntimeError:
+                If ``image`` has a non-finite value, as raised by pyBSM.
+        """
+        if not self.add_noise or not np.isfinite(image).all():
+            return super().apply_noise(image)
+        # The noise of each row is drawn from its own seed, as by pyBSM
+        seeds = (self._rng if rng is None else rng).integers(0, 1 << 63, image.shape[0], dtype=np.uint64)
+        if image.ndim == 2:
+            return _apply_noise2d(image, self._g_noise, seeds)
+        return _apply_noise3d(image, self._g_noise, seeds)
+
+    def apply_noise_realizations(
+        self,
+        image: np.ndarray[Any, Any],
+        *,
+        count: int,
+        rng: np.random.Generator | None = None,
+    ) -> np.ndarray[Any, Any]:
+        """Noisy realizations of an image, as by ``count`` consecutive calls to ``apply_noise``.
+
+        The realizations are stacked so that the noise of all their rows is drawn in one parallel pass, from the
+        same random draws as the consecutive calls.
+
+        Args:
+            image:
+                Blurred image of shape (H, W) or (H, W, C).
+            count:
+                Number of realizations.
+            rng:
+                Random state to draw the noise from, or None for that of the simulator.
+
+        Returns:
+            The realizations, of shape (count, H, W) or (count, H, W, C).
+        """
+        stacked = np.broadcast_to(image, (count, *image.shape)).reshape(count * image.shape[0], *image.shape[1:])
+        return self.apply_noise(stacked, rng=rng).reshape(count, *image.shape)
+
+    @override
+    def simulate_image(
+        self,
+        image: np.ndarray,
+        gsd: float | None,
+        *,
+        rng: np.random.Generator | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+        """Simulate an image as ``SystemOTFSimulator``, with the transfer function cached for its size and GSD.
+
+        The noise is drawn from ``rng`` if given, or else from the random state of the simulator.
+        """
+        plan = self._cached_transfer_plan(shape=image.shape[:2], gsd=gsd)
+        true_img = self._to_photoelectrons(image)
+        (blur_img,) = self._blur(true_imgs=true_img[None], plan=plan, workers=None)
+        noisy_img = self.apply_noise(blur_img, rng=rng) if self.add_noise else None
+        return true_img, blur_img, noisy_img
@@ -0,0 +1,195 @@
+"""Bundles of the OTFs and PSFs of pyBSM simulators, shared between processes instead of being recomputed.
+
+A bundle is an uncompressed ``.npz`` file holding the frequency grid, the OTFs and the PSFs a simulator computed,
+with a fingerprint of the sensor, scenario and simulator values they were computed from. A simulator with the same
+fingerprint takes them from the bundle, memory-mapped read-only, so processes sharing a bundle share both the work
+and the pages. ``ComponentOTFSimulator`` takes its component OTFs, system OTF and native PSF as well as the PSFs of
+the bundled GSDs; other pyBSM simulators, which recompute the OTF for every PSF, take the PSFs.
+
+When a bundle directory is set, bundles are written there named by their fingerprint, and perturbers load the
+bundle of their simulator on construction. The directory is set with ``set_otf_bundle_dir``, or for processes that
+do not set it, such as spawned workers, with the ``NRTK_OTF_BUNDLE_DIR`` environment variable.
+
+Example:
+    set_otf_bundle_dir("/tmp/nrtk-otfs")
+    PybsmPerturber(**config).export_otf_bundle(img_gsds=[0.02])
+    # Perturbers constructed with config in this or any worker process now skip the OTF and PSF computation
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "bundle_path",
+    "export_otf_bundle",
+    "get_otf_bundle_dir",
+    "import_otf_bundle",
+    "set_otf_bundle_dir",
+    "simulator_fingerprint",
+]
+
+import os
+import struct
+import zipfile
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pybsm
+from pybsm.simulation import ImageSimulator
+
+from nrtk.impls.perturb_image.optical._pybsm._cache_files import CacheDir, write_atomically
+from nrtk.impls.perturb_image.optical._pybsm._component_otf_simulator import (
+    _PSF_CACHE,
+    ComponentOTFSimulator,
+    _fingerprint,
+    _scenario_inputs,
+)
+
+_BUNDLE_DIR = CacheDir(variable="NRTK_OTF_BUNDLE_DIR")
+
+
+def get_otf_bundle_dir() -> Path | None:
+    """Returns the directory OTF bundles are written to and loaded from, or None if they are not."""
+    return _BUNDLE_DIR.get()
+
+
+def set_otf_bundle_dir(bundle_dir: str | os.PathLike[str] | None) -> None:
+    """Set the directory OTF bundles are written to and loaded from.
+
+    Args:
+        bundle_dir:
+            Directory of the bundles, created on first export, or None to follow the ``NRTK_OTF_BUNDLE_DIR``
+            environment variable, and not load bundles if it is unset.
+    """
+    _BUNDLE_DIR.set(bundle_dir)
+
+
+def simulator_fingerprint(simulator: ImageSimulator) -> str:
+    """Fingerprint of the values that the OTFs and PSFs of ``simulator`` are computed from."""
+    if isinstance(simulator, ComponentOTFSimulator):
+        system = simulator._fingerprint  # noqa: SLF001 - covers the inputs of the PSFs
+    else:
+        system = _fingerprint(
+            {
+                **vars(simulator.sensor),
+                **_scenario_inputs(simulator.scenario),
+                "mtf_wavelengths": simulator.mtf_wavelengths,
+                "mtf_weights": simulator.mtf_weights,
+                "cutoff_frequency": simulator._cutoff_frequency,  # noqa: SLF001 - no public property
+                "slant_range": simulator.slant_range,
+            },
+        )
+    return _fingerprint({"simulator": type(simulator).__qualname__, "pybsm": pybsm.__version__, "system": system})
+
+
+def bundle_path(simulator: ImageSimulator) -> Path | None:
+    """File of the bundle of ``simulator`` in the bundle directory, or None if no bundle directory is set."""
+    bundle_dir = get_otf_bundle_dir()
+    return None if bundle_dir is None else bundle_dir / f"{simulator_fingerprint(simulator)}.npz"
+
+
+def _psf_key(gsd: float | None) -> float | None:
+    """Key of the PSF of ``gsd`` in the PSF caches of the simulators, with None for the default PSF."""
+    return None if gsd is None else round(gsd, 6)
+
+
+def export_otf_bundle(*, simulator: ImageSimulator, path: Path, gsds: Iterable[float | None]) -> None:
+    """Compute the OTFs of ``simulator`` and its PSFs for ``gsds``, and write them to ``path`` atomically.
+
+    Args:
+        simulator:
+            Simulator whose OTFs and PSFs to bundle.
+        path:
+            File to write, replaced if it exists.
+        gsds:
+            GSDs of the PSFs to bundle, with None for the default PSF.
+    """
+    # PSFs are cached under their rounded GSD, computed for the first GSD to round to it
+    by_key: dict[float | None, float | None] = {}
+    for gsd in gsds:
+        by_key.setdefault(_psf_key(gsd), gsd)
+    arrays: dict[str, np.ndarray[Any, Any]] = {
+        "fingerprint": np.asarray(simulator_fingerprint(simulator)),
+        "uu": simulator.uu,
+        "vv": simulator.vv,
+        # NaN stands for the default PSF
+        "psf_gsds": np.asarray([np.nan if key is None else key for key in by_key], dtype=np.float64),
+    }
+    for idx, gsd in enumerate(by_key.values()):
+        arrays[f"psf_{idx}"] = simulator._get_psf_cached(gsd=gsd, use_default=gsd is None)  # noqa: SLF001
+    if isinstance(simulator, ComponentOTFSimulator):
+        simulator._native_psf()  # noqa: SLF001 - computes the component OTFs, system OTF and native PSF
+        arrays |= {f"otf_{name}": otf for name, otf in simulator._otfs.items()}  # noqa: SLF001
+
+    # Members are stored uncompressed so that they can be memory-mapped
+    write_atomically(path=path, write=lambda file: np.savez(file, **arrays))
+
+
+def _map_members(path: Path) -> dict[str, np.ndarray[Any, Any]]:
+    """Arrays of an uncompressed ``.npz`` file, memory-mapped read-only.
+
+    Raises:
+        ValueError:
+            If a member of the file is compressed.
+    """
+    arrays: dict[str, np.ndarray[Any, Any]] = {}
+    with zipfile.ZipFile(path) as archive, path.open("rb") as file:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"Member {info.filename} of {path} is compressed, so cannot be memory-mapped")
+            # The member data follows its local header, whose name and extra field lengths are at bytes 26 to 30
+            file.seek(info.header_offset + 26)
+            name_length, extra_length = struct.unpack("<HH", file.read(4))
+            file.seek(info.header_offset + 30 + name_length + extra_length)
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+            arrays[info.filename.removesuffix(".npy")] = np.memmap(
+                path,
+                dtype=dtype,
+                mode="r",
+                offset=file.tell(),
+                shape=shape,
+                order="F" if fortran_order else "C",
+            )
+    return arrays
+
+
+def import_otf_bundle(*, simulator: ImageSimulator, path: Path) -> bool:
+    """Give ``simulator`` the frequency grid, OTFs and PSFs of the bundle at ``path``, memory-mapped read-only.
+
+    Args:
+        simulator:
+            Simulator to give the bundled arrays to.
+        path:
+            Bundle written by ``export_otf_bundle``.
+
+    Returns:
+        Whether the bundle was computed from the same values as the OTFs and PSFs of ``simulator``, and so taken.
+        Bundles of other values are left unused.
+
+    Raises:
+        ValueError:
+            If a member of the bundle is compressed.
+    """
+    with np.load(path) as bundle:
+        if str(bundle["fingerprint"]) != simulator_fingerprint(simulator):
+            return False
+    arrays = _map_members(path)
+
+    simulator._uu, simulator._vv = arrays["uu"], arrays["vv"]  # noqa: SLF001 - no public setter
+    psfs = {None if np.isnan(gsd) else float(gsd): arrays[f"psf_{idx}"] for idx, gsd in enumerate(arrays["psf_gsds"])}
+    if isinstance(simulator, ComponentOTFSimulator):
+        prefix = "otf_"
+        simulator._otfs |= {  # noqa: SLF001
+            name.removeprefix(prefix): otf for name, otf in arrays.items() if name.startswith(prefix)
+        }
+        for key, psf in psfs.items():
+            _PSF_CACHE.get(key=(simulator._fingerprint, key), compute=lambda psf=psf: psf)  # noqa: SLF001
+    else:
+        config_hash = simulator._get_config_hash()  # noqa: SLF001
+        simulator._psf_cache |= {(config_hash, key): psf for key, psf in psfs.items()}  # noqa: SLF001
+    return True
@@ -0,0 +1,334 @@
+"""Wavelength-weighted OTFs of pyBSM, evaluated over all wavelengths and frequencies as array computations.
+
+pyBSM weights an OTF over the wavelengths of a sensor by evaluating it on the whole frequency grid once per
+wavelength. The aperture, turbulence and wavefront OTFs only depend on the squares of the frequencies, so they are
+evaluated here once per distinct magnitude of the frequencies of each axis of the grid, about a quarter of the grid,
+and for all wavelengths at once by broadcasting, before being spread back over the grid. The results match those of
+pyBSM up to floating-point rounding. Blocks of the grid may be evaluated by several threads, and in float32.
+
+Functions:
+    polychromatic_aperture_otf: Obscured circular aperture OTF, as weighted by ``pybsm.otf.circular_aperture_OTF``.
+    polychromatic_turbulence_otf: Turbulence OTF, as by ``pybsm.otf.polychromatic_turbulence_OTF``.
+    polychromatic_wavefront_otf: Wavefront OTF, as weighted by ``pybsm.otf.wavefront_OTF``.
+
+Dependencies:
+    - pyBSM for the turbulence profile along the slant path.
+
+Note:
+    This is a private implementation detail of ``ComponentOTFSimulator``.
+"""
+
+from __future__ import annotations
+
+__all__ = ["polychromatic_aperture_otf", "polychromatic_turbulence_otf", "polychromatic_wavefront_otf"]
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Protocol
+
+import numpy as np
+from numpy.typing import DTypeLike
+from pybsm.otf import functional as otf
+
+# Number of values of each intermediate array of a block, over its wavelengths, rows and columns
+_BLOCK_SIZE = 1 << 20
+# Relative difference below which frequency magnitudes are taken as equal, such as those of a symmetric linspace
+_FOLD_TOLERANCE = 1e-12
+
+
+class _BlockOTF(Protocol):
+    """OTF of the squared frequencies of a block, shaped (1, cols) and (rows, 1), at wavelengths shaped (n, 1, 1)."""
+
+    def __call__(
+        self,
+        *,
+        u2: np.ndarray[Any, Any],
+        v2: np.ndarray[Any, Any],
+        lambdas: np.ndarray[Any, Any],
+    ) -> np.ndarray[Any, Any]: ...
+
+
+def _fold(frequencies: np.ndarray[Any, Any]) -> tuple[np.ndarray[Any, Any], np.ndarray[Any, Any]]:
+    """Distinct magnitudes of frequencies, equal up to rounding, and the index of each frequency among them."""
+    magnitudes = np.abs(np.asarray(frequencies, dtype=np.float64))
+    order = np.argsort(magnitudes, kind="stable")
+    ordered = magnitudes[order]
+    distinct = np.ones(ordered.shape, dtype=bool)
+    distinct[1:] = np.diff(ordered) > _FOLD_TOLERANCE * ordered[1:]
+    index = np.empty(ordered.shape, dtype=np.intp)
+    index[order] = np.cumsum(distinct) - 1
+    return ordered[distinct], index
+
+
+def _weighted_by_wavelength(
+    *,
+    u: np.ndarray[Any, Any],
+    v: np.ndarray[Any, Any],
+    wavelengths: np.ndarray[Any, Any],
+    weights: np.ndarray[Any, Any],
+    block_otf: _BlockOTF,
+    dtype: DTypeLike,
+    workers: int | None,
+) -> np.ndarray[Any, Any]:
+    """OTF weighted over wavelengths, as by ``pybsm.otf.weighted_by_wavelength``, on the meshgrid of ``u`` and ``v``.
+
+    Args:
+        u:
+            Frequencies of the columns of the grid (rad^-1).
+        v:
+            Frequencies of the rows of the grid (rad^-1).
+        wavelengths:
+            Wavelengths (m).
+        weights:
+            Weight of each wavelength, normalized to sum to 1.
+        block_otf:
+            OTF of a block of the grid at every wavelength.
+        dtype:
+            Floating-point type of the computation.
+        workers:
+            Number of threads, -1 for one per CPU, or None for one.
+
+    Returns:
+        The OTF, of shape (len(v), len(u)).
+    """
+    u_magnitudes, u_index = _fold(u)
+    v_magnitudes, v_index = _fold(v)
+    u2 = np.square(u_magnitudes).astype(dtype)[None, :]
+    v2 = np.square(v_magnitudes).astype(dtype)[:, None]
+    lambdas = np.asarray(wavelengths, dtype=dtype)[:, None, None]
+    normalized = np.asarray(weights / weights.sum(), dtype=dtype)
+
+    table = np.empty((v2.shape[0], u2.shape[1]), dtype=dtype)
+    rows = max(1, _BLOCK_SIZE // (lambdas.shape[0] * u2.shape[1]))
+
+    def fill(start: int) -> None:
+        table[start : start + rows] = np.tensordot(
+            normalized,
+            block_otf(u2=u2, v2=v2[start : start + rows], lambdas=lambdas),
+            1,
+        )
+
+    starts = range(0, table.shape[0], rows)
+    threads = os.cpu_count() or 1 if workers == -1 else workers or 1
+    if threads == 1:
+        for start in starts:
+            fill(start)
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(fill, starts))
+    return table[v_index[:, None], u_index[None, :]]
+
+
+def polychromatic_aperture_otf(
+    *,
+    u: np.ndarray[Any, Any],
+    v: np.ndarray[Any, Any],
+    wavelengths: np.ndarray[Any, Any],
+    weights: np.ndarray[Any, Any],
+    D: float,  # noqa: N803 - physics convention for aperture diameter
+    eta: float,
+    dtype: DTypeLike = np.float64,
+    workers: int | None = None,
+) -> np.ndarray[Any, Any]:
+    """Obscured circular aperture OTF (IBSM Equation 3-20) weighted over wavelengths.
+
+    Args:
+        u:
+            Frequencies of the columns of the grid (rad^-1).
+        v:
+            Frequencies of the rows of the grid (rad^-1).
+        wavelengths:
+            Wavelengths (m).
+        weights:
+            Weight of each wavelength.
+        D:
+            Effective aperture diameter (m).
+        eta:
+            Relative linear obscuration (unitless), 0 for an unobscured aperture.
+        dtype:
+            Floating-point type of the computation and result.
+        workers:
+            Number of threads, -1 for one per CPU, or None for one.
+
+    Returns:
+        The OTF on the meshgrid of ``u`` and ``v``, of shape (len(v), len(u)).
+    """
+    etasq = eta**2
+
+    def block_otf(
+        *,
+        u2: np.ndarray[Any, Any],
+        v2: np.ndarray[Any, Any],
+        lambdas: np.ndarray[Any, Any],
+    ) -> np.ndarray[Any, Any]:
+        rho = np.sqrt(u2 + v2)
+        cutoff = D / lambdas
+        # Normalized frequencies past the cutoff are clipped to it, where the terms vanish
+        rho_t = np.minimum(rho / cutoff, 1.0)
+        otf_values = (2.0 / np.pi) * (np.arccos(rho_t) - rho_t * np.sqrt(1.0 - rho_t * rho_t))
+        if eta <= 0.0:
+            return otf_values
+
+        rho_t = np.minimum(rho / (cutoff * eta), 1.0)
+        otf_values += (2.0 * etasq / np.pi) * (np.arccos(rho_t) - rho_t * np.sqrt(1.0 - rho_t * rho_t))
+        otf_values -= 2.0 * etasq * (rho < (1.0 - eta) * cutoff / 2.0)
+        phi_inner = (1.0 + etasq - (2.0 * rho / cutoff) ** 2) / 2.0 / eta
+        ring = (np.abs(phi_inner) <= 1.0) & (rho <= (1.0 + eta) * cutoff / 2.0)
+        phi = np.arccos(phi_inner[ring])
+        otf_values[ring] += (
+            2.0 * eta * np.sin(phi) / np.pi
+            + (1.0 + etasq) * phi / np.pi
+            - 2.0 * etasq
+            - (2.0 * (1.0 - etasq) / np.pi) * np.arctan((1.0 + eta) * np.tan(phi / 2.0) / (1.0 - eta))
+        )
+        return otf_values / (1.0 - etasq)
+
+    return _weighted_by_wavelength(
+        u=u,
+        v=v,
+        wavelengths=wavelengths,
+        weights=weights,
+        block_otf=block_otf,
+        dtype=dtype,
+        workers=workers,
+    )
+
+
+def polychromatic_turbulence_otf(
+    *,
+    u: np.ndarray[Any, Any],
+    v: np.ndarray[Any, Any],
+    wavelengths: np.ndarray[Any, Any],
+    weights: np.ndarray[Any, Any],
+    altitude: float,
+    slant_range: float,
+    D: float,  # noqa: N803 - physics convention for aperture diameter
+    ha_wind_speed: float,
+    cn2_at_1m: float,
+    int_time: float,
+    aircraft_speed: float,
+    dtype: DTypeLike = np.float64,
+    workers: int | None = None,
+) -> np.ndarray[Any, Any]:
+    """Wind-adjusted turbulence OTF (IBSM Equation 3-9) of a Hufnagel-Valley profile, weighted over wavelengths.
+
+    Args:
+        u:
+            Frequencies of the columns of the grid (rad^-1).
+        v:
+            Frequencies of the rows of the grid (rad^-1).
+        wavelengths:
+            Wavelengths (m).
+        weights:
+            Weight of each wavelength.
+        altitude:
+            Height of the aircraft above the ground (m).
+        slant_range:
+            Line-of-sight range between the aircraft and the target on the ground (m).
+        D:
+            Effective aperture diameter (m).
+        ha_wind_speed:
+            High altitude wind speed of the turbulence profile (m/s).
+        cn2_at_1m:
+            Refractive index structure parameter near the ground of the turbulence profile.
+        int_time:
+            Dwell (integration) time (s).
+        aircraft_speed:
+            Apparent atmospheric velocity (m/s).
+        dtype:
+            Floating-point type of the computation and result.
+        workers:
+            Number of threads, -1 for one per CPU, or None for one.
+
+    Returns:
+        The OTF on the meshgrid of ``u`` and ``v``, of shape (len(v), len(u)).
+    """
+    z_path, h_path = otf.altitude_along_slant_path(h_target=0.0, h_sensor=altitude, slant_range=slant_range)
+    cn2 = otf.hufnagel_valley_turbulence_profile(h=h_path, v=ha_wind_speed, cn2_at_1m=cn2_at_1m)
+    r0_at_1um = float(otf.coherence_diameter(lambda0=1.0e-6, z_path=z_path, cn2=cn2))
+
+    def block_otf(
+        *,
+        u2: np.ndarray[Any, Any],
+        v2: np.ndarray[Any, Any],
+        lambdas: np.ndarray[Any, Any],
+    ) -> np.ndarray[Any, Any]:
+        rho = np.sqrt(u2 + v2)
+        # Coherence diameter and weight of the two turbulence terms at each wavelength
+        r0 = r0_at_1um * lambdas ** (6.0 / 5.0) * (1e-6) ** (-6.0 / 5.0)
+        weight = np.exp(-aircraft_speed * int_time / r0)
+        # Powers of the frequencies are shared by every wavelength
+        p1 = -3.44 * (lambdas / r0) ** (5.0 / 3.0) * rho ** (5.0 / 3.0)
+        p2 = (lambdas / D) ** (1.0 / 3.0) * rho ** (1.0 / 3.0)
+        return weight * np.exp(p1 * (1.0 - 0.5 * p2)) + (1.0 - weight) * np.exp(p1)
+
+    return _weighted_by_wavelength(
+        u=u,
+        v=v,
+        wavelengths=wavelengths,
+        weights=weights,
+        block_otf=block_otf,
+        dtype=dtype,
+        workers=workers,
+    )
+
+
+def polychromatic_wavefront_otf(
+    *,
+    u: np.ndarray[Any, Any],
+    v: np.ndarray[Any, Any],
+    wavelengths: np.ndarray[Any, Any],
+    weights: np.ndarray[Any, Any],
+    pv: float,
+    pv_wavelength: float,
+    L_x: float,  # noqa: N803 - IBSM notation
+    L_y: float,  # noqa: N803 - IBSM notation
+    dtype: DTypeLike = np.float64,
+    workers: int | None = None,
+) -> np.ndarray[Any, Any]:
+    """Wavefront error OTF (IBSM Equation 3-31) weighted over wavelengths, with the phase variance scaled to each.
+
+    Args:
+        u:
+            Frequencies of the columns of the grid (rad^-1).
+        v:
+            Frequencies of the rows of the grid (rad^-1).
+        wavelengths:
+            Wavelengths (m).
+        weights:
+            Weight of each wavelength.
+        pv:
+            Phase variance (rad^2) at ``pv_wavelength``.
+        pv_wavelength:
+            Wavelength of the phase variance (m).
+        L_x:
+            Correlation length of the phase autocorrelation function along u (m).
+        L_y:
+            Correlation length of the phase autocorrelation function along v (m).
+        dtype:
+            Floating-point type of the computation and result.
+        workers:
+            Number of threads, -1 for one per CPU, or None for one.
+
+    Returns:
+        The OTF on the meshgrid of ``u`` and ``v``, of shape (len(v), len(u)).
+    """
+
+    def block_otf(
+        *,
+        u2: np.ndarray[Any, Any],
+        v2: np.ndarray[Any, Any],
+        lambdas: np.ndarray[Any, Any],
+    ) -> np.ndarray[Any, Any]:
+        auto_c = np.exp(-lambdas * lambdas * (u2 / L_x**2 + v2 / L_y**2))
+        return np.exp(-pv * (pv_wavelength / lambdas) ** 2 * (1.0 - auto_c))
+
+    return _weighted_by_wavelength(
+        u=u,
+        v=v,
+        wavelengths=wavelengths,
+        weights=weights,
+        block_otf=block_otf,
+        dtype=dtype,
+        workers=workers,
+    )
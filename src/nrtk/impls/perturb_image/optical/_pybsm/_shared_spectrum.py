@@ -0,0 +1,75 @@
+"""Correlation of one image with several kernels, transforming the image once.
+
+Functions:
+    shared_spectrum_correlate: Correlate one image with each of several kernels through one forward FFT of the image.
+
+Dependencies:
+    - scipy for the FFTs, as used by pyBSM.
+
+Note:
+    This is a private implementation detail of the sweeps of the pyBSM OTF perturbers.
+"""
+
+from __future__ import annotations
+
+__all__ = ["shared_spectrum_correlate"]
+
+from collections.abc import Iterator, Sequence
+from typing import Any, Literal, cast
+
+import numpy as np
+from scipy import fft
+
+
+def _embed(*, kernels: Sequence[np.ndarray[Any, Any]], half: tuple[int, int]) -> np.ndarray[Any, Any]:
+    """Kernels zero-padded to a common odd shape, with element ``(kh // 2, kw // 2)`` of each at its center."""
+    stacked = np.zeros((len(kernels), 2 * half[0] + 1, 2 * half[1] + 1))
+    for idx, kernel in enumerate(kernels):
+        top, left = half[0] - kernel.shape[0] // 2, half[1] - kernel.shape[1] // 2
+        stacked[idx, top : top + kernel.shape[0], left : left + kernel.shape[1]] = kernel
+    return stacked
+
+
+def shared_spectrum_correlate(
+    *,
+    image: np.ndarray[Any, Any],
+    kernels: Sequence[np.ndarray[Any, Any]],
+    mode: Literal["reflect", "constant"],
+    workers: int | None = None,
+) -> Iterator[np.ndarray[Any, Any]]:
+    """Correlate every channel of an image with each of several kernels, transforming the image once.
+
+    Kernels are zero-padded to a common shape, which leaves the correlation unchanged, and transformed together.
+    The padded image is transformed once, and the product with the transfer function of each kernel is transformed
+    back in turn. The results equal those of correlating the image with each kernel on its own, up to
+    floating-point rounding.
+
+    Args:
+        image:
+            Image of shape (H, W) or (H, W, C).
+        kernels:
+            Kernels of shape (kh, kw), each centered on element ``(kh // 2, kw // 2)``.
+        mode:
+            Whether the image is extended past its borders by reflection, as by ``numpy.pad``, or with zeros.
+        workers:
+            Number of threads of the FFTs, or None for one.
+
+    Returns:
+        Iterator over the float64 correlated image of each kernel, of the shape of ``image``.
+    """
+    # Half-size of the common shape, which holds every kernel once centered
+    half = (max(k.shape[0] // 2 for k in kernels), max(k.shape[1] // 2 for k in kernels))
+    padding = ((half[0], half[0]), (half[1], half[1])) + ((0, 0),) * (image.ndim - 2)
+    padded = np.pad(image.astype(np.float64, copy=False), padding, mode=mode)
+    # Circular convolution at the size of the padded image only wraps around into the padding
+    fft_shape = [fft.next_fast_len(size, real=True) for size in padded.shape[:2]]
+
+    # Correlation is convolution with the flipped kernel
+    flipped = _embed(kernels=kernels, half=half)[:, ::-1, ::-1]
+    transfers = cast(np.ndarray, fft.rfft2(flipped, fft_shape, axes=(1, 2), workers=workers))
+    spectrum = cast(np.ndarray, fft.rfft2(padded, fft_shape, axes=(0, 1), workers=workers))
+    rows, cols = slice(2 * half[0], 2 * half[0] + image.shape[0]), slice(2 * half[1], 2 * half[1] + image.shape[1])
+    for transfer in transfers:
+        product = spectrum * (transfer if image.ndim == 2 else transfer[..., None])
+        blurred = cast(np.ndarray, fft.irfft2(product, fft_shape, axes=(0, 1), workers=workers))
+        yield np.ascontiguousarray(blurred[rows, cols])
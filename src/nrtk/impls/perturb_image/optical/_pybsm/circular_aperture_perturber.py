@@ -121,6 +121,7 @@ class CircularAperturePerturber(PybsmPerturberMixin):
         self._override_eta: float | None = eta
 
         self._simulator = self._create_simulator()
+        self._load_otf_bundle()
 
     @override
     def _create_simulator(self) -> ImageSimulator:
@@ -80,6 +80,7 @@ class DefocusPerturber(PybsmPerturberMixin):
         self._override_w_y = w_y
 
         self._simulator = self._create_simulator()
+        self._load_otf_bundle()
 
     @override
     def _create_simulator(self) -> ImageSimulator:
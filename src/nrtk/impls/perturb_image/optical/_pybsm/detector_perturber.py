@@ -90,6 +90,7 @@ class DetectorPerturber(PybsmPerturberMixin):
         self._override_f = f
 
         self._simulator = self._create_simulator()
+        self._load_otf_bundle()
 
     @override
     def _create_simulator(self) -> ImageSimulator:
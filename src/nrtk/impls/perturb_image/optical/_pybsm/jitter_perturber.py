@@ -78,6 +78,7 @@ class JitterPerturber(PybsmPerturberMixin):
         self._override_s_y = s_y
 
         self._simulator = self._create_simulator()
+        self._load_otf_bundle()
 
     @override
     def _create_simulator(self) -> ImageSimulator:
@@ -13,12 +13,15 @@ from __future__ import annotations
 __all__: list[str] = []
 
 import copy
+import os
 from abc import ABC, abstractmethod
-from collections.abc import Hashable, Iterable
-from typing import Any
+from collections.abc import Hashable, Iterable, Sequence
+from pathlib import Path
+from typing import Any, Literal
 
 import numpy as np
 from numpy.typing import NDArray
+from pybsm.otf.functional import resampled_dimensions
 from pybsm.simulation import ImageSimulator
 from pybsm.simulation.scenario import Scenario
 from pybsm.simulation.sensor import Sensor
@@ -26,7 +29,15 @@ from smqtk_image_io.bbox import AxisAlignedBoundingBox
 from typing_extensions import override
 
 from nrtk.impls.perturb_image._base._numpy_random_perturb_image import NumpyRandomPerturbImage
+from nrtk.impls.perturb_image.optical._pybsm._component_otf_simulator import ComponentOTFSimulator
 from nrtk.impls.perturb_image.optical._pybsm._constants import DEFAULT_PYBSM_PARAMS
+from nrtk.impls.perturb_image.optical._pybsm._otf_bundle import bundle_path, export_otf_bundle, import_otf_bundle
+from nrtk.impls.perturb_image.optical._pybsm._quality_metrics import quality_metrics
+from nrtk.impls.perturb_image.optical._pybsm._shared_spectrum import shared_spectrum_correlate
+from nrtk.interfaces import PerturbImage
+
+# Border padding of the pyBSM convolution methods whose blurs sweeps share the image spectrum of
+_SWEEP_PADDING: dict[str, Literal["reflect", "constant"]] = {"oaconvolve": "reflect", "fftconvolve": "constant"}
 
 
 class PybsmPerturberMixin(NumpyRandomPerturbImage, ABC):
@@ -36,6 +47,10 @@ class PybsmPerturberMixin(NumpyRandomPerturbImage, ABC):
     - Sensor/scenario initialization and validation
     - Default parameter handling
     - Image perturbation workflow (GSD extraction, simulation, box rescaling)
+    - Batched perturbation, simulating images of the same size and GSD together
+    - Parameter sweeps sharing the spectrum of the image between perturbers
+    - Export and import of the computed OTFs and PSFs as bundles shared between processes
+    - Analytic image quality estimates for screening sweeps
     - Configuration management base functionality
 
     Attributes:
@@ -334,6 +349,74 @@ class PybsmPerturberMixin(NumpyRandomPerturbImage, ABC):
         """Create the specific ImageSimulator for this perturber."""
         pass
 
+    def _load_otf_bundle(self) -> None:
+        """Give the simulator the OTFs and PSFs of its bundle in the OTF bundle directory, if there is one."""
+        path = bundle_path(self._simulator)
+        if path is not None and path.exists():
+            import_otf_bundle(simulator=self._simulator, path=path)
+
+    def export_otf_bundle(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        img_gsds: Iterable[float] = (),
+    ) -> Path:
+        """Compute the OTFs of this perturber and its PSFs for the given image GSDs, and write them to a bundle.
+
+        Perturbers computing the same OTFs and PSFs, such as those of the workers of a sweep, take them from the
+        bundle memory-mapped, with ``import_otf_bundle`` or on construction when the bundle is in the OTF bundle
+        directory, instead of computing them again.
+
+        Args:
+            path:
+                File to write, or None to write to the OTF bundle directory, named by the fingerprint of the values
+                the OTFs and PSFs are computed from.
+            img_gsds:
+                GSDs of the images that will be perturbed, whose PSFs are bundled.
+
+        Returns:
+            The file written.
+
+        Raises:
+            ValueError: If 'path' is None and no OTF bundle directory is set.
+        """
+        target = bundle_path(self._simulator) if path is None else Path(path)
+        if target is None:
+            raise ValueError("No OTF bundle directory is set, see otf.set_otf_bundle_dir or NRTK_OTF_BUNDLE_DIR")
+        export_otf_bundle(
+            simulator=self._simulator,
+            path=target,
+            # Perturbers using the default PSF use it for images of any GSD
+            gsds=[None] if self._use_default_psf else img_gsds,
+        )
+        return target
+
+    def import_otf_bundle(self, path: str | os.PathLike[str]) -> bool:
+        """Take the OTFs and PSFs of a bundle written by ``export_otf_bundle``, memory-mapped read-only.
+
+        Args:
+            path:
+                Bundle to read.
+
+        Returns:
+            Whether the bundle was computed from the same parameters as the OTFs and PSFs of this perturber, and so
+            taken. Bundles of other parameters are left unused.
+        """
+        return import_otf_bundle(simulator=self._simulator, path=Path(path))
+
+    def quality_metrics(self) -> dict[str, float]:
+        """Analytic image quality estimates of the sensor and scenario of this perturber, without simulating images.
+
+        The estimates are those of pyBSM's NIIRS model for the whole system, whichever of its effects this perturber
+        simulates. They are cheap enough to screen the points of a sweep before perturbing any image, see
+        ``PerturbImageFactory.screen``.
+
+        Returns:
+            The geometric mean ground sample distance ``"gsd"`` (m) and relative edge response ``"rer"``, the SNR
+            of a GIQE target ``"snr"``, and the ``"niirs"`` of the GIQE 3.
+        """
+        return quality_metrics(sensor=self.sensor, scenario=self.scenario, interp=self.interp)
+
     @override
     def perturb(
         self,
@@ -370,7 +453,10 @@ class PybsmPerturberMixin(NumpyRandomPerturbImage, ABC):
         if self._use_default_psf:
             img_gsd = None
 
-        _, blur_img, noisy_img = self._simulator.simulate_image(image, gsd=img_gsd)
+        if isinstance(self._simulator, ComponentOTFSimulator):
+            _, blur_img, noisy_img = self._simulator.simulate_image(image, gsd=img_gsd, rng=self._rng)
+        else:
+            _, blur_img, noisy_img = self._simulator.simulate_image(image, gsd=img_gsd)
 
         if self._simulator.add_noise and noisy_img is not None:  # noqa: SIM108 - ternary is less readable with compound condition
             perturbed_image = noisy_img
@@ -380,6 +466,249 @@ class PybsmPerturberMixin(NumpyRandomPerturbImage, ABC):
         # Handle formatting and box rescaling
         return self._handle_boxes_and_format(sim_img=perturbed_image, boxes=boxes, orig_shape=image.shape)
 
+    @override
+    def perturb_batch(
+        self,
+        *,
+        images: np.ndarray[Any, Any] | Sequence[np.ndarray[Any, Any]],
+        boxes_list: Sequence[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None] | None = None,
+        img_gsd: float | Sequence[float] | None = None,
+        fft_workers: int | None = None,
+        **kwargs: Any,
+    ) -> tuple[
+        np.ndarray[Any, Any] | list[np.ndarray[Any, Any]],
+        list[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None],
+    ]:
+        """Apply the OTF-based perturbation to a batch of images, simulating images of the same size and GSD together.
+
+        Images sharing their shape and GSD are blurred with one stacked pair of forward and inverse FFTs, by
+        simulators that support it. Noise is then drawn for each image in batch order, so the result matches
+        perturbing the images one at a time. Other simulators, and static perturbers, perturb one image at a time.
+
+        Args:
+            images:
+                Batch of input images, either stacked along a leading axis or as a sequence of numpy arrays.
+            boxes_list:
+                Optional bounding boxes for each image. Must contain exactly one entry per image when provided.
+            img_gsd:
+                GSD of every image, or a sequence with the GSD of each image.
+            fft_workers:
+                Number of threads of the FFTs of each group of images, or None for one per CPU.
+            kwargs:
+                Additional perturbation keyword arguments (currently unused).
+
+        Returns:
+            The perturbed images and the bounding boxes of each image, scaled to the perturbed image shape.
+
+        Raises:
+            ValueError: If 'img_gsd' is None, or is a sequence whose length differs from the number of images.
+        """
+        if img_gsd is None:
+            raise ValueError("img_gsd must be provided for this perturber")
+        gsds = [float(img_gsd)] * len(images) if np.ndim(img_gsd) == 0 else list(img_gsd)  # pyright: ignore[reportArgumentType]
+        if len(gsds) != len(images):
+            raise ValueError(f"img_gsd must have one value per image, got {len(gsds)} for {len(images)} images")
+        boxes_list = self._batch_boxes_list(images=images, boxes_list=boxes_list)
+
+        if not isinstance(self._simulator, ComponentOTFSimulator) or self._resets_seed:
+            perturbed = [
+                self.perturb(image=image, boxes=boxes, img_gsd=gsd, **kwargs)
+                for image, boxes, gsd in zip(images, boxes_list, gsds, strict=True)
+            ]
+        else:
+            blurred = self._blur_batch(images=images, gsds=gsds, fft_workers=fft_workers)
+            perturbed = [
+                self._handle_boxes_and_format(
+                    sim_img=self._apply_noise(blur_img),
+                    boxes=copy.deepcopy(boxes),
+                    orig_shape=image.shape,
+                )
+                for image, boxes, blur_img in zip(images, boxes_list, blurred, strict=True)
+            ]
+        return self._stack_batch(images=images, perturbed_images=[image for image, _ in perturbed]), [
+            boxes for _, boxes in perturbed
+        ]
+
+    def _blur_batch(
+        self,
+        *,
+        images: np.ndarray[Any, Any] | Sequence[np.ndarray[Any, Any]],
+        gsds: list[float],
+        fft_workers: int | None,
+    ) -> list[np.ndarray[Any, Any]]:
+        """Blurred image of each image, simulating the images of each shape and GSD together."""
+        groups: dict[tuple[tuple[int, ...], float | None], list[int]] = {}
+        for idx, (image, gsd) in enumerate(zip(images, gsds, strict=True)):
+            groups.setdefault((image.shape, None if self._use_default_psf else gsd), []).append(idx)
+
+        simulator: ComponentOTFSimulator = self._simulator  # pyright: ignore[reportAssignmentType] - checked by caller
+        blurred: list[np.ndarray[Any, Any]] = [np.empty(0)] * len(images)
+        for (_, gsd), indices in groups.items():
+            group = simulator.blur_batch(
+                [images[idx] for idx in indices],
+                gsd=gsd,
+                workers=-1 if fft_workers is None else fft_workers,
+            )
+            for idx, blur_img in zip(indices, group, strict=True):
+                blurred[idx] = blur_img
+        return blurred
+
+    @override
+    @classmethod
+    def _perturb_sweep(
+        cls,
+        *,
+        perturbers: Sequence[PerturbImage],
+        image: np.ndarray[Any, Any],
+        boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None = None,
+        img_gsd: float | None = None,
+        fft_workers: int | None = None,
+        **kwargs: Any,
+    ) -> list[tuple[np.ndarray[Any, Any], Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]]:
+        """Perturb one image with each of several perturbers, transforming the image once.
+
+        The PSF of each perturber is turned into a correlation kernel. Kernels of similar size are transformed
+        together, and applied to the spectrum of the image, which is transformed once for them. Each blurred image
+        is then resampled and given noise by its perturber. If any perturber converts images to reflectance or
+        resets its random state, or the call has further arguments, the perturbers are called in turn instead.
+
+        Args:
+            perturbers:
+                Perturbers of this type, in order.
+            image:
+                Input image.
+            boxes:
+                Input bounding boxes.
+            img_gsd:
+                GSD of the image.
+            fft_workers:
+                Number of threads of the FFTs, or None for one per CPU.
+            kwargs:
+                Keyword arguments given to every perturber.
+
+        Returns:
+            The perturbed image and bounding boxes of each perturber.
+
+        Raises:
+            ValueError: If 'img_gsd' is None.
+        """
+        if img_gsd is None:
+            raise ValueError("img_gsd must be provided for this perturber")
+        sweep = [perturber for perturber in perturbers if isinstance(perturber, PybsmPerturberMixin)]
+        correlations = [perturber._sweep_correlation(img_gsd=img_gsd) for perturber in sweep]  # noqa: SLF001
+        if kwargs or len(sweep) != len(perturbers) or None in correlations:
+            return super()._perturb_sweep(perturbers=perturbers, image=image, boxes=boxes, img_gsd=img_gsd, **kwargs)
+
+        blurred = cls._sweep_blur(
+            image=np.asarray(image),
+            correlations=correlations,  # pyright: ignore[reportArgumentType] - checked above
+            workers=-1 if fft_workers is None else fft_workers,
+        )
+        return [
+            perturber._finish_blur(  # noqa: SLF001
+                blur_img=blur_img,
+                boxes=copy.deepcopy(boxes),
+                img_gsd=img_gsd,
+                orig_shape=image.shape,
+            )
+            for perturber, blur_img in zip(sweep, blurred, strict=True)
+        ]
+
+    @staticmethod
+    def _sweep_blur(
+        *,
+        image: np.ndarray[Any, Any],
+        correlations: list[tuple[np.ndarray[Any, Any], Literal["reflect", "constant"]]],
+        workers: int,
+    ) -> list[np.ndarray[Any, Any]]:
+        """Blurred image of each correlation, sharing the spectrum of the image between kernels of similar size.
+
+        Kernels are grouped by border padding and by the power of two bounding their size, since sharing a spectrum
+        transforms every kernel of a group at the size of the largest.
+        """
+        groups: dict[tuple[str, int, int], list[int]] = {}
+        for idx, (kernel, mode) in enumerate(correlations):
+            key = (mode, (kernel.shape[0] // 2).bit_length(), (kernel.shape[1] // 2).bit_length())
+            groups.setdefault(key, []).append(idx)
+
+        blurred: list[np.ndarray[Any, Any]] = [np.empty(0)] * len(correlations)
+        for (mode, _, _), indices in groups.items():
+            group = shared_spectrum_correlate(
+                image=image,
+                kernels=[correlations[idx][0] for idx in indices],
+                mode=mode,  # pyright: ignore[reportArgumentType] - a padding of _SWEEP_PADDING
+                workers=workers,
+            )
+            for idx, blur_img in zip(indices, group, strict=True):
+                blurred[idx] = blur_img
+        return blurred
+
+    def _sweep_correlation(
+        self,
+        *,
+        img_gsd: float,
+    ) -> tuple[np.ndarray[Any, Any], Literal["reflect", "constant"]] | None:
+        """Kernel that the simulator correlates images with, and how it pads their borders, or None if not shared.
+
+        Sweeps only share the spectrum of images that the simulator blurs in their pixel values, with the border
+        padding of ``oaconvolve`` or ``fftconvolve``.
+        """
+        method = self._simulator._get_convolution_method()  # noqa: SLF001
+        if method not in _SWEEP_PADDING or self._simulator._use_reflectance or self._resets_seed:  # noqa: SLF001
+            return None
+        gsd = None if self._use_default_psf else img_gsd
+        psf = self._simulator._get_psf_cached(gsd=gsd, use_default=gsd is None)  # noqa: SLF001
+        # oaconvolve correlates with the PSF, fftconvolve convolves with it
+        return (psf if method == "oaconvolve" else psf[::-1, ::-1]), _SWEEP_PADDING[method]
+
+    def _finish_blur(
+        self,
+        *,
+        blur_img: np.ndarray[Any, Any],
+        boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None,
+        img_gsd: float,
+        orig_shape: tuple[int, ...],
+    ) -> tuple[np.ndarray[Any, Any], Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]:
+        """Resample and add noise to a blurred image as ``perturb()`` does, then format it and rescale the boxes."""
+        gsd = None if self._use_default_psf else img_gsd
+        if gsd and self._simulator.do_resample:
+            blur_img = self._simulator.apply_resampling(blur_img, gsd)
+        return self._handle_boxes_and_format(sim_img=self._apply_noise(blur_img), boxes=boxes, orig_shape=orig_shape)
+
+    def _apply_noise(self, blur_img: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+        """Add the noise of the simulator, if any, drawn from the random state of the call in progress."""
+        if not self._simulator.add_noise:
+            return blur_img
+        if isinstance(self._simulator, ComponentOTFSimulator):
+            return self._simulator.apply_noise(blur_img, rng=self._rng)
+        return self._simulator.apply_noise(blur_img)
+
+    @override
+    def _blur_kernel(
+        self,
+        *,
+        image: np.ndarray[Any, Any],
+        img_gsd: float | None = None,
+        **kwargs: Any,
+    ) -> np.ndarray[Any, Any] | None:
+        # Missing GSDs are rejected by perturb(), and added noise is not a linear shift-invariant operation
+        if img_gsd is None or self._simulator.add_noise:
+            return None
+
+        gsd = None if self._use_default_psf else img_gsd
+        if gsd is not None and self._simulator.do_resample:
+            # Only a resampling that preserves the image size leaves the blurred image untouched
+            dx_out = self._simulator._calculate_dx_out(gsd=gsd)  # noqa: SLF001
+            new_wh = resampled_dimensions(img_hw=image.shape[:2], dx_in=gsd / self.slant_range, dx_out=dx_out)
+            if tuple(new_wh) != (image.shape[1], image.shape[0]):
+                return None
+
+        psf = self._simulator._get_psf_cached(gsd=gsd, use_default=gsd is None)  # noqa: SLF001
+        if self._simulator._get_convolution_method() == "fftconvolve":  # noqa: SLF001
+            # True convolution rather than correlation
+            return psf[::-1, ::-1]
+        return psf
+
     @override
     def get_config(self) -> dict[str, Any]:
         """Generates a serializable config that can be used to rehydrate object."""
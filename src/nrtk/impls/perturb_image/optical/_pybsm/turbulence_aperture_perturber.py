@@ -167,6 +167,7 @@ class TurbulenceAperturePerturber(PybsmPerturberMixin):
         self._override_aircraft_speed: float | None = aircraft_speed
 
         self._simulator = self._create_simulator()
+        self._load_otf_bundle()
 
     @override
     def _create_simulator(self) -> ImageSimulator:  # noqa: C901 - override branching for default vs user-provided params
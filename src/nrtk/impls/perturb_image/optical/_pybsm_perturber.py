@@ -21,19 +21,22 @@ from __future__ import annotations
 
 __all__ = ["PybsmPerturber"]
 
+import copy
 from collections.abc import Hashable, Iterable
-from typing import Any, get_args
+from typing import Any, ClassVar, get_args
 
 import numpy as np
-from pybsm.simulation import ImageSimulator, SystemOTFSimulator
+from pybsm.simulation import ImageSimulator
 from smqtk_image_io.bbox import AxisAlignedBoundingBox
 from typing_extensions import override
 
+from nrtk.impls.perturb_image.optical._pybsm._component_otf_simulator import ComponentOTFSimulator
 from nrtk.impls.perturb_image.optical._pybsm._constants import DEFAULT_PYBSM_PARAMS, PixelConversionMode
 from nrtk.impls.perturb_image.optical._pybsm.pybsm_perturber_mixin import PybsmPerturberMixin
+from nrtk.utils._incremental import IncrementalParamsMixin
 
 
-class PybsmPerturber(PybsmPerturberMixin):
+class PybsmPerturber(PybsmPerturberMixin, IncrementalParamsMixin):
     """Implements image perturbation using pyBSM sensor and scenario configurations.
 
     The `PybsmPerturber` class applies realistic perturbations to images by leveraging
@@ -70,6 +73,11 @@ class PybsmPerturber(PybsmPerturberMixin):
     warnings, ADC fallback), see ``ImageSimulator.photoelectrons_to_pixels``:
     https://github.com/Kitware/pybsm/blob/main/src/pybsm/simulation/image_simulator.py
 
+    ``with_params`` and ``update`` change parameters without recomputing what the change leaves valid: the
+    atmosphere unless the haze, altitude or ground range change, and the aperture, turbulence and wavefront OTFs,
+    which dominate the cost of the first perturbation, unless parameters they depend on change. A sweep over jitter,
+    detector or radiometric parameters thus computes them once.
+
     Attributes:
         reflectance_range (np.ndarray):
             Default reflectance range for image simulation.
@@ -79,6 +87,8 @@ class PybsmPerturber(PybsmPerturberMixin):
             If True, recreates simulator after each call for consistent results.
     """
 
+    _rng_entry_points: ClassVar[tuple[str, ...]] = ("perturb_realizations",)
+
     def __init__(
         self,
         *,
@@ -307,20 +317,89 @@ class PybsmPerturber(PybsmPerturberMixin):
 
         self._reflectance_range: np.ndarray[Any, Any] = reflectance_range
         self._pixel_conversion_mode: PixelConversionMode = pixel_conversion_mode
+        # Arguments left to their defaults, which are derived from other arguments
+        self._derived_params = frozenset(
+            name
+            for name, value in {
+                "p_y": p_y,
+                "w_x": w_x,
+                "w_y": w_y,
+                "optics_transmission": optics_transmission,
+                "qe_wavelengths": qe_wavelengths,
+                "qe": qe,
+            }.items()
+            if value is None
+        )
         self._simulator = self._create_simulator()
+        self._load_otf_bundle()
 
     @override
     def _create_simulator(self) -> ImageSimulator:
-        """Create SystemOTFSimulator with explicit parameters."""
-        return SystemOTFSimulator(
+        """Create the system OTF simulator, reusing the derived state of the perturber being updated, if any."""
+        source = self._reuse_source
+        return ComponentOTFSimulator(
             sensor=self.sensor,
             scenario=self.scenario,
             add_noise=True,
             rng=self._rng,
             use_reflectance=True,
             reflectance_range=self._reflectance_range,
+            previous=source._simulator if isinstance(source, PybsmPerturber) else None,  # noqa: SLF001 - same class
         )
 
+    def perturb_realizations(
+        self,
+        *,
+        image: np.ndarray[Any, Any],
+        count: int,
+        boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None = None,
+        img_gsd: float | None = None,
+        **kwargs: Any,
+    ) -> list[tuple[np.ndarray[Any, Any], Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]]:
+        """Perturb one image with ``count`` independent noise realizations of a single optical simulation.
+
+        The image is blurred once, and the noise of every realization is drawn together. The realizations equal
+        those of ``count`` consecutive calls to ``perturb()``, which would each repeat the blur. Like ``perturb()``,
+        the call may be given its own ``rng`` or ``seed``. Static perturbers reset their random state after each
+        call to ``perturb()``, so all their realizations are the same.
+
+        Args:
+            image:
+                The image to be perturbed.
+            count:
+                Number of realizations.
+            boxes:
+                Bounding boxes for detections in input image.
+            img_gsd:
+                GSD is the distance between the centers of two adjacent pixels in an image, measured on the ground.
+            kwargs:
+                Additional perturbation keyword arguments (currently unused).
+
+        Returns:
+            The perturbed image and bounding boxes of each realization.
+
+        Raises:
+            ValueError: If 'img_gsd' is None or 'count' is less than 1.
+        """
+        if img_gsd is None:
+            raise ValueError("img_gsd must be provided for this perturber")
+        if count < 1:
+            raise ValueError(f"count must be at least 1, got {count}")
+        if self._resets_seed:
+            perturbed_image, perturbed_boxes = self.perturb(image=image, boxes=boxes, img_gsd=img_gsd, **kwargs)
+            return [(perturbed_image.copy(), copy.deepcopy(perturbed_boxes)) for _ in range(count)]
+
+        simulator: ComponentOTFSimulator = self._simulator  # pyright: ignore[reportAssignmentType] - created here
+        (blur_img,) = simulator.blur_batch([image], gsd=None if self._use_default_psf else img_gsd)
+        return [
+            self._handle_boxes_and_format(sim_img=noisy_img, boxes=copy.deepcopy(boxes), orig_shape=image.shape)
+            for noisy_img in simulator.apply_noise_realizations(blur_img, count=count, rng=self._rng)
+        ]
+
+    @override
+    def _params(self) -> dict[str, Any]:
+        return self.get_config() | dict.fromkeys(self._derived_params)
+
     def __str__(self) -> str:
         """Returns a string representation combining sensor and scenario names."""
         return self.sensor.name + " " + self.scenario.name
@@ -329,22 +408,6 @@ class PybsmPerturber(PybsmPerturberMixin):
         """Returns a representation of the perturber including sensor and scenario names."""
         return self.__str__()
 
-    @override
-    def _set_seed(self) -> None:
-        """Reset numpy RNG and update the simulator's RNG reference.
-
-        Directly reassigns the simulator's internal RNG rather than recreating
-        the simulator, which would wipe the cached atmospheric data.
-
-        The hasattr guard is needed because RandomPerturbImage.__init__ calls
-        _set_seed() before subclasses have created the simulator.
-        TODO: Replace with self._simulator.set_random_seed() once pyBSM
-        exposes a public API for reseeding (avoids accessing private _rng).
-        """
-        super()._set_seed()
-        if hasattr(self, "_simulator"):
-            self._simulator._rng = self._rng  # noqa: SLF001
-
     @override
     def get_config(self) -> dict[str, Any]:
         """Get current configuration including perturber-specific parameters."""
@@ -370,10 +433,9 @@ class PybsmPerturber(PybsmPerturberMixin):
         orig_shape: tuple,
     ) -> tuple[np.ndarray, Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]:
         """Override to convert photoelectrons to pixels, rescale boxes, and cast to uint8."""
-        # Choose between "radiometric" or "minmax" to convert photoelectrons to pixels
-        sim = self._simulator.photoelectrons_to_pixels(sim_img, mode=self._pixel_conversion_mode)
-        # Convert to uint8 (already clipped to [0, 255] by the conversion)
-        sim_img_uint8 = sim.astype(np.uint8)
+        # Choose between "radiometric" or "minmax" to convert photoelectrons to pixels, clipped to [0, 255]
+        simulator: ComponentOTFSimulator = self._simulator  # pyright: ignore[reportAssignmentType] - created here
+        sim_img_uint8 = simulator.photoelectrons_to_uint8(sim_img, mode=self._pixel_conversion_mode)
 
         # Rescale boxes if provided
         if boxes:
@@ -33,13 +33,16 @@ from __future__ import annotations
 __all__ = ["RadialDistortionPerturber"]
 
 from collections.abc import Hashable, Iterable, Sequence
+from copy import deepcopy
+from functools import lru_cache, partial
 from typing import Any
 
 import numpy as np
 from smqtk_image_io.bbox import AxisAlignedBoundingBox
 from typing_extensions import override
 
-from nrtk.interfaces import PerturbImage
+from nrtk.interfaces import BoxArray, PerturbImage
+from nrtk.interfaces._warp_map import WarpMap
 
 
 class RadialDistortionPerturber(PerturbImage):
@@ -54,6 +57,9 @@ class RadialDistortionPerturber(PerturbImage):
 
     """
 
+    # Pixels are gathered into a separately allocated output
+    _copy_input = False
+
     def __init__(
         self,
         *,
@@ -76,8 +82,8 @@ class RadialDistortionPerturber(PerturbImage):
             raise ValueError("k must have exactly 3 values")
         self.color_fill: np.ndarray[Any, Any] = np.array(color_fill)
 
+    @staticmethod
     def _radial_transform(
-        self,
         *,
         x0: np.ndarray[Any, Any],
         y0: np.ndarray[Any, Any],
@@ -144,40 +150,107 @@ class RadialDistortionPerturber(PerturbImage):
         """
         perturbed_image, perturbed_boxes = super().perturb(image=image, boxes=boxes)
 
-        # Get w, h and empty output image
-        h, w = float(perturbed_image.shape[0]), float(perturbed_image.shape[1])
-        out = np.full_like(perturbed_image, self.color_fill.astype(perturbed_image.dtype), dtype=perturbed_image.dtype)
+        warp = self._warp(image=perturbed_image)
+        return warp.apply(perturbed_image).astype(np.uint8), warp.warp_boxes(perturbed_boxes)
+
+    @override
+    def perturb_batch(
+        self,
+        *,
+        images: np.ndarray[Any, Any] | Sequence[np.ndarray[Any, Any]],
+        boxes_list: Sequence[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None] | None = None,
+        **kwargs: Any,
+    ) -> tuple[
+        np.ndarray[Any, Any] | list[np.ndarray[Any, Any]],
+        list[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None],
+    ]:
+        """Applies a radial distortion to a stacked batch of images, computing the distortion only once.
+
+        Batches given as a sequence of arrays are perturbed one image at a time.
+        """
+        if not isinstance(images, np.ndarray):
+            return super().perturb_batch(images=images, boxes_list=boxes_list, **kwargs)
 
-        # Get distorted coordinates
-        x0, y0 = np.meshgrid(np.arange(perturbed_image.shape[1]), np.arange(perturbed_image.shape[0]))
-        x1, y1 = self._radial_transform(x0=x0, y0=y0, w=w, h=h, k=self.k)
+        boxes_list = self._batch_boxes_list(images=images, boxes_list=boxes_list)
+        warp = self._warp(image=images[0])
 
-        # Valid index mask
-        valid_mask = (x1 >= 0) & (x1 < perturbed_image.shape[1]) & (y1 >= 0) & (y1 < perturbed_image.shape[0])
+        perturbed_boxes = [warp.warp_boxes(deepcopy(boxes)) for boxes in boxes_list]
+        return warp.apply(images, batched=True).astype(np.uint8), perturbed_boxes
 
-        # Assign using correct shape and axis order
-        out[y0[valid_mask], x0[valid_mask]] = perturbed_image[y1[valid_mask], x1[valid_mask]]
+    @override
+    def _warp_map(self, *, image: np.ndarray[Any, Any], **kwargs: Any) -> WarpMap | None:
+        # perturb() casts its output to uint8
+        if image.dtype != np.uint8:
+            return None
+        return self._warp(image=image)
 
-        # Update bounding boxes
-        if perturbed_boxes:
-            perturbed_boxes = list(perturbed_boxes)
-            for i in range(len(perturbed_boxes)):
-                box, label = perturbed_boxes[i]
+    def _warp(self, *, image: np.ndarray[Any, Any]) -> WarpMap:
+        """Helper to build the pixel mapping of the distortion for an image of the given shape and dtype.
 
-                # Get corners
-                min_x, min_y = box.min_vertex
-                max_x, max_y = box.max_vertex
-                x0 = np.array([min_x, max_x, max_x, min_x])
-                y0 = np.array([min_y, min_y, max_y, max_y])
+        Args:
+            image (np.ndarray[Any, Any]): Image to distort
 
-                # Transform corners
-                x1, y1 = self._radial_transform(x0=x0, y0=y0, w=w, h=h, k=[-k for k in self.k])
+        Returns:
+            WarpMap gathering each distorted pixel from the image, or setting it to the color fill
+        """
+        h, w = image.shape[0], image.shape[1]
+        return WarpMap(
+            index=_distortion_index(h=h, w=w, k=tuple(self.k)),
+            shape=(h, w),
+            fills=[self.color_fill.astype(image.dtype)],
+            box_transforms=[partial(self._distort_boxes, h=float(h), w=float(w))],
+        )
+
+    def _distort_boxes(
+        self,
+        *,
+        boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None,
+        h: float,
+        w: float,
+    ) -> Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None:
+        """Helper to update bounding boxes to follow the distortion.
 
-                # New axis-aligned bounding box from distorted corners
-                perturbed_boxes[i] = (self._align_box(np.transpose([x1, y1])), label)
+        Args:
+            boxes: Bounding boxes to update
+            h (float): Image height as a float
+            w (float): Image width as a float
 
-        perturbed_image = out.astype(np.uint8)
-        return perturbed_image, perturbed_boxes
+        Returns:
+            Updated bounding boxes
+        """
+        if not boxes:
+            return boxes
+
+        if isinstance(boxes, BoxArray):
+            # Transform the four corners of every box at once
+            x1, y1 = self._radial_transform(
+                x0=boxes.coords[:, [0, 2, 2, 0]],
+                y0=boxes.coords[:, [1, 1, 3, 3]],
+                w=w,
+                h=h,
+                k=[-k for k in self.k],
+            )
+            return boxes.with_coords(
+                np.column_stack((x1.min(axis=1), y1.min(axis=1), x1.max(axis=1), y1.max(axis=1))),
+            )
+
+        distorted_boxes = list(boxes)
+        for i in range(len(distorted_boxes)):
+            box, label = distorted_boxes[i]
+
+            # Get corners
+            min_x, min_y = box.min_vertex
+            max_x, max_y = box.max_vertex
+            x0 = np.array([min_x, max_x, max_x, min_x])
+            y0 = np.array([min_y, min_y, max_y, max_y])
+
+            # Transform corners
+            x1, y1 = self._radial_transform(x0=x0, y0=y0, w=w, h=h, k=[-k for k in self.k])
+
+            # New axis-aligned bounding box from distorted corners
+            distorted_boxes[i] = (self._align_box(np.transpose([x1, y1])), label)
+
+        return distorted_boxes
 
     @override
     def get_config(self) -> dict[str, Any]:
@@ -186,3 +259,16 @@ class RadialDistortionPerturber(PerturbImage):
         cfg["k"] = self.k
         cfg["color_fill"] = self.color_fill
         return cfg
+
+
+@lru_cache(maxsize=8)
+def _distortion_index(*, h: int, w: int, k: tuple[float, ...]) -> np.ndarray[Any, Any]:
+    """Flat index of the source pixel of each pixel of a distorted (h, w) image, -1 where it falls outside the image.
+
+    The returned index is cached and read-only, so that sweeps over images of the same size compute it once.
+    """
+    x0, y0 = np.meshgrid(np.arange(w), np.arange(h))
+    x1, y1 = RadialDistortionPerturber._radial_transform(x0=x0, y0=y0, w=float(w), h=float(h), k=k)  # noqa: SLF001
+    index = WarpMap.source_index(x=x1, y=y1, shape=(h, w))
+    index.setflags(write=False)
+    return index
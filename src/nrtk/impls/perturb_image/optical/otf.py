@@ -6,9 +6,24 @@ from typing import TYPE_CHECKING, Any
 from nrtk._guard import Group, guard
 
 if TYPE_CHECKING:
+    from nrtk.impls.perturb_image.optical._pybsm._atmosphere_cache import (
+        get_atmosphere_cache_dir as get_atmosphere_cache_dir,
+    )
+    from nrtk.impls.perturb_image.optical._pybsm._atmosphere_cache import (
+        precompute_atmospheres as precompute_atmospheres,
+    )
+    from nrtk.impls.perturb_image.optical._pybsm._atmosphere_cache import (
+        set_atmosphere_cache_dir as set_atmosphere_cache_dir,
+    )
     from nrtk.impls.perturb_image.optical._pybsm._default_config import (
         load_default_config as load_default_config,
     )
+    from nrtk.impls.perturb_image.optical._pybsm._otf_bundle import (
+        get_otf_bundle_dir as get_otf_bundle_dir,
+    )
+    from nrtk.impls.perturb_image.optical._pybsm._otf_bundle import (
+        set_otf_bundle_dir as set_otf_bundle_dir,
+    )
     from nrtk.impls.perturb_image.optical._pybsm.circular_aperture_perturber import (
         CircularAperturePerturber as CircularAperturePerturber,
     )
@@ -43,6 +58,11 @@ __getattr__, __dir__, __all__ = guard(
                 "DetectorPerturber": f"{_PYBSM}.detector_perturber",
                 "JitterPerturber": f"{_PYBSM}.jitter_perturber",
                 "TurbulenceAperturePerturber": f"{_PYBSM}.turbulence_aperture_perturber",
+                "get_atmosphere_cache_dir": f"{_PYBSM}._atmosphere_cache",
+                "get_otf_bundle_dir": f"{_PYBSM}._otf_bundle",
+                "precompute_atmospheres": f"{_PYBSM}._atmosphere_cache",
+                "set_atmosphere_cache_dir": f"{_PYBSM}._atmosphere_cache",
+                "set_otf_bundle_dir": f"{_PYBSM}._otf_bundle",
             },
             extras=["pybsm"],
         ),
@@ -66,4 +66,15 @@ class AverageBlurPerturber(BlurPerturberMixin, PerturbImage):
         """Return image stimulus after applying average blurring."""
         _image, _boxes = super().perturb(image=image, boxes=boxes, **additional_params)
 
-        return cv2.blur(_image, ksize=(self.ksize, self.ksize)), _boxes
+        return self._blur(_image), _boxes
+
+    @override
+    def _blur(self, image: np.ndarray[Any, Any], *, dst: np.ndarray[Any, Any] | None = None) -> np.ndarray[Any, Any]:
+        return cv2.blur(image, ksize=(self.ksize, self.ksize), dst=dst)
+
+    @override
+    def _blur_kernel(self, *, image: np.ndarray[Any, Any], **kwargs: Any) -> np.ndarray[Any, Any] | None:
+        # Images that are not channel last are rejected by perturb()
+        if image.ndim == 3 and image.shape[2] > 4:
+            return None
+        return np.full((self.ksize, self.ksize), 1 / self.ksize**2)
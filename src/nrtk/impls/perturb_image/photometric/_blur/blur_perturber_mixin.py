@@ -4,7 +4,9 @@ from __future__ import annotations
 
 __all__ = []
 
-from collections.abc import Hashable, Iterable
+import abc
+from collections.abc import Hashable, Iterable, Sequence
+from copy import deepcopy
 from typing import Any
 
 import numpy as np
@@ -15,6 +17,9 @@ from nrtk.interfaces import PerturbImage
 
 
 class BlurPerturberMixin(PerturbImage):
+    # OpenCV blurs into a new array
+    _copy_input = False
+
     def __init__(self, ksize: int = 1) -> None:
         super().__init__()
         self.ksize = ksize
@@ -36,6 +41,39 @@ class BlurPerturberMixin(PerturbImage):
 
         return _image, _boxes
 
+    @abc.abstractmethod
+    def _blur(self, image: np.ndarray[Any, Any], *, dst: np.ndarray[Any, Any] | None = None) -> np.ndarray[Any, Any]:
+        """Blur a single image, writing into ``dst`` when given."""
+
+    @override
+    def perturb_batch(
+        self,
+        *,
+        images: np.ndarray[Any, Any] | Sequence[np.ndarray[Any, Any]],
+        boxes_list: Sequence[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None] | None = None,
+        **kwargs: Any,
+    ) -> tuple[
+        np.ndarray[Any, Any] | list[np.ndarray[Any, Any]],
+        list[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None],
+    ]:
+        """Blur a stacked batch of images directly into a single preallocated output array.
+
+        Batches given as a sequence of arrays are perturbed one image at a time.
+        """
+        if not isinstance(images, np.ndarray):
+            return super().perturb_batch(images=images, boxes_list=boxes_list, **kwargs)
+
+        # Check for channel last format
+        if images.ndim == 4 and images.shape[3] > 4:
+            raise ValueError("Images are not in expected format (N, H, W, C)")
+
+        boxes_list = self._batch_boxes_list(images=images, boxes_list=boxes_list)
+        perturbed_images = np.empty_like(images)
+        for image, perturbed_image in zip(images, perturbed_images, strict=True):
+            self._blur(image, dst=perturbed_image)
+
+        return perturbed_images, [deepcopy(boxes) for boxes in boxes_list]
+
     @override
     def get_config(self) -> dict[str, Any]:
         """Returns the current configuration of the MedianBlurPerturber instance.
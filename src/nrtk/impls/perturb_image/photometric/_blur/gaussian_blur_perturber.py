@@ -69,4 +69,16 @@ class GaussianBlurPerturber(BlurPerturberMixin, PerturbImage):
         """Return image stimulus after applying Gaussian blurring."""
         _image, _boxes = super().perturb(image=image, boxes=boxes, **additional_params)
 
-        return cv2.GaussianBlur(_image, ksize=(self.ksize, self.ksize), sigmaX=0), _boxes
+        return self._blur(_image), _boxes
+
+    @override
+    def _blur(self, image: np.ndarray[Any, Any], *, dst: np.ndarray[Any, Any] | None = None) -> np.ndarray[Any, Any]:
+        return cv2.GaussianBlur(image, ksize=(self.ksize, self.ksize), sigmaX=0, dst=dst)
+
+    @override
+    def _blur_kernel(self, *, image: np.ndarray[Any, Any], **kwargs: Any) -> np.ndarray[Any, Any] | None:
+        # Images that are not channel last are rejected by perturb()
+        if image.ndim == 3 and image.shape[2] > 4:
+            return None
+        kernel = cv2.getGaussianKernel(self.ksize, 0)
+        return kernel @ kernel.T
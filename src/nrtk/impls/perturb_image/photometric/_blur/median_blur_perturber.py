@@ -69,4 +69,8 @@ class MedianBlurPerturber(BlurPerturberMixin, PerturbImage):
         """Return image stimulus after applying Gaussian blurring."""
         _image, _boxes = super().perturb(image=image, boxes=boxes, **additional_params)
 
-        return cv2.medianBlur(_image, ksize=self.ksize), _boxes
+        return self._blur(_image), _boxes
+
+    @override
+    def _blur(self, image: np.ndarray[Any, Any], *, dst: np.ndarray[Any, Any] | None = None) -> np.ndarray[Any, Any]:
+        return cv2.medianBlur(image, ksize=self.ksize, dst=dst)
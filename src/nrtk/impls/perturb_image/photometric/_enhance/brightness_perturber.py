@@ -23,6 +23,7 @@ __all__ = ["BrightnessPerturber"]
 from collections.abc import Hashable, Iterable
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from numpy.typing import NDArray
 from PIL import ImageEnhance
 from smqtk_image_io.bbox import AxisAlignedBoundingBox
@@ -30,6 +31,7 @@ from typing_extensions import override
 
 from nrtk.impls.perturb_image.photometric._enhance.enhance_perturber_mixin import (
     EnhancePerturberMixin,
+    _blend_lut,
     _Enhancement,
 )
 
@@ -55,3 +57,13 @@ class BrightnessPerturber(EnhancePerturberMixin, PerturbImage):
         ):  # pragma: no cover
             raise ValueError("enhancement does not conform to _Enhancement protocol")
         return super()._perturb(enhancement=enhancement, image=perturbed_image), perturbed_boxes
+
+    @override
+    def _enhance_lut(
+        self,
+        *,
+        image: NDArray[np.uint8],
+        lut: NDArray[np.uint8],
+    ) -> NDArray[np.uint8]:
+        # Brightness blends every image with black
+        return _blend_lut(degenerate=0, factor=self.factor)
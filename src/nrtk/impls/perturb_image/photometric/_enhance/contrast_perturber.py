@@ -23,6 +23,7 @@ __all__ = ["ContrastPerturber"]
 from collections.abc import Hashable, Iterable
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from numpy.typing import NDArray
 from PIL import ImageEnhance
 from smqtk_image_io.bbox import AxisAlignedBoundingBox
@@ -30,6 +31,7 @@ from typing_extensions import override
 
 from nrtk.impls.perturb_image.photometric._enhance.enhance_perturber_mixin import (
     EnhancePerturberMixin,
+    _blend_lut,
     _Enhancement,
 )
 
@@ -55,3 +57,21 @@ class ContrastPerturber(EnhancePerturberMixin, PerturbImage):
         ):  # pragma: no cover
             raise ValueError("enhancement does not conform to _Enhancement protocol")
         return super()._perturb(enhancement=enhancement, image=perturbed_image), perturbed_boxes
+
+    @override
+    def _enhance_lut(self, *, image: NDArray[np.uint8], lut: NDArray[np.uint8]) -> NDArray[np.uint8]:
+        # Contrast blends the image with its mean grayscale level, rounded as PIL does
+        mean = int(self._grayscale(image, lut=lut).mean() + 0.5)
+        return _blend_lut(degenerate=mean, factor=self.factor)
+
+    @staticmethod
+    def _grayscale(image: NDArray[np.uint8], *, lut: NDArray[np.uint8]) -> NDArray[np.uint32]:
+        """Convert an L, RGB or RGBA image to grayscale with the fixed-point ITU-R 601-2 luma transform PIL uses.
+
+        Each channel of ``image`` is first mapped through the matching row of ``lut``.
+        """
+        if image.ndim == 2:
+            return lut[0].astype(np.uint32)[image]
+        # Fold the luma weights into the lookup tables so that the mapped image is never materialized
+        weighted = lut[:3].astype(np.uint32) * np.array([[19595], [38470], [7471]], dtype=np.uint32)
+        return (weighted[0][image[..., 0]] + weighted[1][image[..., 1]] + weighted[2][image[..., 2]] + 0x8000) >> 16
@@ -5,12 +5,16 @@ from __future__ import annotations
 __all__ = []
 
 import abc
+from collections.abc import Hashable, Iterable, Sequence
+from copy import deepcopy
+from functools import lru_cache
 from typing import Any, Protocol, runtime_checkable
 
 import numpy as np
 from numpy.typing import NDArray
 from PIL import Image
 from PIL.Image import Image as PILImage
+from smqtk_image_io.bbox import AxisAlignedBoundingBox
 from typing_extensions import override
 
 from nrtk.interfaces import PerturbImage
@@ -26,7 +30,41 @@ class _Enhancement(Protocol):  # Used for type checking only  # pragma: no cover
         pass
 
 
+@lru_cache(maxsize=1024)
+def _blend_lut(*, degenerate: int, factor: float) -> NDArray[np.uint8]:
+    """Lookup table reproducing ``PIL.Image.blend`` of a constant ``degenerate`` level with every uint8 value.
+
+    The returned table is cached and read-only.
+    """
+    ramp = Image.fromarray(np.arange(256, dtype=np.uint8).reshape(1, 256))
+    lut = np.asarray(Image.blend(Image.new("L", ramp.size, degenerate), ramp, factor)).reshape(256)
+    lut.setflags(write=False)
+    return lut
+
+
+def _identity_lut(channels: int) -> NDArray[np.uint8]:
+    """Lookup table of shape (channels, 256) mapping every uint8 value of each channel to itself."""
+    return np.tile(np.arange(256, dtype=np.uint8), (channels, 1))
+
+
+def _is_lut_batch(images: NDArray[Any] | Sequence[NDArray[Any]]) -> bool:
+    """Whether ``images`` is a stacked batch of images PIL would treat as L, RGB or RGBA."""
+    if not isinstance(images, np.ndarray):
+        return False
+    if images.dtype != np.uint8 and not np.issubdtype(images.dtype, np.floating):
+        return False
+    return images.ndim == 3 or (images.ndim == 4 and images.shape[3] in (3, 4))
+
+
+def _is_lut_image(image: NDArray[Any]) -> bool:
+    """Whether ``image`` is a uint8 image PIL would treat as L, RGB or RGBA."""
+    return image.dtype == np.uint8 and (image.ndim == 2 or (image.ndim == 3 and image.shape[2] in (3, 4)))
+
+
 class EnhancePerturberMixin(PerturbImage):
+    # PIL enhancements always produce a new image
+    _copy_input = False
+
     def __init__(self, factor: float = 1.0) -> None:
         """Private class to handle general Enhancement functions.
 
@@ -75,6 +113,110 @@ class EnhancePerturberMixin(PerturbImage):
 
         return image_np
 
+    def _enhance_lut(
+        self,
+        *,
+        image: NDArray[np.uint8],  # noqa: ARG002 - see overrides
+        lut: NDArray[np.uint8],  # noqa: ARG002 - see overrides
+    ) -> NDArray[np.uint8] | None:
+        """Lookup table equivalent to the enhancement, shared by the color channels of an image.
+
+        Args:
+            image:
+                uint8 L, RGB or RGBA image.
+            lut:
+                Lookup table of shape (C, 256) through which each channel of ``image`` is mapped before the
+                enhancement.
+
+        Returns:
+            Array of shape (256,) mapping each input value to its enhanced value, or None if the enhancement is
+            not pointwise.
+        """
+        return None
+
+    def _batch_luts(self, images: NDArray[np.uint8]) -> NDArray[np.uint8] | None:
+        """Per-image lookup tables equivalent to the enhancement.
+
+        Args:
+            images:
+                Stacked batch of uint8 images.
+
+        Returns:
+            Array of shape (N, 256) mapping each input value of each image to its enhanced value, or None if the
+            enhancement is not pointwise.
+        """
+        identity = _identity_lut(images.shape[3] if images.ndim == 4 else 1)
+        batch_luts = np.empty((len(images), 256), dtype=np.uint8)
+        for i, image in enumerate(images):
+            lut = self._enhance_lut(image=image, lut=identity)
+            if lut is None:
+                return None
+            batch_luts[i] = lut
+        return batch_luts
+
+    @override
+    def _pointwise_lut(
+        self,
+        *,
+        image: NDArray[Any],
+        lut: NDArray[np.uint8],
+        **kwargs: Any,
+    ) -> NDArray[np.uint8] | None:
+        if not _is_lut_image(image):
+            return None
+        enhance_lut = self._enhance_lut(image=image, lut=lut)
+        if enhance_lut is None:
+            return None
+        stage_lut = np.tile(enhance_lut, (len(lut), 1))
+        if len(lut) == 4:
+            # PIL leaves the alpha channel untouched
+            stage_lut[3] = np.arange(256)
+        return stage_lut
+
+    @override
+    def perturb_batch(
+        self,
+        *,
+        images: NDArray[Any] | Sequence[NDArray[Any]],
+        boxes_list: Sequence[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None] | None = None,
+        **kwargs: Any,
+    ) -> tuple[
+        NDArray[Any] | list[NDArray[Any]],
+        list[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None],
+    ]:
+        """Apply a pointwise enhancement to a stacked batch of images through lookup tables.
+
+        Enhancements that are not pointwise, and batches PIL would not read as L, RGB or RGBA images, are
+        perturbed one image at a time.
+        """
+        if not _is_lut_batch(images):
+            return super().perturb_batch(images=images, boxes_list=boxes_list, **kwargs)
+
+        # Same intermediary conversion as _perturb
+        is_float = np.issubdtype(images.dtype, np.floating)
+        uint8_images = (images * 255).astype(np.uint8) if is_float else images
+
+        luts = self._batch_luts(uint8_images)
+        if luts is None:
+            return super().perturb_batch(images=images, boxes_list=boxes_list, **kwargs)
+
+        boxes_list = self._batch_boxes_list(images=images, boxes_list=boxes_list)
+        perturbed_images = self._apply_luts(images=uint8_images, luts=luts)
+        if is_float:
+            perturbed_images = perturbed_images.astype(images.dtype) / 255
+
+        return perturbed_images, [deepcopy(boxes) for boxes in boxes_list]
+
+    @staticmethod
+    def _apply_luts(*, images: NDArray[np.uint8], luts: NDArray[np.uint8]) -> NDArray[np.uint8]:
+        """Map each image through its lookup table, leaving any alpha channel untouched as PIL does."""
+        perturbed_images = np.empty_like(images)
+        for image, lut, perturbed_image in zip(images, luts, perturbed_images, strict=True):
+            np.take(lut, image, out=perturbed_image)
+        if images.ndim == 4 and images.shape[3] == 4:
+            perturbed_images[..., 3] = images[..., 3]
+        return perturbed_images
+
     @override
     def get_config(self) -> dict[str, Any]:
         """Returns the current configuration of the EnhancePerturberMixin instance."""
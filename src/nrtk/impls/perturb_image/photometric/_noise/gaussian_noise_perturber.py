@@ -41,4 +41,8 @@ class GaussianNoisePerturber(GaussianSpeckleNoisePerturberMixin):
     ) -> tuple[np.ndarray[Any, Any], Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]:
         """Return image stimulus with Gaussian noise."""
         perturbed_image, perturbed_boxes = super().perturb(image=image, boxes=boxes, **kwargs)
-        return self._perturb(image=perturbed_image, mode="gaussian", var=self.var, mean=self.mean), perturbed_boxes
+        return self._perturb(image=perturbed_image, **self._noise_kwargs()), perturbed_boxes
+
+    @override
+    def _noise_kwargs(self) -> dict[str, Any]:
+        return {"mode": "gaussian", "var": self.var, "mean": self.mean}
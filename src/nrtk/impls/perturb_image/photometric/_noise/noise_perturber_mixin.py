@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import abc
+from collections.abc import Hashable, Iterable, Sequence
+from copy import deepcopy
 from typing import Any
 
 import numpy as np
 import skimage.util
+from smqtk_image_io.bbox import AxisAlignedBoundingBox
 from typing_extensions import override
 
 from nrtk.impls.perturb_image._base._numpy_random_perturb_image import NumpyRandomPerturbImage
+from nrtk.utils._precision import float_dtype
 
 __all__ = [
     "NoisePerturberMixin",
@@ -18,8 +23,20 @@ __all__ = [
 
 
 class NoisePerturberMixin(NumpyRandomPerturbImage):
-    def __init__(self, *, seed: int | None = None, is_static: bool = False, clip: bool = True) -> None:
+    # random_noise never writes into its input
+    _copy_input = False
+
+    def __init__(
+        self,
+        *,
+        seed: int | None = None,
+        is_static: bool = False,
+        clip: bool = True,
+        precision: str | None = None,
+    ) -> None:
         self.clip = clip
+        float_dtype(precision)
+        self.precision = precision
         super().__init__(seed=seed, is_static=is_static)
 
     def _perturb(self, *, image: np.ndarray, **kwargs: Any) -> np.ndarray:
@@ -52,17 +69,49 @@ class NoisePerturberMixin(NumpyRandomPerturbImage):
         else:
             convert = convert_image[dtype_str]
 
-        # Apply perturbation
-        image_noise = skimage.util.random_noise(image, rng=self._rng, clip=self.clip, **kwargs)
+        # Apply perturbation to the image converted to the configured precision, as random_noise would otherwise
+        # convert it to float64
+        as_float = {
+            np.dtype(np.float32): skimage.util.img_as_float32,
+            np.dtype(np.float64): skimage.util.img_as_float64,
+        }
+        image_float = as_float[float_dtype(self.precision)](image)
+        image_noise = skimage.util.random_noise(image_float, rng=self._rng, clip=self.clip, **kwargs)
 
         # Convert image back to original dtype
         return convert(image_noise).astype(image.dtype)
 
+    @abc.abstractmethod
+    def _noise_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for the random_noise call, including the noise ``mode``."""
+
+    @override
+    def perturb_batch(
+        self,
+        *,
+        images: np.ndarray[Any, Any] | Sequence[np.ndarray[Any, Any]],
+        boxes_list: Sequence[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None] | None = None,
+        **kwargs: Any,
+    ) -> tuple[
+        np.ndarray[Any, Any] | list[np.ndarray[Any, Any]],
+        list[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None],
+    ]:
+        """Apply noise to a stacked batch of images with a single random_noise call.
+
+        Batches given as a sequence of arrays, and static perturbers, are perturbed one image at a time.
+        """
+        if not isinstance(images, np.ndarray) or self._resets_seed:
+            return super().perturb_batch(images=images, boxes_list=boxes_list, **kwargs)
+
+        boxes_list = self._batch_boxes_list(images=images, boxes_list=boxes_list)
+        return self._perturb(image=images, **self._noise_kwargs()), [deepcopy(boxes) for boxes in boxes_list]
+
     @override
     def get_config(self) -> dict[str, Any]:
         """Returns the current configuration of the _SKImageNoisePerturber instance."""
         cfg = super().get_config()
         cfg["clip"] = self.clip
+        cfg["precision"] = self.precision
         return cfg
 
 
@@ -74,6 +123,7 @@ class SaltPepperNoisePerturberMixin(NoisePerturberMixin):
         is_static: bool = False,
         amount: float = 0.05,
         clip: bool = True,
+        precision: str | None = None,
     ) -> None:
         """Initializes the SPNoisePerturber.
 
@@ -88,8 +138,11 @@ class SaltPepperNoisePerturberMixin(NoisePerturberMixin):
                 Proportion of image pixels to replace with noise on range [0, 1].
             clip:
                 Decide if output is clipped between the range of [-1, 1].
+            precision:
+                Floating-point precision, "float32" or "float64", of the noisy image. If None, the default
+                precision set with ``nrtk.utils.set_default_precision()`` is used.
         """
-        super().__init__(seed=seed, is_static=is_static, clip=clip)
+        super().__init__(seed=seed, is_static=is_static, clip=clip, precision=precision)
 
         if amount < 0.0 or amount > 1.0:
             raise ValueError(
@@ -115,6 +168,7 @@ class GaussianSpeckleNoisePerturberMixin(NoisePerturberMixin):
         mean: float = 0.0,
         var: float = 0.05,
         clip: bool = True,
+        precision: str | None = None,
     ) -> None:
         """Initializes the GSNoisePerturber.
 
@@ -131,8 +185,11 @@ class GaussianSpeckleNoisePerturberMixin(NoisePerturberMixin):
                 Variance of random distribution.
             clip:
                 Decide if output is clipped between the range of [-1, 1].
+            precision:
+                Floating-point precision, "float32" or "float64", of the noisy image. If None, the default
+                precision set with ``nrtk.utils.set_default_precision()`` is used.
         """
-        super().__init__(seed=seed, is_static=is_static, clip=clip)
+        super().__init__(seed=seed, is_static=is_static, clip=clip, precision=precision)
 
         if var < 0:
             raise ValueError(
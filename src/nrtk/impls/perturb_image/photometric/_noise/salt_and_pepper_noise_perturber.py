@@ -38,6 +38,8 @@ class SaltAndPepperNoisePerturber(SaltPepperNoisePerturberMixin):
             If True and seed is set, resets RNG state after each perturb call.
         clip (bool):
             Decide if output is clipped between the range of [-1, 1].
+        precision (str | None):
+            Floating-point precision of the noisy image, or None to follow the default precision.
         amount (float):
             Proportion of image pixels to replace with noise on range [0, 1]
         salt_vs_pepper (float):
@@ -52,6 +54,7 @@ class SaltAndPepperNoisePerturber(SaltPepperNoisePerturberMixin):
         amount: float = 0.05,
         salt_vs_pepper: float = 0.5,
         clip: bool = True,
+        precision: str | None = None,
     ) -> None:
         """Initializes the SaltAndPepperNoisePerturber.
 
@@ -69,8 +72,11 @@ class SaltAndPepperNoisePerturber(SaltPepperNoisePerturberMixin):
                 Higher values represent more salt.
             clip:
                 Decide if output is clipped between the range of [-1, 1].
+            precision:
+                Floating-point precision, "float32" or "float64", of the noisy image. If None, the default
+                precision set with ``nrtk.utils.set_default_precision()`` is used.
         """
-        super().__init__(amount=amount, seed=seed, is_static=is_static, clip=clip)
+        super().__init__(amount=amount, seed=seed, is_static=is_static, clip=clip, precision=precision)
 
         if salt_vs_pepper < 0.0 or salt_vs_pepper > 1.0:
             raise ValueError(
@@ -89,13 +95,11 @@ class SaltAndPepperNoisePerturber(SaltPepperNoisePerturberMixin):
     ) -> tuple[np.ndarray[Any, Any], Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]:
         """Return image stimulus with S&P noise."""
         perturbed_image, perturbed_boxes = super().perturb(image=image, boxes=boxes, **kwargs)
+        return self._perturb(image=perturbed_image, **self._noise_kwargs()), perturbed_boxes
 
-        return self._perturb(
-            image=perturbed_image,
-            mode="s&p",
-            amount=self.amount,
-            salt_vs_pepper=self.salt_vs_pepper,
-        ), perturbed_boxes
+    @override
+    def _noise_kwargs(self) -> dict[str, Any]:
+        return {"mode": "s&p", "amount": self.amount, "salt_vs_pepper": self.salt_vs_pepper}
 
     @override
     def get_config(self) -> dict[str, Any]:
@@ -38,6 +38,8 @@ class SaltNoisePerturber(SaltPepperNoisePerturberMixin):
             If True and seed is set, resets RNG state after each perturb call.
         clip (bool):
             Decide if output is clipped between the range of [-1, 1].
+        precision (str | None):
+            Floating-point precision of the noisy image, or None to follow the default precision.
         amount (float):
             Proportion of image pixels to replace with salt noise on range [0, 1]
     """
@@ -52,4 +54,8 @@ class SaltNoisePerturber(SaltPepperNoisePerturberMixin):
     ) -> tuple[np.ndarray[Any, Any], Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]:
         """Return image stimulus with salt noise."""
         perturbed_image, perturbed_boxes = super().perturb(image=image, boxes=boxes, **kwargs)
-        return self._perturb(image=perturbed_image, mode="salt", amount=self.amount), perturbed_boxes
+        return self._perturb(image=perturbed_image, **self._noise_kwargs()), perturbed_boxes
+
+    @override
+    def _noise_kwargs(self) -> dict[str, Any]:
+        return {"mode": "salt", "amount": self.amount}
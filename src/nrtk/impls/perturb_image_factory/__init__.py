@@ -6,6 +6,15 @@ from typing import TYPE_CHECKING, Any
 from nrtk._guard import Group, guard
 
 if TYPE_CHECKING:
+    from nrtk.impls.perturb_image_factory._perturber_adaptive_factory import (
+        PerturberAdaptiveFactory as PerturberAdaptiveFactory,
+    )
+    from nrtk.impls.perturb_image_factory._perturber_halton_factory import (
+        PerturberHaltonFactory as PerturberHaltonFactory,
+    )
+    from nrtk.impls.perturb_image_factory._perturber_latin_hypercube_factory import (
+        PerturberLatinHypercubeFactory as PerturberLatinHypercubeFactory,
+    )
     from nrtk.impls.perturb_image_factory._perturber_linspace_factory import (
         PerturberLinspaceFactory as PerturberLinspaceFactory,
     )
@@ -15,6 +24,15 @@ if TYPE_CHECKING:
     from nrtk.impls.perturb_image_factory._perturber_one_step_factory import (
         PerturberOneStepFactory as PerturberOneStepFactory,
     )
+    from nrtk.impls.perturb_image_factory._perturber_screen_factory import (
+        PerturberScreenFactory as PerturberScreenFactory,
+    )
+    from nrtk.impls.perturb_image_factory._perturber_shard_factory import (
+        PerturberShardFactory as PerturberShardFactory,
+    )
+    from nrtk.impls.perturb_image_factory._perturber_sobol_factory import (
+        PerturberSobolFactory as PerturberSobolFactory,
+    )
     from nrtk.impls.perturb_image_factory._perturber_step_factory import (
         PerturberStepFactory as PerturberStepFactory,
     )
@@ -28,9 +46,15 @@ __getattr__, __dir__, __all__ = guard(
     groups=[
         Group(
             symbols={
+                "PerturberAdaptiveFactory": "nrtk.impls.perturb_image_factory._perturber_adaptive_factory",
+                "PerturberHaltonFactory": "nrtk.impls.perturb_image_factory._perturber_halton_factory",
+                "PerturberLatinHypercubeFactory": "nrtk.impls.perturb_image_factory._perturber_latin_hypercube_factory",
                 "PerturberLinspaceFactory": "nrtk.impls.perturb_image_factory._perturber_linspace_factory",
                 "PerturberMultivariateFactory": "nrtk.impls.perturb_image_factory._perturber_multivariate_factory",
                 "PerturberOneStepFactory": "nrtk.impls.perturb_image_factory._perturber_one_step_factory",
+                "PerturberScreenFactory": "nrtk.impls.perturb_image_factory._perturber_screen_factory",
+                "PerturberShardFactory": "nrtk.impls.perturb_image_factory._perturber_shard_factory",
+                "PerturberSobolFactory": "nrtk.impls.perturb_image_factory._perturber_sobol_factory",
                 "PerturberStepFactory": "nrtk.impls.perturb_image_factory._perturber_step_factory",
             },
         ),
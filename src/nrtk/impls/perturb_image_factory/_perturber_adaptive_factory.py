@@ -0,0 +1,200 @@
+"""Defines PerturberAdaptiveFactory, which sweeps a parameter at values refined where perturbed images change most.
+
+Classes:
+    PerturberAdaptiveFactory: Factory producing `PerturbImage` instances for an explicit, sorted list of values of
+    one parameter, typically chosen by ``from_calibration``.
+
+Dependencies:
+    - numpy for comparing perturbed images.
+    - nrtk.interfaces for the `PerturbImage` and `PerturbImageFactory` interfaces.
+
+Usage:
+    Call ``PerturberAdaptiveFactory.from_calibration`` with a calibration subset of images, the range of the
+    parameter and a budget of points. The range is first evaluated on a coarse grid, then the intervals between
+    neighbouring values whose perturbed images differ most are bisected until the budget is met. The configuration of
+    the resulting factory lists the chosen values, so it can be saved and reused without the calibration images.
+
+Example:
+    >>> import numpy as np
+    >>> from nrtk.impls.perturb_image.photometric.enhance import BrightnessPerturber
+    >>> images = [np.full((8, 8, 3), 128, dtype=np.uint8)]
+    >>> factory = PerturberAdaptiveFactory.from_calibration(
+    ...     perturber=BrightnessPerturber, theta_key="factor", start=0.0, stop=2.0, images=images, budget=9
+    ... )
+    >>> len(factory)
+    9
+"""
+
+from __future__ import annotations
+
+__all__ = ["PerturberAdaptiveFactory"]
+
+import heapq
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import numpy as np
+from typing_extensions import Self, override
+
+from nrtk.interfaces import PerturbImage, PerturbImageFactory
+from nrtk.interfaces._random_perturb_image import RandomPerturbImage
+
+
+def _mean_absolute_difference(*, a: np.ndarray[Any, Any], b: np.ndarray[Any, Any]) -> float:
+    """Mean absolute difference between two images, computed in float32."""
+    return float(np.mean(np.abs(a.astype(np.float32) - b.astype(np.float32))))
+
+
+def _change(
+    *,
+    a: Sequence[np.ndarray[Any, Any]],
+    b: Sequence[np.ndarray[Any, Any]],
+    metric: Callable[..., float],
+) -> float:
+    """Metric between two sets of perturbed calibration images, averaged over the images."""
+    return float(np.mean([metric(a=x, b=y) for x, y in zip(a, b, strict=True)]))
+
+
+class PerturberAdaptiveFactory(PerturbImageFactory):
+    """Factory stepping through an explicit, sorted list of values of one perturber parameter.
+
+    Uniform sweeps spend most of their points where perturbed images barely change, such as at very low or saturating
+    strengths. ``from_calibration`` instead places points where the output changes most between neighbouring values,
+    keeping resolution where robustness curves bend for the same number of perturbers.
+
+    Attributes:
+        perturber (type[PerturbImage]):
+            perturber type to produce
+        theta_key (str):
+            perturber parameter to modify
+    """
+
+    def __init__(
+        self,
+        *,
+        perturber: type[PerturbImage],
+        theta_key: str,
+        thetas: Sequence[float],
+        perturber_kwargs: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize the factory to produce PerturbImage instances of the given type.
+
+        Args:
+            perturber:
+                Python implementation type of the PerturbImage interface to produce.
+            theta_key:
+                Perturber parameter to vary between instances.
+            thetas:
+                Values of ``theta_key``, one per instance. They are sorted in increasing order.
+            perturber_kwargs:
+                Default kwargs to be used by the perturber. Defaults to {}.
+
+        Raises:
+            TypeError:
+                Given a perturber instance instead of type.
+        """
+        super().__init__(perturber=perturber, theta_key=theta_key, perturber_kwargs=perturber_kwargs)
+
+        self._thetas = sorted(thetas)
+
+    @classmethod
+    def from_calibration(
+        cls,
+        *,
+        perturber: type[PerturbImage],
+        theta_key: str,
+        start: float,
+        stop: float,
+        images: Sequence[np.ndarray[Any, Any]],
+        budget: int,
+        num_coarse: int = 5,
+        metric: Callable[..., float] | None = None,
+        perturber_kwargs: dict[str, Any] | None = None,
+    ) -> Self:
+        """Choose ``budget`` values of ``theta_key`` in [start, stop] by refining where perturbed images change most.
+
+        The calibration images are perturbed at ``num_coarse`` evenly spaced values. The change of an interval between
+        neighbouring values is the metric between their perturbed images, averaged over the calibration images. The
+        interval with the largest change is split at its midpoint, and the two halves are evaluated in turn, until
+        ``budget`` values have been chosen. Random perturbers are called with a fixed seed, so that changes reflect
+        the parameter rather than the random state.
+
+        Args:
+            perturber:
+                Python implementation type of the PerturbImage interface to produce.
+            theta_key:
+                Perturber parameter to vary between instances.
+            start:
+                Initial value of the range (inclusive).
+            stop:
+                Final value of the range (inclusive).
+            images:
+                Calibration images. The perturber must keep their size.
+            budget:
+                Number of values to choose.
+            num_coarse:
+                Number of evenly spaced values of the initial grid. Defaults to 5.
+            metric:
+                Function measuring the change between two perturbed images, passed as keywords ``a`` and ``b``.
+                Defaults to their mean absolute difference.
+            perturber_kwargs:
+                Default kwargs to be used by the perturber. Defaults to {}.
+
+        Returns:
+            A factory stepping through the chosen values.
+
+        Raises:
+            ValueError:
+                If num_coarse is less than 2 or budget is less than num_coarse.
+
+        Note:
+            Fewer than ``budget`` values are chosen if the range runs out of distinct floating-point midpoints.
+        """
+        if num_coarse < 2:
+            raise ValueError(f"num_coarse must be at least 2, got {num_coarse}")
+        if budget < num_coarse:
+            raise ValueError(f"budget must be at least num_coarse ({num_coarse}), got {budget}")
+
+        factory = cls(perturber=perturber, theta_key=theta_key, thetas=[], perturber_kwargs=perturber_kwargs)
+        metric = _mean_absolute_difference if metric is None else metric
+
+        outputs = {
+            theta: factory._perturb_all(theta=theta, images=images)
+            for theta in np.linspace(start, stop, num_coarse).tolist()
+        }
+
+        coarse = sorted(outputs)
+        intervals = [
+            (-_change(a=outputs[a], b=outputs[b], metric=metric), a, b)
+            for a, b in zip(coarse[:-1], coarse[1:], strict=True)
+        ]
+        heapq.heapify(intervals)
+        while intervals and len(outputs) < budget:
+            _, a, b = heapq.heappop(intervals)
+            mid = (a + b) / 2
+            if mid in outputs:
+                # The interval is too narrow to split further in floating point
+                continue
+            outputs[mid] = factory._perturb_all(theta=mid, images=images)
+            heapq.heappush(intervals, (-_change(a=outputs[a], b=outputs[mid], metric=metric), a, mid))
+            heapq.heappush(intervals, (-_change(a=outputs[mid], b=outputs[b], metric=metric), mid, b))
+
+        factory._thetas = sorted(outputs)
+        return factory
+
+    def _perturb_all(self, *, theta: float, images: Sequence[np.ndarray[Any, Any]]) -> list[np.ndarray[Any, Any]]:
+        """Perturb each calibration image with the perturber for ``theta``."""
+        perturber = self._create_perturber(kwargs={self.theta_key: theta})
+        kwargs = {"seed": 0} if isinstance(perturber, RandomPerturbImage) else {}
+        return [perturber(image=image, **kwargs)[0] for image in images]
+
+    @property
+    @override
+    def thetas(self) -> Sequence[float]:
+        return self._thetas
+
+    @override
+    def get_config(self) -> dict[str, Any]:
+        cfg = super().get_config()
+        cfg["thetas"] = self.thetas
+        return cfg
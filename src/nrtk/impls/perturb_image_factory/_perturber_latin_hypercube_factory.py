@@ -0,0 +1,41 @@
+"""Defines PerturberLatinHypercubeFactory, which creates PerturbImage instances at the points of a Latin hypercube.
+
+Classes:
+    PerturberLatinHypercubeFactory: Factory producing one `PerturbImage` per point of a Latin hypercube design over
+    several parameters, each either a continuous range or a list of discrete values.
+
+Dependencies:
+    - numpy for drawing the design.
+    - nrtk.interfaces for the `PerturbImage` interface.
+
+Example:
+    >>> from nrtk.impls.perturb_image.photometric.enhance import BrightnessPerturber
+    >>> factory = PerturberLatinHypercubeFactory(
+    ...     perturber=BrightnessPerturber, theta_keys=["factor"], thetas=[{"low": 0.1, "high": 2.0}], num_samples=8
+    ... )
+"""
+
+from __future__ import annotations
+
+__all__ = ["PerturberLatinHypercubeFactory"]
+
+from typing import Any
+
+import numpy as np
+from typing_extensions import override
+
+from nrtk.impls.perturb_image_factory._perturber_sampling_factory import PerturberSamplingFactory
+from nrtk.impls.perturb_image_factory._sampling import latin_hypercube
+
+
+class PerturberLatinHypercubeFactory(PerturberSamplingFactory):
+    """Factory creating a `PerturbImage` for each point of a Latin hypercube design.
+
+    The range of every parameter is divided into ``num_samples`` equal strata and each stratum holds exactly one
+    point, at a random position within it. Each parameter on its own is therefore covered evenly for any budget, while
+    the pairing of strata across parameters is random.
+    """
+
+    @override
+    def _unit_samples(self, *, num_samples: int, dims: int) -> np.ndarray[Any, Any]:
+        return latin_hypercube(num_samples=num_samples, dims=dims, rng=np.random.default_rng(self.seed))
@@ -93,12 +93,16 @@ class PerturberLinspaceFactory(PerturbImageFactory):
         self.stop = stop
         self.num = num
         self.endpoint = endpoint
+        self._thetas_cache: tuple[tuple[float, float, int, bool], list[float]] | None = None
 
     @property
     @override
     def thetas(self) -> Sequence[float]:
-        """Use linspace to generate the desired range of values."""
-        return np.linspace(self.start, self.stop, self.num, endpoint=self.endpoint).tolist()
+        """Use linspace to generate the desired range of values, once per start, stop, num and endpoint."""
+        key = (self.start, self.stop, self.num, self.endpoint)
+        if self._thetas_cache is None or self._thetas_cache[0] != key:
+            self._thetas_cache = (key, np.linspace(self.start, self.stop, self.num, endpoint=self.endpoint).tolist())
+        return self._thetas_cache[1]
 
     @override
     def get_config(self) -> dict[str, Any]:
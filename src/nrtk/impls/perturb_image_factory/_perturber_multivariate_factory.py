@@ -15,14 +15,62 @@ Example:
 
 __all__ = ["PerturberMultivariateFactory"]
 
+import math
 from collections.abc import Iterable, Iterator, Sequence
-from typing import Any
+from typing import Any, overload
 
 from typing_extensions import override
 
 from nrtk.interfaces import PerturbImage, PerturbImageFactory
 
 
+class _IndexSets(Sequence[list[int]]):
+    """Lazy cartesian product of parameter indices, decoded on demand from a flat index.
+
+    A flat index is written in mixed radix with one digit per parameter, the first parameter being the most
+    significant digit, so the order matches a nested loop over the parameters. No combination is stored.
+    """
+
+    def __init__(self, top: Sequence[int]) -> None:
+        """Initializes the index sets.
+
+        Args:
+            top: Number of values of each parameter.
+        """
+        self._top = tuple(top)
+        self._len = math.prod(self._top)
+
+    def __len__(self) -> int:
+        """Returns the number of index combinations."""
+        return self._len
+
+    @overload
+    def __getitem__(self, idx: int) -> list[int]: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> Sequence[list[int]]: ...
+
+    def __getitem__(self, idx: int | slice) -> list[int] | Sequence[list[int]]:
+        """Decodes the index combination at a flat index.
+
+        Args:
+            idx: Flat index of the combination (supports negative indices), or a slice of them.
+
+        Raises:
+            IndexError: If idx is out of range.
+        """
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self._len))]
+        if idx < 0:
+            idx += self._len
+        if not 0 <= idx < self._len:
+            raise IndexError("index out of range")
+        digits = [0] * len(self._top)
+        for layer in reversed(range(len(self._top))):
+            idx, digits[layer] = divmod(idx, self._top[layer])
+        return digits
+
+
 class PerturberMultivariateFactory(PerturbImageFactory):
     """Base factory for creating `PerturbImage` instances with customizable parameters.
 
@@ -34,29 +82,9 @@ class PerturberMultivariateFactory(PerturbImageFactory):
         perturber (type[PerturbImage]): Type of the PerturbImage interface to produce.
         theta_keys (Iterable[str]): Names of parameters to vary across instances.
         _thetas (Sequence[Any]): Values to vary for each parameter in `theta_keys`.
-        sets (Sequence[list[int]]): Index combinations for each parameter variation.
+        sets (Sequence[list[int]]): Index combinations for each parameter variation, decoded lazily.
     """
 
-    @staticmethod
-    def _build_set_list(*, layer: int, top: Sequence[int]) -> Sequence[list[int]]:
-        """Recursively builds a list of index sets to access combinations of parameter values.
-
-        Args:
-            layer (int): Current depth of recursion.
-            top (Sequence[int]): Maximum index values for each parameter.
-
-        Returns:
-            Sequence[list[int]]: A list of index combinations to access parameter values.
-        """
-        if layer == len(top) - 1:
-            return [[i] for i in range(top[layer])]
-
-        return [
-            [i] + e
-            for i in range(top[layer])
-            for e in PerturberMultivariateFactory._build_set_list(layer=layer + 1, top=top)
-        ]
-
     def __init__(
         self,
         *,
@@ -106,7 +134,7 @@ class PerturberMultivariateFactory(PerturbImageFactory):
         self._thetas = thetas
 
         top = [len(entry) for entry in self.thetas]
-        self.sets: Sequence[list[int]] = PerturberMultivariateFactory._build_set_list(layer=0, top=top)
+        self.sets: Sequence[list[int]] = _IndexSets(top)
         self.n: int = 0
         self.perturber_kwargs: dict[str, Any] = {} if perturber_kwargs is None else perturber_kwargs
 
@@ -130,8 +158,7 @@ class PerturberMultivariateFactory(PerturbImageFactory):
                 When all configurations have been iterated over.
         """
         if self.n < len(self.sets):
-            kwargs = {k: self.thetas[i][self.sets[self.n][i]] for i, k in enumerate(self.theta_keys)}
-            func = self._create_perturber(kwargs=kwargs)
+            func = self[self.n]
             self.n += 1
             return func
         raise StopIteration
@@ -146,8 +173,17 @@ class PerturberMultivariateFactory(PerturbImageFactory):
         Returns:
             PerturbImage: The configured `PerturbImage` instance.
         """
-        kwargs = {k: self.thetas[i][self.sets[idx][i]] for i, k in enumerate(self.theta_keys)}
-        return self._create_perturber(kwargs=kwargs)
+        return self._create_perturber(kwargs=self.theta_values(idx))
+
+    @override
+    def theta_values(self, idx: int) -> dict[str, Any]:
+        """Returns the value of each parameter in the configuration at a specific index.
+
+        Args:
+            idx: Index of the desired perturbation configuration (supports negative indices).
+        """
+        combo = self.sets[idx]
+        return {k: self.thetas[i][combo[i]] for i, k in enumerate(self.theta_keys)}
 
     @property
     @override
@@ -0,0 +1,184 @@
+"""Defines the base of the factories drawing a fixed budget of parameter points from a space-filling design.
+
+Classes:
+    PerturberSamplingFactory: Abstract factory creating one `PerturbImage` per point of a space-filling design over
+    several parameters, each either a continuous range or a list of discrete values.
+
+Dependencies:
+    - numpy for drawing the design.
+    - nrtk.interfaces for the `PerturbImage` and `PerturbImageFactory` interfaces.
+"""
+
+from __future__ import annotations
+
+__all__ = ["PerturberSamplingFactory"]
+
+import abc
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any
+
+import numpy as np
+from typing_extensions import override
+
+from nrtk.interfaces import PerturbImage, PerturbImageFactory
+
+
+def _check_theta(*, key: str, theta: Any) -> None:  # noqa: ANN401 - theta values are JSON-like
+    """Raise a ValueError if ``theta`` is neither a non-empty list of values nor a ``{"low", "high"}`` range."""
+    if isinstance(theta, Mapping):
+        if set(theta) != {"low", "high"}:
+            raise ValueError(f"Range for {key!r} must have exactly the keys 'low' and 'high', got {sorted(theta)}")
+    elif isinstance(theta, str) or not isinstance(theta, Sequence) or len(theta) == 0:
+        raise ValueError(f"Values for {key!r} must be a non-empty list or a {{'low', 'high'}} range")
+
+
+def _theta_value(*, theta: Any, u: float) -> Any:  # noqa: ANN401 - theta values are JSON-like
+    """Map a coordinate ``u`` in [0, 1) onto a ``{"low", "high"}`` range or a list of values."""
+    if isinstance(theta, Mapping):
+        return float(theta["low"] + u * (theta["high"] - theta["low"]))
+    return theta[min(int(u * len(theta)), len(theta) - 1)]
+
+
+class PerturberSamplingFactory(PerturbImageFactory):
+    """Base factory creating a `PerturbImage` for each point of a space-filling design over several parameters.
+
+    Instead of every combination of values, as in `PerturberMultivariateFactory`, the factory draws a fixed budget of
+    ``num_samples`` points spread evenly over the parameter space, so the number of perturbers does not grow with the
+    number of parameters. Each parameter is either a continuous range given as ``{"low": low, "high": high}``, sampled
+    uniformly in [low, high), or a list of discrete values, each covering an equal share of the design. The design is
+    determined by ``seed``, so factories rebuilt from the same configuration, for instance by the workers of a sharded
+    sweep, produce the same perturbers.
+
+    Subclasses implement ``_unit_samples`` to draw the design in the unit hypercube.
+
+    Attributes:
+        perturber (type[PerturbImage]): Type of the PerturbImage interface to produce.
+        theta_keys (list[str]): Names of parameters to vary across instances.
+        num_samples (int): Number of perturbers to produce.
+        seed (int): Seed of the design.
+        samples (list[list[Any]]): Values of each parameter, for each perturber.
+    """
+
+    def __init__(
+        self,
+        *,
+        perturber: type[PerturbImage],
+        theta_keys: Iterable[str],
+        thetas: Sequence[Any],
+        num_samples: int,
+        seed: int = 0,
+        perturber_kwargs: dict[str, Any] | None = None,
+    ) -> None:
+        """Initializes the factory and draws its design.
+
+        Args:
+            perturber:
+                Python implementation type of the PerturbImage interface to produce.
+            theta_keys:
+                Names of perturbation parameters to vary.
+            thetas:
+                For each parameter, either a ``{"low": low, "high": high}`` range or a list of values.
+            num_samples:
+                Number of perturbers to produce.
+            seed:
+                Seed of the design. Defaults to 0.
+            perturber_kwargs:
+                Default kwargs to be used by the perturber. Defaults to {}.
+
+        Raises:
+            TypeError:
+                If perturber is an instance instead of a type.
+            ValueError:
+                If theta_keys is empty, theta_keys and thetas have different lengths, a theta is malformed or
+                num_samples is negative.
+        """
+        super().__init__(perturber=perturber, theta_key="params", perturber_kwargs=perturber_kwargs)
+
+        self.theta_keys = list(theta_keys)
+        if len(self.theta_keys) == 0:
+            raise ValueError("theta_keys must not be empty; at least one parameter key is required")
+        if len(self.theta_keys) != len(thetas):
+            raise ValueError(
+                f"theta_keys and thetas must have the same length; "
+                f"got {len(self.theta_keys)} keys and {len(thetas)} theta sequences",
+            )
+        for key, theta in zip(self.theta_keys, thetas, strict=True):
+            _check_theta(key=key, theta=theta)
+        if num_samples < 0:
+            raise ValueError(f"num_samples must be non-negative, got {num_samples}")
+
+        self._thetas = thetas
+        self.num_samples = num_samples
+        self.seed = seed
+        self.samples: list[list[Any]] = [
+            [_theta_value(theta=theta, u=u) for theta, u in zip(thetas, point, strict=True)]
+            for point in self._unit_samples(num_samples=num_samples, dims=len(thetas)).tolist()
+        ]
+
+    @abc.abstractmethod
+    def _unit_samples(self, *, num_samples: int, dims: int) -> np.ndarray[Any, Any]:
+        """Draw the design in the unit hypercube, as an array of shape (num_samples, dims) with values in [0, 1)."""
+
+    @override
+    def __len__(self) -> int:
+        """Returns the number of perturbers in the design."""
+        return len(self.samples)
+
+    @override
+    def __iter__(self) -> Iterator[PerturbImage]:
+        """Resets the iterator and returns itself for use in for-loops."""
+        self.n = 0
+        return self
+
+    @override
+    def __next__(self) -> PerturbImage:
+        """Returns the perturber of the next point of the design.
+
+        Raises:
+            StopIteration:
+                When all points have been iterated over.
+        """
+        if self.n < len(self.samples):
+            func = self[self.n]
+            self.n += 1
+            return func
+        raise StopIteration
+
+    @override
+    def __getitem__(self, idx: int) -> PerturbImage:
+        """Retrieves the perturber of a specific point of the design.
+
+        Args:
+            idx: Index of the desired point (supports negative indices).
+
+        Returns:
+            PerturbImage: The configured `PerturbImage` instance.
+        """
+        return self._create_perturber(kwargs=self.theta_values(idx))
+
+    @override
+    def theta_values(self, idx: int) -> dict[str, Any]:
+        """Returns the value of each parameter at a specific point of the design.
+
+        Args:
+            idx: Index of the desired point (supports negative indices).
+        """
+        return dict(zip(self.theta_keys, self.samples[idx], strict=True))
+
+    @property
+    @override
+    def thetas(self) -> Sequence[Any]:
+        """Returns the range or list of values of each parameter."""
+        return self._thetas
+
+    @override
+    def get_config(self) -> dict[str, Any]:
+        """Returns the current configuration of the factory."""
+        return {
+            "perturber": self.perturber.get_type_string(),
+            "theta_keys": self.theta_keys,
+            "thetas": self.thetas,
+            "num_samples": self.num_samples,
+            "seed": self.seed,
+            "perturber_kwargs": self.perturber_kwargs,
+        }
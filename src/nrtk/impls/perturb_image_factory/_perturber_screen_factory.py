@@ -0,0 +1,168 @@
+"""Defines PerturberScreenFactory, a view over the perturbers of another factory that pass an analytic screen.
+
+Classes:
+    PerturberScreenFactory: A factory producing the perturbers of another factory whose analytic quality metrics are
+    within user-set bounds and not redundant with an earlier perturber, for pruning sweeps before perturbing images.
+
+Dependencies:
+    - smqtk_core for serializing the screened factory into the screen's configuration.
+    - nrtk.interfaces for the `PerturbImage` and `PerturbImageFactory` interfaces.
+
+Usage:
+    Call ``screen`` on a factory of perturbers providing ``quality_metrics()``, such as the pyBSM perturbers, or
+    construct `PerturberScreenFactory` directly. Every perturber of the screened factory is constructed once to
+    compute its metrics, which for pyBSM perturbers takes a few tens of milliseconds and no image simulation.
+
+Example:
+    factory = PerturberLinspaceFactory(
+        perturber=PybsmPerturber, theta_key="altitude", start=1000, stop=20000, num=40, perturber_kwargs=config
+    )
+    # Drop images too noisy to use or with too little blur to matter, and altitudes that barely change the NIIRS
+    screened = factory.screen(min_metrics={"snr": 2.0}, max_metrics={"rer": 0.9}, collapse_tolerances={"niirs": 0.1})
+    for perturber in screened:
+        ...
+"""
+
+from __future__ import annotations
+
+__all__ = ["PerturberScreenFactory"]
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from smqtk_core.configuration import to_config_dict
+from typing_extensions import override
+
+from nrtk.impls.perturb_image_factory._perturber_view_factory import _PerturberViewFactory
+from nrtk.interfaces import PerturbImage, PerturbImageFactory
+
+
+def _metric(*, metrics: Mapping[str, float], name: str) -> float:
+    """Value of metric ``name``.
+
+    Raises:
+        ValueError:
+            If there is no metric ``name``.
+    """
+    if name not in metrics:
+        raise ValueError(f"Unknown quality metric {name!r}, expected one of {sorted(metrics)}")
+    return metrics[name]
+
+
+class PerturberScreenFactory(_PerturberViewFactory):
+    """View over the perturbers of another factory that pass an analytic screen of their quality metrics.
+
+    The metrics of each perturber of the screened factory are computed with its ``quality_metrics()`` method,
+    without perturbing any image. A perturber is screened out if one of its metrics is below its minimum in
+    ``min_metrics`` or above its maximum in ``max_metrics``. Otherwise it is collapsed onto an earlier kept
+    perturber whose metrics each differ from its own by at most their tolerance in ``collapse_tolerances``, if there
+    is one, and kept if not. Screened out perturbers are dropped from the view, or only flagged in ``reasons`` when
+    ``drop`` is False.
+
+    Attributes:
+        factory (PerturbImageFactory):
+            Factory being screened.
+        min_metrics (dict[str, float]):
+            Minimum of each bounded metric.
+        max_metrics (dict[str, float]):
+            Maximum of each bounded metric.
+        collapse_tolerances (dict[str, float]):
+            Tolerance of each metric compared to collapse perturbers.
+        drop (bool):
+            Whether screened out perturbers are dropped rather than flagged.
+        metrics (list[dict[str, float]]):
+            Metrics of each perturber of the screened factory.
+        reasons (dict[int, str]):
+            Reason each screened out perturber was, by its index in the screened factory.
+    """
+
+    def __init__(
+        self,
+        *,
+        factory: PerturbImageFactory,
+        min_metrics: Mapping[str, float] | None = None,
+        max_metrics: Mapping[str, float] | None = None,
+        collapse_tolerances: Mapping[str, float] | None = None,
+        drop: bool = True,
+    ) -> None:
+        """Initialize a view over the perturbers of the given factory that pass the screen.
+
+        Args:
+            factory:
+                Factory whose perturbers are screened, which must provide ``quality_metrics()``.
+            min_metrics:
+                Minimum value of metrics, below which perturbers are screened out. Defaults to no minimum.
+            max_metrics:
+                Maximum value of metrics, above which perturbers are screened out. Defaults to no maximum.
+            collapse_tolerances:
+                Largest difference of each metric between two perturbers for the later one to be collapsed onto the
+                earlier one. Perturbers are only collapsed if at least one tolerance is given. Defaults to none.
+            drop:
+                Leave screened out perturbers out of the view if True, or keep every perturber and only record the
+                reasons they were screened out if False. Defaults to True.
+
+        Raises:
+            TypeError:
+                If the perturbers of the factory do not provide ``quality_metrics()``.
+            ValueError:
+                If a bound or tolerance names an unknown metric, or a tolerance is negative.
+        """
+        self.min_metrics = dict(min_metrics or {})
+        self.max_metrics = dict(max_metrics or {})
+        self.collapse_tolerances = dict(collapse_tolerances or {})
+        self.drop = drop
+        for name, tolerance in self.collapse_tolerances.items():
+            if tolerance < 0:
+                raise ValueError(f"Tolerance of {name!r} must be non-negative, got {tolerance}")
+
+        self.metrics = [self._quality_metrics(factory[idx]) for idx in range(len(factory))]
+        self.reasons: dict[int, str] = {}
+        kept: list[int] = []
+        for idx, metrics in enumerate(self.metrics):
+            reason = self._out_of_bounds(metrics) or self._collapsed(metrics=metrics, kept=kept)
+            if reason is None:
+                kept.append(idx)
+            else:
+                self.reasons[idx] = reason
+        super().__init__(factory=factory, indices=kept if drop else range(len(factory)))
+
+    @staticmethod
+    def _quality_metrics(perturber: PerturbImage) -> dict[str, float]:
+        """Quality metrics of ``perturber``."""
+        quality_metrics = getattr(perturber, "quality_metrics", None)
+        if not callable(quality_metrics):
+            raise TypeError(f"{type(perturber).__name__} does not provide quality_metrics() to screen")
+        return quality_metrics()
+
+    def _out_of_bounds(self, metrics: Mapping[str, float]) -> str | None:
+        """Reason the metrics are out of bounds, or None if they are within them."""
+        for name, minimum in self.min_metrics.items():
+            if _metric(metrics=metrics, name=name) < minimum:
+                return f"{name} {metrics[name]:.6g} is below {minimum:.6g}"
+        for name, maximum in self.max_metrics.items():
+            if _metric(metrics=metrics, name=name) > maximum:
+                return f"{name} {metrics[name]:.6g} is above {maximum:.6g}"
+        return None
+
+    def _collapsed(self, *, metrics: Mapping[str, float], kept: Sequence[int]) -> str | None:
+        """Reason the metrics are collapsed onto those of a kept perturber, or None if they are not."""
+        if not self.collapse_tolerances:
+            return None
+        for idx in kept:
+            if all(
+                abs(_metric(metrics=metrics, name=name) - self.metrics[idx][name]) <= tolerance
+                for name, tolerance in self.collapse_tolerances.items()
+            ):
+                return f"collapsed onto perturber {idx}"
+        return None
+
+    @override
+    def get_config(self) -> dict[str, Any]:
+        """Returns the configuration of the screen, including that of the screened factory."""
+        return {
+            "factory": to_config_dict(self.factory),
+            "min_metrics": self.min_metrics,
+            "max_metrics": self.max_metrics,
+            "collapse_tolerances": self.collapse_tolerances,
+            "drop": self.drop,
+        }
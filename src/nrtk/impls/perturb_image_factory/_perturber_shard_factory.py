@@ -0,0 +1,109 @@
+"""Defines PerturberShardFactory, a view over one shard of another factory's perturbers.
+
+Classes:
+    PerturberShardFactory: A factory producing the subset of another factory's perturbers that belongs to one of
+    ``count`` shards, for distributing a sweep across processes or hosts.
+
+Dependencies:
+    - smqtk_core for serializing the sharded factory into the shard's configuration.
+    - nrtk.interfaces for the `PerturbImageFactory` interface.
+
+Usage:
+    Call ``shard`` on any factory, or construct `PerturberShardFactory` directly, with the shard index and count. The
+    shard's configuration includes the configuration of the sharded factory, so a shard can be sent to a worker as
+    JSON and rebuilt there with ``from_config``.
+
+Example:
+    >>> from nrtk.impls.perturb_image.photometric.enhance import BrightnessPerturber
+    >>> from nrtk.impls.perturb_image_factory import PerturberLinspaceFactory
+    >>> factory = PerturberLinspaceFactory(
+    ...     perturber=BrightnessPerturber, theta_key="factor", start=0.0, stop=1.0, num=5
+    ... )
+    >>> shard = factory.shard(index=1, count=2)
+    >>> len(shard)
+    2
+"""
+
+from __future__ import annotations
+
+__all__ = ["PerturberShardFactory"]
+
+from typing import Any
+
+from smqtk_core.configuration import to_config_dict
+from typing_extensions import override
+
+from nrtk.impls.perturb_image_factory._perturber_view_factory import _PerturberViewFactory
+from nrtk.interfaces import PerturbImageFactory
+
+
+class PerturberShardFactory(_PerturberViewFactory):
+    """View over the perturbers of one shard of another factory.
+
+    The perturbers of the sharded factory are split into ``count`` disjoint shards that together cover every
+    perturber once. Strided shards take every ``count``-th perturber starting at ``index``, which balances sweeps whose
+    cost varies along the parameter order. Contiguous shards take one consecutive block of near-equal size. Perturbers
+    are created by the sharded factory on demand, so a shard holds no more state than the sharded factory itself.
+
+    Attributes:
+        factory (PerturbImageFactory):
+            Factory being sharded.
+        index (int):
+            Index of this shard, from 0 to ``count - 1``.
+        count (int):
+            Total number of shards.
+        strided (bool):
+            Whether the shard takes every ``count``-th perturber rather than a contiguous block.
+    """
+
+    def __init__(
+        self,
+        *,
+        factory: PerturbImageFactory,
+        index: int,
+        count: int,
+        strided: bool = True,
+    ) -> None:
+        """Initialize a view over one shard of the given factory.
+
+        Args:
+            factory:
+                Factory whose perturbers are sharded.
+            index:
+                Index of this shard, from 0 to ``count - 1``.
+            count:
+                Total number of shards.
+            strided:
+                Take every ``count``-th perturber starting at ``index`` if True, or a contiguous block if False.
+                Defaults to True.
+
+        Raises:
+            ValueError:
+                If count is less than 1 or index is not in [0, count).
+        """
+        if count < 1:
+            raise ValueError(f"count must be at least 1, got {count}")
+        if not 0 <= index < count:
+            raise ValueError(f"index must be in [0, {count}), got {index}")
+
+        total = len(factory)
+        super().__init__(
+            factory=factory,
+            indices=range(index, total, count)
+            if strided
+            else range(index * total // count, (index + 1) * total // count),
+        )
+
+        self.index = index
+        self.count = count
+        self.strided = strided
+
+    @override
+    def get_config(self) -> dict[str, Any]:
+        """Returns the configuration of the shard, including that of the sharded factory."""
+        return {
+            "factory": to_config_dict(self.factory),
+            "index": self.index,
+            "count": self.count,
+            "strided": self.strided,
+        }
@@ -0,0 +1,100 @@
+"""Defines PerturberSobolFactory, which creates PerturbImage instances at the points of a Sobol sequence.
+
+Classes:
+    PerturberSobolFactory: Factory producing one `PerturbImage` per point of a Sobol sequence over several
+    parameters, each either a continuous range or a list of discrete values.
+
+Dependencies:
+    - numpy for drawing the design.
+    - nrtk.interfaces for the `PerturbImage` interface.
+
+Example:
+    >>> from nrtk.impls.perturb_image.photometric.enhance import BrightnessPerturber
+    >>> factory = PerturberSobolFactory(
+    ...     perturber=BrightnessPerturber, theta_keys=["factor"], thetas=[{"low": 0.1, "high": 2.0}], num_samples=8
+    ... )
+"""
+
+from __future__ import annotations
+
+__all__ = ["PerturberSobolFactory"]
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import numpy as np
+from typing_extensions import override
+
+from nrtk.impls.perturb_image_factory._perturber_sampling_factory import PerturberSamplingFactory
+from nrtk.impls.perturb_image_factory._sampling import sobol
+from nrtk.interfaces import PerturbImage
+
+
+class PerturberSobolFactory(PerturberSamplingFactory):
+    """Factory creating a `PerturbImage` for each point of a Sobol sequence.
+
+    The Sobol sequence is a low-discrepancy sequence whose first ``2**k`` points are balanced across every
+    dimension, so budgets that are powers of two cover the parameter space most evenly. At most ``SOBOL_MAX_DIMS``
+    parameters are supported. Scrambling applies a random digital shift, which keeps the balance of the sequence but
+    moves its first point off the corner of the parameter space.
+
+    Attributes:
+        scramble (bool): Whether the sequence is randomized with ``seed``.
+    """
+
+    def __init__(
+        self,
+        *,
+        perturber: type[PerturbImage],
+        theta_keys: Iterable[str],
+        thetas: Sequence[Any],
+        num_samples: int,
+        scramble: bool = True,
+        seed: int = 0,
+        perturber_kwargs: dict[str, Any] | None = None,
+    ) -> None:
+        """Initializes the factory and draws its design.
+
+        Args:
+            perturber:
+                Python implementation type of the PerturbImage interface to produce.
+            theta_keys:
+                Names of perturbation parameters to vary.
+            thetas:
+                For each parameter, either a ``{"low": low, "high": high}`` range or a list of values.
+            num_samples:
+                Number of perturbers to produce.
+            scramble:
+                Whether to apply a random digital shift drawn with ``seed``. Defaults to True.
+            seed:
+                Seed of the scrambling. Defaults to 0.
+            perturber_kwargs:
+                Default kwargs to be used by the perturber. Defaults to {}.
+
+        Raises:
+            TypeError:
+                If perturber is an instance instead of a type.
+            ValueError:
+                If theta_keys is empty, theta_keys and thetas have different lengths, a theta is malformed,
+                num_samples is negative, or more than ``SOBOL_MAX_DIMS`` parameters are given.
+        """
+        self.scramble = scramble
+        super().__init__(
+            perturber=perturber,
+            theta_keys=theta_keys,
+            thetas=thetas,
+            num_samples=num_samples,
+            seed=seed,
+            perturber_kwargs=perturber_kwargs,
+        )
+
+    @override
+    def _unit_samples(self, *, num_samples: int, dims: int) -> np.ndarray[Any, Any]:
+        rng = np.random.default_rng(self.seed) if self.scramble else None
+        return sobol(num_samples=num_samples, dims=dims, rng=rng)
+
+    @override
+    def get_config(self) -> dict[str, Any]:
+        cfg = super().get_config()
+        cfg["scramble"] = self.scramble
+        return cfg
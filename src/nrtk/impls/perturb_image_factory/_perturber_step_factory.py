@@ -92,13 +92,18 @@ class PerturberStepFactory(PerturbImageFactory):
         self.start = start
         self.stop = stop
         self.step = step
+        self._thetas_cache: tuple[tuple[float, float, float, bool], list[float] | list[int]] | None = None
 
     @property
     @override
     def thetas(self) -> Sequence[float] | Sequence[int]:
-        if not self.to_int:
-            return [self.start + i * self.step for i in range(math.ceil((self.stop - self.start) / self.step))]
-        return [int(self.start + i * self.step) for i in range(math.ceil((self.stop - self.start) / self.step))]
+        """Values stepped through, computed once per combination of start, stop, step and to_int."""
+        key = (self.start, self.stop, self.step, self.to_int)
+        if self._thetas_cache is None or self._thetas_cache[0] != key:
+            count = math.ceil((self.stop - self.start) / self.step)
+            values = [self.start + i * self.step for i in range(count)]
+            self._thetas_cache = (key, [int(v) for v in values] if self.to_int else values)
+        return self._thetas_cache[1]
 
     @override
     def get_config(self) -> dict[str, Any]:
@@ -0,0 +1,175 @@
+"""Defines the base of the factories producing a subset of the perturbers of another factory.
+
+Classes:
+    _PerturberViewFactory: Abstract factory producing the perturbers of another factory at given indices, created by
+    that factory on demand.
+
+Dependencies:
+    - smqtk_core for serializing the viewed factory into the view's configuration.
+    - nrtk.interfaces for the `PerturbImage` and `PerturbImageFactory` interfaces.
+"""
+
+from __future__ import annotations
+
+__all__: list[str] = []
+
+import abc
+from collections.abc import Sequence
+from typing import Any
+
+from smqtk_core.configuration import from_config_dict
+from typing_extensions import Self, override
+
+from nrtk.interfaces import PerturbImage, PerturbImageFactory
+
+
+class _PerturberViewFactory(PerturbImageFactory):
+    """View over the perturbers at some indices of another factory.
+
+    Perturbers are created by the viewed factory on demand, so a view holds no more state than the viewed factory
+    and its indices. Subclasses choose the indices and implement ``get_config``, which must hold the configuration of
+    the viewed factory under ``"factory"``.
+
+    Attributes:
+        factory (PerturbImageFactory):
+            Factory being viewed.
+    """
+
+    def __init__(self, *, factory: PerturbImageFactory, indices: Sequence[int]) -> None:
+        """Initialize a view over the perturbers of the given factory at the given indices.
+
+        Args:
+            factory:
+                Factory whose perturbers are viewed.
+            indices:
+                Index in ``factory`` of each perturber of the view.
+        """
+        super().__init__(
+            perturber=factory.perturber,
+            theta_key=factory.theta_key,
+            perturber_kwargs=factory.perturber_kwargs,
+        )
+
+        self.factory = factory
+        self._indices = indices
+
+    @property
+    def indices(self) -> Sequence[int]:
+        """Returns the index in the viewed factory of each perturber of this view."""
+        return self._indices
+
+    @property
+    @override
+    def thetas(self) -> Sequence[Any]:
+        """Returns the theta value of each perturber of this view.
+
+        Factories varying several parameters, whose thetas are the values of each parameter rather than of each
+        perturber, keep their thetas in views. ``theta_values`` gives the values of each perturber of any view.
+        """
+        thetas = self.factory.thetas
+        if len(thetas) != len(self.factory):
+            return thetas
+        return [thetas[idx] for idx in self._indices]
+
+    @override
+    def __len__(self) -> int:
+        """Returns the number of perturbers in this view."""
+        return len(self._indices)
+
+    @override
+    def __next__(self) -> PerturbImage:
+        """Returns the next perturber of this view.
+
+        Raises:
+            StopIteration:
+                Iterator exhausted.
+        """
+        if self.n < len(self._indices):
+            func = self[self.n]
+            self.n += 1
+            return func
+        raise StopIteration
+
+    @override
+    def __getitem__(self, idx: int) -> PerturbImage:
+        """Get the perturber for a specific index within this view.
+
+        Args:
+            idx: Index of desired perturber within the view (supports negative indices).
+
+        Raises:
+            IndexError:
+                If idx is out of range for this view.
+        """
+        return self.factory[self._indices[idx]]
+
+    @override
+    def set_perturber_cache(self, *, maxsize: int) -> None:
+        """Set the perturber cache of the viewed factory, which creates the perturbers of this view.
+
+        Args:
+            maxsize:
+                Maximum number of perturbers to keep, or 0 to disable the cache.
+        """
+        self.factory.set_perturber_cache(maxsize=maxsize)
+
+    @override
+    def set_perturber_derivation(self, *, enabled: bool) -> None:
+        """Set whether the viewed factory, which creates the perturbers of this view, derives them.
+
+        Args:
+            enabled:
+                Whether to derive perturbers rather than construct each from scratch.
+        """
+        self.factory.set_perturber_derivation(enabled=enabled)
+
+    @override
+    def theta_values(self, idx: int) -> dict[str, Any]:
+        """Get the values of the varied parameters of the perturber for a specific index within this view.
+
+        Args:
+            idx: Index of desired perturber within the view (supports negative indices).
+        """
+        return self.factory.theta_values(self._indices[idx])
+
+    @classmethod
+    @override
+    def get_default_config(cls) -> dict[str, Any]:
+        """Returns the default configuration of the view.
+
+        The perturber type is taken from the viewed factory, so unlike other factories it is not a configuration
+        parameter.
+        """
+        return super(PerturbImageFactory, cls).get_default_config()
+
+    @abc.abstractmethod
+    @override
+    def get_config(self) -> dict[str, Any]:
+        """Returns the configuration of the view, including that of the viewed factory under ``"factory"``."""
+
+    @classmethod
+    @override
+    def from_config(
+        cls,
+        config_dict: dict[str, Any],
+        merge_default: bool = True,
+    ) -> Self:
+        """Create a view from a configuration dictionary.
+
+        Args:
+            config_dict:
+                Configuration dictionary with the viewed factory details.
+            merge_default:
+                Whether to merge with the default configuration.
+
+        Returns:
+            An instance of the view.
+        """
+        config_dict = dict(config_dict)
+
+        config_dict["factory"] = from_config_dict(
+            config=config_dict["factory"],
+            type_iter=PerturbImageFactory.get_impls(),
+        )
+
+        return super().from_config(config_dict, merge_default=merge_default)
@@ -0,0 +1,146 @@
+"""Space-filling point sets in the unit hypercube, used by the sampling factories.
+
+Each function returns an array of shape ``(num_samples, dims)`` with values in [0, 1). Points are deterministic given
+the ``rng`` they are drawn with, so a factory rebuilt from the same seed produces the same points.
+"""
+
+from __future__ import annotations
+
+__all__ = ["halton", "latin_hypercube", "sobol"]
+
+from typing import Any
+
+import numpy as np
+
+# Primitive polynomials and initial direction numbers of Sobol dimensions 2 to 21 (Joe and Kuo, 2008). A polynomial is
+# encoded with its leading and constant terms, so its degree is one less than its bit length.
+_SOBOL_DIRECTIONS: tuple[tuple[int, tuple[int, ...]], ...] = (
+    (3, (1,)),
+    (7, (1, 3)),
+    (11, (1, 3, 1)),
+    (13, (1, 1, 1)),
+    (19, (1, 1, 3, 3)),
+    (25, (1, 3, 5, 13)),
+    (37, (1, 1, 5, 5, 17)),
+    (41, (1, 1, 5, 5, 5)),
+    (47, (1, 1, 7, 11, 19)),
+    (55, (1, 1, 5, 1, 1)),
+    (59, (1, 1, 1, 3, 11)),
+    (61, (1, 3, 5, 5, 31)),
+    (67, (1, 3, 3, 9, 7, 49)),
+    (91, (1, 1, 1, 15, 21, 21)),
+    (97, (1, 3, 1, 13, 27, 49)),
+    (103, (1, 1, 1, 15, 7, 5)),
+    (109, (1, 3, 1, 15, 13, 25)),
+    (115, (1, 1, 5, 5, 19, 61)),
+    (131, (1, 3, 7, 11, 23, 15, 103)),
+    (137, (1, 3, 7, 13, 13, 15, 69)),
+)
+
+SOBOL_MAX_DIMS = len(_SOBOL_DIRECTIONS) + 1
+
+_SOBOL_BITS = 32
+
+
+def _sobol_direction_numbers(dims: int) -> np.ndarray[Any, Any]:
+    """Direction numbers of the first ``dims`` Sobol dimensions, as a (dims, 32) array of 32-bit integers."""
+    v = np.zeros((dims, _SOBOL_BITS), dtype=np.uint64)
+    v[0] = [1 << (_SOBOL_BITS - 1 - k) for k in range(_SOBOL_BITS)]
+    for dim, (poly, m) in enumerate(_SOBOL_DIRECTIONS[: dims - 1], start=1):
+        degree = poly.bit_length() - 1
+        row = [m[k] << (_SOBOL_BITS - 1 - k) for k in range(degree)]
+        for k in range(degree, _SOBOL_BITS):
+            value = row[k - degree] ^ (row[k - degree] >> degree)
+            for j in range(1, degree):
+                if (poly >> (degree - j)) & 1:
+                    value ^= row[k - j]
+            row.append(value)
+        v[dim] = row
+    return v
+
+
+def sobol(*, num_samples: int, dims: int, rng: np.random.Generator | None) -> np.ndarray[Any, Any]:
+    """First ``num_samples`` points of the Sobol sequence.
+
+    Args:
+        num_samples:
+            Number of points.
+        dims:
+            Number of dimensions, at most SOBOL_MAX_DIMS.
+        rng:
+            Generator for a random digital shift of the sequence, or None for the unscrambled sequence.
+
+    Returns:
+        Array of shape (num_samples, dims).
+
+    Raises:
+        ValueError: If dims exceeds SOBOL_MAX_DIMS.
+    """
+    if dims > SOBOL_MAX_DIMS:
+        raise ValueError(f"Sobol sequences support at most {SOBOL_MAX_DIMS} dimensions, got {dims}")
+    v = _sobol_direction_numbers(dims)
+    # Points are taken in Gray code order, the usual order of the sequence
+    index = np.arange(num_samples, dtype=np.uint64)
+    index ^= index >> np.uint64(1)
+    points = np.zeros((num_samples, dims), dtype=np.uint64)
+    for bit in range(max(num_samples - 1, 0).bit_length()):
+        points ^= ((index >> np.uint64(bit)) & np.uint64(1))[:, None] * v[:, bit]
+    if rng is not None:
+        points ^= rng.integers(0, 1 << _SOBOL_BITS, size=dims, dtype=np.uint64)
+    return points / float(1 << _SOBOL_BITS)
+
+
+def _primes(count: int) -> list[int]:
+    """First ``count`` prime numbers."""
+    primes: list[int] = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % p for p in primes):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def halton(*, num_samples: int, dims: int, rng: np.random.Generator | None) -> np.ndarray[Any, Any]:
+    """First ``num_samples`` points of the Halton sequence.
+
+    Args:
+        num_samples:
+            Number of points.
+        dims:
+            Number of dimensions.
+        rng:
+            Generator for a random shift of the sequence modulo 1, or None for the unscrambled sequence.
+
+    Returns:
+        Array of shape (num_samples, dims).
+    """
+    points = np.zeros((num_samples, dims))
+    for dim, base in enumerate(_primes(dims)):
+        index = np.arange(num_samples)
+        scale = 1.0 / base
+        while index.any():
+            index, digit = np.divmod(index, base)
+            points[:, dim] += digit * scale
+            scale /= base
+    if rng is not None:
+        points = (points + rng.random(dims)) % 1.0
+    return points
+
+
+def latin_hypercube(*, num_samples: int, dims: int, rng: np.random.Generator) -> np.ndarray[Any, Any]:
+    """Latin hypercube sample, with exactly one point in each of ``num_samples`` equal strata of every dimension.
+
+    Args:
+        num_samples:
+            Number of points.
+        dims:
+            Number of dimensions.
+        rng:
+            Generator for the strata permutations and the position of each point within its stratum.
+
+    Returns:
+        Array of shape (num_samples, dims).
+    """
+    strata = np.stack([rng.permutation(num_samples) for _ in range(dims)], axis=1)
+    return (strata + rng.random((num_samples, dims))) / max(num_samples, 1)
@@ -30,7 +30,7 @@ __all__ = ["TurbulenceVideoPerturber"]
 import warnings
 from collections.abc import Generator, Hashable, Iterable, Iterator, Sequence
 from copy import deepcopy
-from typing import Any
+from typing import Any, ClassVar
 
 import numpy as np
 from hcipy import (
@@ -50,8 +50,10 @@ from smqtk_image_io.bbox import AxisAlignedBoundingBox
 from typing_extensions import override
 
 from nrtk.impls.perturb_video._base.numpy_random_perturb_video import NumpyRandomPerturbVideo
-from nrtk.interfaces import VideoFrame
+from nrtk.interfaces import BoxArray, VideoFrame
 from nrtk.interfaces._perturb_video import _perturb_guard
+from nrtk.utils._incremental import IncrementalParamsMixin, changed_values, stale_state
+from nrtk.utils._precision import float_dtype
 
 _MAX_NUM_AIRY = 150
 _FRIED_COEFFICIENT = 0.423
@@ -68,7 +70,7 @@ def _next_power_of_two(x: int) -> int:
     return 1 << (x - 1).bit_length()
 
 
-class TurbulenceVideoPerturber(NumpyRandomPerturbVideo):
+class TurbulenceVideoPerturber(NumpyRandomPerturbVideo, IncrementalParamsMixin):
     """Simulates atmospheric turbulence effects on video using HCIPy.
 
     Produces temporally evolving blur and jitter from a wind-advected
@@ -84,6 +86,13 @@ class TurbulenceVideoPerturber(NumpyRandomPerturbVideo):
     is ``None``, each call produces a statistically independent
     non-reproducible sequence.
 
+    ``with_params`` and ``update`` change parameters while reusing the
+    HCIPy state the change leaves valid, per ``_DERIVED_STATE``. For
+    instance, a change of ``wind_speed`` or ``wind_direction_deg``
+    only sets the velocity of the layer, whose covariance matrices are
+    reused, and the pupil grid, aperture, focal grid and propagator are
+    reused unless the aperture, grid size or focal sampling change.
+
     Note:
         At extreme turbulence (D/r0 > 60), the focal grid size is
         capped to limit memory use, which may clip the outer wings
@@ -124,8 +133,19 @@ class TurbulenceVideoPerturber(NumpyRandomPerturbVideo):
             Ratio D/r0. Read-only property.
         ifov:
             Instantaneous field of view = pixel_pitch / focal_length (rad/pixel). Read-only property.
+        precision:
+            Floating-point precision of the blur and sub-pixel shift; None follows the default precision.
     """
 
+    # HCIPy state, with the values and other HCIPy state that each piece is built from
+    _DERIVED_STATE: ClassVar[dict[str, frozenset[str]]] = {
+        "pupil_grid": frozenset({"grid_size", "D"}),
+        "aperture": frozenset({"pupil_grid", "D", "eta"}),
+        "layer": frozenset({"pupil_grid", "path_avg_cn2", "slant_range", "L0", "hcipy_seed"}),
+        "focal_grid": frozenset({"D", "wavelength", "num_airy"}),
+        "propagator": frozenset({"pupil_grid", "focal_grid"}),
+    }
+
     def __init__(
         self,
         *,
@@ -143,6 +163,7 @@ class TurbulenceVideoPerturber(NumpyRandomPerturbVideo):
         color_fill: int | Sequence[int] | None = None,
         sub_pixel: bool = False,
         seed: int | None = None,
+        precision: str | None = None,
     ) -> None:
         """Initialize the TurbulenceVideoPerturber.
 
@@ -199,6 +220,12 @@ class TurbulenceVideoPerturber(NumpyRandomPerturbVideo):
                 (jitter rms < 1 px) and for T&E fidelity.
             seed:
                 Random seed for reproducibility. None for non-deterministic.
+            precision:
+                Floating-point precision, "float32" or "float64", of the PSF
+                convolution and sub-pixel shift. If None (the default), the
+                default precision set with
+                ``nrtk.utils.set_default_precision()`` is used. float64
+                reproduces earlier results most closely for T&E fidelity.
         """
         # Store all params BEFORE super().__init__(), which calls _set_seed()
         self.path_avg_cn2 = path_avg_cn2
@@ -213,12 +240,16 @@ class TurbulenceVideoPerturber(NumpyRandomPerturbVideo):
         self.L0 = L0
         self.color_fill = color_fill
         self.sub_pixel = sub_pixel
+        float_dtype(precision)
+        self.precision = precision
 
         # r0 is needed before _validate so the grid_size auto-resolution and
         # sampling warning can both reference it.
         self._r0 = self.compute_r0(path_avg_cn2=path_avg_cn2, wavelength=wavelength, slant_range=slant_range)
 
         self.grid_size: int = self._auto_grid_size() if grid_size is None else grid_size
+        # None when derived from r0, so that with_params() derives it again
+        self._grid_size_param = grid_size
 
         self._validate()
         self._warn_if_undersampled()
@@ -409,28 +440,6 @@ class TurbulenceVideoPerturber(NumpyRandomPerturbVideo):
         wind_vx = self.wind_speed * np.cos(self._direction_rad)
         wind_vy = self.wind_speed * np.sin(self._direction_rad)
 
-        pupil_grid = make_pupil_grid(
-            dims=self.grid_size,
-            diameter=self.D,  # pyright: ignore[reportArgumentType] - HCIPy stub types diameter as int
-        )
-        if self.eta > 0:
-            self._aperture = make_obstructed_circular_aperture(
-                pupil_diameter=self.D,
-                central_obscuration_ratio=self.eta,
-            )(pupil_grid)
-        else:
-            self._aperture = make_circular_aperture(diameter=self.D)(pupil_grid)
-        self._pupil_grid = pupil_grid
-
-        self._layer = InfiniteAtmosphericLayer(
-            input_grid=pupil_grid,
-            Cn_squared=self.path_avg_cn2 * self.slant_range,
-            L0=self.L0,
-            velocity=[wind_vx, wind_vy],  # pyright: ignore[reportArgumentType] - HCIPy stub types velocity as int
-            height=self.slant_range / 2,  # pyright: ignore[reportArgumentType] - HCIPy stub types height as int
-            seed=hcipy_seed,
-        )
-
         # Focal grid spans the seeing disk (~D/r0 Airy radii) with 2.5x margin,
         # capped by _MAX_NUM_AIRY to bound memory.
         requested_airy = int(np.ceil(2.5 * self.D / self._r0))
@@ -443,15 +452,83 @@ class TurbulenceVideoPerturber(NumpyRandomPerturbVideo):
                 stacklevel=2,
             )
 
-        focal_grid = make_focal_grid(
-            q=4,
-            num_airy=num_airy,
-            pupil_diameter=self.D,
-            focal_length=1.0,
-            reference_wavelength=self.wavelength,
+        self._state_inputs: dict[str, Any] = {
+            "grid_size": self.grid_size,
+            "D": self.D,
+            "eta": self.eta,
+            "path_avg_cn2": self.path_avg_cn2,
+            "slant_range": self.slant_range,
+            "L0": self.L0,
+            "hcipy_seed": hcipy_seed,
+            "wavelength": self.wavelength,
+            "num_airy": num_airy,
+        }
+        reused = self._reusable_state()
+
+        self._pupil_grid = (
+            reused["pupil_grid"]
+            if "pupil_grid" in reused
+            else make_pupil_grid(
+                dims=self.grid_size,
+                diameter=self.D,  # pyright: ignore[reportArgumentType] - HCIPy stub types diameter as int
+            )
         )
-        self._propagator = FraunhoferPropagator(input_grid=pupil_grid, output_grid=focal_grid)
-        self._focal_grid = focal_grid
+        self._aperture = reused["aperture"] if "aperture" in reused else self._make_aperture()
+
+        if "layer" in reused:
+            # The layer evolves as frames are perturbed, so it is copied, with its covariance matrices, rather than
+            # shared. The velocity only moves the screen as it evolves.
+            self._layer = deepcopy(reused["layer"])
+            self._layer.velocity = [wind_vx, wind_vy]
+            self._layer.reset()
+        else:
+            self._layer = InfiniteAtmosphericLayer(
+                input_grid=self._pupil_grid,
+                Cn_squared=self.path_avg_cn2 * self.slant_range,
+                L0=self.L0,
+                velocity=[wind_vx, wind_vy],  # pyright: ignore[reportArgumentType] - HCIPy stub types velocity as int
+                height=self.slant_range / 2,  # pyright: ignore[reportArgumentType] - HCIPy stub types height as int
+                seed=hcipy_seed,
+            )
+
+        self._focal_grid = (
+            reused["focal_grid"]
+            if "focal_grid" in reused
+            else make_focal_grid(
+                q=4,
+                num_airy=num_airy,
+                pupil_diameter=self.D,
+                focal_length=1.0,
+                reference_wavelength=self.wavelength,
+            )
+        )
+        self._propagator = (
+            reused["propagator"]
+            if "propagator" in reused
+            else FraunhoferPropagator(input_grid=self._pupil_grid, output_grid=self._focal_grid)
+        )
+
+    def _make_aperture(self) -> Field:
+        """Evaluate the (optionally obstructed) circular aperture on the pupil grid."""
+        if self.eta > 0:
+            return make_obstructed_circular_aperture(
+                pupil_diameter=self.D,
+                central_obscuration_ratio=self.eta,
+            )(self._pupil_grid)
+        return make_circular_aperture(diameter=self.D)(self._pupil_grid)
+
+    def _reusable_state(self) -> dict[str, Any]:
+        """HCIPy state of the perturber being updated that is valid for this one, by name in ``_DERIVED_STATE``."""
+        source = self._reuse_source
+        if not isinstance(source, TurbulenceVideoPerturber):
+            return {}
+        changed = changed_values(old=source._state_inputs, new=self._state_inputs)  # noqa: SLF001 - same class
+        stale = stale_state(dependencies=self._DERIVED_STATE, changed=changed)
+        return {name: getattr(source, f"_{name}") for name in self._DERIVED_STATE if name not in stale}
+
+    @override
+    def _params(self) -> dict[str, Any]:
+        return self.get_config() | {"grid_size": self._grid_size_param}
 
     def _restore_atmosphere_for_perturb(self) -> None:
         """Reset the cached layer's phase screen to t=0.
@@ -563,18 +640,22 @@ class TurbulenceVideoPerturber(NumpyRandomPerturbVideo):
         *,
         image: np.ndarray[Any, Any],
         psf: np.ndarray[Any, Any],
+        precision: str | None = None,
     ) -> np.ndarray[Any, Any]:
         """Convolve image with PSF using FFT convolution.
 
         Args:
             image: Input image array (H, W) or (H, W, C).
             psf: 2D PSF kernel.
+            precision: Floating-point precision of the convolution; None follows the default precision.
 
         Returns:
             Convolved image with same shape and dtype as input.
         """
         original_dtype = image.dtype
-        img_float = image.astype(np.float64)
+        dtype = float_dtype(precision)
+        img_float = image.astype(dtype)
+        psf = psf.astype(dtype, copy=False)
 
         if img_float.ndim == 2:
             result = fftconvolve(in1=img_float, in2=psf, mode="same")
@@ -658,11 +739,11 @@ class TurbulenceVideoPerturber(NumpyRandomPerturbVideo):
             return image.copy()
 
         fill = self._resolve_fill(original_image)
-        img_f64 = image.astype(np.float64)
+        img_float = image.astype(float_dtype(self.precision))
 
-        if img_f64.ndim == 2:
+        if img_float.ndim == 2:
             shifted = ndi_shift(
-                img_f64,
+                img_float,
                 shift=(shift_y, shift_x),
                 order=3,
                 mode="constant",
@@ -670,10 +751,10 @@ class TurbulenceVideoPerturber(NumpyRandomPerturbVideo):
                 prefilter=True,
             )
         else:
-            shifted = np.empty_like(img_f64)
-            for c in range(img_f64.shape[-1]):
+            shifted = np.empty_like(img_float)
+            for c in range(img_float.shape[-1]):
                 shifted[:, :, c] = ndi_shift(
-                    img_f64[:, :, c],
+                    img_float[:, :, c],
                     shift=(shift_y, shift_x),
                     order=3,
                     mode="constant",
@@ -741,7 +822,7 @@ class TurbulenceVideoPerturber(NumpyRandomPerturbVideo):
         shift_y: float,
         image_shape: tuple[int, ...],
         sub_pixel: bool = False,
-    ) -> list[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]]:
+    ) -> list[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | BoxArray:
         """Shift and clip bounding boxes by jitter amount.
 
         Args:
@@ -754,7 +835,7 @@ class TurbulenceVideoPerturber(NumpyRandomPerturbVideo):
                 to the nearest integer pixel to match ``np.roll``.
 
         Returns:
-            Shifted and clipped bounding boxes.
+            Shifted and clipped bounding boxes, as a ``BoxArray`` if ``boxes`` is one.
         """
         if sub_pixel:
             translate_x: float = float(shift_x)
@@ -764,6 +845,11 @@ class TurbulenceVideoPerturber(NumpyRandomPerturbVideo):
             translate_y = float(int(np.round(shift_y)))
         h, w = image_shape[0], image_shape[1]
 
+        if isinstance(boxes, BoxArray):
+            coords = np.clip(boxes.coords + (translate_x, translate_y, translate_x, translate_y), 0, (w, h, w, h))
+            keep = np.all(coords[:, 0:2] < coords[:, 2:4], axis=1)
+            return boxes.with_coords(coords[keep], keep=keep)
+
         shifted_boxes: list[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] = []
         for bbox, metadata in boxes:
             new_min_x = max(0, min(bbox.min_vertex[0] + translate_x, w))
@@ -830,7 +916,7 @@ class TurbulenceVideoPerturber(NumpyRandomPerturbVideo):
             psf = self._propagator(wf_no_tilt).power
             psf_resampled = self._resample_psf(psf=psf, plate_scale=plate_scale)
 
-            blurred = self._convolve(image=frame.image, psf=psf_resampled)
+            blurred = self._convolve(image=frame.image, psf=psf_resampled, precision=self.precision)
 
             pixel_shift_x = tilt_x / plate_scale
             pixel_shift_y = tilt_y / plate_scale
@@ -878,4 +964,5 @@ class TurbulenceVideoPerturber(NumpyRandomPerturbVideo):
         cfg["grid_size"] = self.grid_size
         cfg["color_fill"] = list(self.color_fill) if isinstance(self.color_fill, Sequence) else self.color_fill
         cfg["sub_pixel"] = self.sub_pixel
+        cfg["precision"] = self.precision
         return cfg
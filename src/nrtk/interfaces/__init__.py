@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any
 from nrtk._guard import Group, guard
 
 if TYPE_CHECKING:
+    from nrtk.interfaces._box_array import BoxArray as BoxArray
     from nrtk.interfaces._perturb_image import PerturbImage as PerturbImage
     from nrtk.interfaces._perturb_image_factory import PerturbImageFactory as PerturbImageFactory
     from nrtk.interfaces._perturb_video import PerturbVideo as PerturbVideo
@@ -20,6 +21,7 @@ __getattr__, __dir__, __all__ = guard(
     groups=[
         Group(
             symbols={
+                "BoxArray": "nrtk.interfaces._box_array",
                 "PerturbImage": "nrtk.interfaces._perturb_image",
                 "PerturbImageFactory": "nrtk.interfaces._perturb_image_factory",
             },
@@ -0,0 +1,186 @@
+"""Defines BoxArray, a columnar container for the bounding boxes of a single image.
+
+Classes:
+    BoxArray: Stores bounding boxes as NumPy arrays of coordinates, labels and scores, so that box
+    transformations can be applied to every box at once.
+
+Dependencies:
+    - numpy for storing box coordinates, labels and scores.
+    - smqtk_image_io for the legacy ``AxisAlignedBoundingBox`` representation.
+
+Usage:
+    Perturbers accept bounding boxes as an ``Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]]``.
+    A ``BoxArray`` is such an iterable, so it can be passed to any perturber. Perturbers that support it natively
+    transform all boxes with array operations and return a ``BoxArray``, while other perturbers consume it one box
+    at a time like any other iterable of boxes.
+
+Example:
+    boxes = BoxArray(
+        coords=np.array([[10, 20, 30, 40], [5, 5, 15, 25]]),
+        labels=np.array([1, 3]),
+        scores=np.array([0.9, 0.4]),
+    )
+    perturbed_image, perturbed_boxes = perturber(image=image, boxes=boxes)
+"""
+
+from __future__ import annotations
+
+__all__ = ["BoxArray"]
+
+from collections.abc import Hashable, Iterable, Iterator
+from typing import Any
+
+import numpy as np
+from smqtk_image_io.bbox import AxisAlignedBoundingBox
+
+
+class BoxArray:
+    """Columnar container for the 2D axis-aligned bounding boxes of a single image.
+
+    Iterating over a ``BoxArray`` yields ``(AxisAlignedBoundingBox, {label: score})`` tuples, the legacy format
+    accepted by ``PerturbImage.perturb()``.
+
+    Attributes:
+        coords (np.ndarray)
+            Box coordinates as a float array of shape (N, 4), with each row given as
+            ``(min_x, min_y, max_x, max_y)``.
+        labels (np.ndarray)
+            Label of each box, as an array of length N.
+        scores (np.ndarray)
+            Score of each box, as an array of length N.
+    """
+
+    def __init__(
+        self,
+        *,
+        coords: np.ndarray[Any, Any],
+        labels: np.ndarray[Any, Any],
+        scores: np.ndarray[Any, Any],
+    ) -> None:
+        """Initializes the BoxArray.
+
+        Args:
+            coords:
+                Box coordinates of shape (N, 4), with each row given as ``(min_x, min_y, max_x, max_y)``.
+                An empty array of any shape is treated as zero boxes.
+            labels:
+                Label of each box.
+            scores:
+                Score of each box.
+
+        Raises:
+            ValueError: If coords is not of shape (N, 4), or if labels or scores do not contain one entry per box.
+        """
+        coords = np.asarray(coords, dtype=np.float64)
+        if coords.size == 0:
+            coords = coords.reshape(0, 4)
+        if coords.ndim != 2 or coords.shape[1] != 4:
+            raise ValueError(f"Box coordinates must be of shape (N, 4), got {coords.shape}")
+        labels = np.asarray(labels)
+        scores = np.asarray(scores)
+        if len(labels) != len(coords) or len(scores) != len(coords):
+            raise ValueError(
+                f"Expected one label and score per box ({len(coords)}), got {len(labels)} labels and "
+                f"{len(scores)} scores",
+            )
+        self.coords = coords
+        self.labels = labels
+        self.scores = scores
+
+    @classmethod
+    def from_boxes(cls, boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]]) -> BoxArray:
+        """Create a BoxArray from bounding boxes in the legacy format.
+
+        Each score dictionary is reduced to its highest scoring ``(label, score)`` pair. A ``BoxArray`` is returned
+        unchanged.
+
+        Args:
+            boxes:
+                Bounding boxes as an iterable of ``(AxisAlignedBoundingBox, {label: score})`` tuples.
+
+        Returns:
+            BoxArray holding the given bounding boxes.
+
+        Raises:
+            ValueError: If a bounding box is not 2D or a score dictionary is empty.
+        """
+        if isinstance(boxes, BoxArray):
+            return boxes
+
+        coords = []
+        labels = []
+        scores = []
+        for box, score_dict in boxes:
+            if box.ndim != 2:
+                raise ValueError(f"BoxArray only supports 2D bounding boxes, got a {box.ndim}D box")
+            if not score_dict:
+                raise ValueError("Cannot convert a bounding box with an empty score dictionary")
+            coords.append((*box.min_vertex, *box.max_vertex))
+            label, score = max(score_dict.items(), key=lambda x: x[1])
+            labels.append(label)
+            scores.append(score)
+
+        return cls(coords=np.asarray(coords), labels=_label_array(labels), scores=np.asarray(scores))
+
+    def to_boxes(self) -> list[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]]:
+        """Convert to bounding boxes in the legacy format.
+
+        Returns:
+            List of ``(AxisAlignedBoundingBox, {label: score})`` tuples.
+        """
+        return list(self)
+
+    def copy(self) -> BoxArray:
+        """Returns a copy of the BoxArray that does not share memory with it."""
+        return BoxArray(coords=self.coords.copy(), labels=self.labels.copy(), scores=self.scores.copy())
+
+    def with_coords(self, coords: np.ndarray[Any, Any], *, keep: np.ndarray[Any, Any] | None = None) -> BoxArray:
+        """Returns a BoxArray with new coordinates and copied labels and scores.
+
+        Args:
+            coords:
+                New box coordinates of shape (M, 4).
+            keep:
+                Optional boolean mask or index array selecting the M boxes whose labels and scores are kept. When
+                None, all labels and scores are kept.
+
+        Returns:
+            New BoxArray with the given coordinates.
+        """
+        if keep is None:
+            return BoxArray(coords=coords, labels=self.labels.copy(), scores=self.scores.copy())
+        return BoxArray(coords=coords, labels=self.labels[keep], scores=self.scores[keep])
+
+    def __len__(self) -> int:
+        """Returns the number of bounding boxes."""
+        return len(self.coords)
+
+    def __iter__(self) -> Iterator[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]]:
+        """Yields each bounding box in the legacy ``(AxisAlignedBoundingBox, {label: score})`` format."""
+        for coord, label, score in zip(self.coords.tolist(), self.labels.tolist(), self.scores.tolist(), strict=True):
+            yield AxisAlignedBoundingBox(min_vertex=coord[0:2], max_vertex=coord[2:4]), {label: score}
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the BoxArray."""
+        return f"{self.__class__.__name__}(coords={self.coords!r}, labels={self.labels!r}, scores={self.scores!r})"
+
+
+def _label_array(labels: list[Hashable]) -> np.ndarray[Any, Any]:
+    """Convert labels to an array, falling back to an object array when NumPy would alter them.
+
+    Args:
+        labels:
+            Label of each box.
+
+    Returns:
+        Array of labels whose ``tolist()`` reproduces the given labels.
+    """
+    try:
+        arr = np.asarray(labels)
+    except ValueError:  # labels of inhomogeneous shape, such as tuples mixed with scalars
+        arr = None
+    if arr is None or arr.shape != (len(labels),) or arr.tolist() != labels:
+        arr = np.empty(len(labels), dtype=object)
+        for i, label in enumerate(labels):
+            arr[i] = label
+    return arr
@@ -10,7 +10,8 @@ Dependencies:
 
 Usage:
     To create a custom image perturbation class, inherit from `PerturbImage` and implement
-    the `perturb` method, defining the specific perturbation logic.
+    the `perturb` method, defining the specific perturbation logic. Implementations that can
+    process a stacked batch of images at once may additionally override `perturb_batch`.
 
 Example:
     class CustomPerturbImage(PerturbImage):
@@ -29,17 +30,33 @@ __all__ = ["PerturbImage"]
 import abc
 from collections.abc import Hashable, Iterable, Sequence
 from copy import deepcopy
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 from numpy.typing import ArrayLike
 from smqtk_image_io.bbox import AxisAlignedBoundingBox
 
+from nrtk.interfaces._box_array import BoxArray
 from nrtk.interfaces._plugfigurable import Plugfigurable
+from nrtk.interfaces._warp_map import WarpMap
+
+if TYPE_CHECKING:
+    from nrtk.interfaces._random_perturb_image import RandomPerturbImage
 
 
 class PerturbImage(Plugfigurable):
-    """Algorithm that generates a perturbed image for given input image stimulus as a ``numpy.ndarray`` type array."""
+    """Algorithm that generates a perturbed image for given input image stimulus as a ``numpy.ndarray`` type array.
+
+    Implementations never modify their input image and always return an image that does not share memory with it.
+    By default, the base ``perturb()`` hands implementations a private copy of the input image that they are free to
+    modify in place. Implementations that only read from the image they receive and always allocate their own output
+    set ``_copy_input`` to False, which skips that copy. Inputs may be ``np.memmap`` arrays, which the base
+    ``perturb()`` hands to implementations as plain ``np.ndarray`` arrays, without reading them into memory when the
+    copy is skipped.
+    """
+
+    # Whether the base perturb() returns a copy of the input image rather than the input image itself
+    _copy_input: bool = True
 
     def __init__(self) -> None:
         """Initializes the PerturbImage."""
@@ -63,6 +80,8 @@ class PerturbImage(Plugfigurable):
             boxes:
                 Input bounding boxes as a Iterable of tuples containing bounding boxes.
                 This is the single image output from DetectImageObjects.detect_objects
+                A ``BoxArray`` may be given instead; implementations that transform boxes with array operations
+                return a ``BoxArray`` in that case.
             kwargs:
                 Implementation-specific keyword arguments.
 
@@ -71,8 +90,227 @@ class PerturbImage(Plugfigurable):
                 effects upon the input image.
             Iterable of tuples containing the bounding boxes for detections in the image. If an implementation
                 modifies the size of an image, it is expected to modify the bounding boxes as well.
+                The base implementation returns a copy of the input image, or the input image itself if
+                ``_copy_input`` is False, along with a copy of the bounding boxes.
+        """
+        # np.asarray views a memory-mapped image as a plain array, whose derived arrays are plain arrays as well
+        return (np.copy(image) if self._copy_input else np.asarray(image)), deepcopy(boxes)
+
+    def perturb_batch(
+        self,
+        *,
+        images: np.ndarray[Any, Any] | Sequence[np.ndarray[Any, Any]],
+        boxes_list: Sequence[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None] | None = None,
+        **kwargs: Any,
+    ) -> tuple[
+        np.ndarray[Any, Any] | list[np.ndarray[Any, Any]],
+        list[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None],
+    ]:
+        """Generate perturbed images for a batch of image stimuli.
+
+        The default implementation calls ``perturb()`` once per image. Implementations that can operate on a
+        stacked ``(N, H, W[, C])`` array override this method to process the whole batch at once. Overrides
+        produce the same result as the per-image loop, except that random perturbers may consume their random
+        state in a different order.
+
+        Args:
+            images:
+                Batch of input images, either stacked along a leading axis or as a sequence of numpy arrays.
+            boxes_list:
+                Optional bounding boxes for each image, in the format accepted by ``perturb()``. Must contain
+                exactly one entry per image when provided.
+            kwargs:
+                Implementation-specific keyword arguments, applied to every image in the batch.
+
+        Returns:
+            Perturbed images and the bounding boxes for each image. Images are returned stacked along a leading
+                axis when the input was stacked and every perturbed image shares the same shape and dtype,
+                otherwise as a list. Implementations should impart no side effects upon the input images.
+        """
+        boxes_list = self._batch_boxes_list(images=images, boxes_list=boxes_list)
+        perturbed = [
+            self.perturb(image=image, boxes=boxes, **kwargs) for image, boxes in zip(images, boxes_list, strict=True)
+        ]
+        return self._stack_batch(images=images, perturbed_images=[image for image, _ in perturbed]), [
+            boxes for _, boxes in perturbed
+        ]
+
+    @classmethod
+    def _perturb_sweep(
+        cls,
+        *,
+        perturbers: Sequence[PerturbImage],
+        image: np.ndarray[Any, Any],
+        boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None = None,
+        **kwargs: Any,
+    ) -> list[tuple[np.ndarray[Any, Any], Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]]:
+        """Perturb one image with each of several perturbers of this type, differing in their parameters.
+
+        Used by ``PerturbImageFactory.perturb_sweep()``. The default implementation calls each perturber in turn.
+        Implementations that can share work between the perturbers, such as transforming the image once, override
+        this method. Overrides produce the same result as calling each perturber, up to floating-point rounding.
+
+        Args:
+            perturbers:
+                Perturbers of this type, in order.
+            image:
+                Input image.
+            boxes:
+                Input bounding boxes, in the format accepted by ``perturb()``.
+            kwargs:
+                Keyword arguments given to every perturber.
+
+        Returns:
+            The perturbed image and bounding boxes of each perturber.
+        """
+        return [perturber(image=image, boxes=boxes, **kwargs) for perturber in perturbers]
+
+    def _pointwise_lut(
+        self,
+        *,
+        image: np.ndarray[Any, Any],  # noqa: ARG002 - see overrides
+        lut: np.ndarray[Any, Any],  # noqa: ARG002 - see overrides
+        **kwargs: Any,  # noqa: ARG002 - see overrides
+    ) -> np.ndarray[Any, Any] | None:
+        """Lookup table equivalent to ``perturb()``, for perturbations that map each uint8 pixel value independently.
+
+        Used by ``ComposePerturber`` to fuse consecutive pointwise perturbations into a single pass over the image.
+        Implementations that override ``perturb()`` of a perturber providing a lookup table must override this
+        method as well.
+
+        Args:
+            image:
+                Input uint8 image of shape (H, W) or (H, W, C).
+            lut:
+                Lookup table of shape (C, 256), with C = 1 for an (H, W) image, through which each channel of
+                ``image`` is mapped before this perturbation. The input to this perturbation is therefore
+                ``lut[c][image[..., c]]``, which is not materialized.
+            kwargs:
+                Keyword arguments that would be given to ``perturb()``.
+
+        Returns:
+            Lookup table of shape (C, 256) mapping each channel value of the input to this perturbation to the
+                corresponding value of the output of ``perturb()``, or None if the perturbation cannot be expressed
+                as a lookup table for this input.
+        """
+        return None
+
+    def _blur_kernel(
+        self,
+        *,
+        image: np.ndarray[Any, Any],  # noqa: ARG002 - see overrides
+        **kwargs: Any,  # noqa: ARG002 - see overrides
+    ) -> np.ndarray[Any, Any] | None:
+        """Spatial kernel equivalent to ``perturb()``, for perturbations that are linear shift-invariant blurs.
+
+        Used by ``ComposePerturber`` to fuse consecutive blurs into a single convolution in the frequency domain.
+        The kernel may only depend on the shape and dtype of ``image``, not on its pixel values. Implementations
+        that override ``perturb()`` of a perturber providing a kernel must override this method as well.
+
+        Args:
+            image:
+                Input image of shape (H, W) or (H, W, C).
+            kwargs:
+                Keyword arguments that would be given to ``perturb()``.
+
+        Returns:
+            Kernel of shape (kh, kw) that ``perturb()`` correlates every channel of ``image`` with, centered on
+                element ``(kh // 2, kw // 2)``, or None if the perturbation cannot be expressed as such a kernel for
+                this input. Fused kernels are applied with reflected image borders, regardless of how ``perturb()``
+                treats them.
+        """
+        return None
+
+    def _warp_map(
+        self,
+        *,
+        image: np.ndarray[Any, Any],  # noqa: ARG002 - see overrides
+        **kwargs: Any,  # noqa: ARG002 - see overrides
+    ) -> WarpMap | None:
+        """Pixel gather table equivalent to ``perturb()``, for perturbations that only move pixels around.
+
+        Used by ``ComposePerturber`` to compose consecutive geometric warps into a single gather over the image.
+        The warp may only depend on the shape and dtype of ``image``, not on its pixel values. Random perturbers
+        draw their parameters when the warp is requested, as ``perturb()`` would. Implementations that override
+        ``perturb()`` of a perturber providing a warp must override this method as well.
+
+        Args:
+            image:
+                Input image of shape (H, W) or (H, W, C).
+            kwargs:
+                Keyword arguments that would be given to ``perturb()``.
+
+        Returns:
+            WarpMap producing the image and bounding boxes returned by ``perturb()``, or None if the perturbation
+                cannot be expressed as such a warp for this input.
+        """
+        return None
+
+    def _random_stages(self) -> list[RandomPerturbImage]:
+        """Random perturbers applied by ``perturb()``, which draw from the ``rng`` or ``seed`` given to the call.
+
+        Used by ``TiledPerturber`` to give each tile its own random state. Perturbers that apply others must
+        override this method to return their random stages, in the order they are applied.
+
+        Returns:
+            The random perturbers applied, including this one if it is random.
         """
-        return np.copy(image), deepcopy(boxes)
+        return []
+
+    @staticmethod
+    def _batch_boxes_list(
+        *,
+        images: np.ndarray[Any, Any] | Sequence[np.ndarray[Any, Any]],
+        boxes_list: Sequence[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None] | None,
+    ) -> list[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]:
+        """Utility function to validate the bounding boxes given to ``perturb_batch()``.
+
+        Args:
+            images:
+                Batch of input images.
+            boxes_list:
+                Bounding boxes for each image, or None if no image has bounding boxes.
+
+        Returns:
+            One entry of bounding boxes per image.
+
+        Raises:
+            ValueError: If the number of bounding box entries does not match the number of images.
+        """
+        if boxes_list is None:
+            return [None] * len(images)
+        if len(boxes_list) != len(images):
+            raise ValueError(
+                f"Number of bounding box entries ({len(boxes_list)}) does not match number of images ({len(images)})",
+            )
+        return list(boxes_list)
+
+    @staticmethod
+    def _stack_batch(
+        *,
+        images: np.ndarray[Any, Any] | Sequence[np.ndarray[Any, Any]],
+        perturbed_images: list[np.ndarray[Any, Any]],
+    ) -> np.ndarray[Any, Any] | list[np.ndarray[Any, Any]]:
+        """Utility function to stack per-image outputs of ``perturb_batch()`` when the input batch was stacked.
+
+        Args:
+            images:
+                Batch of input images.
+            perturbed_images:
+                Perturbed image for each input image.
+
+        Returns:
+            Perturbed images stacked along a leading axis if ``images`` is a numpy array and all perturbed
+                images share the same shape and dtype, otherwise the list of perturbed images.
+        """
+        if not isinstance(images, np.ndarray):
+            return perturbed_images
+        if not perturbed_images:
+            return np.copy(images)
+        first = perturbed_images[0]
+        if any(image.shape != first.shape or image.dtype != first.dtype for image in perturbed_images):
+            return perturbed_images
+        return np.stack(perturbed_images)
 
     def _rescale_boxes(
         self,
@@ -94,13 +332,17 @@ class PerturbImage(Plugfigurable):
                 the height and width respectively.
 
         Returns:
-            Rescaled bounding boxes in the same format as input.
+            Rescaled bounding boxes in the same format as input. A ``BoxArray`` is rescaled with a single array
+                operation.
         """
         y_factor, x_factor = np.array(new_shape)[0:2] / np.array(orig_shape)[0:2]
         if x_factor == y_factor == 1:
             # no scaling needed
             return deepcopy(boxes)
 
+        if isinstance(boxes, BoxArray):
+            return boxes.with_coords(boxes.coords * (x_factor, y_factor, x_factor, y_factor))
+
         scaled_boxes = []
         for box, score_dict in boxes:
             x0, y0 = box.min_vertex
@@ -19,23 +19,69 @@ from __future__ import annotations
 __all__ = ["PerturbImageFactory"]
 
 import abc
-from collections.abc import Iterator, Sequence
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Iterator, Mapping, Sequence
 from typing import Any
 
+import numpy as np
+from smqtk_core.configuration import Configurable, to_config_dict
+from smqtk_image_io.bbox import AxisAlignedBoundingBox
 from typing_extensions import Self, override
 
 from nrtk.interfaces._perturb_image import PerturbImage
 from nrtk.interfaces._plugfigurable import Plugfigurable
+from nrtk.utils._incremental import IncrementalParamsMixin
+
+
+def _cache_key(value: object) -> Hashable:
+    """Hashable key identifying a perturber keyword argument by value.
+
+    Raises:
+        TypeError:
+            If the value is unhashable and can be compared neither by its items nor by its configuration.
+    """
+    if isinstance(value, Configurable):
+        # Configurations include the type, so objects of different types never share a key
+        value = to_config_dict(value)
+    if isinstance(value, Mapping | list | tuple | np.ndarray):
+        return _items_key(value)
+    if isinstance(value, Hashable):
+        # Typed so that equal values of different types, such as 1 and 1.0, construct distinct perturbers
+        return (type(value), value)
+    raise TypeError(f"Cannot key a perturber argument of type {type(value).__name__} by value")
+
+
+def _items_key(value: Mapping[Any, Any] | list[Any] | tuple[Any, ...] | np.ndarray[Any, Any]) -> Hashable:
+    """Hashable key identifying a mapping, sequence or array by its items."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _cache_key(item)) for key, item in value.items()))
+    if isinstance(value, np.ndarray):
+        return (value.shape, value.dtype.str, value.tobytes())
+    return tuple(_cache_key(item) for item in value)
 
 
 class PerturbImageFactory(Plugfigurable):
     """Factory class for producing PerturbImage instances of a specified type and configuration.
 
+    By default every access constructs a new perturber. ``set_perturber_cache`` enables a bounded LRU cache of
+    constructed perturbers, keyed by their keyword arguments, so that repeated iteration and random access from
+    several consumers reuse perturbers that are expensive to construct.
+
+    ``set_perturber_derivation`` derives perturbers that support ``with_params``, such as ``PybsmPerturber``, from
+    the perturber at index 0 instead of constructing them, reusing the derived state that their parameters leave
+    valid.
+
     Attributes:
         perturber (type[PerturbImage]): python implementation type of the PerturbImage interface to produce
         theta_key (str): perturber parameter to vary between instances
     """
 
+    # Maximum number of constructed perturbers to keep, or 0 to construct one on every access
+    _perturber_cache_size: int = 0
+    # Whether perturbers supporting with_params() are derived from the perturber at index 0
+    _derive_perturbers: bool = False
+
     def __init__(
         self,
         *,
@@ -71,7 +117,98 @@ class PerturbImageFactory(Plugfigurable):
     def _create_perturber(self, kwargs: dict[str, Any]) -> PerturbImage:
         """Returns PerturbImage implementation with given input args."""
         input_kwargs = self.perturber_kwargs | kwargs
-        return self.perturber(**input_kwargs)
+        if not self._perturber_cache_size:
+            return self._construct_perturber(input_kwargs)
+
+        try:
+            key = _cache_key(input_kwargs)
+        except TypeError:
+            # Arguments that cannot be compared by value are never cached, since the perturber may not match them
+            return self._construct_perturber(input_kwargs)
+        with self._perturber_cache_lock:
+            perturber = self._perturber_cache.get(key)
+            if perturber is not None:
+                self._perturber_cache.move_to_end(key)
+                return perturber
+
+        # Constructed outside the lock, so that consumers of other perturbers are not held up
+        perturber = self._construct_perturber(input_kwargs)
+        with self._perturber_cache_lock:
+            # Consumers constructing the same perturber concurrently all get the first one cached
+            perturber = self._perturber_cache.setdefault(key, perturber)
+            self._perturber_cache.move_to_end(key)
+            if len(self._perturber_cache) > self._perturber_cache_size:
+                self._perturber_cache.popitem(last=False)
+            return perturber
+
+    def _construct_perturber(self, kwargs: dict[str, Any]) -> PerturbImage:
+        """Constructs a perturber, deriving it from the base perturber if enabled and supported."""
+        if self._derive_perturbers:
+            base_kwargs, base = self._base_perturber()
+            # Only derived given the same arguments, so that any others keep their defaults
+            if isinstance(base, IncrementalParamsMixin) and base_kwargs.keys() == kwargs.keys():
+                return base.with_params(**kwargs)
+        return self.perturber(**kwargs)
+
+    def _base_perturber(self) -> tuple[dict[str, Any], PerturbImage]:
+        """Keyword arguments and perturber of index 0, constructed once and never returned, to derive others from."""
+        base = self.__dict__.get("_base")
+        if base is None:
+            kwargs = self.perturber_kwargs | self.theta_values(0)
+            # Consumers constructing the base concurrently all derive from the first one stored
+            base = self.__dict__.setdefault("_base", (kwargs, self.perturber(**kwargs)))
+        return base
+
+    def set_perturber_derivation(self, *, enabled: bool) -> None:
+        """Derive perturbers that support ``with_params`` from the perturber at index 0 instead of constructing them.
+
+        Derived perturbers equal constructed ones, whichever index is accessed first, but reuse the derived state of
+        the perturber at index 0 that their parameters leave valid, such as the component OTFs of ``PybsmPerturber``
+        in an altitude sweep. That state is shared between the derived perturbers, so must not be modified in place.
+
+        Args:
+            enabled:
+                Whether to derive perturbers rather than construct each from scratch.
+        """
+        self._derive_perturbers = enabled
+        self.__dict__.pop("_base", None)
+
+    def set_perturber_cache(self, *, maxsize: int) -> None:
+        """Keep up to ``maxsize`` constructed perturbers for reuse, evicting the least recently used.
+
+        Cached perturbers are keyed by their keyword arguments, including ``perturber_kwargs``, and are shared by
+        every access with the same arguments. Configurable arguments are compared by their configuration, and
+        perturbers with other arguments that cannot be compared by value are constructed on every access. Consumers
+        that use random perturbers concurrently should pass their own ``rng`` or ``seed`` to each call.
+
+        Args:
+            maxsize:
+                Maximum number of perturbers to keep, or 0 to disable the cache and construct a perturber on every
+                access. Any cached perturbers are discarded.
+
+        Raises:
+            ValueError:
+                If maxsize is negative.
+        """
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be non-negative, got {maxsize}")
+        self._perturber_cache_size = maxsize
+        self._perturber_cache: OrderedDict[Hashable, PerturbImage] = OrderedDict()
+        self._perturber_cache_lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Returns the state to pickle or copy, without cached or base perturbers or the cache lock."""
+        state = self.__dict__.copy()
+        state.pop("_perturber_cache", None)
+        state.pop("_perturber_cache_lock", None)
+        state.pop("_base", None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restores a pickled or copied state, with an empty perturber cache."""
+        self.__dict__.update(state)
+        if self._perturber_cache_size:
+            self.set_perturber_cache(maxsize=self._perturber_cache_size)
 
     @property
     @abc.abstractmethod
@@ -112,9 +249,117 @@ class PerturbImageFactory(Plugfigurable):
         Args:
             idx: Index of desired perturber (supports negative indices).
         """
-        kwargs = {self.theta_key: self.thetas[idx]}
+        return self._create_perturber(kwargs=self.theta_values(idx))
+
+    def perturb_sweep(
+        self,
+        *,
+        image: np.ndarray[Any, Any],
+        boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None = None,
+        **kwargs: Any,
+    ) -> list[tuple[np.ndarray[Any, Any], Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]]:
+        """Perturb one image with every perturber of this factory, sharing work between them where supported.
+
+        The OTF perturbers of pyBSM, for example, transform the image once and apply the transfer function of each
+        perturber to its spectrum, instead of transforming the image once per perturber. Other perturbers are
+        called in turn. Results equal those of calling each perturber, up to floating-point rounding.
+
+        Args:
+            image:
+                Input image.
+            boxes:
+                Input bounding boxes, in the format accepted by the ``perturb()`` method of the perturbers.
+            kwargs:
+                Keyword arguments given to every perturber, such as ``img_gsd``.
+
+        Returns:
+            The perturbed image and bounding boxes of each perturber, in the order of the factory.
+        """
+        return self.perturber._perturb_sweep(perturbers=list(self), image=image, boxes=boxes, **kwargs)  # noqa: SLF001
+
+    def theta_values(self, idx: int) -> dict[str, Any]:
+        """Get the values of the varied parameters of the perturber for a specific index.
+
+        Args:
+            idx: Index of desired perturber (supports negative indices).
+
+        Returns:
+            Mapping of each varied perturber parameter to its value, without ``perturber_kwargs``.
+        """
+        return {self.theta_key: self.thetas[idx]}
+
+    def shard(self, *, index: int, count: int, strided: bool = True) -> PerturbImageFactory:
+        """Get a view over one of ``count`` disjoint shards of this factory's perturbers.
 
-        return self._create_perturber(kwargs=kwargs)
+        The shard's configuration includes this factory's configuration, so it can be sent to a worker process or
+        host as JSON and rebuilt there with ``from_config``.
+
+        Args:
+            index:
+                Index of the shard, from 0 to ``count - 1``.
+            count:
+                Total number of shards.
+            strided:
+                Take every ``count``-th perturber starting at ``index`` if True, or a contiguous block if False.
+                Defaults to True.
+
+        Returns:
+            A PerturberShardFactory producing the perturbers of the shard.
+
+        Raises:
+            ValueError:
+                If count is less than 1 or index is not in [0, count).
+        """
+        # Imported here since the implementation depends on this interface
+        from nrtk.impls.perturb_image_factory._perturber_shard_factory import PerturberShardFactory
+
+        return PerturberShardFactory(factory=self, index=index, count=count, strided=strided)
+
+    def screen(
+        self,
+        *,
+        min_metrics: Mapping[str, float] | None = None,
+        max_metrics: Mapping[str, float] | None = None,
+        collapse_tolerances: Mapping[str, float] | None = None,
+        drop: bool = True,
+    ) -> PerturbImageFactory:
+        """Get a view over the perturbers of this factory that pass an analytic screen of their quality metrics.
+
+        The metrics are computed by the ``quality_metrics()`` method of each perturber, such as the NIIRS estimates
+        of the pyBSM perturbers, without perturbing any image. Sweep points that would leave images unchanged, destroy
+        them, or barely differ from another point can so be pruned before any image is processed.
+
+        Args:
+            min_metrics:
+                Minimum value of metrics, below which perturbers are screened out. Defaults to no minimum.
+            max_metrics:
+                Maximum value of metrics, above which perturbers are screened out. Defaults to no maximum.
+            collapse_tolerances:
+                Largest difference of each metric between two perturbers for the later one to be collapsed onto the
+                earlier one. Defaults to no collapsing.
+            drop:
+                Leave screened out perturbers out of the view if True, or only record the reasons they were screened
+                out if False. Defaults to True.
+
+        Returns:
+            A PerturberScreenFactory producing the perturbers that pass the screen.
+
+        Raises:
+            TypeError:
+                If the perturbers of this factory do not provide ``quality_metrics()``.
+            ValueError:
+                If a bound or tolerance names an unknown metric, or a tolerance is negative.
+        """
+        # Imported here since the implementation depends on this interface
+        from nrtk.impls.perturb_image_factory._perturber_screen_factory import PerturberScreenFactory
+
+        return PerturberScreenFactory(
+            factory=self,
+            min_metrics=min_metrics,
+            max_metrics=max_metrics,
+            collapse_tolerances=collapse_tolerances,
+            drop=drop,
+        )
 
     @override
     @classmethod
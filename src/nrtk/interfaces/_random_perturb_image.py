@@ -26,6 +26,9 @@ Example:
 
     perturber = CustomRandomPerturbImage(seed=42, is_static=True)
     perturbed_image, _ = perturber(image=image_data)
+
+    # Pure call, safe to run concurrently from several threads on the same perturber
+    perturbed_image, _ = perturber(image=image_data, seed=7)
 """
 
 from __future__ import annotations
@@ -33,9 +36,12 @@ from __future__ import annotations
 __all__: list[str] = ["RandomPerturbImage"]
 
 import abc
+import threading
 import warnings
-from collections.abc import Hashable, Iterable
-from typing import Any
+from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, ClassVar, TypeVar
 
 import numpy as np
 from smqtk_image_io.bbox import AxisAlignedBoundingBox
@@ -43,6 +49,31 @@ from typing_extensions import override
 
 from nrtk.interfaces._perturb_image import PerturbImage
 
+F = TypeVar("F", bound=Callable[..., object])
+
+# Random state of the calls in progress on each thread, by id() of the perturber
+_call_rngs = threading.local()
+
+
+def _per_call_rng(fn: F) -> F:
+    """Wraps a RandomPerturbImage entry point to draw from the ``rng`` or ``seed`` given to the call, if any."""
+
+    @wraps(fn)
+    def _wrapper(
+        self: RandomPerturbImage,
+        /,
+        *args: Any,
+        rng: np.random.Generator | None = None,
+        seed: int | None = None,
+        **kwargs: Any,
+    ) -> object:
+        if rng is None and seed is None:
+            return fn(self, *args, **kwargs)
+        with self._call_rng_scope(rng=rng, seed=seed):
+            return fn(self, *args, **kwargs)
+
+    return _wrapper  # pyright: ignore[reportReturnType]
+
 
 class RandomPerturbImage(PerturbImage):
     """Interface for image perturbers that use random state.
@@ -57,12 +88,25 @@ class RandomPerturbImage(PerturbImage):
     The is_static feature is particularly useful for video processing where
     the same perturbation should be applied consistently across all frames.
 
+    ``perturb()`` and ``perturb_batch()`` also accept an ``rng`` (numpy Generator) or
+    ``seed`` (int) keyword argument. The call then draws its random values from that
+    random state only and leaves the random state of the perturber untouched, so its
+    result depends on the given ``rng`` or ``seed`` alone, not on earlier calls or
+    ``is_static``. Calls made in this mode are pure, and the same perturber instance
+    may be called concurrently from several threads as long as each call passes its
+    own ``rng`` or ``seed``. Calls without either keep using, and advancing, the
+    shared random state of the perturber and must not run concurrently.
+
     Attributes:
         seed: Random seed for reproducibility. None (default) means non-deterministic.
         is_static: If True and seed is set, resets RNG state after each perturb
             call to ensure identical results for repeated calls with the same input.
     """
 
+    # Entry points that accept the per-call ``rng`` and ``seed`` keyword arguments. Subclasses name their own
+    # additional entry points, which are added to those of their bases.
+    _rng_entry_points: ClassVar[tuple[str, ...]] = ("perturb", "perturb_batch", "_warp_map")
+
     def __init__(self, *, seed: int | None = None, is_static: bool = False) -> None:
         """Initialize the RandomPerturbImage with seed and static behavior options.
 
@@ -91,6 +135,17 @@ class RandomPerturbImage(PerturbImage):
             )
         self._set_seed()
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Let every override of the random entry points accept the per-call ``rng`` and ``seed`` arguments.
+
+        The entry points are those named in ``_rng_entry_points`` by the class or any of its bases.
+        """
+        super().__init_subclass__(**kwargs)
+        entry_points = {name for base in cls.__mro__ for name in vars(base).get("_rng_entry_points", ())}
+        for name in entry_points:
+            if name in cls.__dict__:
+                setattr(cls, name, _per_call_rng(cls.__dict__[name]))
+
     @property
     def seed(self) -> int | None:
         """Random seed for reproducibility. None means non-deterministic."""
@@ -101,6 +156,11 @@ class RandomPerturbImage(PerturbImage):
         """If True and seed is set, resets RNG state after each perturb call."""
         return self._is_static
 
+    @override
+    def _random_stages(self) -> list[RandomPerturbImage]:
+        """Returns this perturber, which draws from the random state of each call."""
+        return [self]
+
     @abc.abstractmethod
     def _set_seed(self) -> None:
         """Seed the random state(s) for this perturber.
@@ -113,7 +173,33 @@ class RandomPerturbImage(PerturbImage):
         when is_static is True and seed is not None.
         """
 
+    @property
+    def _call_rng(self) -> np.random.Generator | None:
+        """Random state given to the call in progress on this thread, or None if it was given no ``rng`` or ``seed``."""
+        return getattr(_call_rngs, "rngs", {}).get(id(self))
+
+    @contextmanager
+    def _call_rng_scope(self, *, rng: np.random.Generator | None, seed: int | None) -> Iterator[None]:
+        """Make ``rng``, or a generator seeded with ``seed``, the random state of this perturber on this thread.
+
+        Raises:
+            ValueError: If both rng and seed are given.
+        """
+        if rng is not None and seed is not None:
+            raise ValueError("Only one of rng and seed may be given")
+        rngs: dict[int, np.random.Generator] = _call_rngs.__dict__.setdefault("rngs", {})
+        previous = rngs.get(id(self))
+        rngs[id(self)] = rng if rng is not None else np.random.default_rng(seed)
+        try:
+            yield
+        finally:
+            if previous is None:
+                del rngs[id(self)]
+            else:
+                rngs[id(self)] = previous
+
     @override
+    @_per_call_rng
     def perturb(
         self,
         *,
@@ -133,16 +219,41 @@ class RandomPerturbImage(PerturbImage):
             boxes:
                 Input bounding boxes as an Iterable of tuples containing bounding boxes.
             kwargs:
-                Implementation-specific keyword arguments.
+                Implementation-specific keyword arguments. ``rng`` or ``seed`` makes the call draw from its own
+                random state, see ``RandomPerturbImage``.
 
         Returns:
             Perturbed image as numpy array and optionally modified bounding boxes.
         """
         perturbed_image, perturbed_boxes = super().perturb(image=image, boxes=boxes, **kwargs)
-        if self._is_static and self._seed is not None:
+        if self._resets_seed:
             self._set_seed()
         return perturbed_image, perturbed_boxes
 
+    @override
+    @_per_call_rng
+    def perturb_batch(
+        self,
+        *,
+        images: np.ndarray[Any, Any] | Sequence[np.ndarray[Any, Any]],
+        boxes_list: Sequence[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None] | None = None,
+        **kwargs: Any,
+    ) -> tuple[
+        np.ndarray[Any, Any] | list[np.ndarray[Any, Any]],
+        list[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None],
+    ]:
+        """Perturb a batch of images, drawing from a single per-call ``rng`` or ``seed`` across the whole batch."""
+        return super().perturb_batch(images=images, boxes_list=boxes_list, **kwargs)
+
+    @property
+    def _resets_seed(self) -> bool:
+        """Whether the random state is reset after each perturb call.
+
+        Batched implementations fall back to per-image perturbation in this case, since every image must see the
+        same random draws. Calls given their own ``rng`` or ``seed`` never reset the random state of the perturber.
+        """
+        return self._is_static and self._seed is not None and self._call_rng is None
+
     @override
     def get_config(self) -> dict[str, Any]:
         """Returns the current configuration of the RandomPerturbImage instance.
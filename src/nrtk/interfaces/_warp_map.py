@@ -0,0 +1,171 @@
+"""Defines WarpMap, a pixel gather table describing a geometric warp of an image onto an image of the same size.
+
+Classes:
+    WarpMap: Stores, for every pixel of a warped image, the index of the source pixel it is taken from or the fill
+    value it is set to, along with the matching bounding box transformations.
+
+Dependencies:
+    - numpy for storing and applying the gather table.
+
+Usage:
+    Geometric perturbers that move pixels without blending them, such as translation and nearest-neighbour
+    distortion, describe their warp as a ``WarpMap`` through ``PerturbImage._warp_map()``. Successive warps are
+    composed with ``WarpMap.then()`` into a single table, which is applied to an image in one gather.
+
+Example:
+    warp = first._warp_map(image=image).then(second._warp_map(image=image))
+    perturbed_image = warp.apply(image)
+    perturbed_boxes = warp.warp_boxes(boxes)
+"""
+
+from __future__ import annotations
+
+__all__ = ["WarpMap"]
+
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from typing import Any
+
+import numpy as np
+from smqtk_image_io.bbox import AxisAlignedBoundingBox
+
+_Boxes = Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None
+
+
+class WarpMap:
+    """Gather table mapping every pixel of a warped (H, W) image to a pixel of the source image or a fill value.
+
+    Attributes:
+        index (np.ndarray)
+            Flat index, in row-major order, of the source pixel of each warped pixel, as an integer array of length
+            H * W. A negative value ``-(i + 1)`` sets the warped pixel to ``fills[i]`` instead.
+        shape (tuple[int, int])
+            Height and width of both the source and the warped image.
+        fills (list[np.ndarray])
+            Fill values of pixels that have no source pixel, each broadcastable to the channels of the image.
+        box_transforms (list[Callable])
+            Functions called with a ``boxes`` keyword argument, in order, to transform bounding boxes along with
+            the image. Each returns the transformed boxes and may modify the boxes it is given.
+    """
+
+    def __init__(
+        self,
+        *,
+        index: np.ndarray[Any, Any],
+        shape: tuple[int, int],
+        fills: Sequence[np.ndarray[Any, Any]] = (),
+        box_transforms: Sequence[Callable[..., _Boxes]] = (),
+    ) -> None:
+        """Initializes the WarpMap.
+
+        Args:
+            index:
+                Flat source pixel index of each warped pixel, or ``-(i + 1)`` for pixels set to ``fills[i]``.
+            shape:
+                Height and width of the source and warped images.
+            fills:
+                Fill values referenced by negative entries of ``index``.
+            box_transforms:
+                Bounding box transformations matching the warp, applied in order.
+
+        Raises:
+            ValueError: If index does not contain one entry per pixel.
+        """
+        if index.shape != (shape[0] * shape[1],):
+            raise ValueError(f"Expected a flat index of {shape[0] * shape[1]} pixels, got shape {index.shape}")
+        self.index = index
+        self.shape = (shape[0], shape[1])
+        self.fills = list(fills)
+        self.box_transforms = list(box_transforms)
+
+    @staticmethod
+    def source_index(
+        *,
+        x: np.ndarray[Any, Any],
+        y: np.ndarray[Any, Any],
+        shape: tuple[int, int],
+    ) -> np.ndarray[Any, Any]:
+        """Flat gather index from integer source coordinates, set to -1 where they fall outside the image.
+
+        Args:
+            x:
+                Source column of each warped pixel, as an integer array broadcastable to ``shape``.
+            y:
+                Source row of each warped pixel, as an integer array broadcastable to ``shape``.
+            shape:
+                Height and width of the source and warped images.
+
+        Returns:
+            Flat index suitable for a ``WarpMap`` with a single fill value.
+        """
+        h, w = shape
+        x = np.asarray(x, dtype=np.intp)
+        y = np.asarray(y, dtype=np.intp)
+        valid = ((x >= 0) & (x < w)) & ((y >= 0) & (y < h))
+        return np.where(valid, y * w + x, -1).reshape(-1)
+
+    def then(self, other: WarpMap) -> WarpMap:
+        """Compose this warp with a warp applied after it.
+
+        Args:
+            other:
+                Warp applied to the output of this warp.
+
+        Returns:
+            WarpMap equivalent to applying this warp followed by ``other``.
+
+        Raises:
+            ValueError: If the warps do not apply to images of the same size.
+        """
+        if other.shape != self.shape:
+            raise ValueError(f"Cannot compose warps of {self.shape} and {other.shape} images")
+        # Fill values of the second warp are numbered after those of the first one, so fill value i of the second
+        # warp, found at index -(i + 1) from the end of the table, maps to -(len(self.fills) + i + 1)
+        table = np.concatenate((self.index, -np.arange(len(self.fills) + len(other.fills), len(self.fills), -1)))
+        index = np.take(table, other.index)
+        return WarpMap(
+            index=index,
+            shape=self.shape,
+            fills=[*self.fills, *other.fills],
+            box_transforms=[*self.box_transforms, *other.box_transforms],
+        )
+
+    def apply(self, image: np.ndarray[Any, Any], *, batched: bool = False) -> np.ndarray[Any, Any]:
+        """Warp an image, or a stacked batch of images, in a single gather.
+
+        Args:
+            image:
+                Image of shape (H, W) or (H, W, C), or a stacked batch of such images when ``batched`` is True.
+            batched:
+                Whether ``image`` is a batch stacked along a leading axis.
+
+        Returns:
+            Warped image of the same shape and dtype as ``image``.
+
+        Raises:
+            ValueError: If the image is not of the size of the warp.
+        """
+        axis = 1 if batched else 0
+        if image.shape[axis : axis + 2] != self.shape:
+            raise ValueError(f"Cannot apply a warp of {self.shape} images to an image of shape {image.shape}")
+        lead, channels = image.shape[:axis], image.shape[axis + 2 :]
+        table = image.reshape(*lead, -1, *channels)
+        if self.fills:
+            # Fill value i is the (i + 1)-th row from the end, where index -(i + 1) points
+            fills = np.stack([np.broadcast_to(np.asarray(fill).astype(image.dtype), channels) for fill in self.fills])
+            fills = np.broadcast_to(fills[::-1], (*lead, len(self.fills), *channels))
+            table = np.concatenate((table, fills), axis=axis)
+        return np.take(table, self.index, axis=axis).reshape(image.shape)
+
+    def warp_boxes(self, boxes: _Boxes) -> _Boxes:
+        """Transform bounding boxes to follow the warp.
+
+        Args:
+            boxes:
+                Bounding boxes of the source image, which may be modified.
+
+        Returns:
+            Bounding boxes of the warped image.
+        """
+        for transform in self.box_transforms:
+            boxes = transform(boxes=boxes)
+        return boxes
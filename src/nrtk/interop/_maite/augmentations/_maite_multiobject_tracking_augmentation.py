@@ -19,9 +19,8 @@ from maite.protocols.multiobject_tracking import (
     TargetType,
 )
 from maite.protocols.multiobject_tracking import VideoFrame as MAITEVideoFrameProtocol
-from smqtk_image_io.bbox import AxisAlignedBoundingBox
 
-from nrtk.interfaces import PerturbVideo, VideoFrame
+from nrtk.interfaces import BoxArray, PerturbVideo, VideoFrame
 from nrtk.interop._maite.metadata import NRTKDatumMetadata
 from nrtk.interop._maite.metadata._nrtk_datum_metadata import _forward_md_keys
 
@@ -80,25 +79,16 @@ class MAITEMultiobjectTrackingAugmentation(Augmentation):
         frame: MAITEVideoFrameProtocol,
         single_frame_target: SingleFrameObjectTrackingTarget,
     ) -> VideoFrame:
-        frame_bboxes = [
-            AxisAlignedBoundingBox(min_vertex=bbox[0:2], max_vertex=bbox[2:4])
-            for bbox in np.array(
-                single_frame_target.boxes,
-            )
-        ]
-        frame_labels = [
-            {label: score}
-            for label, score in zip(
-                np.array(single_frame_target.labels),
-                np.array(single_frame_target.scores),
-                strict=True,
-            )
-        ]
+        frame_boxes = BoxArray(
+            coords=np.array(single_frame_target.boxes),
+            labels=np.array(single_frame_target.labels),
+            scores=np.array(single_frame_target.scores),
+        )
 
         return VideoFrame(
             image=np.transpose(np.asarray(copy.deepcopy(frame.pixels)), (1, 2, 0)),
             timestamp=frame.time_s,
-            boxes=zip(frame_bboxes, frame_labels, strict=True),
+            boxes=frame_boxes,
             additional_params={
                 "pts": frame.pts,
                 "frame_index": frame.frame_index,
@@ -117,6 +107,15 @@ class MAITEMultiobjectTrackingAugmentation(Augmentation):
             frame_index=frame.additional_params["frame_index"],
         )
 
+        if isinstance(frame.boxes, BoxArray) and len(frame.boxes):
+            # Columnar boxes map directly onto the MAITE target
+            return maite_frame, MAITESingleFrameObjectTrackingTarget(
+                boxes=frame.boxes.coords,
+                labels=frame.boxes.labels,
+                scores=frame.boxes.scores,
+                track_ids=frame.additional_params["track_ids"],
+            )
+
         try:
             aug_bboxes, aug_score_dicts = zip(*frame.boxes, strict=True)
             aug_bboxes_arr = np.vstack([np.hstack((bbox.min_vertex, bbox.max_vertex)) for bbox in aug_bboxes])
@@ -16,9 +16,8 @@ from maite.protocols.object_detection import (
     InputType,
     TargetType,
 )
-from smqtk_image_io.bbox import AxisAlignedBoundingBox
 
-from nrtk.interfaces import PerturbImage
+from nrtk.interfaces import BoxArray, PerturbImage
 from nrtk.interop._maite.datasets import MAITEObjectDetectionTarget
 from nrtk.interop._maite.metadata import NRTKDatumMetadata
 from nrtk.interop._maite.metadata._nrtk_datum_metadata import _forward_md_keys
@@ -76,39 +75,29 @@ class MAITEObjectDetectionAugmentation(Augmentation):  # pyright: ignore [report
             aug_img = np.transpose(aug_img, (1, 2, 0))
 
             # format annotations for passing to perturber
-            img_bboxes = [
-                AxisAlignedBoundingBox(min_vertex=bbox[0:2], max_vertex=bbox[2:4]) for bbox in np.array(img_anns.boxes)
-            ]  # pyright: ignore [reportAttributeAccessIssue]
-            img_labels = [
-                {label: score}
-                for label, score in zip(np.array(img_anns.labels), np.array(img_anns.scores), strict=False)  # pyright: ignore [reportAttributeAccessIssue]
-            ]
+            img_boxes = BoxArray(
+                coords=np.array(img_anns.boxes),  # pyright: ignore [reportAttributeAccessIssue]
+                labels=np.array(img_anns.labels),  # pyright: ignore [reportAttributeAccessIssue]
+                scores=np.array(img_anns.scores),  # pyright: ignore [reportAttributeAccessIssue]
+            )
 
             aug_img, aug_img_anns = self.augment(
                 image=np.asarray(aug_img),
-                boxes=zip(img_bboxes, img_labels, strict=False),
+                boxes=img_boxes,
                 **dict(md),
             )
             if TYPE_CHECKING and not aug_img_anns:
                 break
             aug_imgs.append(np.transpose(aug_img, (2, 0, 1)))
 
-            # re-format annotations to MAITEObjectDetectionTarget for returning
-            aug_img_bboxes, aug_img_score_dicts = zip(*aug_img_anns, strict=False)
-            aug_img_bboxes_arr = np.vstack([np.hstack((bbox.min_vertex, bbox.max_vertex)) for bbox in aug_img_bboxes])
-            aug_img_labels, aug_img_scores = zip(
-                *[
-                    # get (label, score) pair for highest score
-                    max(score_dict.items(), key=lambda x: x[1])
-                    for score_dict in aug_img_score_dicts
-                ],
-                strict=False,
-            )
+            # re-format annotations to MAITEObjectDetectionTarget for returning. Perturbers that do not
+            # support BoxArray natively return legacy boxes, keeping the highest scoring label of each box.
+            aug_img_boxes = BoxArray.from_boxes(aug_img_anns if aug_img_anns is not None else [])
             aug_dets.append(
                 MAITEObjectDetectionTarget(
-                    boxes=aug_img_bboxes_arr,
-                    labels=np.array(aug_img_labels),
-                    scores=np.array(aug_img_scores),
+                    boxes=aug_img_boxes.coords,
+                    labels=aug_img_boxes.labels,
+                    scores=aug_img_boxes.scores,
                 ),
             )
 
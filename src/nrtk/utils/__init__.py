@@ -1 +1,28 @@
 """Package for nrtk utils needed for carrying out pertubations."""
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from nrtk._guard import Group, guard
+
+if TYPE_CHECKING:
+    from nrtk.utils._precision import float_dtype as float_dtype
+    from nrtk.utils._precision import get_default_precision as get_default_precision
+    from nrtk.utils._precision import set_default_precision as set_default_precision
+
+__getattr__: Callable[[str], Any]
+__dir__: Callable[[], list[str]]
+__all__: list[str]
+
+__getattr__, __dir__, __all__ = guard(
+    namespace=globals(),
+    groups=[
+        Group(
+            symbols={
+                "float_dtype": "nrtk.utils._precision",
+                "get_default_precision": "nrtk.utils._precision",
+                "set_default_precision": "nrtk.utils._precision",
+            },
+        ),
+    ],
+)
@@ -0,0 +1,160 @@
+"""Support for updating the parameters of a perturber while reusing the derived state the change leaves valid.
+
+Classes:
+    IncrementalParamsMixin: Adds ``with_params`` and ``update`` to perturbers that can reuse the derived state of the
+    instance they are updated from.
+
+Functions:
+    changed_values: Names of the values that differ between two mappings, comparing arrays by value.
+    stale_state: Derived state invalidated by changed values, following a declared dependency graph.
+    state_inputs: Values that derived state is computed from, following a declared dependency graph.
+
+Note:
+    This is a private implementation detail of the perturbers that support incremental updates.
+"""
+
+from __future__ import annotations
+
+__all__ = ["IncrementalParamsMixin", "changed_values", "stale_state", "state_inputs"]
+
+import abc
+import copy
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import numpy as np
+from typing_extensions import Self
+
+
+def changed_values(*, old: Mapping[str, Any], new: Mapping[str, Any]) -> set[str]:
+    """Names of the values of ``new`` that are missing from or differ in ``old``, comparing arrays by value."""
+    return {name for name, value in new.items() if name not in old or not np.array_equal(old[name], value)}
+
+
+def stale_state(*, dependencies: Mapping[str, Iterable[str]], changed: Iterable[str]) -> set[str]:
+    """Derived state invalidated by a change.
+
+    Args:
+        dependencies:
+            For each piece of derived state, the names of the values and other derived state it is computed from.
+        changed:
+            Names of the changed values.
+
+    Returns:
+        Names of the derived state computed, directly or through other derived state, from a changed value.
+    """
+    invalid = set(changed)
+    stale: set[str] = set()
+    while True:
+        newly_stale = {
+            name for name, inputs in dependencies.items() if name not in stale and not invalid.isdisjoint(inputs)
+        }
+        if not newly_stale:
+            return stale
+        stale |= newly_stale
+        invalid |= newly_stale
+
+
+def state_inputs(*, dependencies: Mapping[str, Iterable[str]], names: Iterable[str]) -> set[str]:
+    """Values, as opposed to other derived state, that derived state is computed from.
+
+    Args:
+        dependencies:
+            For each piece of derived state, the names of the values and other derived state it is computed from.
+        names:
+            Names of the derived state.
+
+    Returns:
+        Names of the values the derived state is computed from, directly or through other derived state.
+    """
+    pending = list(names)
+    visited: set[str] = set()
+    while pending:
+        name = pending.pop()
+        if name not in visited:
+            visited.add(name)
+            pending.extend(dependencies.get(name, ()))
+    return visited - set(dependencies)
+
+
+class IncrementalParamsMixin(abc.ABC):
+    """Mixin for perturbers whose parameters can be changed without recomputing all of their derived state.
+
+    ``with_params`` and ``update`` run the constructor with the changed parameters, so the result is the same as
+    constructing the perturber from scratch. While the constructor runs, ``_reuse_source`` is the instance the
+    parameters are changed from, and the derived state that the subclass declares independent of the change is
+    taken from it instead of being recomputed.
+    """
+
+    # Instance whose derived state may be reused, set only while the constructor runs for with_params() or update()
+    _reuse_source: IncrementalParamsMixin | None = None
+
+    @abc.abstractmethod
+    def _params(self) -> dict[str, Any]:
+        """Constructor arguments of this instance, leaving out those derived from other arguments by default."""
+
+    def _changed_params(self, changes: Mapping[str, Any]) -> dict[str, Any]:
+        """Constructor arguments of this instance, updated with ``changes``.
+
+        Raises:
+            TypeError:
+                If a change is not a constructor argument.
+        """
+        params = self._params()
+        unknown = set(changes) - set(params)
+        if unknown:
+            raise TypeError(f"{type(self).__name__} has no parameters {sorted(unknown)}")
+        return params | dict(changes)
+
+    def with_params(self, **changes: Any) -> Self:
+        """Create a copy of this perturber with some parameters changed.
+
+        The copy is equal to a perturber constructed with the changed parameters, including its random state, but
+        reuses the derived state of this perturber that does not depend on them. Parameters that default to values
+        derived from other parameters, and were not given, are derived again.
+
+        Args:
+            changes:
+                Constructor arguments to change.
+
+        Returns:
+            The perturber with changed parameters. This perturber is left unchanged.
+
+        Raises:
+            TypeError:
+                If a change is not a constructor argument.
+        """
+        params = self._changed_params(changes)
+        perturber = type(self).__new__(type(self))
+        perturber._reuse_source = self  # noqa: SLF001 - same class
+        try:
+            perturber.__init__(**params)
+        finally:
+            del perturber._reuse_source  # noqa: SLF001 - same class
+        return perturber
+
+    def update(self, **changes: Any) -> None:
+        """Change some parameters of this perturber in place.
+
+        Equivalent to ``with_params`` but modifies this perturber, which also resets its random state. If the
+        changed parameters are rejected by the constructor, the perturber is left unchanged.
+
+        Args:
+            changes:
+                Constructor arguments to change.
+
+        Raises:
+            TypeError:
+                If a change is not a constructor argument.
+        """
+        params = self._changed_params(changes)
+        previous = copy.copy(self)
+        self._reuse_source = previous
+        try:
+            self.__init__(**params)
+        except BaseException:
+            self.__dict__.clear()
+            self.__dict__.update(vars(previous))
+            raise
+        finally:
+            self.__dict__.pop("_reuse_source", None)
@@ -2,6 +2,7 @@ import numpy as np
 import pytest
 
 from nrtk.entrypoints import nrtk_perturber
+from nrtk.impls.perturb_image_factory import PerturberHaltonFactory
 from nrtk.interfaces import PerturbImageFactory
 from nrtk.interop._maite.datasets import (
     MAITEObjectDetectionDataset,
@@ -29,6 +30,24 @@ class TestNRTKPerturber:
                 ),
                 ["_param1-1", "_param1-3"],
             ),
+            (
+                PerturberHaltonFactory(
+                    perturber=FakePerturber,
+                    theta_keys=["param1", "param2"],
+                    thetas=[[1, 3], [2, 4]],
+                    num_samples=2,
+                    scramble=False,
+                ),
+                ["_param1-1_param2-2", "_param1-3_param2-2"],
+            ),
+            (
+                PerturberFakeFactory(
+                    perturber=FakePerturber,
+                    theta_key="param1",
+                    theta_values=[1, 3, 5],
+                ).shard(index=1, count=2),
+                ["_param1-3"],
+            ),
         ],
     )
     def test_nrtk_perturber(self, perturber_factory: PerturbImageFactory, img_dirs: list[str]) -> None:
@@ -48,8 +67,9 @@ class TestNRTKPerturber:
             dataset_id="test_dataset",
         )
 
-        augmented_datasets = nrtk_perturber(maite_dataset=dataset, perturber_factory=perturber_factory)
+        augmented_datasets = list(nrtk_perturber(maite_dataset=dataset, perturber_factory=perturber_factory))
 
+        assert len(augmented_datasets) == len(img_dirs)
         for perturber_params, aug_dataset in augmented_datasets:
             assert perturber_params in list(img_dirs)
             assert len(aug_dataset) == num_imgs
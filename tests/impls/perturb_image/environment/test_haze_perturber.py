@@ -12,6 +12,7 @@ from nrtk.impls.perturb_image.environment import HazePerturber
 from tests.impls import INPUT_TANK_IMG_FILE_PATH as INPUT_IMG_FILE_PATH
 from tests.impls.perturb_image.perturber_tests_mixin import PerturberTestsMixin
 from tests.impls.perturb_image.perturber_utils import perturber_assertions
+from tests.utils import random_image
 
 
 @pytest.mark.core
@@ -88,20 +89,22 @@ class TestHazePerturber(PerturberTestsMixin):
         tiff_snapshot.assert_match(out_img)
 
     @pytest.mark.parametrize(
-        ("factor"),
+        ("factor", "precision"),
         [
-            1.0,
-            2.0,
+            (1.0, None),
+            (2.0, "float64"),
         ],
     )
     def test_configuration(
         self,
         factor: float,
+        precision: str | None,
     ) -> None:
         """Test configuration stability."""
-        inst = HazePerturber(factor=factor)
+        inst = HazePerturber(factor=factor, precision=precision)
         for i in configuration_test_helper(inst):
             assert i.factor == factor
+            assert i.precision == precision
 
     @pytest.mark.parametrize(
         ("metadata", "expectation"),
@@ -127,3 +130,43 @@ class TestHazePerturber(PerturberTestsMixin):
         inst = HazePerturber()
         with expectation:
             inst(image=image, **metadata)
+
+    @pytest.mark.parametrize(
+        ("images", "metadata"),
+        [
+            (np.stack([random_image(seed=0), random_image(seed=1)]), {}),
+            (np.stack([random_image(seed=0), random_image(seed=1)]), {"sky_color": [0.5, 0.5, 0.5]}),
+            (
+                np.random.default_rng(2).random((3, 64, 64, 3)) * 255,
+                {"depth_map": np.random.default_rng(3).random((64, 64, 1))},
+            ),
+            (np.random.default_rng(4).integers(0, 255, size=(2, 64, 64), dtype=np.uint8), {}),
+        ],
+    )
+    def test_perturb_batch(self, images: np.ndarray, metadata: dict[str, Any]) -> None:
+        """Ensure batched perturbation matches perturbing each image in turn."""
+        inst = HazePerturber(factor=0.7)
+        out_images, _ = inst.perturb_batch(images=images, **metadata)
+        assert out_images.dtype == np.uint8
+        assert np.array_equal(out_images, np.stack([inst.perturb(image=image, **metadata)[0] for image in images]))
+
+    @pytest.mark.parametrize(
+        ("metadata"),
+        [
+            {},
+            {"sky_color": [0.5, 0.5, 0.5]},
+            {"depth_map": np.random.default_rng(5).random((256, 256, 1))},
+        ],
+    )
+    def test_precision_parity(self, metadata: dict[str, Any]) -> None:
+        """Ensure float32 weathering matches float64 weathering to within one gray level."""
+        image = random_image(seed=0)
+        out_32, _ = HazePerturber(factor=0.7, precision="float32")(image=image, **metadata)
+        out_64, _ = HazePerturber(factor=0.7, precision="float64")(image=image, **metadata)
+        assert out_32.dtype == out_64.dtype == np.uint8
+        assert np.abs(out_32.astype(np.int16) - out_64).max() <= 1
+
+    def test_invalid_precision(self) -> None:
+        """Raise a ValueError for unsupported precisions."""
+        with pytest.raises(ValueError, match=r"Unsupported precision 'float16'"):
+            HazePerturber(precision="float16")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import warnings
 from collections.abc import Hashable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pytest
@@ -77,6 +78,16 @@ class TestWaterDropletPerturber(PerturberTestsMixin):
         # Same result each call with is_static
         perturber_assertions(perturb=inst.perturb, image=image, expected=out1)
 
+    def test_per_call_seed(self) -> None:
+        """Verify concurrent calls given their own seeds match fresh seeded perturbers."""
+        image = random_image(seed=23456)
+        inst = WaterDropletPerturber(seed=1)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            outputs = list(executor.map(lambda seed: inst(image=image, seed=seed)[0], range(4)))
+        for seed, out in enumerate(outputs):
+            expected, _ = WaterDropletPerturber(seed=seed)(image=image)
+            assert np.array_equal(out, expected)
+
     def test_is_static_warning(self) -> None:
         """Verify warning when is_static=True with seed=None."""
         with pytest.warns(UserWarning, match="is_static=True has no effect"):
@@ -199,11 +210,12 @@ class TestWaterDropletPerturber(PerturberTestsMixin):
             "f_y",
             "seed",
             "is_static",
+            "precision",
         ),
         [
-            ((0.0, 1.0), 20, 0.25, 90.0 / 180.0 * np.pi, 1.0, 1.33, 400, 400, 0, False),
-            ((0.0, 1.0), 20, 0.25, 90.0 / 180.0 * np.pi, 1.0, 1.33, 400, 400, 42, True),
-            ((0.0, 1.0), 20, 0.25, 90.0 / 180.0 * np.pi, 1.0, 1.33, 400, 400, None, False),
+            ((0.0, 1.0), 20, 0.25, 90.0 / 180.0 * np.pi, 1.0, 1.33, 400, 400, 0, False, None),
+            ((0.0, 1.0), 20, 0.25, 90.0 / 180.0 * np.pi, 1.0, 1.33, 400, 400, 42, True, "float64"),
+            ((0.0, 1.0), 20, 0.25, 90.0 / 180.0 * np.pi, 1.0, 1.33, 400, 400, None, False, "float32"),
         ],
     )
     def test_configuration(
@@ -218,6 +230,7 @@ class TestWaterDropletPerturber(PerturberTestsMixin):
         f_y: int,
         seed: int | None,
         is_static: bool,
+        precision: str | None,
     ) -> None:
         """Test configuration stability."""
         inst = WaterDropletPerturber(
@@ -231,6 +244,7 @@ class TestWaterDropletPerturber(PerturberTestsMixin):
             f_y=f_y,
             seed=seed,
             is_static=is_static,
+            precision=precision,
         )
         for i in configuration_test_helper(inst):
             assert list(i.size_range) == list(size_range)
@@ -243,6 +257,7 @@ class TestWaterDropletPerturber(PerturberTestsMixin):
             assert i.f_y == f_y
             assert i.seed == seed
             assert i.is_static == is_static
+            assert i.precision == precision
 
     @pytest.mark.parametrize(
         "boxes",
@@ -286,6 +301,13 @@ class TestWaterDropletPerturber(PerturberTestsMixin):
         assert out_image.shape == image.shape
         assert out_image.dtype == np.uint8
 
+    def test_precision_parity(self) -> None:
+        """Ensure a float32 blur matches a float64 blur to within one gray level."""
+        image = random_image(seed=2345)
+        out_32, _ = WaterDropletPerturber(seed=42, precision="float32").perturb(image=image)
+        out_64, _ = WaterDropletPerturber(seed=42, precision="float64").perturb(image=image)
+        assert np.abs(out_32.astype(np.int16) - out_64).max() <= 1
+
 
 @pytest.mark.waterdroplet
 class TestWaterDropletPerturberUtils:
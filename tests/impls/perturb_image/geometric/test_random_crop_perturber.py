@@ -14,7 +14,7 @@ from syrupy.assertion import SnapshotAssertion
 from nrtk.impls.perturb_image.geometric.random import RandomCropPerturber
 from tests.impls import INPUT_TANK_IMG_FILE_PATH as INPUT_IMG_FILE_PATH
 from tests.impls.perturb_image.perturber_tests_mixin import PerturberTestsMixin
-from tests.impls.perturb_image.perturber_utils import bbox_perturber_assertions
+from tests.impls.perturb_image.perturber_utils import bbox_perturber_assertions, box_array_perturber_assertions
 from tests.utils import random_image
 
 
@@ -194,6 +194,20 @@ class TestRandomCropPerturber(PerturberTestsMixin):
             assert i.seed == seed
             assert i.is_static == is_static
 
+    def test_box_array(self) -> None:
+        """Verify BoxArray boxes are cropped natively and match the legacy box format."""
+        boxes = [
+            (AxisAlignedBoundingBox(min_vertex=(10, 20), max_vertex=(60, 90)), {1: 0.9}),
+            (AxisAlignedBoundingBox(min_vertex=(0, 0), max_vertex=(5, 5)), {"cat": 0.3}),
+            (AxisAlignedBoundingBox(min_vertex=(50, 50), max_vertex=(250, 250)), {2: 0.5}),
+        ]
+        box_array_perturber_assertions(
+            perturb=RandomCropPerturber(crop_size=(100, 120), seed=3).perturb,
+            perturb_legacy=RandomCropPerturber(crop_size=(100, 120), seed=3).perturb,
+            image=random_image(),
+            boxes=boxes,
+        )
+
     @pytest.mark.parametrize(
         ("crop_size", "expectation"),
         [
@@ -10,9 +10,15 @@ from smqtk_image_io.bbox import AxisAlignedBoundingBox
 from syrupy.assertion import SnapshotAssertion
 
 from nrtk.impls.perturb_image.geometric.random import RandomTranslationPerturber
+from nrtk.interfaces import BoxArray
 from tests.impls import INPUT_TANK_IMG_FILE_PATH as INPUT_IMG_FILE_PATH
 from tests.impls.perturb_image.perturber_tests_mixin import PerturberTestsMixin
-from tests.impls.perturb_image.perturber_utils import bbox_perturber_assertions
+from tests.impls.perturb_image.perturber_utils import (
+    batch_perturber_assertions,
+    bbox_perturber_assertions,
+    box_array_perturber_assertions,
+    warp_map_assertions,
+)
 from tests.utils import random_image
 
 
@@ -246,3 +252,84 @@ class TestRandomTranslationPerturber(PerturberTestsMixin):
         for i in configuration_test_helper(inst):
             assert i.seed == seed
             assert i.is_static == is_static
+
+    @pytest.mark.parametrize(
+        ("images", "max_translation_limit", "is_static"),
+        [
+            (np.stack([random_image(size=(32, 48, 3), seed=i) for i in range(4)]), None, False),
+            (np.stack([random_image(size=(32, 48, 3), seed=i) for i in range(4)]), (8, 4), False),
+            (np.stack([random_image(size=(32, 48, 3), seed=i) for i in range(4)]), None, True),
+            (np.random.default_rng(0).random((3, 32, 48)).astype(np.float32), (32, 48), False),
+        ],
+    )
+    def test_perturb_batch(
+        self,
+        images: np.ndarray,
+        max_translation_limit: tuple[int, int] | None,
+        is_static: bool,
+    ) -> None:
+        """Ensure batched perturbation matches perturbing each image in turn with the same seed."""
+        batch_perturber_assertions(
+            perturb_batch=RandomTranslationPerturber(seed=7, is_static=is_static).perturb_batch,
+            perturb=RandomTranslationPerturber(seed=7, is_static=is_static).perturb,
+            images=images,
+            max_translation_limit=max_translation_limit,
+        )
+
+    @pytest.mark.parametrize("seed", [1, 7, 42])
+    def test_box_array(self, seed: int) -> None:
+        """Verify BoxArray boxes are translated natively and match the legacy box format."""
+        boxes = [
+            (AxisAlignedBoundingBox(min_vertex=(10, 20), max_vertex=(60, 90)), {1: 0.9}),
+            (AxisAlignedBoundingBox(min_vertex=(0, 0), max_vertex=(5, 5)), {"cat": 0.3}),
+            (AxisAlignedBoundingBox(min_vertex=(200, 150), max_vertex=(250, 250)), {2: 0.5}),
+        ]
+        box_array_perturber_assertions(
+            perturb=RandomTranslationPerturber(seed=seed).perturb,
+            perturb_legacy=RandomTranslationPerturber(seed=seed).perturb,
+            image=random_image(),
+            boxes=boxes,
+        )
+
+    def test_warp_map_per_call_seed(self) -> None:
+        """Verify a warp map drawn with a per-call seed matches perturb() with that seed."""
+        image = random_image(seed=0)
+        inst = RandomTranslationPerturber(seed=7, is_static=True)
+        warp = inst._warp_map(image=image, seed=3)
+        expected, _ = inst.perturb(image=image, seed=3)
+        assert warp is not None
+        assert np.array_equal(warp.apply(image), expected)
+        assert np.array_equal(expected, RandomTranslationPerturber(seed=3)(image=image)[0])
+
+    @pytest.mark.parametrize(
+        ("image", "max_translation_limit", "is_static"),
+        [
+            (random_image(size=(32, 48, 3), seed=1), None, False),
+            (random_image(size=(32, 48, 3), seed=1), (8, 4), True),
+            (random_image(size=(32, 48), seed=1), (0, 12), False),
+            (np.random.default_rng(0).random((32, 48)).astype(np.float32), (32, 48), False),
+        ],
+    )
+    @pytest.mark.parametrize("box_array", [False, True])
+    def test_warp_map(
+        self,
+        image: np.ndarray,
+        max_translation_limit: tuple[int, int] | None,
+        is_static: bool,
+        box_array: bool,
+    ) -> None:
+        """Verify successive warp maps draw the same translations as successive perturb() calls."""
+        boxes = [
+            (AxisAlignedBoundingBox(min_vertex=(10, 20), max_vertex=(30, 25)), {1: 0.9}),
+            (AxisAlignedBoundingBox(min_vertex=(0, 0), max_vertex=(5, 5)), {"cat": 0.3}),
+        ]
+        inst = RandomTranslationPerturber(seed=7, is_static=is_static, color_fill=[255, 0, 128])
+        reference = RandomTranslationPerturber(seed=7, is_static=is_static, color_fill=[255, 0, 128])
+        for _ in range(3):
+            warp_map_assertions(
+                perturber=inst,
+                reference=reference,
+                image=image,
+                boxes=BoxArray.from_boxes(boxes) if box_array else boxes,
+                max_translation_limit=max_translation_limit,
+            )
@@ -0,0 +1,74 @@
+"""Tests for the on-disk cache of interpolated pyBSM atmospheres."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+from pybsm import utils
+
+import nrtk.impls.perturb_image.optical._pybsm._atmosphere_cache as _mod
+from nrtk.impls.perturb_image.optical import PybsmPerturber
+from nrtk.impls.perturb_image.optical.otf import (
+    get_atmosphere_cache_dir,
+    load_default_config,
+    precompute_atmospheres,
+    set_atmosphere_cache_dir,
+)
+from tests.impls import INPUT_TANK_IMG_FILE_PATH as INPUT_IMG_FILE
+
+
+@pytest.fixture(autouse=True)
+def _no_cache_dir(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    """Start every test without a cache directory, and unset the one a test set afterwards."""
+    monkeypatch.delenv("NRTK_ATMOSPHERE_CACHE_DIR", raising=False)
+    set_atmosphere_cache_dir(None)
+    yield
+    set_atmosphere_cache_dir(None)
+
+
+@pytest.mark.pybsm
+class TestAtmosphereCache:
+    def test_cache_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The set directory takes precedence over the environment variable, which is followed otherwise."""
+        assert get_atmosphere_cache_dir() is None
+        monkeypatch.setenv("NRTK_ATMOSPHERE_CACHE_DIR", str(tmp_path / "env"))
+        assert get_atmosphere_cache_dir() == tmp_path / "env"
+        set_atmosphere_cache_dir(tmp_path)
+        assert get_atmosphere_cache_dir() == tmp_path
+        set_atmosphere_cache_dir(None)
+        assert get_atmosphere_cache_dir() == tmp_path / "env"
+
+    def test_precompute(self, tmp_path: Path) -> None:
+        """Precomputed atmospheres are those of pyBSM, memory-mapped read-only, and are only interpolated once."""
+        set_atmosphere_cache_dir(tmp_path)
+        assert precompute_atmospheres(ihaze=1, altitudes=[1000.0, 1500.0], ground_ranges=[0.0, 2500.0]) == 4
+        assert precompute_atmospheres(ihaze=1, altitudes=[1500.0, 2000.0], ground_ranges=[2500.0]) == 1
+
+        atm = _mod.cached_atmosphere(ihaze=1, altitude=1500.0, ground_range=2500.0)
+        assert isinstance(atm, np.memmap)
+        assert not atm.flags.writeable
+        assert np.array_equal(atm, utils.load_database_atmosphere(altitude=1500.0, ground_range=2500.0, ihaze=1))
+        assert len(list(tmp_path.glob("*/*.npy"))) == 5
+
+    def test_precompute_without_cache_dir(self) -> None:
+        """Precomputing requires a cache directory, without which nothing is cached."""
+        assert _mod.cached_atmosphere(ihaze=1, altitude=1000.0, ground_range=0.0) is None
+        with pytest.raises(ValueError, match=r"No atmosphere cache directory is set"):
+            precompute_atmospheres(ihaze=1, altitudes=[1000.0], ground_ranges=[0.0])
+
+    def test_perturber(self, tmp_path: Path) -> None:
+        """Perturbers of interpolated scenarios read the cached atmosphere and give the same images."""
+        image = np.array(Image.open(INPUT_IMG_FILE))[:128, :128]
+        config = load_default_config(preset="sample") | {"altitude": 8500.0, "ground_range": 61000.0}
+        expected, _ = PybsmPerturber(seed=1, **config)(image=image, img_gsd=3.19 / 160.0)
+
+        set_atmosphere_cache_dir(tmp_path)
+        inst = PybsmPerturber(seed=1, **config)
+        assert isinstance(inst._simulator.scenario._atm, np.memmap)
+        actual, _ = inst(image=image, img_gsd=3.19 / 160.0)
+        assert np.array_equal(actual, expected)
+        assert len(list(tmp_path.glob("*/*.npy"))) == 1
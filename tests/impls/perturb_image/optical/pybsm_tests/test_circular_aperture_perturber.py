@@ -15,7 +15,7 @@ from syrupy.assertion import SnapshotAssertion
 from nrtk.impls.perturb_image.optical.otf import CircularAperturePerturber, load_default_config
 from tests.impls import INPUT_TANK_IMG_FILE_PATH as INPUT_IMG_FILE_PATH
 from tests.impls.perturb_image.perturber_tests_mixin import PerturberTestsMixin
-from tests.impls.perturb_image.perturber_utils import pybsm_perturber_assertions
+from tests.impls.perturb_image.perturber_utils import blur_kernel_assertions, pybsm_perturber_assertions
 
 
 @pytest.mark.pybsm
@@ -300,3 +300,8 @@ class TestCircularAperturePerturber(PerturberTestsMixin):
         inst = CircularAperturePerturber()
         _, out_boxes = inst.perturb(image=np.ones((256, 256, 3)), boxes=boxes, img_gsd=(3.19 / 160))
         assert boxes == out_boxes
+
+    def test_blur_kernel(self) -> None:
+        """Test that the blur kernel reproduces the perturbation, up to the rounding of the output."""
+        image = np.random.default_rng(seed=0).integers(0, 256, (40, 48, 3), dtype=np.uint8)
+        blur_kernel_assertions(perturber=CircularAperturePerturber(), image=image, rounded=True, img_gsd=(3.19 / 160))
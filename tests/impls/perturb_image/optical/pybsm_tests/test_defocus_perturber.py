@@ -13,9 +13,15 @@ from smqtk_image_io.bbox import AxisAlignedBoundingBox
 from syrupy.assertion import SnapshotAssertion
 
 from nrtk.impls.perturb_image.optical.otf import DefocusPerturber, load_default_config
+from nrtk.impls.perturb_image_factory import PerturberLinspaceFactory
 from tests.impls import INPUT_TANK_IMG_FILE_PATH as INPUT_IMG_FILE_PATH
 from tests.impls.perturb_image.perturber_tests_mixin import PerturberTestsMixin
-from tests.impls.perturb_image.perturber_utils import bbox_perturber_assertions, pybsm_perturber_assertions
+from tests.impls.perturb_image.perturber_utils import (
+    bbox_perturber_assertions,
+    blur_kernel_assertions,
+    perturb_sweep_assertions,
+    pybsm_perturber_assertions,
+)
 
 
 @pytest.mark.pybsm
@@ -258,3 +264,22 @@ class TestDefocusPerturber(PerturberTestsMixin):
             boxes=boxes,
             img_gsd=img_gsd,
         )
+
+    def test_blur_kernel(self) -> None:
+        """Test that the blur kernel reproduces the perturbation, up to the rounding of the output."""
+        image = np.random.default_rng(seed=0).integers(0, 256, (40, 48, 3), dtype=np.uint8)
+        blur_kernel_assertions(perturber=DefocusPerturber(), image=image, rounded=True, border=8, img_gsd=(3.19 / 160))
+
+    def test_perturb_sweep(self) -> None:
+        """Sweeps over w_x share the spectrum of the image and reproduce calling each perturber."""
+        image = np.stack((np.array(Image.open(INPUT_IMG_FILE_PATH))[:256, :256],) * 3, axis=-1)
+        factory = PerturberLinspaceFactory(
+            perturber=DefocusPerturber,
+            theta_key="w_x",
+            start=1e-6,
+            stop=5e-5,
+            num=5,
+            perturber_kwargs=load_default_config(preset="sample"),
+        )
+        boxes = [(AxisAlignedBoundingBox(min_vertex=(10, 20), max_vertex=(100, 120)), {"test": 1.0})]
+        perturb_sweep_assertions(factory=factory, image=image, boxes=boxes, rounded=True, img_gsd=(3.19 / 160))
@@ -13,9 +13,14 @@ from smqtk_image_io.bbox import AxisAlignedBoundingBox
 from syrupy.assertion import SnapshotAssertion
 
 from nrtk.impls.perturb_image.optical.otf import JitterPerturber, load_default_config
+from nrtk.impls.perturb_image_factory import PerturberLinspaceFactory
 from tests.impls import INPUT_TANK_IMG_FILE_PATH as INPUT_IMG_FILE_PATH
 from tests.impls.perturb_image.perturber_tests_mixin import PerturberTestsMixin
-from tests.impls.perturb_image.perturber_utils import pybsm_perturber_assertions
+from tests.impls.perturb_image.perturber_utils import (
+    blur_kernel_assertions,
+    perturb_sweep_assertions,
+    pybsm_perturber_assertions,
+)
 
 
 @pytest.mark.pybsm
@@ -247,3 +252,22 @@ class TestJitterPerturber(PerturberTestsMixin):
         inst = JitterPerturber()
         _, out_boxes = inst.perturb(image=np.ones((256, 256, 3)), boxes=boxes, img_gsd=(3.19 / 160))
         assert boxes == out_boxes
+
+    def test_blur_kernel(self) -> None:
+        """Test that the blur kernel reproduces the perturbation, up to the rounding of the output."""
+        image = np.random.default_rng(seed=0).integers(0, 256, (40, 48, 3), dtype=np.uint8)
+        blur_kernel_assertions(perturber=JitterPerturber(), image=image, rounded=True, img_gsd=(3.19 / 160))
+
+    def test_perturb_sweep(self) -> None:
+        """Sweeps over s_x share the spectrum of the image and reproduce calling each perturber."""
+        image = np.stack((np.array(Image.open(INPUT_IMG_FILE_PATH))[:256, :256],) * 3, axis=-1)
+        factory = PerturberLinspaceFactory(
+            perturber=JitterPerturber,
+            theta_key="s_x",
+            start=1e-6,
+            stop=2e-5,
+            num=5,
+            perturber_kwargs=load_default_config(preset="sample"),
+        )
+        boxes = [(AxisAlignedBoundingBox(min_vertex=(10, 20), max_vertex=(100, 120)), {"test": 1.0})]
+        perturb_sweep_assertions(factory=factory, image=image, boxes=boxes, rounded=True, img_gsd=(3.19 / 160))
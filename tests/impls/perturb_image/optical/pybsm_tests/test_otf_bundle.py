@@ -0,0 +1,89 @@
+"""Tests for the bundles of the OTFs and PSFs of pyBSM perturbers."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from nrtk.impls.perturb_image.optical import PybsmPerturber
+from nrtk.impls.perturb_image.optical.otf import (
+    JitterPerturber,
+    get_otf_bundle_dir,
+    load_default_config,
+    set_otf_bundle_dir,
+)
+from tests.impls import INPUT_TANK_IMG_FILE_PATH as INPUT_IMG_FILE
+
+IMG_GSD = 3.19 / 160.0
+
+
+@pytest.fixture(autouse=True)
+def _no_bundle_dir(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    """Start every test without a bundle directory, and unset the one a test set afterwards."""
+    monkeypatch.delenv("NRTK_OTF_BUNDLE_DIR", raising=False)
+    set_otf_bundle_dir(None)
+    yield
+    set_otf_bundle_dir(None)
+
+
+@pytest.mark.pybsm
+class TestOTFBundle:
+    def test_bundle_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The set directory takes precedence over the environment variable, which is followed otherwise."""
+        assert get_otf_bundle_dir() is None
+        monkeypatch.setenv("NRTK_OTF_BUNDLE_DIR", str(tmp_path / "env"))
+        assert get_otf_bundle_dir() == tmp_path / "env"
+        set_otf_bundle_dir(tmp_path)
+        assert get_otf_bundle_dir() == tmp_path
+        set_otf_bundle_dir(None)
+        assert get_otf_bundle_dir() == tmp_path / "env"
+
+    def test_export_without_bundle_dir(self) -> None:
+        """Exporting without a path requires a bundle directory."""
+        inst = JitterPerturber(**load_default_config(preset="sample"))
+        with pytest.raises(ValueError, match=r"No OTF bundle directory is set"):
+            inst.export_otf_bundle(img_gsds=[IMG_GSD])
+
+    def test_jitter_perturber(self, tmp_path: Path) -> None:
+        """Perturbers of pyBSM simulators constructed after an export take the bundled PSFs and give the same images."""
+        image = np.array(Image.open(INPUT_IMG_FILE))[:128, :128]
+        config = load_default_config(preset="sample")
+        set_otf_bundle_dir(tmp_path)
+        path = JitterPerturber(**config).export_otf_bundle(img_gsds=[IMG_GSD])
+        assert path.parent == tmp_path
+
+        inst = JitterPerturber(**config)
+        (psf,) = inst._simulator._psf_cache.values()
+        assert isinstance(psf, np.memmap)
+        assert not psf.flags.writeable
+        set_otf_bundle_dir(None)
+        expected, _ = JitterPerturber(**config)(image=image, img_gsd=IMG_GSD)
+        assert np.array_equal(inst(image=image, img_gsd=IMG_GSD)[0], expected)
+
+    def test_pybsm_perturber(self, tmp_path: Path) -> None:
+        """Perturbers of system OTFs take the bundled OTFs and give the same images."""
+        image = np.array(Image.open(INPUT_IMG_FILE))[:128, :128]
+        config = load_default_config(preset="sample")
+        inst = PybsmPerturber(seed=1, **config)
+        expected, _ = inst(image=image, img_gsd=IMG_GSD)
+        path = inst.export_otf_bundle(tmp_path / "bundle.npz", img_gsds=[IMG_GSD])
+
+        other = PybsmPerturber(seed=1, **config)
+        assert not other._simulator._otfs
+        assert other.import_otf_bundle(path)
+        assert isinstance(other._simulator._otfs["system_OTF"], np.memmap)
+        assert np.array_equal(other._simulator._otfs["system_OTF"], inst._simulator._otfs["system_OTF"])
+        assert np.array_equal(other(image=image, img_gsd=IMG_GSD)[0], expected)
+
+    def test_import_other_parameters(self, tmp_path: Path) -> None:
+        """Bundles computed from other parameters are left unused."""
+        config = load_default_config(preset="sample")
+        path = JitterPerturber(**config).export_otf_bundle(tmp_path / "bundle.npz", img_gsds=[IMG_GSD])
+
+        inst = JitterPerturber(**(config | {"s_x": 2 * config["s_x"]}))
+        assert not inst.import_otf_bundle(path)
+        assert not inst._simulator._psf_cache
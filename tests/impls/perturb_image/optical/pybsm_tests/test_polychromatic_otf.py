@@ -0,0 +1,137 @@
+"""Tests for the wavelength-weighted OTFs evaluated over all wavelengths at once."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pytest
+from pybsm.otf import functional as otf
+
+from nrtk.impls.perturb_image.optical._pybsm._polychromatic_otf import (
+    polychromatic_aperture_otf,
+    polychromatic_turbulence_otf,
+    polychromatic_wavefront_otf,
+)
+
+CUTOFF = 6.0e5
+WAVELENGTHS = np.linspace(0.4e-6, 0.9e-6, 11)
+WEIGHTS = np.linspace(0.5, 1.0, 11)
+TURBULENCE = {
+    "altitude": 9000.0,
+    "slant_range": 12000.0,
+    "D": 0.275,
+    "ha_wind_speed": 21.0,
+    "cn2_at_1m": 1.7e-14,
+    "int_time": 0.03,
+    "aircraft_speed": 100.0,
+}
+
+
+@pytest.fixture
+def grid() -> tuple[np.ndarray[Any, Any], np.ndarray[Any, Any]]:
+    """Frequency grid as built by pyBSM simulators, on fewer samples."""
+    return np.meshgrid(np.linspace(-1, 1, 301) * CUTOFF, np.linspace(1, -1, 301) * CUTOFF)
+
+
+@pytest.mark.pybsm
+@pytest.mark.parametrize(
+    ("dtype", "workers", "rtol", "atol"),
+    [(np.float64, None, 0.0, 1e-12), (np.float64, 3, 0.0, 1e-12), (np.float32, -1, 0.0, 1e-5)],
+)
+class TestPolychromaticOTF:
+    @pytest.mark.parametrize("eta", [0.0, 0.4])
+    def test_aperture_otf(
+        self,
+        grid: tuple[np.ndarray[Any, Any], np.ndarray[Any, Any]],
+        eta: float,
+        dtype: type[np.floating[Any]],
+        workers: int | None,
+        rtol: float,
+        atol: float,
+    ) -> None:
+        """The aperture OTF matches the one pyBSM weights wavelength by wavelength."""
+        uu, vv = grid
+        expected = otf.weighted_by_wavelength(
+            wavelengths=WAVELENGTHS,
+            weights=WEIGHTS,
+            my_function=lambda wavelength: otf.circular_aperture_OTF(u=uu, v=vv, lambda0=wavelength, D=0.275, eta=eta),
+        )
+        actual = polychromatic_aperture_otf(
+            u=uu[0],
+            v=vv[:, 0],
+            wavelengths=WAVELENGTHS,
+            weights=WEIGHTS,
+            D=0.275,
+            eta=eta,
+            dtype=dtype,
+            workers=workers,
+        )
+        assert actual.dtype == dtype
+        assert np.allclose(actual, expected, rtol=rtol, atol=atol)
+
+    def test_turbulence_otf(
+        self,
+        grid: tuple[np.ndarray[Any, Any], np.ndarray[Any, Any]],
+        dtype: type[np.floating[Any]],
+        workers: int | None,
+        rtol: float,
+        atol: float,
+    ) -> None:
+        """The turbulence OTF matches that of pyBSM."""
+        uu, vv = grid
+        expected, _ = otf.polychromatic_turbulence_OTF(
+            u=uu,
+            v=vv,
+            wavelengths=WAVELENGTHS,
+            weights=WEIGHTS,
+            **TURBULENCE,
+        )
+        actual = polychromatic_turbulence_otf(
+            u=uu[0],
+            v=vv[:, 0],
+            wavelengths=WAVELENGTHS,
+            weights=WEIGHTS,
+            dtype=dtype,
+            workers=workers,
+            **TURBULENCE,
+        )
+        assert actual.dtype == dtype
+        assert np.allclose(actual, expected, rtol=rtol, atol=atol)
+
+    def test_wavefront_otf(
+        self,
+        grid: tuple[np.ndarray[Any, Any], np.ndarray[Any, Any]],
+        dtype: type[np.floating[Any]],
+        workers: int | None,
+        rtol: float,
+        atol: float,
+    ) -> None:
+        """The wavefront OTF, with correlation lengths differing between axes, matches the one weighted by pyBSM."""
+        uu, vv = grid
+        expected = otf.weighted_by_wavelength(
+            wavelengths=WAVELENGTHS,
+            weights=WEIGHTS,
+            my_function=lambda wavelength: otf.wavefront_OTF(
+                u=uu,
+                v=vv,
+                lambda0=wavelength,
+                pv=0.3 * (0.6e-6 / wavelength) ** 2,
+                L_x=0.275,
+                L_y=0.1,
+            ),
+        )
+        actual = polychromatic_wavefront_otf(
+            u=uu[0],
+            v=vv[:, 0],
+            wavelengths=WAVELENGTHS,
+            weights=WEIGHTS,
+            pv=0.3,
+            pv_wavelength=0.6e-6,
+            L_x=0.275,
+            L_y=0.1,
+            dtype=dtype,
+            workers=workers,
+        )
+        assert actual.dtype == dtype
+        assert np.allclose(actual, expected, rtol=rtol, atol=atol)
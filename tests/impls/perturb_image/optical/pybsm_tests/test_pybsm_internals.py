@@ -0,0 +1,100 @@
+"""Tests that pyBSM still provides the private members that the pyBSM perturbers build on.
+
+``ComponentOTFSimulator``, the OTF bundles, the radiometric conversion to uint8 and the polychromatic OTFs reuse and
+override private members of pyBSM, which may change between its minor versions. These tests fail first if one does.
+"""
+
+from __future__ import annotations
+
+import inspect
+
+import pytest
+from pybsm.otf import functional as otf
+from pybsm.simulation import SystemOTFSimulator, image_simulator
+
+from nrtk.impls.perturb_image.optical import PybsmPerturber
+from nrtk.impls.perturb_image.optical.otf import load_default_config
+
+
+@pytest.fixture(scope="module")
+def perturber() -> PybsmPerturber:
+    return PybsmPerturber(**load_default_config(preset="sample"))
+
+
+@pytest.mark.pybsm
+class TestPybsmInternals:
+    @pytest.mark.parametrize(
+        ("name", "params"),
+        [
+            ("_apply_resampling_float", ["self", "image", "new_wh", "mode"]),
+            ("_calculate_dx_out", ["self", "gsd"]),
+            ("_compute_otf", ["self"]),
+            ("_get_config_hash", ["self"]),
+            ("_get_convolution_method", ["self"]),
+            ("_get_default_psf", ["self"]),
+            ("_get_psf", ["self", "gsd"]),
+            ("_get_psf_cached", ["self", "gsd", "use_default"]),
+            ("_record_clip_fraction", ["self", "photoelectrons_img"]),
+        ],
+    )
+    def test_simulator_methods(self, name: str, params: list[str]) -> None:
+        """Private methods of the system OTF simulator keep the parameters they are called and overridden with."""
+        assert list(inspect.signature(getattr(SystemOTFSimulator, name)).parameters) == params
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "_affine_pe_coefs",
+            "_cutoff_frequency",
+            "_df",
+            "_forward_is_monotonic",
+            "_fwd_y_max",
+            "_fwd_y_min",
+            "_g_noise",
+            "_last_clip_fraction",
+            "_psf_cache",
+            "_reflect_to_photoelectrons",
+            "_reflectance_range",
+            "_rng",
+            "_use_reflectance",
+            "_uu",
+            "_vv",
+        ],
+    )
+    def test_simulator_attributes(self, perturber: PybsmPerturber, name: str) -> None:
+        """Private attributes set by the system OTF simulator of pyBSM are still set."""
+        simulator = SystemOTFSimulator(
+            sensor=perturber.sensor,
+            scenario=perturber.scenario,
+            add_noise=True,
+            use_reflectance=True,
+            reflectance_range=perturber._reflectance_range,
+        )
+        assert hasattr(simulator, name)
+
+    @pytest.mark.parametrize("name", ["_atm", "_interp"])
+    def test_scenario_attributes(self, perturber: PybsmPerturber, name: str) -> None:
+        """Private attributes of scenarios, which share cached atmospheres, are still set."""
+        assert name in vars(perturber.scenario)
+
+    @pytest.mark.parametrize("name", ["_apply_noise2d", "_apply_noise3d"])
+    def test_noise_kernels(self, name: str) -> None:
+        """The noise kernels drawing each row from its own seed still exist."""
+        assert callable(getattr(image_simulator, name))
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "altitude_along_slant_path",
+            "coherence_diameter",
+            "detector_OTF",
+            "drift_OTF",
+            "filter_OTF",
+            "hufnagel_valley_turbulence_profile",
+            "jitter_OTF",
+            "resampled_dimensions",
+        ],
+    )
+    def test_otf_functions(self, name: str) -> None:
+        """OTF functions of pyBSM that the component and polychromatic OTFs are computed with still exist."""
+        assert callable(getattr(otf, name))
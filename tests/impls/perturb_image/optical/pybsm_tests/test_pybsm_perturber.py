@@ -1,4 +1,6 @@
+import copy
 from collections.abc import Hashable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import AbstractContextManager
 from contextlib import nullcontext as does_not_raise
 from typing import Any, Literal
@@ -6,12 +8,15 @@ from typing import Any, Literal
 import numpy as np
 import pytest
 from PIL import Image
+from pybsm.metrics import niirs
+from pybsm.simulation import SystemOTFSimulator
 from smqtk_core.configuration import configuration_test_helper
 from smqtk_image_io.bbox import AxisAlignedBoundingBox
 from syrupy.assertion import SnapshotAssertion
 
 from nrtk.impls.perturb_image.optical import PybsmPerturber
 from nrtk.impls.perturb_image.optical.otf import load_default_config
+from nrtk.impls.perturb_image_factory import PerturberLinspaceFactory
 from tests.impls import INPUT_TANK_IMG_FILE_PATH as INPUT_IMG_FILE
 from tests.impls.perturb_image.perturber_tests_mixin import PerturberTestsMixin
 from tests.impls.perturb_image.perturber_utils import pybsm_perturber_assertions
@@ -116,6 +121,205 @@ class TestPyBSMPerturber(PerturberTestsMixin):
             img_gsd=img_gsd,
         )
 
+    def test_per_call_seed(self) -> None:
+        """Verify concurrent calls given their own seeds draw the same noise as fresh seeded perturbers."""
+        image = np.array(Image.open(INPUT_IMG_FILE))
+        sensor_and_scenario = load_default_config(preset="sample")
+        img_gsd = 3.19 / 160.0
+
+        inst = PybsmPerturber(seed=1, **sensor_and_scenario)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            outputs = list(executor.map(lambda seed: inst(image=image, img_gsd=img_gsd, seed=seed)[0], [2, 3]))
+        for seed, out in zip([2, 3], outputs, strict=True):
+            expected, _ = PybsmPerturber(seed=seed, **sensor_and_scenario)(image=image, img_gsd=img_gsd)
+            assert np.array_equal(out, expected)
+
+    @pytest.mark.parametrize(
+        ("changes", "otfs_reused"),
+        [
+            ({"s_x": 1e-6}, {"ap_OTF", "turb_OTF", "wav_OTF"}),
+            ({"ha_wind_speed": 10.0}, {"ap_OTF", "wav_OTF"}),
+            ({"altitude": 10000}, set()),
+        ],
+    )
+    def test_with_params(self, changes: dict[str, Any], otfs_reused: set[str]) -> None:
+        """with_params matches fresh construction and reuses the component OTFs the change leaves valid."""
+        image = np.array(Image.open(INPUT_IMG_FILE))
+        sensor_and_scenario = load_default_config(preset="sample")
+        img_gsd = 3.19 / 160.0
+
+        inst = PybsmPerturber(seed=1, **sensor_and_scenario)
+        inst(image=image, img_gsd=img_gsd)
+        derived = inst.with_params(**changes)
+        fresh = PybsmPerturber(seed=1, **(sensor_and_scenario | changes))
+
+        assert derived.get_config() == fresh.get_config()
+        assert np.array_equal(derived(image=image, img_gsd=img_gsd)[0], fresh(image=image, img_gsd=img_gsd)[0])
+        for name, otf in inst._simulator._otfs.items():
+            assert (derived._simulator._otfs[name] is otf) == (name in otfs_reused)
+
+    def test_with_params_rederives_defaults(self) -> None:
+        """Parameters defaulting to values derived from others are derived again."""
+        sensor_and_scenario = load_default_config(preset="sample")
+        inst = PybsmPerturber(**sensor_and_scenario)
+        assert inst.with_params(p_x=12e-6).get_config()["p_y"] == 12e-6
+
+    def test_update(self) -> None:
+        """Update changes parameters in place and leaves the perturber unchanged if they are rejected."""
+        sensor_and_scenario = load_default_config(preset="sample")
+        inst = PybsmPerturber(seed=1, **sensor_and_scenario)
+        inst.update(s_x=1e-6)
+        expected = PybsmPerturber(seed=1, **(sensor_and_scenario | {"s_x": 1e-6})).get_config()
+        assert inst.get_config() == expected
+
+        with pytest.raises(ValueError, match=r"ihaze"):
+            inst.update(ihaze=5)
+        assert inst.get_config() == expected
+
+        with pytest.raises(TypeError, match=r"has no parameters \['s_z'\]"):
+            inst.update(s_z=0.5e-6)
+
+    def test_transfer_cache(self) -> None:
+        """Cached PSFs and transfer functions give the results of pyBSM and are shared by perturbers of one system."""
+        image = np.array(Image.open(INPUT_IMG_FILE))
+        sensor_and_scenario = load_default_config(preset="sample")
+        img_gsd = 3.19 / 160.0
+
+        inst = PybsmPerturber(seed=1, **sensor_and_scenario)
+        simulator = SystemOTFSimulator(
+            sensor=inst.sensor,
+            scenario=inst.scenario,
+            add_noise=True,
+            use_reflectance=True,
+            reflectance_range=inst._reflectance_range,
+        )
+        for gsd, shape in [(img_gsd, (512, 512)), (img_gsd, (300, 200)), (img_gsd * 1.3, (512, 512)), (None, (64, 64))]:
+            expected = simulator.simulate_image(image[: shape[0], : shape[1]], gsd=gsd)
+            actual = inst._simulator.simulate_image(image[: shape[0], : shape[1]], gsd=gsd)
+            # Component OTFs are evaluated for all wavelengths at once, so match pyBSM up to rounding
+            assert np.allclose(actual[0], expected[0], rtol=1e-9, atol=1e-9)
+            assert np.allclose(actual[1], expected[1], rtol=1e-9, atol=1e-9)
+
+        same_system = PybsmPerturber(seed=2, **sensor_and_scenario)
+        other_system = PybsmPerturber(seed=1, **(sensor_and_scenario | {"s_x": 1e-6}))
+        psf = inst._simulator._get_psf_cached(gsd=img_gsd)
+        assert same_system._simulator._get_psf_cached(gsd=img_gsd) is psf
+        assert other_system._simulator._fingerprint != inst._simulator._fingerprint
+
+    def test_apply_noise_rng(self) -> None:
+        """Noise drawn from a given generator is that of pyBSM drawing from it, leaving the simulator's unchanged."""
+        image = np.array(Image.open(INPUT_IMG_FILE))
+        inst = PybsmPerturber(seed=1, **load_default_config(preset="sample"))
+        simulator = SystemOTFSimulator(
+            sensor=inst.sensor,
+            scenario=inst.scenario,
+            add_noise=True,
+            rng=np.random.default_rng(2),
+            use_reflectance=True,
+            reflectance_range=inst._reflectance_range,
+        )
+        _, blur_img, _ = inst._simulator.simulate_image(image, gsd=None)
+        state = copy.deepcopy(inst._simulator._rng.bit_generator.state)
+
+        for img in [blur_img, np.stack([blur_img] * 3, axis=-1)]:
+            rng = np.random.default_rng(2)
+            simulator._rng = np.random.default_rng(2)
+            assert np.array_equal(inst._simulator.apply_noise(img, rng=rng), simulator.apply_noise(img))
+        assert inst._simulator._rng.bit_generator.state == state
+
+    def test_perturb_batch(self) -> None:
+        """Batches of images of several sizes and GSDs give the results of perturbing them one at a time."""
+        image = np.array(Image.open(INPUT_IMG_FILE))
+        sensor_and_scenario = load_default_config(preset="sample")
+        img_gsd = 3.19 / 160.0
+        images = [image, image[:300, :200], np.flipud(image), image[:300, :200] // 2, image]
+        gsds = [img_gsd, img_gsd, img_gsd, img_gsd, img_gsd * 1.3]
+        boxes = [(AxisAlignedBoundingBox(min_vertex=(10, 20), max_vertex=(100, 120)), {"test": 1.0})]
+        boxes_list = [boxes, None, boxes, [], boxes]
+
+        inst = PybsmPerturber(seed=1, **sensor_and_scenario)
+        expected = [
+            inst(image=image, boxes=boxes, img_gsd=gsd)
+            for image, boxes, gsd in zip(images, boxes_list, gsds, strict=True)
+        ]
+        inst = PybsmPerturber(seed=1, **sensor_and_scenario)
+        out_images, out_boxes = inst.perturb_batch(images=images, boxes_list=boxes_list, img_gsd=gsds)
+
+        for (expected_image, expected_boxes), out_image, boxes in zip(expected, out_images, out_boxes, strict=True):
+            assert np.array_equal(out_image, expected_image)
+            assert boxes == expected_boxes
+
+    @pytest.mark.parametrize("is_static", [False, True])
+    def test_perturb_realizations(self, is_static: bool) -> None:
+        """Realizations give the results of consecutive calls to perturb(), including those of static perturbers."""
+        image = np.array(Image.open(INPUT_IMG_FILE))
+        sensor_and_scenario = load_default_config(preset="sample")
+        img_gsd = 3.19 / 160.0
+        boxes = [(AxisAlignedBoundingBox(min_vertex=(10, 20), max_vertex=(100, 120)), {"test": 1.0})]
+
+        inst = PybsmPerturber(seed=1, is_static=is_static, **sensor_and_scenario)
+        expected = [inst(image=image, boxes=boxes, img_gsd=img_gsd) for _ in range(3)]
+        inst = PybsmPerturber(seed=1, is_static=is_static, **sensor_and_scenario)
+        realizations = inst.perturb_realizations(image=image, count=3, boxes=boxes, img_gsd=img_gsd)
+
+        assert len(realizations) == 3
+        for (expected_image, expected_boxes), (out_image, out_boxes) in zip(expected, realizations, strict=True):
+            assert np.array_equal(out_image, expected_image)
+            assert out_boxes == expected_boxes
+        assert np.array_equal(realizations[0][0], realizations[1][0]) == is_static
+
+    def test_perturb_realizations_seed(self) -> None:
+        """Realizations given their own seed draw from it, as consecutive calls given one generator."""
+        image = np.array(Image.open(INPUT_IMG_FILE))
+        sensor_and_scenario = load_default_config(preset="sample")
+        img_gsd = 3.19 / 160.0
+
+        inst = PybsmPerturber(seed=1, **sensor_and_scenario)
+        rng = np.random.default_rng(2)
+        expected = [inst(image=image, img_gsd=img_gsd, rng=rng)[0] for _ in range(2)]
+        realizations = inst.perturb_realizations(image=image, count=2, img_gsd=img_gsd, seed=2)
+        for expected_image, (out_image, _) in zip(expected, realizations, strict=True):
+            assert np.array_equal(out_image, expected_image)
+
+    @pytest.mark.parametrize(
+        ("count", "img_gsd", "match"),
+        [(2, None, r"img_gsd must be provided"), (0, 3.19 / 160.0, r"count must be at least 1")],
+    )
+    def test_perturb_realizations_errors(self, count: int, img_gsd: float | None, match: str) -> None:
+        """Realizations need a GSD and at least one realization."""
+        inst = PybsmPerturber(**load_default_config(preset="sample"))
+        with pytest.raises(ValueError, match=match):
+            inst.perturb_realizations(image=np.zeros((8, 8), dtype=np.uint8), count=count, img_gsd=img_gsd)
+
+    def test_quality_metrics(self) -> None:
+        """Quality metrics are those of the NIIRS model of pyBSM, leaving the scenario unchanged."""
+        inst = PybsmPerturber(**(load_default_config(preset="sample") | {"target_reflectance": 0.3}))
+        expected = niirs(sensor=copy.deepcopy(inst.sensor), scenario=copy.deepcopy(inst.scenario), interp=inst.interp)
+        assert inst.quality_metrics() == {
+            "gsd": expected.gsd_gm,
+            "rer": expected.rer_gm,
+            "snr": expected.snr.snr,
+            "niirs": expected.niirs,
+        }
+        assert inst.scenario.target_reflectance == 0.3
+
+    def test_screen(self) -> None:
+        """Screens of altitude sweeps drop the altitudes too noisy to use and collapse those of similar quality."""
+        factory = PerturberLinspaceFactory(
+            perturber=PybsmPerturber,
+            theta_key="altitude",
+            start=1000,
+            stop=20000,
+            num=20,
+            perturber_kwargs=load_default_config(preset="sample"),
+        )
+        screen = factory.screen(min_metrics={"snr": 2.0}, collapse_tolerances={"niirs": 0.2})
+        assert 0 < len(screen) < len(factory)
+        for idx, perturber in enumerate(screen):
+            assert perturber.quality_metrics() == screen.metrics[screen.indices[idx]]
+            assert perturber.quality_metrics()["snr"] >= 2.0
+        assert screen.reasons[0].startswith("snr")
+
     def test_is_static_warning(self) -> None:
         """Verify warning when is_static=True with seed=None."""
         with pytest.warns(UserWarning, match="is_static=True has no effect"):
@@ -252,6 +456,32 @@ class TestPyBSMPerturber(PerturberTestsMixin):
                 # sensor-calibrated output stays within the calibrated sub-range
                 assert not spans_full_range
 
+    @pytest.mark.parametrize("pixel_conversion_mode", ["radiometric", "minmax"])
+    @pytest.mark.parametrize("shape", [(300, 200), (70000,), (5, 7, 3)])
+    def test_photoelectrons_to_uint8(
+        self,
+        pixel_conversion_mode: Literal["radiometric", "minmax"],
+        shape: tuple[int, ...],
+    ) -> None:
+        """Conversions to uint8 give the pixels and clip fraction of pyBSM, cast to uint8."""
+        simulator = PybsmPerturber(**load_default_config(preset="sample"))._simulator
+        low, high = simulator._fwd_y_min, simulator._fwd_y_max
+        photoelectrons = np.random.default_rng(1).uniform(low - 0.001 * (high - low), high, shape)
+
+        expected = simulator.photoelectrons_to_pixels(photoelectrons, mode=pixel_conversion_mode).astype(np.uint8)
+        expected_clip_fraction = simulator._last_clip_fraction
+        simulator._last_clip_fraction = (0.0, 0.0)
+        assert np.array_equal(simulator.photoelectrons_to_uint8(photoelectrons, mode=pixel_conversion_mode), expected)
+        assert simulator._last_clip_fraction == expected_clip_fraction
+
+    def test_photoelectrons_to_uint8_non_finite(self) -> None:
+        """Non-finite photoelectrons are rejected as by pyBSM."""
+        simulator = PybsmPerturber(**load_default_config(preset="sample"))._simulator
+        photoelectrons = np.full((4, 4), simulator._fwd_y_min)
+        photoelectrons[2, 1] = np.nan
+        with pytest.raises(RuntimeError, match=r"non-finite"):
+            simulator.photoelectrons_to_uint8(photoelectrons)
+
     @pytest.mark.parametrize(
         ("kwargs", "expectation"),
         [
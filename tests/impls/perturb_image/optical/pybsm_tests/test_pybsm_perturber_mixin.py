@@ -193,6 +193,56 @@ def test_img_gsd_default_psf(use_default_psf: bool, called_gsd: float | None) ->
     assert mock_simulate_image.call_args.kwargs == {"gsd": called_gsd}
 
 
+@pytest.mark.pybsm
+@pytest.mark.parametrize(
+    ("img_gsd", "match"),
+    [
+        (None, r"img_gsd must be provided"),
+        ([1.0, 2.0, 3.0], r"img_gsd must have one value per image, got 3 for 2 images"),
+    ],
+)
+def test_perturb_batch_img_gsd_invalid(img_gsd: list[float] | None, match: str) -> None:
+    """Batches need a GSD for every image."""
+    perturber = DummyPybsmPerturber()
+    with pytest.raises(ValueError, match=match):
+        perturber.perturb_batch(images=np.ones((2, 10, 10, 3), dtype=np.uint8), img_gsd=img_gsd)
+
+
+@pytest.mark.pybsm
+def test_perturb_batch_per_image() -> None:
+    """Simulators without batched blurring simulate each image with its own GSD."""
+    perturber = DummyPybsmPerturber()
+    cast(MagicMock, perturber._simulator).add_noise = False
+    mock_simulate_image = cast(MagicMock, perturber._simulator.simulate_image)
+    mock_simulate_image.return_value = (None, np.zeros((10, 10, 3), dtype=np.uint8), None)
+    images, _ = perturber.perturb_batch(images=np.ones((2, 10, 10, 3), dtype=np.uint8), img_gsd=[2.0, 3.0])
+
+    assert images.shape == (2, 10, 10, 3)
+    assert [call.kwargs for call in mock_simulate_image.call_args_list] == [{"gsd": 2.0}, {"gsd": 3.0}]
+
+
+@pytest.mark.pybsm
+def test_perturb_sweep_img_gsd_none() -> None:
+    """Sweeps need a GSD."""
+    with pytest.raises(ValueError, match=r"img_gsd must be provided"):
+        DummyPybsmPerturber._perturb_sweep(perturbers=[DummyPybsmPerturber()], image=np.ones((10, 10, 3)))
+
+
+@pytest.mark.pybsm
+def test_perturb_sweep_per_perturber() -> None:
+    """Perturbers whose simulators do not blur with a shared padding are called in turn."""
+    perturbers = [DummyPybsmPerturber(), DummyPybsmPerturber()]
+    for perturber in perturbers:
+        cast(MagicMock, perturber._simulator).add_noise = False
+        mock_simulate_image = cast(MagicMock, perturber._simulator.simulate_image)
+        mock_simulate_image.return_value = (None, np.zeros((10, 10, 3), dtype=np.uint8), None)
+    outputs = DummyPybsmPerturber._perturb_sweep(perturbers=perturbers, image=np.ones((10, 10, 3)), img_gsd=2.0)
+
+    assert len(outputs) == 2
+    for perturber in perturbers:
+        cast(MagicMock, perturber._simulator.simulate_image).assert_called_once()
+
+
 @pytest.mark.pybsm
 @pytest.mark.parametrize(
     ("add_noise", "noisy_image", "use_noisy_image"),
@@ -217,3 +267,40 @@ def test_use_noisy_image(add_noise: bool, noisy_image: np.ndarray | None, use_no
         assert np.array_equal(out_image, noisy_image)
     else:
         assert np.array_equal(out_image, blur_image)
+
+
+@pytest.mark.pybsm
+@pytest.mark.parametrize(
+    ("img_gsd", "add_noise", "dx_out", "method", "flipped"),
+    [
+        (None, False, 1.0, "oaconvolve", None),
+        (2.0, True, 1.0, "oaconvolve", None),
+        (2.0, False, 0.5, "oaconvolve", None),
+        (2.0, False, 1.0, "oaconvolve", False),
+        (2.0, False, 1.0, "fftconvolve", True),
+    ],
+)
+def test_blur_kernel(
+    img_gsd: float | None,
+    add_noise: bool,
+    dx_out: float,
+    method: str,
+    flipped: bool | None,
+) -> None:
+    """Test when a blur kernel is provided, and its orientation for each convolution method."""
+    perturber = DummyPybsmPerturber()
+    mock_simulator = cast(MagicMock, perturber._simulator)
+    mock_simulator.add_noise = add_noise
+    mock_simulator.do_resample = True
+    mock_simulator.slant_range = 2.0
+    mock_simulator._calculate_dx_out.return_value = dx_out
+    psf = np.arange(9.0).reshape(3, 3)
+    mock_simulator._get_psf_cached.return_value = psf
+    mock_simulator._get_convolution_method.return_value = method
+
+    kernel = perturber._blur_kernel(image=np.ones((10, 12, 3), dtype=np.uint8), img_gsd=img_gsd)
+    if flipped is None:
+        assert kernel is None
+    else:
+        assert kernel is not None
+        assert np.array_equal(kernel, psf[::-1, ::-1] if flipped else psf)
@@ -3,11 +3,18 @@ from collections.abc import Sequence
 import numpy as np
 import pytest
 from PIL import Image
+from smqtk_image_io.bbox import AxisAlignedBoundingBox
 from syrupy.assertion import SnapshotAssertion
 
 from nrtk.impls.perturb_image.optical import RadialDistortionPerturber
+from nrtk.interfaces import BoxArray
 from tests.impls import INPUT_TANK_IMG_FILE_PATH as INPUT_IMG_FILE_PATH
-from tests.impls.perturb_image.perturber_utils import perturber_assertions
+from tests.impls.perturb_image.perturber_utils import (
+    batch_perturber_assertions,
+    box_array_perturber_assertions,
+    perturber_assertions,
+    warp_map_assertions,
+)
 from tests.utils import random_image
 
 
@@ -86,3 +93,46 @@ class TestRadialDistortionPerturber:
     def test_bad_k(self, k: Sequence[float]) -> None:
         with pytest.raises(ValueError, match="k must have exactly 3 values"):
             RadialDistortionPerturber(k=k)
+
+    @pytest.mark.parametrize("k", [[0, 0, 0], [0.05, -0.01, 0.02], [-0.02, -0.05, 0]])
+    def test_perturb_batch(self, k: Sequence[float]) -> None:
+        """Ensure batched perturbation matches perturbing each image in turn."""
+        images = np.stack([random_image(seed=0), random_image(seed=1), random_image(seed=2)])
+        inst = RadialDistortionPerturber(k=k)
+        batch_perturber_assertions(perturb_batch=inst.perturb_batch, perturb=inst.perturb, images=images)
+
+    @pytest.mark.parametrize("k", [[0, 0, 0], [0.05, -0.01, 0.02], [-0.02, -0.05, 0]])
+    def test_box_array(self, k: Sequence[float]) -> None:
+        """Verify BoxArray boxes are distorted natively and match the legacy box format."""
+        boxes = [
+            (AxisAlignedBoundingBox(min_vertex=(10, 20), max_vertex=(60, 90)), {1: 0.9}),
+            (AxisAlignedBoundingBox(min_vertex=(100, 120), max_vertex=(250, 200)), {"cat": 0.3}),
+        ]
+        inst = RadialDistortionPerturber(k=k)
+        box_array_perturber_assertions(
+            perturb=inst.perturb,
+            perturb_legacy=inst.perturb,
+            image=random_image(),
+            boxes=boxes,
+        )
+
+    @pytest.mark.parametrize("k", [[0, 0, 0], [0.05, -0.01, 0.02], [-0.02, -0.05, 0]])
+    @pytest.mark.parametrize("box_array", [False, True])
+    def test_warp_map(self, k: Sequence[float], box_array: bool) -> None:
+        """Verify the warp map reproduces the distorted image and boxes."""
+        boxes = [
+            (AxisAlignedBoundingBox(min_vertex=(10, 20), max_vertex=(60, 90)), {1: 0.9}),
+            (AxisAlignedBoundingBox(min_vertex=(100, 120), max_vertex=(250, 200)), {"cat": 0.3}),
+        ]
+        inst = RadialDistortionPerturber(k=k, color_fill=[255, 0, 128])
+        warp_map_assertions(
+            perturber=inst,
+            reference=inst,
+            image=random_image(),
+            boxes=BoxArray.from_boxes(boxes) if box_array else boxes,
+        )
+
+    def test_warp_map_float(self) -> None:
+        """Verify no warp map is provided for images perturb() would cast to uint8."""
+        inst = RadialDistortionPerturber(k=[0.05, -0.01, 0.02])
+        assert inst._warp_map(image=np.zeros((32, 48, 3), dtype=np.float32)) is None
@@ -7,6 +7,7 @@ from typing import Any
 import numpy as np
 from smqtk_image_io.bbox import AxisAlignedBoundingBox
 
+from nrtk.interfaces import BoxArray, PerturbImage, PerturbImageFactory
 from tests.utils import deep_equals
 
 
@@ -149,3 +150,192 @@ def pybsm_perturber_assertions(
     _assert_no_box_memory_sharing(a=boxes, b=out_boxes)
 
     return out_image
+
+
+def batch_perturber_assertions(
+    perturb_batch: Callable[
+        ...,
+        tuple[
+            np.ndarray | list[np.ndarray],
+            list[Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None],
+        ],
+    ],
+    perturb: Callable[
+        ...,
+        tuple[np.ndarray, Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None],
+    ],
+    images: np.ndarray,
+    **kwargs: Any,
+) -> np.ndarray:
+    """Test several blanket assertions for batched perturbers.
+
+    1) Input should remain unchanged
+    2) Output should be stacked and not share memory with input
+    3) Output should have the same dtype as input
+    4) Output images and boxes should match perturbing each image in turn
+
+    :param perturb_batch: Interface with which to generate the batched perturbation.
+    :param perturb: Interface with which to generate the per-image perturbations. Random perturbers should use a
+        separate instance with the same seed.
+    :param images: Stacked input images as numpy array.
+    :param kwargs: A dictionary containing perturber implementation-specific input param-values pairs.
+    """
+    copy = np.copy(images)
+
+    boxes_list = [_create_test_boxes() for _ in images]
+    boxes_list_copy = deepcopy(boxes_list)
+
+    out_images, out_boxes_list = perturb_batch(images=images, boxes_list=boxes_list, **kwargs)
+    assert np.array_equal(images, copy)
+    assert deep_equals(a=boxes_list, b=boxes_list_copy)
+    assert isinstance(out_images, np.ndarray)
+    assert not np.shares_memory(images, out_images)
+    assert out_images.dtype == images.dtype
+
+    for image, boxes, out_image, out_boxes in zip(images, boxes_list, out_images, out_boxes_list, strict=True):
+        expected_image, expected_boxes = perturb(image=image, boxes=boxes, **kwargs)
+        assert np.array_equal(out_image, expected_image)
+        assert deep_equals(a=out_boxes, b=expected_boxes)
+        _assert_no_box_memory_sharing(a=boxes, b=out_boxes)
+
+    return out_images
+
+
+def box_array_perturber_assertions(
+    perturb: Callable[
+        ...,
+        tuple[np.ndarray, Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None],
+    ],
+    perturb_legacy: Callable[
+        ...,
+        tuple[np.ndarray, Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None],
+    ],
+    image: np.ndarray,
+    boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]],
+    **kwargs: Any,
+) -> BoxArray:
+    """Test several blanket assertions for perturbers that support BoxArray natively.
+
+    1) Input boxes should remain unchanged
+    2) Output boxes should be a BoxArray that does not share memory with the input
+    3) Output image and boxes should match perturbing the same boxes in the legacy format
+
+    :param perturb: Interface with which to generate the perturbation from a BoxArray.
+    :param perturb_legacy: Interface with which to generate the perturbation from legacy boxes. Random perturbers
+        should use a separate instance with the same seed.
+    :param image: Input image as numpy array.
+    :param boxes: Input bounding boxes in the legacy format, with one label per box.
+    :param kwargs: A dictionary containing perturber implementation-specific input param-values pairs.
+    """
+    box_array = BoxArray.from_boxes(boxes)
+    box_array_copy = box_array.copy()
+
+    out_image, out_boxes = perturb(image=image, boxes=box_array, **kwargs)
+    assert np.array_equal(box_array.coords, box_array_copy.coords)
+    assert isinstance(out_boxes, BoxArray)
+    assert not np.shares_memory(box_array.coords, out_boxes.coords)
+    assert not np.shares_memory(box_array.scores, out_boxes.scores)
+
+    expected_image, expected_boxes = perturb_legacy(image=image, boxes=boxes, **kwargs)
+    assert np.array_equal(out_image, expected_image)
+    assert expected_boxes is not None
+    for (expected_box, expected_meta), (out_box, out_meta) in zip(expected_boxes, out_boxes, strict=True):
+        assert np.allclose(expected_box.min_vertex, out_box.min_vertex)
+        assert np.allclose(expected_box.max_vertex, out_box.max_vertex)
+        assert expected_meta == out_meta
+
+    return out_boxes
+
+
+def blur_kernel_assertions(
+    perturber: PerturbImage,
+    image: np.ndarray,
+    rounded: bool = False,
+    border: int = 0,
+    **kwargs: Any,
+) -> np.ndarray:
+    """Test that a blur kernel reproduces its perturber.
+
+    1) The perturber should provide a kernel for the image
+    2) Correlating each channel of the image with the kernel, with reflected borders, should match the output of
+       perturbing the image
+
+    :param perturber: Perturber providing the blur kernel.
+    :param image: Input image.
+    :param rounded: Whether the perturber rounds or truncates its output to integers.
+    :param border: Width of the image border excluded from the comparison, for perturbers that do not reflect the
+        image at its borders.
+    :param kwargs: A dictionary containing perturber implementation-specific input param-values pairs.
+    """
+    kernel = perturber._blur_kernel(image=image, **kwargs)
+    assert kernel is not None
+
+    kh, kw = kernel.shape
+    padding = ((kh // 2, kh - 1 - kh // 2), (kw // 2, kw - 1 - kw // 2)) + ((0, 0),) * (image.ndim - 2)
+    windows = np.lib.stride_tricks.sliding_window_view(np.pad(image, padding, mode="reflect"), kernel.shape, (0, 1))
+    expected = np.einsum("...ij,ij->...", windows, kernel)
+
+    out_image, _ = perturber(image=image, **kwargs)
+    interior = (slice(border, image.shape[0] - border), slice(border, image.shape[1] - border))
+    assert np.allclose(out_image[interior], expected[interior], rtol=0, atol=1 + 1e-8 if rounded else 1e-8)
+    return kernel
+
+
+def warp_map_assertions(
+    perturber: PerturbImage,
+    reference: PerturbImage,
+    image: np.ndarray,
+    boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None = None,
+    **kwargs: Any,
+) -> None:
+    """Test that a warp map reproduces its perturber.
+
+    1) The perturber should provide a warp for the image
+    2) Applying the warp to the image and boxes should match perturbing them with an identically configured and
+       seeded reference perturber
+
+    :param perturber: Perturber providing the warp map.
+    :param reference: Perturber in the same state as ``perturber``, used to compute the expected output.
+    :param image: Input image.
+    :param boxes: Input bounding boxes.
+    :param kwargs: A dictionary containing perturber implementation-specific input param-values pairs.
+    """
+    warp = perturber._warp_map(image=image, **kwargs)
+    assert warp is not None
+
+    expected_image, expected_boxes = reference(image=image, boxes=deepcopy(boxes), **kwargs)
+    out_image = warp.apply(image)
+    out_boxes = warp.warp_boxes(deepcopy(boxes))
+    assert out_image.dtype == image.dtype
+    assert np.array_equal(out_image, expected_image)
+    assert type(out_boxes) is type(expected_boxes)
+    if expected_boxes is not None:
+        assert list(out_boxes) == list(expected_boxes)
+
+
+def perturb_sweep_assertions(
+    factory: PerturbImageFactory,
+    image: np.ndarray,
+    boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None = None,
+    rounded: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Test that a sweep of a factory reproduces calling each of its perturbers.
+
+    1) The sweep should produce one output per perturber, in order
+    2) Each output image should match calling the perturber, up to floating-point rounding, with the same boxes
+
+    :param factory: Factory producing the perturbers of the sweep.
+    :param image: Input image.
+    :param boxes: Input bounding boxes.
+    :param rounded: Whether the perturbers round or truncate their output to integers.
+    :param kwargs: A dictionary containing perturber implementation-specific input param-values pairs.
+    """
+    expected = [perturber(image=image, boxes=deepcopy(boxes), **kwargs) for perturber in factory]
+    outputs = factory.perturb_sweep(image=image, boxes=boxes, **kwargs)
+
+    assert len(outputs) == len(expected)
+    for (out_image, out_boxes), (expected_image, expected_boxes) in zip(outputs, expected, strict=True):
+        assert out_image.shape == expected_image.shape
+        assert np.allclose(out_image, expected_image, rtol=0, atol=1 + 1e-8 if rounded else 1e-8)
+        assert out_boxes == expected_boxes
@@ -13,7 +13,11 @@ from syrupy.assertion import SnapshotAssertion
 from nrtk.impls.perturb_image.photometric.blur import AverageBlurPerturber
 from tests.impls import INPUT_VISDRONE_IMG_FILE_PATH as INPUT_IMG_FILE_PATH
 from tests.impls.perturb_image.perturber_tests_mixin import PerturberTestsMixin
-from tests.impls.perturb_image.perturber_utils import perturber_assertions
+from tests.impls.perturb_image.perturber_utils import (
+    batch_perturber_assertions,
+    blur_kernel_assertions,
+    perturber_assertions,
+)
 from tests.utils import random_image
 
 
@@ -109,3 +113,28 @@ class TestAverageBlurPerturber(PerturberTestsMixin):
         inst = AverageBlurPerturber()
         _, out_boxes = inst.perturb(image=np.ones((256, 256, 3)), boxes=boxes)
         assert boxes == out_boxes
+
+    @pytest.mark.parametrize(
+        ("images", "ksize"),
+        [
+            (np.stack([random_image(seed=0), random_image(seed=1)]), 4),
+            (np.ones((3, 64, 64, 3), dtype=np.float32), 5),
+            (np.ones((2, 64, 64), dtype=np.uint8), 4),
+        ],
+    )
+    def test_perturb_batch(self, images: np.ndarray, ksize: int) -> None:
+        """Ensure batched perturbation matches perturbing each image in turn."""
+        inst = AverageBlurPerturber(ksize=ksize)
+        batch_perturber_assertions(perturb_batch=inst.perturb_batch, perturb=inst.perturb, images=images)
+
+    @pytest.mark.parametrize("ksize", [1, 4, 5])
+    @pytest.mark.parametrize("shape", [(20, 24, 3), (20, 24)])
+    def test_blur_kernel(self, ksize: int, shape: tuple[int, ...]) -> None:
+        """Test that the blur kernel reproduces the perturbation."""
+        image = np.random.default_rng(seed=0).random(shape)
+        kernel = blur_kernel_assertions(perturber=AverageBlurPerturber(ksize=ksize), image=image)
+        assert np.isclose(kernel.sum(), 1)
+
+    def test_blur_kernel_channel_first(self) -> None:
+        """Test that images rejected by perturb() have no blur kernel."""
+        assert AverageBlurPerturber(ksize=3)._blur_kernel(image=np.ones((3, 5, 7))) is None
@@ -13,7 +13,7 @@ from syrupy.assertion import SnapshotAssertion
 from nrtk.impls.perturb_image.photometric.blur import GaussianBlurPerturber
 from tests.impls import INPUT_VISDRONE_IMG_FILE_PATH as INPUT_IMG_FILE_PATH
 from tests.impls.perturb_image.perturber_tests_mixin import PerturberTestsMixin
-from tests.impls.perturb_image.perturber_utils import perturber_assertions
+from tests.impls.perturb_image.perturber_utils import blur_kernel_assertions, perturber_assertions
 from tests.utils import random_image
 
 
@@ -117,3 +117,15 @@ class TestGaussianBlurPerturber(PerturberTestsMixin):
         inst = GaussianBlurPerturber()
         _, out_boxes = inst.perturb(image=np.ones((256, 256, 3)), boxes=boxes)
         assert boxes == out_boxes
+
+    @pytest.mark.parametrize("ksize", [1, 5, 7])
+    @pytest.mark.parametrize("shape", [(20, 24, 3), (20, 24)])
+    def test_blur_kernel(self, ksize: int, shape: tuple[int, ...]) -> None:
+        """Test that the blur kernel reproduces the perturbation."""
+        image = np.random.default_rng(seed=0).random(shape)
+        kernel = blur_kernel_assertions(perturber=GaussianBlurPerturber(ksize=ksize), image=image)
+        assert np.isclose(kernel.sum(), 1)
+
+    def test_blur_kernel_channel_first(self) -> None:
+        """Test that images rejected by perturb() have no blur kernel."""
+        assert GaussianBlurPerturber(ksize=3)._blur_kernel(image=np.ones((3, 5, 7))) is None
@@ -13,7 +13,7 @@ from syrupy.assertion import SnapshotAssertion
 from nrtk.impls.perturb_image.photometric.blur import MedianBlurPerturber
 from tests.impls import INPUT_VISDRONE_IMG_FILE_PATH as INPUT_IMG_FILE_PATH
 from tests.impls.perturb_image.perturber_tests_mixin import PerturberTestsMixin
-from tests.impls.perturb_image.perturber_utils import perturber_assertions
+from tests.impls.perturb_image.perturber_utils import batch_perturber_assertions, perturber_assertions
 from tests.utils import random_image
 
 
@@ -116,3 +116,16 @@ class TestMedianBlurPerturber(PerturberTestsMixin):
         inst = MedianBlurPerturber(ksize=5)
         _, out_boxes = inst.perturb(image=np.ones((256, 256, 3), dtype=np.float32), boxes=boxes)
         assert boxes == out_boxes
+
+    @pytest.mark.parametrize(
+        ("images", "ksize"),
+        [
+            (np.stack([random_image(seed=0), random_image(seed=1)]), 3),
+            (np.ones((3, 64, 64, 3), dtype=np.float32), 5),
+            (np.ones((2, 64, 64), dtype=np.uint8), 3),
+        ],
+    )
+    def test_perturb_batch(self, images: np.ndarray, ksize: int) -> None:
+        """Ensure batched perturbation matches perturbing each image in turn."""
+        inst = MedianBlurPerturber(ksize=ksize)
+        batch_perturber_assertions(perturb_batch=inst.perturb_batch, perturb=inst.perturb, images=images)
@@ -13,7 +13,7 @@ from syrupy.assertion import SnapshotAssertion
 from nrtk.impls.perturb_image.photometric.enhance import ContrastPerturber
 from tests.impls import INPUT_VISDRONE_IMG_FILE_PATH as INPUT_IMG_FILE_PATH
 from tests.impls.perturb_image.perturber_tests_mixin import PerturberTestsMixin
-from tests.impls.perturb_image.perturber_utils import perturber_assertions
+from tests.impls.perturb_image.perturber_utils import batch_perturber_assertions, perturber_assertions
 from tests.utils import random_image
 
 
@@ -98,3 +98,18 @@ class TestContrastPerturber(PerturberTestsMixin):
         inst = ContrastPerturber(factor=0.5)
         _, out_boxes = inst.perturb(image=np.ones((256, 256, 3)), boxes=boxes)
         assert boxes == out_boxes
+
+    @pytest.mark.parametrize(
+        "images",
+        [
+            np.stack([random_image(seed=0), random_image(seed=1)]),
+            np.stack([random_image(size=(32, 48, 4), seed=2)] * 2),
+            np.random.default_rng(3).random((2, 32, 48, 3)).astype(np.float32),
+            np.random.default_rng(4).integers(0, 255, size=(3, 32, 48), dtype=np.uint8),
+        ],
+    )
+    @pytest.mark.parametrize("factor", [0.0, 0.3, 1.7])
+    def test_perturb_batch(self, images: np.ndarray, factor: float) -> None:
+        """Ensure batched perturbation matches perturbing each image in turn."""
+        inst = ContrastPerturber(factor=factor)
+        batch_perturber_assertions(perturb_batch=inst.perturb_batch, perturb=inst.perturb, images=images)
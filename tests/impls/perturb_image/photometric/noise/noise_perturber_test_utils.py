@@ -22,3 +22,17 @@ def seed_assertions(perturber: type[NoisePerturberMixin], seed: int) -> None:
     out_2b, _ = inst_2(image=dummy_image_b)
     assert np.array_equal(out_1a, out_2a)
     assert np.array_equal(out_1b, out_2b)
+
+
+def precision_assertions(perturber: type[NoisePerturberMixin], seed: int) -> None:
+    """Test that float32 output matches float64 output to within one gray level.
+
+    :param perturber: SKImage random_noise perturber class of interest.
+    :param seed: Seed value.
+    """
+    dummy_image = random_image()
+
+    out_32, _ = perturber(seed=seed, precision="float32")(image=dummy_image)
+    out_64, _ = perturber(seed=seed, precision="float64")(image=dummy_image)
+    assert out_32.dtype == out_64.dtype == dummy_image.dtype
+    assert np.abs(out_32.astype(np.int16) - out_64).max() <= 1
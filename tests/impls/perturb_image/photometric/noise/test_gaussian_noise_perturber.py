@@ -11,8 +11,11 @@ from syrupy.assertion import SnapshotAssertion
 
 from nrtk.impls.perturb_image.photometric.noise import GaussianNoisePerturber
 from tests.impls.perturb_image.perturber_tests_mixin import PerturberTestsMixin
-from tests.impls.perturb_image.perturber_utils import perturber_assertions
-from tests.impls.perturb_image.photometric.noise.noise_perturber_test_utils import seed_assertions
+from tests.impls.perturb_image.perturber_utils import batch_perturber_assertions, perturber_assertions
+from tests.impls.perturb_image.photometric.noise.noise_perturber_test_utils import (
+    precision_assertions,
+    seed_assertions,
+)
 from tests.utils import random_image
 
 
@@ -82,6 +85,11 @@ class TestGaussianNoisePerturber(PerturberTestsMixin):
         """Ensure results are reproducible when explicit seed is provided."""
         seed_assertions(perturber=GaussianNoisePerturber, seed=seed)
 
+    @pytest.mark.parametrize("seed", [2])
+    def test_precision_parity(self, seed: int) -> None:
+        """Ensure float32 noise matches float64 noise to within one gray level."""
+        precision_assertions(perturber=GaussianNoisePerturber, seed=seed)
+
     def test_is_static(self) -> None:
         """Verify is_static resets RNG each call."""
         dummy_image = random_image()
@@ -152,3 +160,18 @@ class TestGaussianNoisePerturber(PerturberTestsMixin):
         inst = GaussianNoisePerturber(seed=42, mean=0.3, var=0.5)
         _, out_boxes = inst.perturb(image=np.ones((256, 256, 3)), boxes=boxes)
         assert boxes == out_boxes
+
+    @pytest.mark.parametrize(
+        "images",
+        [
+            np.stack([random_image(seed=0), random_image(seed=1)]),
+            np.random.default_rng(2).random((3, 32, 48, 3)),
+        ],
+    )
+    def test_perturb_batch(self, images: np.ndarray) -> None:
+        """Ensure batched perturbation matches perturbing each image in turn with the same seed."""
+        batch_perturber_assertions(
+            perturb_batch=GaussianNoisePerturber(seed=42, mean=0.1, var=0.05).perturb_batch,
+            perturb=GaussianNoisePerturber(seed=42, mean=0.1, var=0.05).perturb,
+            images=images,
+        )
@@ -14,7 +14,10 @@ from nrtk.impls.perturb_image.photometric.noise import PepperNoisePerturber
 from tests.impls import INPUT_VISDRONE_IMG_FILE_PATH as INPUT_IMG_FILE_PATH
 from tests.impls.perturb_image.perturber_tests_mixin import PerturberTestsMixin
 from tests.impls.perturb_image.perturber_utils import perturber_assertions
-from tests.impls.perturb_image.photometric.noise.noise_perturber_test_utils import seed_assertions
+from tests.impls.perturb_image.photometric.noise.noise_perturber_test_utils import (
+    precision_assertions,
+    seed_assertions,
+)
 from tests.utils import random_image
 
 
@@ -83,6 +86,11 @@ class TestPepperNoisePerturber(PerturberTestsMixin):
         """Ensure results are reproducible when explicit seed is provided."""
         seed_assertions(perturber=PepperNoisePerturber, seed=seed)
 
+    @pytest.mark.parametrize("seed", [2])
+    def test_precision_parity(self, seed: int) -> None:
+        """Ensure float32 noise matches float64 noise to within one gray level."""
+        precision_assertions(perturber=PepperNoisePerturber, seed=seed)
+
     def test_is_static(self) -> None:
         """Verify is_static resets RNG each call."""
         dummy_image = random_image()
@@ -13,8 +13,11 @@ from syrupy.assertion import SnapshotAssertion
 from nrtk.impls.perturb_image.photometric.noise import SaltAndPepperNoisePerturber
 from tests.impls import INPUT_VISDRONE_IMG_FILE_PATH as INPUT_IMG_FILE_PATH
 from tests.impls.perturb_image.perturber_tests_mixin import PerturberTestsMixin
-from tests.impls.perturb_image.perturber_utils import perturber_assertions
-from tests.impls.perturb_image.photometric.noise.noise_perturber_test_utils import seed_assertions
+from tests.impls.perturb_image.perturber_utils import batch_perturber_assertions, perturber_assertions
+from tests.impls.perturb_image.photometric.noise.noise_perturber_test_utils import (
+    precision_assertions,
+    seed_assertions,
+)
 from tests.utils import random_image
 
 
@@ -89,6 +92,11 @@ class TestSaltAndPepperNoisePerturber(PerturberTestsMixin):
         """Ensure results are reproducible when explicit seed is provided."""
         seed_assertions(perturber=SaltAndPepperNoisePerturber, seed=seed)
 
+    @pytest.mark.parametrize("seed", [2])
+    def test_precision_parity(self, seed: int) -> None:
+        """Ensure float32 noise matches float64 noise to within one gray level."""
+        precision_assertions(perturber=SaltAndPepperNoisePerturber, seed=seed)
+
     def test_is_static(self) -> None:
         """Verify is_static resets RNG each call."""
         dummy_image = random_image()
@@ -193,3 +201,21 @@ class TestSaltAndPepperNoisePerturber(PerturberTestsMixin):
         inst = SaltAndPepperNoisePerturber(seed=42, amount=0.3, salt_vs_pepper=0.5)
         _, out_boxes = inst.perturb(image=np.ones((256, 256, 3)), boxes=boxes)
         assert boxes == out_boxes
+
+    def test_perturb_batch(self) -> None:
+        """Ensure batched perturbation is reproducible and leaves its input untouched."""
+        images = np.stack([random_image(seed=0), random_image(seed=1)])
+        copy = np.copy(images)
+        out_images, out_boxes_list = SaltAndPepperNoisePerturber(seed=42).perturb_batch(images=images)
+        expected_images, _ = SaltAndPepperNoisePerturber(seed=42).perturb_batch(images=images)
+        assert np.array_equal(images, copy)
+        assert out_images.shape == images.shape
+        assert out_images.dtype == images.dtype
+        assert np.array_equal(out_images, expected_images)
+        assert out_boxes_list == [None, None]
+
+    def test_perturb_batch_static(self) -> None:
+        """Ensure a static perturber applies the same noise to every image of a batch."""
+        image = random_image(seed=0)
+        inst = SaltAndPepperNoisePerturber(seed=42, is_static=True)
+        batch_perturber_assertions(perturb_batch=inst.perturb_batch, perturb=inst.perturb, images=np.stack([image] * 3))
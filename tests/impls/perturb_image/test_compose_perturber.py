@@ -17,10 +17,16 @@ from smqtk_core.configuration import (
 from smqtk_image_io.bbox import AxisAlignedBoundingBox
 
 from nrtk.impls.perturb_image import ComposePerturber
-from nrtk.impls.perturb_image.geometric.random import RandomCropPerturber
-from nrtk.interfaces import PerturbImage
+from nrtk.impls.perturb_image.environment import HazePerturber
+from nrtk.impls.perturb_image.geometric.random import RandomCropPerturber, RandomTranslationPerturber
+from nrtk.impls.perturb_image.optical import RadialDistortionPerturber
+from nrtk.impls.perturb_image.photometric.blur import AverageBlurPerturber, GaussianBlurPerturber, MedianBlurPerturber
+from nrtk.impls.perturb_image.photometric.enhance import BrightnessPerturber, ColorPerturber, ContrastPerturber
+from nrtk.impls.perturb_image.photometric.noise import GaussianNoisePerturber
+from nrtk.interfaces import BoxArray, PerturbImage
 from tests.fakes import FakePerturber
 from tests.impls.perturb_image.perturber_utils import perturber_assertions
+from tests.utils import random_image
 
 
 def _perturb(
@@ -70,10 +76,12 @@ class TestComposePerturber:
         perturber_assertions(perturb=inst, image=image, expected=out_image)
 
     @pytest.mark.parametrize("perturbers", [[FakePerturber()], [FakePerturber(), FakePerturber()]])
-    def test_configuration(self, perturbers: list[PerturbImage]) -> None:
+    @pytest.mark.parametrize("fuse_blur", [False, True])
+    def test_configuration(self, perturbers: list[PerturbImage], fuse_blur: bool) -> None:
         """Test configuration stability."""
-        inst = ComposePerturber(perturbers=perturbers)
+        inst = ComposePerturber(perturbers=perturbers, fuse_blur=fuse_blur)
         for i in configuration_test_helper(inst):
+            assert i.fuse_blur == fuse_blur
             for idx, perturber in enumerate(i.perturbers):
                 assert perturber.get_config() == perturbers[idx].get_config()
 
@@ -156,5 +164,235 @@ class TestComposePerturber:
 
         cfg = {}
         cfg["perturbers"] = []
+        cfg["fuse_blur"] = False
         assert (out_image == image).all()
         assert inst.get_config() == cfg
+
+    @pytest.mark.parametrize(
+        "images",
+        [
+            np.stack([np.ones((16, 24, 3), dtype=np.uint8) * i for i in range(3)]),
+            [np.ones((16, 24, 3), dtype=np.uint8), np.ones((8, 12, 3), dtype=np.uint8)],
+        ],
+    )
+    def test_perturb_batch(self, images: np.ndarray | list[np.ndarray]) -> None:
+        """Ensure each stage is applied to the whole batch in order."""
+        inst = ComposePerturber(perturbers=[HazePerturber(factor=0.5), RadialDistortionPerturber(k=[0.1, 0, 0])])
+        out_images, out_boxes_list = inst.perturb_batch(images=images)
+        assert type(out_images) is type(images)
+        for image, out_image in zip(images, out_images, strict=True):
+            assert np.array_equal(out_image, inst.perturb(image=image)[0])
+        assert out_boxes_list == [None] * len(images)
+
+    def test_perturb_batch_empty(self) -> None:
+        """Ensure an empty composition copies the batch."""
+        images = np.ones((2, 3, 3, 3))
+        out_images, _ = ComposePerturber(perturbers=[]).perturb_batch(images=images)
+        assert np.array_equal(out_images, images)
+        assert not np.shares_memory(out_images, images)
+
+
+@pytest.mark.pillow
+@pytest.mark.skimage
+class TestComposePerturberFusion:
+    @pytest.mark.parametrize("shape", [(32, 48, 3), (32, 48), (32, 48, 4)])
+    @pytest.mark.parametrize(
+        ("stages", "kwargs"),
+        [
+            ([(BrightnessPerturber, {"factor": 1.4}), (ContrastPerturber, {"factor": 0.6})], {}),
+            (
+                [
+                    (ContrastPerturber, {"factor": 1.7}),
+                    (HazePerturber, {"factor": 0.4}),
+                    (BrightnessPerturber, {"factor": 0.8}),
+                ],
+                {},
+            ),
+            (
+                [
+                    (HazePerturber, {"factor": 0.3}),
+                    (GaussianNoisePerturber, {"seed": 3}),
+                    (ContrastPerturber, {"factor": 0.5}),
+                    (RandomCropPerturber, {"crop_size": (16, 16), "seed": 3}),
+                    (BrightnessPerturber, {"factor": 1.3}),
+                ],
+                {},
+            ),
+        ],
+        ids=["enhance", "enhance-haze", "mixed"],
+    )
+    def test_pointwise_fusion(
+        self,
+        shape: tuple[int, ...],
+        stages: list[tuple[type[PerturbImage], dict[str, Any]]],
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Ensure fused pointwise perturbers match applying each perturber in turn."""
+        image = random_image(size=shape, seed=1)  # pyright: ignore[reportArgumentType]
+        expected_image = image
+        for perturber_type, config in stages:
+            expected_image, _ = perturber_type(**config)(image=expected_image, **kwargs)
+
+        inst = ComposePerturber(perturbers=[perturber_type(**config) for perturber_type, config in stages])
+        perturber_assertions(perturb=inst.perturb, image=image, expected=expected_image, **kwargs)
+
+    @pytest.mark.parametrize(
+        ("stages", "kwargs"),
+        [
+            ([(HazePerturber, {"factor": 0.2}), (BrightnessPerturber, {"factor": 1.1})], {"sky_color": [40, 90, 200]}),
+            ([(ColorPerturber, {"factor": 0.5}), (ContrastPerturber, {"factor": 1.5})], {}),
+        ],
+        ids=["haze-sky-color", "non-pointwise"],
+    )
+    def test_pointwise_fusion_rgb(
+        self,
+        stages: list[tuple[type[PerturbImage], dict[str, Any]]],
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Ensure fusion matches applying each perturber in turn for RGB-only perturbations."""
+        self.test_pointwise_fusion(shape=(32, 48, 3), stages=stages, kwargs=kwargs)
+
+    def test_pointwise_fusion_single_pass(self) -> None:
+        """Ensure fused pointwise perturbers are not applied one at a time."""
+        boxes = [(AxisAlignedBoundingBox(min_vertex=(1, 1), max_vertex=(4, 4)), {"test": 1.0})]
+        inst = ComposePerturber(
+            perturbers=[BrightnessPerturber(factor=1.2), ContrastPerturber(factor=0.7), HazePerturber(factor=0.5)],
+        )
+        with (
+            mock.patch.object(BrightnessPerturber, "perturb") as brightness_perturb,
+            mock.patch.object(ContrastPerturber, "perturb") as contrast_perturb,
+            mock.patch.object(HazePerturber, "perturb") as haze_perturb,
+        ):
+            out_image, out_boxes = inst.perturb(image=random_image(size=(16, 16, 3)), boxes=boxes)
+        brightness_perturb.assert_not_called()
+        contrast_perturb.assert_not_called()
+        haze_perturb.assert_not_called()
+        assert out_image.dtype == np.uint8
+        assert out_boxes == boxes
+        assert out_boxes is not boxes
+
+    def test_pointwise_fusion_depth_map(self) -> None:
+        """Ensure haze with a depth map is not fused."""
+        image = random_image(size=(16, 16, 3))
+        depth_map = np.linspace(0, 1, image.size).reshape(image.shape)
+        inst = ComposePerturber(perturbers=[BrightnessPerturber(factor=1.2), HazePerturber(factor=0.5)])
+        expected_image, _ = BrightnessPerturber(factor=1.2)(image=image)
+        expected_image, _ = HazePerturber(factor=0.5)(image=expected_image, depth_map=depth_map)
+        with mock.patch.object(HazePerturber, "perturb", wraps=inst.perturbers[1].perturb) as haze_perturb:
+            out_image, _ = inst.perturb(image=image, depth_map=depth_map)
+        haze_perturb.assert_called_once()
+        assert np.array_equal(out_image, expected_image)
+
+
+@pytest.mark.opencv
+class TestComposePerturberBlurFusion:
+    @pytest.mark.parametrize("shape", [(64, 48, 3), (64, 48)])
+    def test_blur_fusion(self, shape: tuple[int, ...]) -> None:
+        """Ensure fused blurs match applying each blur in turn, up to rounding and away from the image borders."""
+        image = random_image(size=shape, seed=1)  # pyright: ignore[reportArgumentType]
+        perturbers: list[PerturbImage] = [
+            GaussianBlurPerturber(ksize=5),
+            AverageBlurPerturber(ksize=4),
+            GaussianBlurPerturber(ksize=7),
+        ]
+        expected_image, _ = ComposePerturber(perturbers=perturbers)(image=image)
+
+        inst = ComposePerturber(perturbers=perturbers, fuse_blur=True)
+        with (
+            mock.patch.object(GaussianBlurPerturber, "perturb") as gaussian_perturb,
+            mock.patch.object(AverageBlurPerturber, "perturb") as average_perturb,
+        ):
+            out_image = perturber_assertions(perturb=inst.perturb, image=image)
+        gaussian_perturb.assert_not_called()
+        average_perturb.assert_not_called()
+
+        assert out_image.shape == expected_image.shape
+        assert out_image.dtype == np.uint8
+        border = 8
+        diff = np.abs(out_image.astype(int) - expected_image)[border:-border, border:-border]
+        assert diff.max() <= 1
+
+    @pytest.mark.parametrize(
+        ("perturbers", "fuse_blur"),
+        [
+            ([GaussianBlurPerturber(ksize=5), AverageBlurPerturber(ksize=3)], False),
+            ([GaussianBlurPerturber(ksize=5), MedianBlurPerturber(ksize=3), AverageBlurPerturber(ksize=3)], True),
+        ],
+    )
+    def test_blur_not_fused(self, perturbers: list[PerturbImage], fuse_blur: bool) -> None:
+        """Ensure blurs are applied exactly as they would be on their own when they are not fused."""
+        image = random_image(size=(32, 48, 3), seed=1)
+        boxes = [(AxisAlignedBoundingBox(min_vertex=(1, 1), max_vertex=(4, 4)), {"test": 1.0})]
+        expected_image = image
+        for perturber in perturbers:
+            expected_image, _ = perturber(image=expected_image)
+
+        out_image, out_boxes = ComposePerturber(perturbers=perturbers, fuse_blur=fuse_blur)(image=image, boxes=boxes)
+        assert np.array_equal(out_image, expected_image)
+        assert out_boxes == boxes
+
+
+@pytest.mark.core
+class TestComposePerturberWarpFusion:
+    @staticmethod
+    def _perturbers(*, is_static: bool) -> list[PerturbImage]:
+        return [
+            RandomTranslationPerturber(seed=1, is_static=is_static, color_fill=[255, 0, 128]),
+            RadialDistortionPerturber(k=[0.05, -0.01, 0.02], color_fill=[1, 2, 3]),
+            RandomTranslationPerturber(seed=2, is_static=is_static),
+            RadialDistortionPerturber(k=[-0.02, -0.05, 0]),
+        ]
+
+    @pytest.mark.parametrize("is_static", [False, True])
+    @pytest.mark.parametrize("box_array", [False, True])
+    def test_warp_fusion(self, is_static: bool, box_array: bool) -> None:
+        """Ensure composed warps match applying each warp in turn, in a single gather over the image."""
+        image = random_image(size=(32, 48, 3), seed=1)
+        boxes = [
+            (AxisAlignedBoundingBox(min_vertex=(10, 20), max_vertex=(30, 25)), {1: 0.9}),
+            (AxisAlignedBoundingBox(min_vertex=(0, 0), max_vertex=(5, 5)), {"cat": 0.3}),
+        ]
+        if box_array:
+            boxes = BoxArray.from_boxes(boxes)
+        perturbers = self._perturbers(is_static=is_static)
+        inst = ComposePerturber(perturbers=self._perturbers(is_static=is_static))
+
+        for _ in range(3):
+            expected_image, expected_boxes = image, boxes
+            for perturber in perturbers:
+                expected_image, expected_boxes = perturber(image=expected_image, boxes=expected_boxes)
+
+            with (
+                mock.patch.object(RandomTranslationPerturber, "perturb") as translation_perturb,
+                mock.patch.object(RadialDistortionPerturber, "perturb") as distortion_perturb,
+            ):
+                out_image, out_boxes = inst(image=image, boxes=boxes)
+            translation_perturb.assert_not_called()
+            distortion_perturb.assert_not_called()
+
+            assert np.array_equal(out_image, expected_image)
+            assert type(out_boxes) is type(expected_boxes)
+            assert list(out_boxes) == list(expected_boxes)  # pyright: ignore[reportArgumentType]
+
+    def test_warp_not_fused(self) -> None:
+        """Ensure warps separated by other perturbers are applied in order."""
+        image = random_image(size=(32, 48, 3), seed=1)
+        perturbers = [
+            RandomTranslationPerturber(seed=1),
+            GaussianNoisePerturber(seed=1),
+            RadialDistortionPerturber(k=[0.05, -0.01, 0.02]),
+        ]
+        inst = ComposePerturber(
+            perturbers=[
+                RandomTranslationPerturber(seed=1),
+                GaussianNoisePerturber(seed=1),
+                RadialDistortionPerturber(k=[0.05, -0.01, 0.02]),
+            ],
+        )
+        expected_image = image
+        for perturber in perturbers:
+            expected_image, _ = perturber(image=expected_image)
+
+        out_image, out_boxes = inst(image=image)
+        assert np.array_equal(out_image, expected_image)
+        assert out_boxes == []
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Hashable, Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+from smqtk_core.configuration import (
+    configuration_test_helper,
+    from_config_dict,
+    to_config_dict,
+)
+from smqtk_image_io.bbox import AxisAlignedBoundingBox
+from typing_extensions import override
+
+from nrtk.impls.perturb_image import ComposePerturber, TiledPerturber
+from nrtk.impls.perturb_image.photometric.blur import AverageBlurPerturber, GaussianBlurPerturber
+from nrtk.impls.perturb_image.photometric.noise import GaussianNoisePerturber
+from nrtk.interfaces import PerturbImage
+from tests.fakes import FakePerturber
+from tests.impls.perturb_image.perturber_utils import perturber_assertions
+from tests.utils import random_image
+
+
+class _HalvingPerturber(FakePerturber):
+    """Perturber returning the top half of its input, which cannot be stitched."""
+
+    @override
+    def perturb(
+        self,
+        *,
+        image: np.ndarray[Any, Any],
+        boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None = None,
+        **_: Any,
+    ) -> tuple[np.ndarray[Any, Any], Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]:
+        return np.copy(image[: image.shape[0] // 2]), boxes
+
+
+@pytest.mark.core
+class TestTiledPerturber:
+    def test_single_tile(self) -> None:
+        """Images that fit in a single tile are perturbed whole, without a halo."""
+        image = random_image(size=(16, 24, 3), seed=1)
+        inst = TiledPerturber(perturber=FakePerturber(), tile_size=32)
+        perturber_assertions(perturb=inst.perturb, image=image, expected=image)
+
+    @pytest.mark.parametrize(
+        "boxes",
+        [
+            None,
+            [(AxisAlignedBoundingBox(min_vertex=(0, 0), max_vertex=(1, 1)), {"test": 0.0})],
+        ],
+    )
+    def test_perturb_with_boxes(self, boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]]) -> None:
+        """Test that bounding boxes do not change during perturb."""
+        inst = TiledPerturber(perturber=FakePerturber(), tile_size=8, halo=2)
+        image = random_image(size=(20, 30, 3), seed=1)
+        perturber_assertions(perturb=inst.perturb, image=image, expected=image)
+        out_image, out_boxes = inst.perturb(image=image, boxes=boxes)
+        assert np.array_equal(out_image, image)
+        assert boxes == out_boxes
+
+    def test_halo_required(self) -> None:
+        """The halo must be given for perturbers that provide no blur kernel."""
+        inst = TiledPerturber(perturber=FakePerturber(), tile_size=8)
+        with pytest.raises(ValueError, match=r"FakePerturber provides no blur kernel"):
+            inst(image=random_image(size=(20, 30, 3), seed=1))
+
+    def test_perturb_into_single_tile(self) -> None:
+        """Images that fit in a single tile need no halo when perturbed into a preallocated output."""
+        image = random_image(size=(16, 24, 3), seed=1)
+        out = np.zeros_like(image)
+        out_image, out_boxes = TiledPerturber(perturber=FakePerturber(), tile_size=32).perturb_into(
+            image=image,
+            out=out,
+        )
+        assert out_image is out
+        assert np.array_equal(out, image)
+        assert out_boxes is None
+
+    def test_perturb_into_shape_mismatch(self) -> None:
+        inst = TiledPerturber(perturber=FakePerturber(), tile_size=8, halo=2)
+        with pytest.raises(ValueError, match=r"does not match the size of the image \(20, 30\)"):
+            inst.perturb_into(image=random_image(size=(20, 30, 3), seed=1), out=np.empty((20, 31, 3)))
+
+    def test_tile_size_changed(self) -> None:
+        """Perturbers that change the size of a tile cannot be tiled."""
+        inst = TiledPerturber(perturber=_HalvingPerturber(), tile_size=8, halo=2)
+        with pytest.raises(ValueError, match=r"_HalvingPerturber changed the size of a tile"):
+            inst(image=random_image(size=(20, 30, 3), seed=1))
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [({"tile_size": 0}, r"tile_size must be positive"), ({"halo": -1}, r"halo must not be negative")],
+    )
+    def test_invalid_init(self, kwargs: dict[str, Any], match: str) -> None:
+        with pytest.raises(ValueError, match=match):
+            TiledPerturber(perturber=FakePerturber(), **kwargs)
+
+    @pytest.mark.parametrize(("halo", "max_workers"), [(None, None), (4, 2)])
+    def test_configuration(self, halo: int | None, max_workers: int | None) -> None:
+        """Test configuration stability."""
+        perturber = FakePerturber(param1=3)
+        inst = TiledPerturber(perturber=perturber, tile_size=128, halo=halo, max_workers=max_workers)
+        for i in configuration_test_helper(inst):
+            assert i.perturber.get_config() == perturber.get_config()
+            assert i.tile_size == 128
+            assert i.halo == halo
+            assert i.max_workers == max_workers
+
+    def test_hydration(self, tmp_path: Path) -> None:
+        """Test configuration hydration using from_config_dict."""
+        original_perturber = TiledPerturber(perturber=FakePerturber(), tile_size=64, halo=3)
+
+        config_file_path = tmp_path / "config.json"
+        with open(str(config_file_path), "w") as f:
+            json.dump(to_config_dict(original_perturber), f)
+
+        with open(str(config_file_path)) as config_file:
+            hydrated_perturber = from_config_dict(config=json.load(config_file), type_iter=PerturbImage.get_impls())
+            assert original_perturber.get_config() == hydrated_perturber.get_config()
+
+
+@pytest.mark.opencv
+class TestTiledPerturberBlur:
+    @pytest.mark.parametrize("shape", [(70, 90, 3), (70, 90)])
+    @pytest.mark.parametrize("tile_size", [16, 25])
+    @pytest.mark.parametrize(
+        ("cls", "kwargs"),
+        [(GaussianBlurPerturber, {"ksize": 7}), (AverageBlurPerturber, {"ksize": 4})],
+    )
+    def test_matches_whole_image(
+        self,
+        shape: tuple[int, ...],
+        tile_size: int,
+        cls: type[PerturbImage],
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Ensure stitched tiles match blurring the whole image, with the halo sized from the blur kernel."""
+        image = random_image(size=shape, seed=1)  # pyright: ignore[reportArgumentType]
+        perturber = cls(**kwargs)
+        expected, _ = perturber(image=image)
+
+        inst = TiledPerturber(perturber=perturber, tile_size=tile_size, max_workers=4)
+        perturber_assertions(perturb=inst.perturb, image=image, expected=expected)
+
+    @pytest.mark.parametrize("shape", [(70, 90, 3), (70, 90)])
+    def test_perturb_into_memmap(self, tmp_path: Path, shape: tuple[int, ...]) -> None:
+        """Ensure memory-mapped images are streamed into a memory-mapped output, matching the in-memory result."""
+        image = np.lib.format.open_memmap(tmp_path / "image.npy", mode="w+", dtype=np.uint8, shape=shape)
+        image[...] = random_image(size=shape, seed=1)  # pyright: ignore[reportArgumentType]
+        out = np.lib.format.open_memmap(tmp_path / "out.npy", mode="w+", dtype=np.uint8, shape=shape)
+        perturber = GaussianBlurPerturber(ksize=5)
+        expected, _ = perturber(image=np.array(image))
+
+        out_image, _ = TiledPerturber(perturber=perturber, tile_size=16, max_workers=2).perturb_into(
+            image=image,
+            out=out,
+        )
+        assert out_image is out
+        del out
+        assert np.array_equal(np.load(tmp_path / "out.npy"), expected)
+
+
+@pytest.mark.skimage
+class TestTiledPerturberRandom:
+    def test_seeded_perturber_reproducible(self) -> None:
+        """Tiles of a seeded random perturber give the same image on every run, whatever the thread scheduling."""
+        image = random_image(size=(96, 96, 3), seed=1)
+        outputs = [
+            TiledPerturber(perturber=GaussianNoisePerturber(seed=1), tile_size=32, halo=0, max_workers=4)(image=image)[
+                0
+            ]
+            for _ in range(4)
+        ]
+        for out in outputs[1:]:
+            assert np.array_equal(out, outputs[0])
+
+        # Calls of a non-static perturber advance its random state, static ones repeat it
+        inst = TiledPerturber(perturber=GaussianNoisePerturber(seed=1), tile_size=32, halo=0)
+        assert not np.array_equal(inst(image=image)[0], inst(image=image)[0])
+        inst = TiledPerturber(perturber=GaussianNoisePerturber(seed=1, is_static=True), tile_size=32, halo=0)
+        assert np.array_equal(inst(image=image)[0], inst(image=image)[0])
+
+    @pytest.mark.opencv
+    def test_composed_random_stage(self) -> None:
+        """Random stages of a composed perturber draw from the generators of the tiles, as a random perturber does."""
+        image = random_image(size=(96, 96, 3), seed=1)
+        expected, _ = TiledPerturber(perturber=GaussianNoisePerturber(seed=1), tile_size=32, halo=0)(image=image)
+        for _ in range(4):
+            inst = TiledPerturber(
+                perturber=ComposePerturber([AverageBlurPerturber(ksize=1), GaussianNoisePerturber(seed=1)]),
+                tile_size=32,
+                halo=0,
+                max_workers=8,
+            )
+            assert np.array_equal(inst(image=image)[0], expected)
+
+    @pytest.mark.parametrize("call_kwargs", [{"seed": 3}, {"rng": None}])
+    def test_per_call_random_state(self, call_kwargs: dict[str, Any]) -> None:
+        """Tiles spawn their own generators from the rng or seed of the call, so they do not repeat the same noise."""
+        image = np.full((64, 64), 128, dtype=np.uint8)
+        inst = TiledPerturber(perturber=GaussianNoisePerturber(), tile_size=32, halo=0, max_workers=4)
+
+        def call() -> np.ndarray[Any, Any]:
+            kwargs = {"rng": np.random.default_rng(3)} if "rng" in call_kwargs else call_kwargs
+            return inst(image=image, **kwargs)[0]
+
+        out = call()
+        assert not np.array_equal(out[:32, :32], out[:32, 32:])
+        assert np.array_equal(call(), out)
+
+    def test_rng_and_seed(self) -> None:
+        """Giving both an rng and a seed raises ValueError."""
+        inst = TiledPerturber(perturber=GaussianNoisePerturber(), tile_size=8, halo=0)
+        with pytest.raises(ValueError, match=r"Only one of rng and seed may be given"):
+            inst(image=np.zeros((16, 16), dtype=np.uint8), rng=np.random.default_rng(), seed=1)
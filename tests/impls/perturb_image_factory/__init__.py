@@ -1,3 +1,4 @@
 from .perturber_factory_mixin import PerturberFactoryMixin
+from .sampling_factory_mixin import SamplingFactoryMixin
 
-__all__ = ["PerturberFactoryMixin"]
+__all__ = ["PerturberFactoryMixin", "SamplingFactoryMixin"]
@@ -44,6 +44,10 @@ Shared Test Cases:
         - Factory survives JSON serialization/deserialization roundtrip
         - Reconstructed factory config matches original
 
+    Sharding
+        - Strided and contiguous shards partition the factory's perturbers
+        - Shards survive JSON serialization/deserialization roundtrip
+
     Input Validation
         - Passing perturber instance (not type) raises TypeError
 
@@ -52,6 +56,10 @@ Shared Test Cases:
         - theta_key property returns a string
         - thetas property returns a Sequence
         - factory[i] matches i-th item from iteration
+        - theta_values(i) are the values set on the i-th perturber
+
+    Perturber Cache
+        - With the cache enabled, iteration and indexing reuse constructed perturbers
 """
 
 from __future__ import annotations
@@ -192,6 +200,28 @@ class PerturberFactoryMixin:
 
         assert deep_equals(a=original_config, b=hydrated_config)
 
+    # ============================== Sharding ==============================
+
+    @pytest.mark.parametrize("strided", [True, False])
+    @pytest.mark.parametrize("count", [1, 2, 3, 5])
+    def test_shards_partition_factory(self, count: int, strided: bool) -> None:
+        """Shards rebuilt from JSON together produce every perturber of the factory exactly once, in order."""
+        factory = self._make_factory(**self.default_factory_kwargs)
+        configs = [p.get_config() for p in factory]
+
+        sharded: list[tuple[int, dict[str, Any]]] = []
+        for index in range(count):
+            shard = factory.shard(index=index, count=count, strided=strided)
+            config = json.loads(json.dumps(to_config_dict(shard)))
+            hydrated = from_config_dict(config=config, type_iter=PerturbImageFactory.get_impls())
+            assert len(hydrated) == len(shard)
+            positions = range(index, len(factory), count) if strided else range(len(sharded), len(sharded) + len(shard))
+            sharded.extend((i, p.get_config()) for i, p in zip(positions, hydrated, strict=True))
+
+        assert sorted(i for i, _ in sharded) == list(range(len(factory)))
+        for i, config in sharded:
+            assert deep_equals(a=config, b=configs[i])
+
     # ========================== Input Validation ==========================
 
     def test_rejects_perturber_instance(self) -> None:
@@ -240,3 +270,25 @@ class PerturberFactoryMixin:
         for i, perturber in enumerate(iterated):
             indexed = factory[i]
             assert perturber.get_config() == indexed.get_config()
+
+    def test_theta_values_match_perturbers(self) -> None:
+        """theta_values(i) are the values set on the i-th perturber."""
+        factory = self._make_factory(**self.default_factory_kwargs)
+        for i, perturber in enumerate(factory):
+            config = perturber.get_config()
+            for key, value in factory.theta_values(i).items():
+                assert config[key] == value
+
+    # =========================== Perturber Cache ==========================
+
+    def test_perturber_cache_reuses_perturbers(self) -> None:
+        """With the cache enabled, iteration and indexing reuse constructed perturbers."""
+        factory = self._make_factory(**self.default_factory_kwargs)
+        assert factory[0] is not factory[0]
+
+        factory.set_perturber_cache(maxsize=len(factory))
+        first_pass = list(factory)
+        second_pass = list(factory)
+        for p1, p2 in zip(first_pass, second_pass, strict=True):
+            assert p1 is p2
+        assert factory[-1] is first_pass[-1]
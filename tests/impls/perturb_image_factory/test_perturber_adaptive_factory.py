@@ -0,0 +1,201 @@
+"""Tests for PerturberAdaptiveFactory.
+
+PerturberAdaptiveFactory steps through an explicit list of values of one
+parameter, typically chosen by ``from_calibration`` to refine the sweep
+where perturbed images change most.
+
+Test Cases (in addition to shared base class tests):
+    Iteration (Valid)
+        - Values are produced in increasing order
+
+    Iteration (Empty)
+        - Empty thetas produces empty factory
+
+    Calibration
+        - Produces budget values including the ends of the range
+        - Refines where perturbed images change, not where they saturate
+        - Custom metric steers refinement
+        - Random perturbers are calibrated reproducibly
+        - Config lists the chosen values and round-trips without the images
+        - Invalid num_coarse or budget raises ValueError
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Sequence
+from contextlib import AbstractContextManager
+from contextlib import nullcontext as does_not_raise
+from typing import Any
+
+import numpy as np
+import pytest
+from smqtk_core.configuration import configuration_test_helper
+from smqtk_image_io.bbox import AxisAlignedBoundingBox
+from typing_extensions import override
+
+from nrtk.impls.perturb_image._base._numpy_random_perturb_image import NumpyRandomPerturbImage
+from nrtk.impls.perturb_image_factory import PerturberAdaptiveFactory
+from nrtk.interfaces import PerturbImage
+from tests.fakes import FakePerturber
+from tests.impls.perturb_image_factory import PerturberFactoryMixin
+from tests.utils import random_image
+
+
+class _ScalePerturber(FakePerturber):
+    """Scales images by param1, saturating at 255."""
+
+    @override
+    def perturb(
+        self,
+        *,
+        image: np.ndarray[Any, Any],
+        boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None = None,
+        **_: Any,
+    ) -> tuple[np.ndarray[Any, Any], Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]:
+        return np.clip(image * float(self.param1), 0, 255).astype(np.uint8), boxes
+
+
+class _NoisePerturber(NumpyRandomPerturbImage):
+    """Adds noise with standard deviation param1 drawn from the random state of the perturber."""
+
+    def __init__(self, *, param1: float = 1.0, seed: int | None = None, is_static: bool = False) -> None:
+        super().__init__(seed=seed, is_static=is_static)
+        self.param1 = param1
+
+    @override
+    def perturb(
+        self,
+        *,
+        image: np.ndarray[Any, Any],
+        boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None = None,
+        **kwargs: Any,
+    ) -> tuple[np.ndarray[Any, Any], Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]:
+        perturbed_image, perturbed_boxes = super().perturb(image=image, boxes=boxes, **kwargs)
+        noise = self._rng.normal(scale=self.param1, size=image.shape)
+        return np.clip(perturbed_image + noise, 0, 255).astype(np.uint8), perturbed_boxes
+
+    @override
+    def get_config(self) -> dict[str, Any]:
+        cfg = super().get_config()
+        cfg["param1"] = self.param1
+        return cfg
+
+
+def _calibrate(perturber: type[PerturbImage] = _ScalePerturber, **kwargs: Any) -> PerturberAdaptiveFactory:
+    """Calibrate a factory on a uniform mid-gray image."""
+    return PerturberAdaptiveFactory.from_calibration(
+        perturber=perturber,
+        theta_key="param1",
+        **({"images": [np.full((8, 8, 3), 64, dtype=np.uint8)], "start": 0.0, "stop": 16.0} | kwargs),
+    )
+
+
+@pytest.mark.core
+class TestPerturberAdaptiveFactory(PerturberFactoryMixin):
+    """Tests for PerturberAdaptiveFactory. See module docstring for test cases."""
+
+    default_factory_kwargs: dict[str, Any] = {
+        "theta_key": "param1",
+        "thetas": [1.0, 2.0, 4.0],
+    }
+
+    @override
+    def _make_factory(self, **kwargs: Any) -> PerturberAdaptiveFactory:
+        """Create a factory with FakePerturber pre-filled."""
+        return PerturberAdaptiveFactory(perturber=FakePerturber, **kwargs)
+
+    # ========================= Iteration (Valid) ==========================
+
+    @pytest.mark.parametrize(
+        ("factory_kwargs", "expected"),
+        [
+            pytest.param({"theta_key": "param1", "thetas": [1.0, 2.0, 4.0]}, [1.0, 2.0, 4.0], id="sorted"),
+            pytest.param({"theta_key": "param1", "thetas": [4.0, 1.0, 2.5]}, [1.0, 2.5, 4.0], id="unsorted"),
+        ],
+    )
+    @override
+    def test_iteration_valid(self, factory_kwargs: dict[str, Any], expected: Sequence[Any]) -> None:
+        super().test_iteration_valid(factory_kwargs=factory_kwargs, expected=expected)
+
+    # ========================= Iteration (Empty) ==========================
+
+    @pytest.mark.parametrize(
+        "empty_factory_kwargs",
+        [pytest.param({"theta_key": "param1", "thetas": []}, id="empty thetas")],
+    )
+    @override
+    def test_iteration_empty(self, empty_factory_kwargs: dict[str, Any]) -> None:
+        super().test_iteration_empty(empty_factory_kwargs=empty_factory_kwargs)
+
+    # ============================== Indexing ==============================
+
+    @pytest.mark.parametrize(
+        ("idx", "expected_val", "expectation"),
+        [
+            pytest.param(0, 1.0, does_not_raise(), id="first"),
+            pytest.param(2, 4.0, does_not_raise(), id="last"),
+            pytest.param(-1, 4.0, does_not_raise(), id="negative -1 (last)"),
+            pytest.param(3, None, pytest.raises(IndexError), id="out of bounds positive"),
+        ],
+    )
+    @override
+    def test_indexing(
+        self,
+        idx: int,
+        expected_val: float | None,
+        expectation: AbstractContextManager,
+    ) -> None:
+        super().test_indexing(idx=idx, expected_val=expected_val, expectation=expectation)
+
+    # ============================= Calibration ============================
+
+    @pytest.mark.parametrize(("budget", "num_coarse"), [(5, 5), (12, 5), (9, 2)])
+    def test_calibration_budget(self, budget: int, num_coarse: int) -> None:
+        """Calibration produces budget values including the ends of the range."""
+        factory = _calibrate(budget=budget, num_coarse=num_coarse)
+        assert len(factory) == budget
+        assert factory.thetas[0] == 0.0
+        assert factory.thetas[-1] == 16.0
+        assert list(factory.thetas) == sorted(set(factory.thetas))
+
+    def test_calibration_refines_where_images_change(self) -> None:
+        """Values are refined below 4, past which the scaled mid-gray image saturates."""
+        factory = _calibrate(budget=13)
+        assert [theta for theta in factory.thetas if theta > 4.0] == [8.0, 12.0, 16.0]
+
+    def test_calibration_metric(self) -> None:
+        """A custom metric steers refinement."""
+
+        def saturated_change(*, a: np.ndarray[Any, Any], b: np.ndarray[Any, Any]) -> float:
+            return float(np.sum((a == 255) != (b == 255)))
+
+        factory = _calibrate(budget=7, metric=saturated_change)
+        # Mid-gray saturates just below 4, so only the half of [0, 4] containing that value is bisected again
+        assert list(factory.thetas) == [0.0, 2.0, 3.0, 4.0, 8.0, 12.0, 16.0]
+
+    def test_calibration_random_perturber(self) -> None:
+        """Random perturbers are calibrated with a fixed seed, so calibration is reproducible."""
+        images = [random_image(size=(16, 16, 3), seed=0)]
+        thetas = _calibrate(_NoisePerturber, images=images, budget=9, stop=64.0).thetas
+        assert _calibrate(_NoisePerturber, images=images, budget=9, stop=64.0).thetas == thetas
+
+    def test_calibration_config(self) -> None:
+        """Config lists the chosen values and round-trips without the calibration images."""
+        factory = _calibrate(budget=7, perturber_kwargs={"param2": 3})
+        config = factory.get_config()
+        assert config["thetas"] == list(factory.thetas)
+        for reconstructed in configuration_test_helper(factory):
+            assert reconstructed.thetas == factory.thetas
+            assert reconstructed.perturber_kwargs == {"param2": 3}
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            pytest.param({"budget": 5, "num_coarse": 1}, r"num_coarse must be at least 2", id="num_coarse"),
+            pytest.param({"budget": 4, "num_coarse": 5}, r"budget must be at least num_coarse", id="budget"),
+        ],
+    )
+    def test_calibration_rejects_invalid_arguments(self, kwargs: dict[str, Any], match: str) -> None:
+        """Invalid num_coarse or budget raises ValueError."""
+        with pytest.raises(ValueError, match=match):
+            _calibrate(**kwargs)
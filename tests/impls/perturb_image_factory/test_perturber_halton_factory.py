@@ -0,0 +1,47 @@
+"""Tests for PerturberHaltonFactory.
+
+PerturberHaltonFactory creates perturbers at the points of a Halton sequence
+over several parameters.
+
+Test Cases (in addition to shared sampling factory tests):
+    Design
+        - Unscrambled design is the Halton sequence
+
+    Configuration
+        - The scramble flag is part of the config
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from nrtk.impls.perturb_image_factory import PerturberHaltonFactory
+from tests.impls.perturb_image_factory import SamplingFactoryMixin
+
+
+@pytest.mark.core
+class TestPerturberHaltonFactory(SamplingFactoryMixin):
+    """Tests for PerturberHaltonFactory. See module docstring for test cases."""
+
+    factory_type = PerturberHaltonFactory
+
+    # =============================== Design ===============================
+
+    def test_unscrambled(self) -> None:
+        """Unscrambled design is the Halton sequence, in bases 2 and 3."""
+        factory = self._make_factory(
+            theta_keys=["param1", "param2"],
+            thetas=[{"low": 0.0, "high": 1.0}] * 2,
+            num_samples=5,
+            scramble=False,
+        )
+        expected = [[0.0, 0.0], [1 / 2, 1 / 3], [1 / 4, 2 / 3], [3 / 4, 1 / 9], [1 / 8, 4 / 9]]
+        assert np.allclose(factory.samples, expected)
+
+    # ============================ Configuration ===========================
+
+    def test_config_scramble(self) -> None:
+        """The scramble flag is part of the config."""
+        factory = self._make_factory(**self.default_factory_kwargs, scramble=False)
+        assert factory.get_config()["scramble"] is False
@@ -0,0 +1,37 @@
+"""Tests for PerturberLatinHypercubeFactory.
+
+PerturberLatinHypercubeFactory creates perturbers at the points of a Latin
+hypercube design over several parameters.
+
+Test Cases (in addition to shared sampling factory tests):
+    Design
+        - Every parameter has exactly one sample in each of num_samples strata
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from nrtk.impls.perturb_image_factory import PerturberLatinHypercubeFactory
+from tests.impls.perturb_image_factory import SamplingFactoryMixin
+
+
+@pytest.mark.core
+class TestPerturberLatinHypercubeFactory(SamplingFactoryMixin):
+    """Tests for PerturberLatinHypercubeFactory. See module docstring for test cases."""
+
+    factory_type = PerturberLatinHypercubeFactory
+
+    # =============================== Design ===============================
+
+    @pytest.mark.parametrize("num_samples", [1, 7, 50])
+    def test_one_sample_per_stratum(self, num_samples: int) -> None:
+        """Every parameter has exactly one sample in each of num_samples strata."""
+        factory = self._make_factory(
+            theta_keys=["param1", "param2", "param3"],
+            thetas=[{"low": 0.0, "high": 1.0}] * 3,
+            num_samples=num_samples,
+        )
+        for dim in range(3):
+            strata = sorted(int(sample[dim] * num_samples) for sample in factory.samples)
+            assert strata == list(range(num_samples))
@@ -19,6 +19,9 @@ Test Cases (in addition to shared base class tests):
     Edge Cases
         - start > stop produces descending range
         - Negative value ranges work correctly
+
+    Theta Caching
+        - Theta values are computed once and recomputed when a range parameter changes
 """
 
 from __future__ import annotations
@@ -181,3 +184,15 @@ class TestPerturberLinspaceFactory(PerturberFactoryMixin):
         expected = [-1.0, -0.5, 0.0, 0.5, 1.0]
         for actual, exp in zip(factory.thetas, expected, strict=False):
             assert np.isclose(actual, exp, atol=1e-4)
+
+    # ============================ Theta Caching ===========================
+
+    def test_thetas_cached(self) -> None:
+        """Theta values are computed once and recomputed when a range parameter changes."""
+        factory = self._make_factory(theta_key="param1", start=0.0, stop=1.0, num=3)
+        thetas = factory.thetas
+        assert factory.thetas is thetas
+        factory.num = 5
+        assert np.allclose(factory.thetas, [0.0, 0.25, 0.5, 0.75, 1.0])
+        factory.endpoint = False
+        assert np.allclose(factory.thetas, [0.0, 0.2, 0.4, 0.6, 0.8])
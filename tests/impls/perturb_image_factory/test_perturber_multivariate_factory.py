@@ -37,6 +37,7 @@ Test Cases (in addition to shared base class tests):
     Length / Cartesian Product
         - Length equals number of values for single key
         - Length equals product of all value list lengths
+        - Large sweeps are indexed without building every combination
 
     theta_key Property
         - Returns "params" (fixed value for multivariate)
@@ -186,6 +187,21 @@ class TestPerturberMultivariateFactory(PerturberFactoryMixin):
         # default_factory_kwargs has thetas=[[1, 3], [2, 4]] -> 2 * 2 = 4
         assert len(factory) == 4
 
+    def test_large_sweep(self) -> None:
+        """A 6 parameter sweep of 20 values each is sized and indexed without building every combination."""
+        theta_keys = [f"param{i}" for i in range(6)]
+        factory = PerturberMultivariateFactory(
+            perturber=FakePerturber,
+            theta_keys=theta_keys,
+            thetas=[list(range(20))] * 6,
+        )
+        assert len(factory) == 20**6
+        assert factory.sets[-1] == [19] * 6
+        assert factory.sets[20**5 + 2 * 20 + 3] == [1, 0, 0, 0, 2, 3]
+        assert factory.sets[-20] == [19, 19, 19, 19, 19, 0]
+        with pytest.raises(IndexError):
+            factory.sets[20**6]
+
     @pytest.mark.skip(reason="Multivariate len is cartesian product, not len(thetas)")
     @override
     def test_len_matches_thetas_length(self) -> None:
@@ -0,0 +1,130 @@
+"""Tests for PerturberScreenFactory.
+
+PerturberScreenFactory is a view over the perturbers of another factory that pass an analytic screen of their
+quality metrics. These tests screen a PerturberStepFactory stepping param1 through 0, 1, ..., 9, of perturbers whose
+metrics are param1 and its half, rounded down.
+
+Test Cases:
+    Screening
+        - Perturbers with metrics out of bounds are dropped, with their reasons
+        - Perturbers with metrics within tolerance of a kept perturber are collapsed onto it
+        - Screened out perturbers are only flagged when drop is False
+
+    Indexing
+        - Indexes within the view, with negative indices and IndexError out of range
+
+    Input Validation
+        - Unknown metrics and negative tolerances raise ValueError
+        - Perturbers without quality metrics raise TypeError
+
+    Configuration
+        - Config holds the screened factory's config and round-trips through from_config
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from smqtk_core.configuration import to_config_dict
+
+from nrtk.impls.perturb_image_factory import PerturberScreenFactory, PerturberStepFactory
+from tests.fakes import FakePerturber
+
+
+class FakeQualityPerturber(FakePerturber):
+    """Fake perturber with quality metrics derived from param1."""
+
+    def quality_metrics(self) -> dict[str, float]:
+        return {"sharpness": float(self.param1), "level": float(self.param1 // 2)}
+
+
+def _make_factory(**kwargs: Any) -> PerturberScreenFactory:
+    """Screen of a step factory of param1 through 0, 1, ..., 9."""
+    return PerturberScreenFactory(
+        factory=PerturberStepFactory(perturber=FakeQualityPerturber, theta_key="param1", start=0, stop=10, to_int=True),
+        **kwargs,
+    )
+
+
+@pytest.mark.core
+class TestPerturberScreenFactory:
+    """Tests for PerturberScreenFactory. See module docstring for test cases."""
+
+    # ============================= Screening ==============================
+
+    def test_bounds(self) -> None:
+        """Perturbers with metrics out of bounds are dropped, with their reasons."""
+        factory = _make_factory(min_metrics={"sharpness": 2}, max_metrics={"level": 3})
+        assert [perturber.get_config()["param1"] for perturber in factory] == [2, 3, 4, 5, 6, 7]
+        assert factory.indices == [2, 3, 4, 5, 6, 7]
+        assert factory.reasons[0] == "sharpness 0 is below 2"
+        assert factory.reasons[8] == "level 4 is above 3"
+        assert len(factory.metrics) == 10
+
+    def test_collapse(self) -> None:
+        """Perturbers with metrics within tolerance of a kept perturber are collapsed onto it."""
+        factory = _make_factory(min_metrics={"sharpness": 1}, collapse_tolerances={"level": 0})
+        assert factory.indices == [1, 2, 4, 6, 8]
+        assert factory.reasons[3] == "collapsed onto perturber 2"
+        assert [factory.theta_values(idx) for idx in range(len(factory))] == [
+            {"param1": idx} for idx in [1, 2, 4, 6, 8]
+        ]
+
+    def test_flag_only(self) -> None:
+        """Screened out perturbers are kept and only flagged when drop is False."""
+        factory = _make_factory(max_metrics={"sharpness": 4}, drop=False)
+        assert len(factory) == 10
+        assert sorted(factory.reasons) == [5, 6, 7, 8, 9]
+
+    def test_screen(self) -> None:
+        """screen() creates the screening view of the factory."""
+        factory = PerturberStepFactory(perturber=FakeQualityPerturber, theta_key="param1", start=0, stop=10)
+        screen = factory.screen(max_metrics={"sharpness": 4})
+        assert isinstance(screen, PerturberScreenFactory)
+        assert screen.factory is factory
+        assert len(screen) == 5
+
+    # ============================== Indexing ==============================
+
+    def test_indexing(self) -> None:
+        """Indexes within the view, with negative indices and IndexError out of range."""
+        factory = _make_factory(min_metrics={"sharpness": 5})
+        assert factory[0].get_config()["param1"] == 5
+        assert factory[-1].get_config()["param1"] == 9
+        with pytest.raises(IndexError):
+            factory[5]
+
+    # ========================== Input Validation ==========================
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            pytest.param({"min_metrics": {"niirs": 2}}, r"Unknown quality metric 'niirs'", id="unknown bound"),
+            pytest.param({"collapse_tolerances": {"niirs": 1}}, r"Unknown quality metric 'niirs'", id="unknown tol"),
+            pytest.param({"collapse_tolerances": {"level": -1}}, r"must be non-negative", id="negative tolerance"),
+        ],
+    )
+    def test_rejects_invalid_screen(self, kwargs: dict[str, Any], match: str) -> None:
+        """Unknown metrics and negative tolerances raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            _make_factory(**kwargs)
+
+    def test_rejects_perturbers_without_metrics(self) -> None:
+        """Perturbers without quality metrics raise TypeError."""
+        factory = PerturberStepFactory(perturber=FakePerturber, theta_key="param1", start=0, stop=2)
+        with pytest.raises(TypeError, match=r"does not provide quality_metrics"):
+            factory.screen()
+
+    # ============================ Configuration ===========================
+
+    def test_config(self) -> None:
+        """Config holds the screened factory's config and round-trips through from_config."""
+        factory = _make_factory(min_metrics={"sharpness": 2}, collapse_tolerances={"level": 0})
+        config = factory.get_config()
+        assert config["factory"] == to_config_dict(factory.factory)
+        assert (config["min_metrics"], config["max_metrics"], config["drop"]) == ({"sharpness": 2}, {}, True)
+
+        rebuilt = PerturberScreenFactory.from_config(config)
+        assert rebuilt.get_config() == config
+        assert rebuilt.indices == factory.indices
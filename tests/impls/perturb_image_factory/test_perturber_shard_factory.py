@@ -0,0 +1,219 @@
+"""Tests for PerturberShardFactory.
+
+PerturberShardFactory is a view over one of ``count`` disjoint shards of
+another factory's perturbers. These tests shard a PerturberStepFactory
+stepping param1 through 0, 1, ..., 9.
+
+Note: This class inherits from PerturberFactoryMixin but overrides several
+tests because the perturber type and theta values come from the sharded factory.
+
+Test Cases (in addition to shared base class tests):
+    Iteration (Valid)
+        - Strided shards take every count-th theta starting at index, which are their thetas
+        - Contiguous shards take a consecutive block
+        - Contiguous shard sizes differ by at most one
+        - Shards of multivariate factories keep the values of each parameter as thetas
+
+    Iteration (Empty)
+        - More shards than perturbers produces empty shards
+
+    Indexing
+        - Indexes within the shard, with negative indices and IndexError out of range
+
+    Input Validation
+        - count below 1 raises ValueError
+        - index outside [0, count) raises ValueError
+
+    Configuration
+        - Config holds the sharded factory's config
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from contextlib import AbstractContextManager
+from contextlib import nullcontext as does_not_raise
+from typing import Any
+
+import pytest
+from smqtk_core.configuration import to_config_dict
+from typing_extensions import override
+
+from nrtk.impls.perturb_image_factory import (
+    PerturberMultivariateFactory,
+    PerturberShardFactory,
+    PerturberStepFactory,
+)
+from tests.fakes import FakePerturber
+from tests.impls.perturb_image_factory import PerturberFactoryMixin
+
+
+@pytest.mark.core
+class TestPerturberShardFactory(PerturberFactoryMixin):
+    """Tests for PerturberShardFactory. See module docstring for test cases."""
+
+    default_factory_kwargs: dict[str, Any] = {
+        "theta_key": "param1",
+        "start": 0,
+        "stop": 10,
+        "to_int": True,
+        "index": 1,
+        "count": 3,
+    }
+
+    @override
+    def _make_factory(
+        self,
+        *,
+        index: int = 0,
+        count: int = 1,
+        strided: bool = True,
+        **kwargs: Any,
+    ) -> PerturberShardFactory:
+        """Create a shard of a step factory with FakePerturber pre-filled."""
+        return PerturberShardFactory(
+            factory=PerturberStepFactory(perturber=FakePerturber, **kwargs),
+            index=index,
+            count=count,
+            strided=strided,
+        )
+
+    # ========================= Iteration (Valid) ==========================
+
+    @pytest.mark.parametrize(
+        ("factory_kwargs", "expected"),
+        [
+            pytest.param(
+                {"theta_key": "param1", "start": 0, "stop": 10, "to_int": True, "index": 1, "count": 3},
+                [1, 4, 7],
+                id="strided",
+            ),
+            pytest.param(
+                {"theta_key": "param1", "start": 0, "stop": 10, "to_int": True, "index": 0, "count": 3},
+                [0, 3, 6, 9],
+                id="strided first shard",
+            ),
+            pytest.param(
+                {
+                    "theta_key": "param1",
+                    "start": 0,
+                    "stop": 10,
+                    "to_int": True,
+                    "index": 1,
+                    "count": 3,
+                    "strided": False,
+                },
+                [3, 4, 5],
+                id="contiguous",
+            ),
+            pytest.param(
+                {
+                    "theta_key": "param1",
+                    "start": 0,
+                    "stop": 10,
+                    "to_int": True,
+                    "index": 2,
+                    "count": 3,
+                    "strided": False,
+                },
+                [6, 7, 8, 9],
+                id="contiguous last shard",
+            ),
+        ],
+    )
+    @override
+    def test_iteration_valid(self, factory_kwargs: dict[str, Any], expected: Sequence[Any]) -> None:
+        super().test_iteration_valid(factory_kwargs=factory_kwargs, expected=expected)
+        assert list(self._make_factory(**factory_kwargs).thetas) == expected
+
+    @pytest.mark.parametrize("count", [3, 4, 7])
+    def test_contiguous_shard_sizes(self, count: int) -> None:
+        """Contiguous shard sizes differ by at most one."""
+        sizes = [
+            len(self._make_factory(theta_key="param1", start=0, stop=10, index=index, count=count, strided=False))
+            for index in range(count)
+        ]
+        assert sum(sizes) == 10
+        assert max(sizes) - min(sizes) <= 1
+
+    def test_multivariate_thetas(self) -> None:
+        """Shards of factories varying several parameters keep the values of each parameter as thetas."""
+        factory = PerturberMultivariateFactory(
+            perturber=FakePerturber,
+            theta_keys=["param1", "param2"],
+            thetas=[[1, 2, 3], [4, 5]],
+        )
+        shard = factory.shard(index=1, count=2)
+        assert shard.thetas == factory.thetas
+        assert [shard.theta_values(idx) for idx in range(len(shard))] == [
+            factory.theta_values(idx) for idx in range(1, 6, 2)
+        ]
+
+    # ========================= Iteration (Empty) ==========================
+
+    @pytest.mark.parametrize(
+        "empty_factory_kwargs",
+        [
+            pytest.param(
+                {"theta_key": "param1", "start": 0, "stop": 2, "index": 2, "count": 3},
+                id="strided",
+            ),
+            pytest.param(
+                {"theta_key": "param1", "start": 0, "stop": 2, "index": 0, "count": 3, "strided": False},
+                id="contiguous",
+            ),
+        ],
+    )
+    @override
+    def test_iteration_empty(self, empty_factory_kwargs: dict[str, Any]) -> None:
+        super().test_iteration_empty(empty_factory_kwargs=empty_factory_kwargs)
+
+    # ============================== Indexing ==============================
+
+    @pytest.mark.parametrize(
+        ("idx", "expected_val", "expectation"),
+        [
+            pytest.param(0, 1, does_not_raise(), id="first"),
+            pytest.param(2, 7, does_not_raise(), id="last"),
+            pytest.param(-1, 7, does_not_raise(), id="negative -1 (last)"),
+            pytest.param(3, None, pytest.raises(IndexError), id="out of bounds positive"),
+            pytest.param(-4, None, pytest.raises(IndexError), id="out of bounds negative"),
+        ],
+    )
+    @override
+    def test_indexing(
+        self,
+        idx: int,
+        expected_val: float | None,
+        expectation: AbstractContextManager,
+    ) -> None:
+        super().test_indexing(idx=idx, expected_val=expected_val, expectation=expectation)
+
+    # ========================== Input Validation ==========================
+
+    @pytest.mark.parametrize(
+        ("index", "count", "match"),
+        [
+            pytest.param(0, 0, r"count must be at least 1", id="zero count"),
+            pytest.param(3, 3, r"index must be in \[0, 3\)", id="index too large"),
+            pytest.param(-1, 3, r"index must be in \[0, 3\)", id="negative index"),
+        ],
+    )
+    def test_rejects_invalid_shard(self, index: int, count: int, match: str) -> None:
+        """Invalid shard index or count raises ValueError."""
+        with pytest.raises(ValueError, match=match):
+            self._make_factory(theta_key="param1", start=0, stop=10, index=index, count=count)
+
+    @pytest.mark.skip(reason="Shard takes its perturber type from the sharded factory")
+    @override
+    def test_rejects_perturber_instance(self) -> None:
+        pass  # pragma: no cover
+
+    # ============================ Configuration ===========================
+
+    def test_config_holds_sharded_factory(self) -> None:
+        """Config holds the sharded factory's config alongside the shard index, count and strided."""
+        factory = self._make_factory(**self.default_factory_kwargs)
+        config = factory.get_config()
+        assert config["factory"] == to_config_dict(factory.factory)
+        assert (config["index"], config["count"], config["strided"]) == (1, 3, True)
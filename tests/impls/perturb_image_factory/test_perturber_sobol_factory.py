@@ -0,0 +1,77 @@
+"""Tests for PerturberSobolFactory.
+
+PerturberSobolFactory creates perturbers at the points of a Sobol sequence
+over several parameters.
+
+Test Cases (in addition to shared sampling factory tests):
+    Design
+        - Unscrambled design is the Sobol sequence
+        - Scrambled designs of 2**k points have one point in each of 2**k strata
+        - More than SOBOL_MAX_DIMS parameters raises ValueError
+
+    Configuration
+        - The scramble flag is part of the config
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from nrtk.impls.perturb_image_factory import PerturberSobolFactory
+from nrtk.impls.perturb_image_factory._sampling import SOBOL_MAX_DIMS
+from tests.impls.perturb_image_factory import SamplingFactoryMixin
+
+
+@pytest.mark.core
+class TestPerturberSobolFactory(SamplingFactoryMixin):
+    """Tests for PerturberSobolFactory. See module docstring for test cases."""
+
+    factory_type = PerturberSobolFactory
+
+    # =============================== Design ===============================
+
+    def test_unscrambled(self) -> None:
+        """Unscrambled design is the Sobol sequence."""
+        factory = self._make_factory(
+            theta_keys=["param1", "param2", "param3"],
+            thetas=[{"low": 0.0, "high": 1.0}] * 3,
+            num_samples=8,
+            scramble=False,
+        )
+        expected = [
+            [0.0, 0.0, 0.0],
+            [0.5, 0.5, 0.5],
+            [0.75, 0.25, 0.25],
+            [0.25, 0.75, 0.75],
+            [0.375, 0.375, 0.625],
+            [0.875, 0.875, 0.125],
+            [0.625, 0.125, 0.875],
+            [0.125, 0.625, 0.375],
+        ]
+        assert np.array_equal(factory.samples, expected)
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_scrambled_balance(self, seed: int) -> None:
+        """Scrambled designs of 2**k points have one point in each of 2**k strata of every parameter."""
+        factory = self._make_factory(
+            theta_keys=[f"param{i}" for i in range(6)],
+            thetas=[{"low": 0.0, "high": 1.0}] * 6,
+            num_samples=64,
+            seed=seed,
+        )
+        for dim in range(6):
+            assert sorted(int(sample[dim] * 64) for sample in factory.samples) == list(range(64))
+
+    def test_rejects_too_many_parameters(self) -> None:
+        """More than SOBOL_MAX_DIMS parameters raises ValueError."""
+        dims = SOBOL_MAX_DIMS + 1
+        with pytest.raises(ValueError, match=rf"at most {SOBOL_MAX_DIMS} dimensions"):
+            self._make_factory(theta_keys=[f"param{i}" for i in range(dims)], thetas=[[1]] * dims, num_samples=4)
+
+    # ============================ Configuration ===========================
+
+    def test_config_scramble(self) -> None:
+        """The scramble flag is part of the config."""
+        factory = self._make_factory(**self.default_factory_kwargs, scramble=False)
+        assert factory.get_config()["scramble"] is False
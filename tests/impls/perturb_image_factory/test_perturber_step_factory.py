@@ -24,6 +24,9 @@ Test Cases (in addition to shared base class tests):
         - to_int=True returns integer theta values
         - to_int=False returns float theta values
         - to_int=True truncates fractional values
+
+    Theta Caching
+        - Theta values are computed once and recomputed when a range parameter changes
 """
 
 from __future__ import annotations
@@ -213,3 +216,16 @@ class TestPerturberStepFactory(PerturberFactoryMixin):
         thetas = factory.thetas
         assert all(isinstance(t, expected_type) for t in thetas)
         assert np.allclose(thetas, expected_values)
+
+    # ============================ Theta Caching ===========================
+
+    def test_thetas_cached(self) -> None:
+        """Theta values are computed once and recomputed when a range parameter changes."""
+        factory = self._make_factory(**self.default_factory_kwargs)
+        thetas = factory.thetas
+        assert factory.thetas is thetas
+        factory.stop = 8.0
+        assert factory.thetas == [1, 3, 5, 7]
+        factory.to_int = False
+        assert factory.thetas == [1.0, 3.0, 5.0, 7.0]
+        assert all(isinstance(t, float) for t in factory.thetas)
@@ -17,7 +17,7 @@ from smqtk_image_io.bbox import AxisAlignedBoundingBox
 from syrupy.assertion import SnapshotAssertion
 
 from nrtk.impls.perturb_video.optical import TurbulenceVideoPerturber
-from nrtk.interfaces import VideoFrame
+from nrtk.interfaces import BoxArray, VideoFrame
 from tests.conftest import PSNRVideoSnapshotExtension
 from tests.impls import INPUT_DRONE_VIDEO_FILE_PATH
 from tests.impls.perturb_video.perturber_tests_mixin import PerturbVideoTestsMixin
@@ -107,6 +107,7 @@ class TestTurbulenceVideoPerturber(PerturbVideoTestsMixin):
             {"color_fill": None, "grid_size": 32},
             {"eta": 0.3, "L0": 10.0},
             {"sub_pixel": True},
+            {"precision": "float64"},
         ],
     )
     def test_configuration(self, kwargs: dict[str, Any]) -> None:
@@ -126,6 +127,7 @@ class TestTurbulenceVideoPerturber(PerturbVideoTestsMixin):
             assert i.grid_size == inst.grid_size
             assert i.color_fill == inst.color_fill
             assert i.sub_pixel == inst.sub_pixel
+            assert i.precision == inst.precision
             assert i.seed == inst.seed
 
     def test_seeded_reproducible(self) -> None:
@@ -190,6 +192,47 @@ class TestTurbulenceVideoPerturber(PerturbVideoTestsMixin):
         assert inst._pupil_grid is pupil_before
         assert inst._propagator is propagator_before
 
+    @pytest.mark.parametrize(
+        ("changes", "reused"),
+        [
+            ({"wind_speed": 10.0}, {"_pupil_grid", "_aperture", "_focal_grid", "_propagator"}),
+            ({"wavelength": 600e-9}, {"_pupil_grid", "_aperture"}),
+            ({"eta": 0.2}, {"_pupil_grid", "_focal_grid", "_propagator"}),
+            ({"seed": 7}, {"_pupil_grid", "_aperture", "_focal_grid", "_propagator"}),
+        ],
+    )
+    def test_with_params(self, changes: dict[str, Any], reused: set[str]) -> None:
+        """with_params matches fresh construction and shares the HCIPy state the change leaves valid."""
+        inst = self.make_perturber(seed=42, wind_speed=5.0)
+        derived = inst.with_params(**changes)
+        fresh = self.make_perturber(**({"seed": 42, "wind_speed": 5.0} | changes))
+
+        assert derived.get_config() == fresh.get_config()
+        for r_derived, r_fresh in zip(
+            derived.perturb(frames=iter(self.make_frames(n=3))),
+            fresh.perturb(frames=iter(self.make_frames(n=3))),
+            strict=True,
+        ):
+            assert np.array_equal(r_derived.image, r_fresh.image)
+        for name in ("_pupil_grid", "_aperture", "_focal_grid", "_propagator"):
+            assert (getattr(derived, name) is getattr(inst, name)) == (name in reused)
+        assert derived._layer is not inst._layer
+
+    def test_update(self) -> None:
+        """Update changes parameters in place and leaves the perturber unchanged if they are rejected."""
+        inst = self.make_perturber(seed=42)
+        propagator = inst._propagator
+        inst.update(wind_speed=10.0)
+        assert inst.wind_speed == 10.0
+        assert inst._propagator is propagator
+
+        with pytest.raises(ValueError, match=r"eta"):
+            inst.update(eta=1.5)
+        assert inst.get_config() == self.make_perturber(seed=42, wind_speed=10.0).get_config()
+
+        with pytest.raises(TypeError, match=r"has no parameters \['speed'\]"):
+            inst.update(speed=1.0)
+
     @pytest.mark.parametrize(
         ("path_avg_cn2", "slant_range", "D", "expected"),
         [
@@ -253,6 +296,16 @@ class TestTurbulenceVideoPerturber(PerturbVideoTestsMixin):
             "at weak turbulence — integer rounding discards sub-pixel jitter."
         )
 
+    @pytest.mark.parametrize("sub_pixel", [False, True])
+    def test_precision_parity(self, sub_pixel: bool) -> None:
+        """float32 blur and shift match float64 to within one gray level."""
+        kwargs = {"path_avg_cn2": 5e-13, "sub_pixel": sub_pixel}
+        results_32 = list(self.make_perturber(precision="float32", **kwargs).perturb(frames=iter(self.make_frames())))
+        results_64 = list(self.make_perturber(precision="float64", **kwargs).perturb(frames=iter(self.make_frames())))
+        for r32, r64 in zip(results_32, results_64, strict=True):
+            assert r32.image.dtype == r64.image.dtype == np.uint8
+            assert np.abs(r32.image.astype(np.int16) - r64.image).max() <= 1
+
     def test_undersampled_warning_on_explicit_small_grid(self) -> None:
         """Explicit grid_size that puts pitch > r0/6 emits a UserWarning."""
         with pytest.warns(UserWarning, match="phase screen may be aliased"):
@@ -415,6 +468,29 @@ class TestTurbulenceVideoPerturber(PerturbVideoTestsMixin):
         assert len(shifted) == 1
         assert shifted[0][1] == {"label": 2.0}
 
+    @pytest.mark.parametrize("sub_pixel", [False, True])
+    def test_shift_box_array(self, sub_pixel: bool) -> None:
+        """BoxArray boxes are shifted natively and match the legacy box format."""
+        boxes: list[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] = [
+            (AxisAlignedBoundingBox(min_vertex=(30, 30), max_vertex=(31, 31)), {"label": 1.0}),
+            (AxisAlignedBoundingBox(min_vertex=(5, 5), max_vertex=(10, 10)), {"label": 2.0}),
+            (AxisAlignedBoundingBox(min_vertex=(-3, 2), max_vertex=(4, 12)), {7: 0.5}),
+        ]
+        kwargs: dict[str, Any] = {
+            "shift_x": 10.4,
+            "shift_y": -2.6,
+            "image_shape": (SMALL_SIZE, SMALL_SIZE, 3),
+            "sub_pixel": sub_pixel,
+        }
+        expected = TurbulenceVideoPerturber._shift_boxes(boxes=boxes, **kwargs)
+        shifted = TurbulenceVideoPerturber._shift_boxes(boxes=BoxArray.from_boxes(boxes), **kwargs)
+        assert isinstance(shifted, BoxArray)
+        assert len(shifted) == len(expected)
+        for (expected_box, expected_meta), (box, meta) in zip(expected, shifted, strict=True):
+            assert np.allclose(expected_box.min_vertex, box.min_vertex)
+            assert np.allclose(expected_box.max_vertex, box.max_vertex)
+            assert expected_meta == meta
+
     @pytest.mark.parametrize(
         ("shift_x", "shift_y", "exposed_corner"),
         [
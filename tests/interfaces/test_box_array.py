@@ -0,0 +1,109 @@
+from collections.abc import Hashable
+from types import MethodType
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from smqtk_image_io.bbox import AxisAlignedBoundingBox
+
+from nrtk.interfaces import BoxArray, PerturbImage
+
+
+@pytest.mark.core
+class TestBoxArray:
+    @pytest.mark.parametrize(
+        "boxes",
+        [
+            [],
+            [(AxisAlignedBoundingBox(min_vertex=(1, 2), max_vertex=(3, 4)), {0: 0.5})],
+            [
+                (AxisAlignedBoundingBox(min_vertex=(1, 2), max_vertex=(3, 4)), {"car": 0.5}),
+                (AxisAlignedBoundingBox(min_vertex=(0.5, 0), max_vertex=(10, 12.5)), {3: 0.25}),
+                (AxisAlignedBoundingBox(min_vertex=(5, 5), max_vertex=(5, 5)), {("a", 1): 1.0}),
+            ],
+        ],
+    )
+    def test_round_trip(self, boxes: list[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]]) -> None:
+        box_array = BoxArray.from_boxes(boxes)
+        assert len(box_array) == len(boxes)
+        assert box_array.coords.shape == (len(boxes), 4)
+        assert box_array.to_boxes() == boxes
+
+    def test_from_boxes_highest_score(self) -> None:
+        box = AxisAlignedBoundingBox(min_vertex=(1, 2), max_vertex=(3, 4))
+        box_array = BoxArray.from_boxes([(box, {"a": 0.1, "b": 0.7, "c": 0.2})])
+        assert box_array.labels.tolist() == ["b"]
+        assert box_array.scores.tolist() == [0.7]
+
+    def test_from_boxes_box_array(self) -> None:
+        box_array = BoxArray(coords=np.ones((2, 4)), labels=np.zeros(2), scores=np.ones(2))
+        assert BoxArray.from_boxes(box_array) is box_array
+
+    @pytest.mark.parametrize(
+        ("boxes", "match"),
+        [
+            (
+                [(AxisAlignedBoundingBox(min_vertex=(1, 2, 3), max_vertex=(4, 5, 6)), {0: 0.5})],
+                r"only supports 2D bounding boxes",
+            ),
+            ([(AxisAlignedBoundingBox(min_vertex=(1, 2), max_vertex=(3, 4)), {})], r"empty score dictionary"),
+        ],
+    )
+    def test_from_boxes_invalid(
+        self,
+        boxes: list[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]],
+        match: str,
+    ) -> None:
+        with pytest.raises(ValueError, match=match):
+            BoxArray.from_boxes(boxes)
+
+    @pytest.mark.parametrize(
+        ("coords", "labels", "scores", "match"),
+        [
+            (np.ones((2, 3)), np.zeros(2), np.ones(2), r"must be of shape \(N, 4\)"),
+            (np.ones((2, 4)), np.zeros(3), np.ones(2), r"Expected one label and score per box \(2\)"),
+            (np.ones((2, 4)), np.zeros(2), np.ones(1), r"Expected one label and score per box \(2\)"),
+        ],
+    )
+    def test_init_invalid(
+        self,
+        coords: np.ndarray,
+        labels: np.ndarray,
+        scores: np.ndarray,
+        match: str,
+    ) -> None:
+        with pytest.raises(ValueError, match=match):
+            BoxArray(coords=coords, labels=labels, scores=scores)
+
+    def test_copy(self) -> None:
+        box_array = BoxArray(coords=np.ones((2, 4)), labels=np.array([1, 2]), scores=np.array([0.5, 0.25]))
+        box_copy = box_array.copy()
+        assert np.array_equal(box_copy.coords, box_array.coords)
+        assert np.array_equal(box_copy.labels, box_array.labels)
+        assert np.array_equal(box_copy.scores, box_array.scores)
+        assert not np.shares_memory(box_copy.coords, box_array.coords)
+        assert not np.shares_memory(box_copy.labels, box_array.labels)
+        assert not np.shares_memory(box_copy.scores, box_array.scores)
+
+    def test_with_coords_keep(self) -> None:
+        box_array = BoxArray(coords=np.ones((3, 4)), labels=np.array([1, 2, 3]), scores=np.array([0.5, 0.25, 0.1]))
+        keep = np.array([True, False, True])
+        subset = box_array.with_coords(np.zeros((2, 4)), keep=keep)
+        assert subset.labels.tolist() == [1, 3]
+        assert subset.scores.tolist() == [0.5, 0.1]
+
+    def test_rescale_boxes(self) -> None:
+        perturber = MagicMock(spec=PerturbImage)
+        # map mock object rescale method to actual one
+        perturber._rescale_boxes = MethodType(PerturbImage._rescale_boxes, perturber)  # noqa: FKA100, RUF100
+        boxes = [
+            (AxisAlignedBoundingBox(min_vertex=(10, 5), max_vertex=(20, 15)), {"test": 0.53}),
+            (AxisAlignedBoundingBox(min_vertex=(54, 21), max_vertex=(97, 112)), {3: 0.23}),
+        ]
+        expected = perturber._rescale_boxes(boxes=boxes, orig_shape=(100, 99), new_shape=(25, 33))
+        out = perturber._rescale_boxes(boxes=BoxArray.from_boxes(boxes), orig_shape=(100, 99), new_shape=(25, 33))
+        assert isinstance(out, BoxArray)
+        for (expected_box, expected_meta), (out_box, out_meta) in zip(expected, out, strict=True):
+            assert np.allclose(expected_box.min_vertex, out_box.min_vertex)
+            assert np.allclose(expected_box.max_vertex, out_box.max_vertex)
+            assert expected_meta == out_meta
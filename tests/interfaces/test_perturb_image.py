@@ -1,4 +1,5 @@
 from collections.abc import Hashable
+from pathlib import Path
 from types import MethodType
 from unittest.mock import MagicMock
 
@@ -7,6 +8,7 @@ import pytest
 from smqtk_image_io.bbox import AxisAlignedBoundingBox
 
 from nrtk.interfaces import PerturbImage
+from tests.fakes import FakePerturber
 
 
 @pytest.mark.core
@@ -81,3 +83,66 @@ def test_align_bboxes(
     )
     assert np.allclose(out_box.min_vertex, expected_box.min_vertex)
     assert np.allclose(out_box.max_vertex, expected_box.max_vertex)
+
+
+@pytest.mark.core
+class TestPerturbBatch:
+    def test_stacked(self) -> None:
+        images = np.arange(2 * 4 * 5 * 3, dtype=np.uint8).reshape(2, 4, 5, 3)
+        boxes_list = [None, [(AxisAlignedBoundingBox(min_vertex=(0, 0), max_vertex=(1, 1)), {"test": 0.5})]]
+        out_images, out_boxes_list = FakePerturber().perturb_batch(images=images, boxes_list=boxes_list)
+        assert isinstance(out_images, np.ndarray)
+        assert np.array_equal(out_images, images)
+        assert not np.shares_memory(out_images, images)
+        assert out_boxes_list == boxes_list
+        assert out_boxes_list[1] is not boxes_list[1]
+
+    def test_sequence(self) -> None:
+        images = [np.ones((4, 5, 3), dtype=np.uint8), np.zeros((6, 7), dtype=np.float32)]
+        out_images, out_boxes_list = FakePerturber().perturb_batch(images=images)
+        assert isinstance(out_images, list)
+        assert all(np.array_equal(a, b) and a.dtype == b.dtype for a, b in zip(out_images, images, strict=True))
+        assert out_boxes_list == [None, None]
+
+    def test_empty(self) -> None:
+        out_images, out_boxes_list = FakePerturber().perturb_batch(images=np.ones((0, 4, 5, 3)))
+        assert isinstance(out_images, np.ndarray)
+        assert out_images.shape == (0, 4, 5, 3)
+        assert out_boxes_list == []
+
+    def test_boxes_list_mismatch(self) -> None:
+        with pytest.raises(ValueError, match=r"Number of bounding box entries \(1\) does not match number of images"):
+            FakePerturber().perturb_batch(images=np.ones((2, 4, 5, 3)), boxes_list=[None])
+
+
+@pytest.mark.core
+@pytest.mark.parametrize("copy_input", [True, False])
+def test_base_perturb_copy_input(copy_input: bool) -> None:
+    perturber = MagicMock(spec=PerturbImage)
+    perturber._copy_input = copy_input
+    # map mock object perturb method to the base implementation
+    perturber.perturb = MethodType(PerturbImage.perturb, perturber)  # noqa: FKA100, RUF100
+    image = np.ones((4, 5, 3), dtype=np.uint8)
+    boxes = [(AxisAlignedBoundingBox(min_vertex=(0, 0), max_vertex=(1, 1)), {"test": 0.5})]
+    out_image, out_boxes = perturber.perturb(image=image, boxes=boxes)
+    assert np.array_equal(out_image, image)
+    assert (out_image is image) is not copy_input
+    # boxes are always copied, regardless of image copy elision
+    assert out_boxes == boxes
+    assert out_boxes is not boxes
+
+
+@pytest.mark.core
+@pytest.mark.parametrize("copy_input", [True, False])
+def test_base_perturb_memmap(tmp_path: Path, copy_input: bool) -> None:
+    perturber = MagicMock(spec=PerturbImage)
+    perturber._copy_input = copy_input
+    # map mock object perturb method to the base implementation
+    perturber.perturb = MethodType(PerturbImage.perturb, perturber)  # noqa: FKA100, RUF100
+    image = np.lib.format.open_memmap(tmp_path / "image.npy", mode="w+", dtype=np.uint8, shape=(4, 5, 3))
+    image[...] = 7
+    out_image, _ = perturber.perturb(image=image)
+    # memory-mapped inputs are handed over as plain arrays, viewing the mapped memory when not copied
+    assert type(out_image) is np.ndarray
+    assert np.array_equal(out_image, image)
+    assert np.shares_memory(out_image, image) is not copy_input
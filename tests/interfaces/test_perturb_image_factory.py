@@ -15,23 +15,66 @@ Test Cases (inherited from PerturberFactoryMixin):
 Test Cases (interface-specific):
     - from_config resolves perturber type string to class
     - from_config rejects invalid perturber type string
+    - Perturber cache evicts the least recently used perturber
+    - Perturber cache is disabled with maxsize 0 and rejects negative sizes
+    - Perturber cache keys distinguish unhashable and differently typed arguments
+    - Perturber cache keys Configurable arguments by configuration
+    - Perturbers with arguments that cannot be compared by value are not cached
+    - Perturber cache is shared by concurrent consumers
+    - Perturbers are constructed outside the cache lock
+    - Factories with a perturber cache can be copied and pickled
+    - Perturbers supporting incremental updates are constructed from scratch by default
+    - With derivation, they are derived from a private perturber of index 0, whatever the access order
+    - Updating a derived perturber does not change later perturbers
 """
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import copy
+import pickle
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import AbstractContextManager
 from contextlib import nullcontext as does_not_raise
 from typing import Any
 
+import numpy as np
 import pytest
+from smqtk_image_io.bbox import AxisAlignedBoundingBox
 from typing_extensions import override
 
 from nrtk.interfaces import PerturbImageFactory
+from nrtk.utils._incremental import IncrementalParamsMixin
 from tests.fakes import FakePerturber, PerturberFakeFactory
 from tests.impls.perturb_image_factory import PerturberFactoryMixin
 
 
+class _IncrementalFakePerturber(FakePerturber, IncrementalParamsMixin):
+    """FakePerturber recording the perturber it was derived from."""
+
+    def __init__(self, *, param1: float = 1, param2: float = 2) -> None:
+        super().__init__(param1=param1, param2=param2)
+        self.derived_from = self._reuse_source
+
+    @override
+    def _params(self) -> dict[str, Any]:
+        return self.get_config()
+
+
+class _OffsetFakePerturber(FakePerturber):
+    """Adds param1 to images."""
+
+    @override
+    def perturb(
+        self,
+        *,
+        image: np.ndarray[Any, Any],
+        boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None = None,
+        **_: Any,
+    ) -> tuple[np.ndarray[Any, Any], Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]:
+        return image + self.param1, boxes
+
+
 @pytest.mark.core
 class TestPerturbImageFactory(PerturberFactoryMixin):
     """Tests for PerturbImageFactory interface."""
@@ -128,3 +171,120 @@ class TestPerturbImageFactory(PerturberFactoryMixin):
         }
         with pytest.raises(ValueError, match=r"not a valid perturber"):
             PerturberFakeFactory.from_config(config)
+
+    def test_perturber_cache_evicts_least_recently_used(self) -> None:
+        """The cache keeps maxsize perturbers and evicts the least recently used."""
+        factory = self._make_factory(**self.default_factory_kwargs)
+        factory.set_perturber_cache(maxsize=2)
+        first, second = factory[0], factory[1]
+        assert factory[0] is first  # second is now least recently used
+        factory[2]
+        assert factory[0] is first
+        assert factory[1] is not second
+
+    def test_perturber_cache_disable(self) -> None:
+        """A maxsize of 0 disables the cache and negative sizes raise ValueError."""
+        factory = self._make_factory(**self.default_factory_kwargs)
+        factory.set_perturber_cache(maxsize=4)
+        factory.set_perturber_cache(maxsize=0)
+        assert factory[0] is not factory[0]
+        with pytest.raises(ValueError, match=r"maxsize must be non-negative"):
+            factory.set_perturber_cache(maxsize=-1)
+
+    def test_perturber_cache_keys(self) -> None:
+        """Unhashable arguments are keyed by value, and equal values of different types are distinct."""
+        factory = self._make_factory(
+            theta_key="param1",
+            theta_values=[1, 1.0, [1, 2], [1, 2]],
+            perturber_kwargs={"param2": {"nested": [3, 4]}},
+        )
+        factory.set_perturber_cache(maxsize=4)
+        assert factory[0] is not factory[1]
+        assert factory[2] is factory[3]
+        assert factory[1].get_config()["param1"] == 1.0
+
+    def test_perturber_cache_configurable_keys(self) -> None:
+        """Configurable arguments are keyed by their configuration rather than by object."""
+        factory = self._make_factory(
+            theta_key="param1",
+            theta_values=[FakePerturber(param1=1), FakePerturber(param1=1), FakePerturber(param1=2)],
+        )
+        factory.set_perturber_cache(maxsize=3)
+        assert factory[0] is factory[1]
+        assert factory[0] is not factory[2]
+
+    def test_perturber_cache_uncomparable_arguments(self) -> None:
+        """Perturbers with arguments that cannot be compared by value are never cached."""
+        factory = self._make_factory(theta_key="param1", theta_values=[{1, 2}])
+        factory.set_perturber_cache(maxsize=2)
+        assert factory[0] is not factory[0]
+        assert factory[0].get_config()["param1"] == {1, 2}
+
+    def test_perturber_cache_concurrent(self) -> None:
+        """Concurrent consumers indexing the factory share one perturber per index."""
+        factory = self._make_factory(**self.default_factory_kwargs)
+        factory.set_perturber_cache(maxsize=3)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            perturbers = list(executor.map(lambda idx: factory[idx % 3], range(64)))
+        for idx, perturber in enumerate(perturbers):
+            assert perturber is factory[idx % 3]
+
+    def test_perturber_cache_constructs_outside_lock(self) -> None:
+        """Perturbers are constructed without holding the cache lock, so other consumers are not held up."""
+
+        class _LockCheckingPerturber(FakePerturber):
+            def __init__(self, **kwargs: Any) -> None:
+                assert not factory._perturber_cache_lock.locked()
+                super().__init__(**kwargs)
+
+        factory = PerturberFakeFactory(perturber=_LockCheckingPerturber, **self.default_factory_kwargs)
+        factory.set_perturber_cache(maxsize=3)
+        assert [perturber.get_config()["param1"] for perturber in factory] == [1, 2, 3]
+
+    @pytest.mark.parametrize(
+        "copier",
+        [copy.copy, copy.deepcopy, lambda f: pickle.loads(pickle.dumps(f))],  # noqa: S301 - test-controlled data
+        ids=["copy", "deepcopy", "pickle"],
+    )
+    def test_perturber_cache_copy(self, copier: Callable[[PerturbImageFactory], PerturbImageFactory]) -> None:
+        """Copies of a factory with a perturber cache have their own, empty cache of the same size."""
+        factory = self._make_factory(**self.default_factory_kwargs)
+        factory.set_perturber_cache(maxsize=3)
+        perturber = factory[0]
+        copied = copier(factory)
+        assert copied[0] is not perturber
+        assert copied[0] is copied[0]
+
+    def test_incremental_perturbers_constructed(self) -> None:
+        """Perturbers supporting incremental updates are constructed from scratch by default."""
+        factory = PerturberFakeFactory(perturber=_IncrementalFakePerturber, **self.default_factory_kwargs)
+        assert [perturber.derived_from for perturber in factory] == [None, None, None]
+
+    def test_incremental_perturbers_derived(self) -> None:
+        """With derivation, perturbers are derived from a private perturber of index 0, whatever the access order."""
+        factory = PerturberFakeFactory(perturber=_IncrementalFakePerturber, **self.default_factory_kwargs)
+        factory.set_perturber_derivation(enabled=True)
+        perturbers = [factory[2], factory[0], factory[1]]
+        base = perturbers[0].derived_from
+        assert base.get_config() == {"param1": 1, "param2": 2}
+        assert all(perturber.derived_from is base for perturber in perturbers)
+        assert all(perturber is not base for perturber in perturbers)
+        assert [perturber.get_config()["param1"] for perturber in perturbers] == [3, 1, 2]
+
+        factory.set_perturber_derivation(enabled=False)
+        assert factory[1].derived_from is None
+
+    def test_incremental_perturbers_isolated(self) -> None:
+        """Updating a derived perturber does not change the perturbers derived after it."""
+        factory = PerturberFakeFactory(perturber=_IncrementalFakePerturber, **self.default_factory_kwargs)
+        factory.set_perturber_derivation(enabled=True)
+        factory[0].update(param2=5)
+        assert factory[1].get_config() == {"param1": 2, "param2": 2}
+
+    def test_perturb_sweep(self) -> None:
+        """Sweeps perturb the image with every perturber of the factory, in order."""
+        factory = PerturberFakeFactory(perturber=_OffsetFakePerturber, **self.default_factory_kwargs)
+        boxes = [(AxisAlignedBoundingBox(min_vertex=(0, 0), max_vertex=(1, 1)), {"test": 1.0})]
+        outputs = factory.perturb_sweep(image=np.zeros((4, 4)), boxes=boxes)
+        assert [float(image[0, 0]) for image, _ in outputs] == [1.0, 2.0, 3.0]
+        assert all(out_boxes == boxes for _, out_boxes in outputs)
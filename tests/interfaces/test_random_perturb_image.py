@@ -0,0 +1,110 @@
+"""Tests for the per-call random state of the RandomPerturbImage interface."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar
+
+import numpy as np
+import pytest
+from smqtk_image_io.bbox import AxisAlignedBoundingBox
+from typing_extensions import override
+
+from nrtk.impls.perturb_image._base._numpy_random_perturb_image import NumpyRandomPerturbImage
+from tests.utils import random_image
+
+
+class _AddNoisePerturber(NumpyRandomPerturbImage):
+    """Minimal concrete subclass adding integer noise drawn from the random state of the perturber."""
+
+    @override
+    def perturb(
+        self,
+        *,
+        image: np.ndarray[Any, Any],
+        boxes: Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None = None,
+        **kwargs: Any,
+    ) -> tuple[np.ndarray[Any, Any], Iterable[tuple[AxisAlignedBoundingBox, dict[Hashable, float]]] | None]:
+        perturbed_image, perturbed_boxes = super().perturb(image=image, boxes=boxes, **kwargs)
+        noise = self._rng.integers(low=0, high=16, size=image.shape, dtype=np.uint8)
+        return perturbed_image + noise, perturbed_boxes
+
+
+class _RealizationsPerturber(_AddNoisePerturber):
+    """Subclass with an entry point of its own, drawing one perturbed image per realization."""
+
+    _rng_entry_points: ClassVar[tuple[str, ...]] = ("perturb_realizations",)
+
+    def perturb_realizations(self, *, image: np.ndarray[Any, Any], count: int) -> list[np.ndarray[Any, Any]]:
+        return [self.perturb(image=image)[0] for _ in range(count)]
+
+
+@pytest.mark.core
+class TestRandomPerturbImage:
+    def test_seed_matches_fresh_perturber(self) -> None:
+        """A per-call seed draws the same values as a perturber constructed with that seed."""
+        image = random_image(seed=0)
+        out, _ = _AddNoisePerturber(seed=1)(image=image, seed=5)
+        expected, _ = _AddNoisePerturber(seed=5)(image=image)
+        assert np.array_equal(out, expected)
+
+    def test_call_leaves_perturber_state(self) -> None:
+        """Calls given their own random state do not advance the random state of the perturber."""
+        image = random_image(seed=0)
+        inst = _AddNoisePerturber(seed=1)
+        inst(image=image, seed=5)
+        inst(image=image, rng=np.random.default_rng(6))
+        out, _ = inst(image=image)
+        expected, _ = _AddNoisePerturber(seed=1)(image=image)
+        assert np.array_equal(out, expected)
+
+    def test_rng_is_advanced(self) -> None:
+        """A given rng is drawn from, so successive calls sharing it differ."""
+        image = random_image(seed=0)
+        inst = _AddNoisePerturber(seed=1)
+        rng = np.random.default_rng(5)
+        out_1, _ = inst(image=image, rng=rng)
+        out_2, _ = inst(image=image, rng=rng)
+        assert not np.array_equal(out_1, out_2)
+
+    def test_is_static_not_reset(self) -> None:
+        """A static perturber is not reseeded by calls given their own random state."""
+        image = random_image(seed=0)
+        inst = _AddNoisePerturber(seed=1, is_static=True)
+        rng = inst._rng
+        inst(image=image, seed=5)
+        assert inst._rng is rng
+
+    def test_rng_and_seed(self) -> None:
+        """Giving both rng and seed is ambiguous."""
+        with pytest.raises(ValueError, match=r"Only one of rng and seed may be given"):
+            _AddNoisePerturber()(image=random_image(seed=0), rng=np.random.default_rng(0), seed=0)
+
+    def test_perturb_batch_shares_rng(self) -> None:
+        """A batch draws from a single per-call random state, one image after another."""
+        images = np.stack([random_image(seed=0), random_image(seed=1)])
+        inst = _AddNoisePerturber()
+        out_images, _ = inst.perturb_batch(images=images, seed=5)
+        rng = np.random.default_rng(5)
+        expected = [inst.perturb(image=image, rng=rng)[0] for image in images]
+        assert np.array_equal(out_images, np.stack(expected))
+
+    def test_concurrent_calls(self) -> None:
+        """Concurrent calls to one perturber given their own seeds match sequential calls."""
+        image = random_image(seed=0)
+        inst = _AddNoisePerturber()
+        expected = [inst(image=image, seed=seed)[0] for seed in range(16)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            outputs = list(executor.map(lambda seed: inst(image=image, seed=seed)[0], range(16)))
+        for out, exp in zip(outputs, expected, strict=True):
+            assert np.array_equal(out, exp)
+
+    def test_subclass_entry_points(self) -> None:
+        """Entry points named by a subclass accept the per-call random state, as do those of its bases."""
+        image = random_image(seed=0)
+        inst = _RealizationsPerturber(seed=1)
+        out = inst.perturb_realizations(image=image, count=2, seed=5)  # pyright: ignore[reportCallIssue]
+        expected, _ = _AddNoisePerturber(seed=5).perturb_batch(images=np.stack([image, image]))
+        assert np.array_equal(np.stack(out), expected)
+        assert np.array_equal(inst(image=image, seed=5)[0], expected[0])
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from nrtk.interfaces._warp_map import WarpMap
+
+
+def _shift_right(*, shape: tuple[int, int], fill: int) -> WarpMap:
+    h, w = shape
+    return WarpMap(
+        index=WarpMap.source_index(x=np.arange(w) - 1, y=np.arange(h)[:, np.newaxis], shape=shape),
+        shape=shape,
+        fills=[np.array(fill)],
+        box_transforms=[lambda boxes: [*boxes, fill]],
+    )
+
+
+@pytest.mark.core
+class TestWarpMap:
+    def test_source_index(self) -> None:
+        index = WarpMap.source_index(x=np.array([[1, 0], [2, -1]]), y=np.array([[0, 1], [0, 1]]), shape=(2, 2))
+        assert index.tolist() == [1, 2, -1, -1]
+
+    @pytest.mark.parametrize("shape", [(3, 4), (3, 4, 2)])
+    def test_apply(self, shape: tuple[int, ...]) -> None:
+        image = np.arange(np.prod(shape), dtype=np.uint8).reshape(shape)
+        out = _shift_right(shape=(3, 4), fill=200).apply(image)
+        assert out.dtype == image.dtype
+        assert np.array_equal(out[:, 1:], image[:, :-1])
+        assert (out[:, 0] == 200).all()
+
+    def test_apply_batched(self) -> None:
+        images = np.arange(2 * 3 * 4 * 3, dtype=np.uint8).reshape(2, 3, 4, 3)
+        warp = _shift_right(shape=(3, 4), fill=7)
+        out = warp.apply(images, batched=True)
+        assert np.array_equal(out, np.stack([warp.apply(image) for image in images]))
+
+    def test_then(self) -> None:
+        """Composed warps keep the fill values of each warp and apply box transforms in order."""
+        image = np.arange(12, dtype=np.uint8).reshape(3, 4)
+        first = _shift_right(shape=(3, 4), fill=100)
+        second = _shift_right(shape=(3, 4), fill=200)
+        warp = first.then(second)
+        assert np.array_equal(warp.apply(image), second.apply(first.apply(image)))
+        assert warp.warp_boxes([]) == [100, 200]
+
+    @pytest.mark.parametrize(
+        ("shape", "match"),
+        [((3, 5), r"Cannot compose warps"), ((4, 4), r"Cannot compose warps")],
+    )
+    def test_then_mismatch(self, shape: tuple[int, int], match: str) -> None:
+        with pytest.raises(ValueError, match=match):
+            _shift_right(shape=(3, 4), fill=0).then(_shift_right(shape=shape, fill=0))
+
+    def test_apply_mismatch(self) -> None:
+        with pytest.raises(ValueError, match=r"Cannot apply a warp"):
+            _shift_right(shape=(3, 4), fill=0).apply(np.zeros((4, 3)))
+
+    def test_init_invalid(self) -> None:
+        with pytest.raises(ValueError, match=r"Expected a flat index of 12 pixels"):
+            WarpMap(index=np.zeros(10, dtype=np.intp), shape=(3, 4))
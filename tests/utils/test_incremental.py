@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from nrtk.utils._incremental import changed_values, stale_state, state_inputs
+
+_DEPENDENCIES = {
+    "grid": {"size"},
+    "aperture": {"grid", "diameter"},
+    "layer": {"grid", "seed"},
+    "propagator": {"grid", "wavelength"},
+}
+
+
+@pytest.mark.core
+class TestIncremental:
+    def test_changed_values(self) -> None:
+        """Values are compared by value, including arrays, and new names count as changed."""
+        old = {"a": 1.0, "b": np.array([1.0, 2.0]), "c": "x"}
+        new = {"a": 1.0, "b": np.array([1.0, 2.0]), "c": "y", "d": None}
+        assert changed_values(old=old, new=new) == {"c", "d"}
+        assert changed_values(old=old, new=old | {"b": np.array([1.0, 3.0])}) == {"b"}
+
+    @pytest.mark.parametrize(
+        ("changed", "expected"),
+        [
+            pytest.param(set(), set(), id="nothing"),
+            pytest.param({"unused"}, set(), id="unused value"),
+            pytest.param({"seed"}, {"layer"}, id="direct"),
+            pytest.param({"size"}, {"grid", "aperture", "layer", "propagator"}, id="transitive"),
+            pytest.param({"diameter", "wavelength"}, {"aperture", "propagator"}, id="several"),
+        ],
+    )
+    def test_stale_state(self, changed: set[str], expected: set[str]) -> None:
+        """Derived state is stale if computed, directly or through other derived state, from a changed value."""
+        assert stale_state(dependencies=_DEPENDENCIES, changed=changed) == expected
+
+    @pytest.mark.parametrize(
+        ("names", "expected"),
+        [
+            pytest.param({"grid"}, {"size"}, id="direct"),
+            pytest.param({"aperture"}, {"size", "diameter"}, id="transitive"),
+            pytest.param({"layer", "propagator"}, {"size", "seed", "wavelength"}, id="several"),
+        ],
+    )
+    def test_state_inputs(self, names: set[str], expected: set[str]) -> None:
+        """Inputs are the values derived state is computed from, directly or through other derived state."""
+        assert state_inputs(dependencies=_DEPENDENCIES, names=names) == expected
@@ -0,0 +1,48 @@
+from collections.abc import Generator
+
+import numpy as np
+import pytest
+
+from nrtk.impls.perturb_image.environment import HazePerturber
+from nrtk.utils import float_dtype, get_default_precision, set_default_precision
+from tests.utils import random_image
+
+
+@pytest.fixture
+def restore_default_precision() -> Generator[None, None, None]:
+    """Restore the default precision changed by a test."""
+    precision = get_default_precision()
+    yield
+    set_default_precision(precision)
+
+
+@pytest.mark.core
+class TestPrecision:
+    def test_default_is_float32(self) -> None:
+        """float32 is the default precision."""
+        assert get_default_precision() == "float32"
+        assert float_dtype() == np.float32
+
+    @pytest.mark.parametrize("precision", ["float32", "float64"])
+    def test_float_dtype(self, precision: str) -> None:
+        """An explicit precision takes priority over the default precision."""
+        assert float_dtype(precision) == np.dtype(precision)
+
+    @pytest.mark.usefixtures("restore_default_precision")
+    def test_set_default_precision(self) -> None:
+        """Perturbers configured without a precision follow the default precision."""
+        image = random_image(seed=0)
+        set_default_precision("float64")
+        assert float_dtype() == np.float64
+        out_default, _ = HazePerturber(factor=0.7)(image=image)
+        out_64, _ = HazePerturber(factor=0.7, precision="float64")(image=image)
+        assert np.array_equal(out_default, out_64)
+
+    @pytest.mark.usefixtures("restore_default_precision")
+    def test_invalid_precision(self) -> None:
+        """Unsupported precisions raise a ValueError and leave the default unchanged."""
+        with pytest.raises(ValueError, match=r"Unsupported precision 'float16'"):
+            set_default_precision("float16")
+        with pytest.raises(ValueError, match=r"Unsupported precision 'int8'"):
+            float_dtype("int8")
+        assert get_default_precision() == "float32"